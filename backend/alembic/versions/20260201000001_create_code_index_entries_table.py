@@ -0,0 +1,47 @@
+"""create_code_index_entries_table
+
+Revision ID: 20260201000001
+Revises: 20260129000001
+Create Date: 2026-02-01 10:00:00.000000
+
+Creates the code_index_entries table: a per-project manifest of indexed
+files (size, mtime, content hash, RAG document ids) used for incremental
+codebase indexing.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = '20260201000001'
+down_revision: Union[str, None] = '20260129000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create code_index_entries table"""
+    op.create_table(
+        'code_index_entries',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True, server_default=sa.text('gen_random_uuid()')),
+        sa.Column('project_id', UUID(as_uuid=True), sa.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('file_path', sa.String(1000), nullable=False),
+        sa.Column('language', sa.String(50), nullable=True),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('mtime', sa.Float(), nullable=False),
+        sa.Column('content_hash', sa.String(64), nullable=False),
+        sa.Column('line_count', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('doc_ids', sa.JSON(), nullable=False),
+        sa.Column('indexed_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+        sa.UniqueConstraint('project_id', 'file_path', name='uq_code_index_entries_project_path'),
+    )
+
+    op.create_index('ix_code_index_entries_project_id', 'code_index_entries', ['project_id'])
+
+
+def downgrade() -> None:
+    """Drop code_index_entries table"""
+    op.drop_index('ix_code_index_entries_project_id', table_name='code_index_entries')
+    op.drop_table('code_index_entries')
@@ -0,0 +1,31 @@
+"""add_code_indexing_job_type
+
+Revision ID: 20260202000001
+Revises: 20260201000001
+Create Date: 2026-02-02 10:00:00.000000
+
+Adds 'code_indexing' to the jobtype ENUM so codebase indexing runs are
+tracked (with progress) as AsyncJobs.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20260202000001'
+down_revision: Union[str, None] = '20260201000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Add 'code_indexing' value to jobtype ENUM
+    op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'code_indexing'")
+
+
+def downgrade() -> None:
+    # PostgreSQL does not support removing ENUM values directly.
+    # Leaving the extra value in place is harmless.
+    pass
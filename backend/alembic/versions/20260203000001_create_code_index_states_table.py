@@ -0,0 +1,37 @@
+"""create_code_index_states_table
+
+Revision ID: 20260203000001
+Revises: 20260202000001
+Create Date: 2026-02-03 10:00:00.000000
+
+Creates the code_index_states table: the last git commit each project's
+code index was synced to, used to re-index only files changed since then.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = '20260203000001'
+down_revision: Union[str, None] = '20260202000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create code_index_states table"""
+    op.create_table(
+        'code_index_states',
+        sa.Column('project_id', UUID(as_uuid=True), sa.ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('root_path', sa.String(1000), nullable=False),
+        sa.Column('commit_sha', sa.String(64), nullable=False),
+        sa.Column('pending_paths', sa.JSON(), nullable=False),
+        sa.Column('indexed_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop code_index_states table"""
+    op.drop_table('code_index_states')
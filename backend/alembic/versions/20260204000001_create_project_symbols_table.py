@@ -0,0 +1,48 @@
+"""create_project_symbols_table
+
+Revision ID: 20260204000001
+Revises: 20260203000001
+Create Date: 2026-02-04 10:00:00.000000
+
+Creates the project_symbols table: per-project symbol table (definitions,
+exports, imports, methods, fields and usages) extracted from TaskResult
+outputs and indexed project files.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = '20260204000001'
+down_revision: Union[str, None] = '20260203000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create project_symbols table"""
+    op.create_table(
+        'project_symbols',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('project_id', UUID(as_uuid=True), sa.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('source', sa.String(10), nullable=False),
+        sa.Column('source_key', sa.String(1000), nullable=False),
+        sa.Column('file_path', sa.String(1000), nullable=True),
+        sa.Column('content_hash', sa.String(64), nullable=False),
+        sa.Column('kind', sa.String(20), nullable=False),
+        sa.Column('name', sa.String(255), nullable=False),
+        sa.Column('owner', sa.String(255), nullable=True),
+        sa.Column('qualified_name', sa.String(1000), nullable=True),
+        sa.Column('language', sa.String(50), nullable=True),
+    )
+    op.create_index('ix_project_symbols_project_kind_name', 'project_symbols', ['project_id', 'kind', 'name'])
+    op.create_index('ix_project_symbols_project_source', 'project_symbols', ['project_id', 'source', 'source_key'])
+
+
+def downgrade() -> None:
+    """Drop project_symbols table"""
+    op.drop_index('ix_project_symbols_project_source', table_name='project_symbols')
+    op.drop_index('ix_project_symbols_project_kind_name', table_name='project_symbols')
+    op.drop_table('project_symbols')
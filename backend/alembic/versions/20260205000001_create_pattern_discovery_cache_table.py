@@ -0,0 +1,37 @@
+"""create_pattern_discovery_cache_table
+
+Revision ID: 20260205000001
+Revises: 20260204000001
+Create Date: 2026-02-05 10:00:00.000000
+
+Creates the pattern_discovery_cache table: last AI answer per project file
+group, reused while the sampled files' content is unchanged.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = '20260205000001'
+down_revision: Union[str, None] = '20260204000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create pattern_discovery_cache table"""
+    op.create_table(
+        'pattern_discovery_cache',
+        sa.Column('project_id', UUID(as_uuid=True), sa.ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True),
+        sa.Column('group_key', sa.String(255), primary_key=True),
+        sa.Column('fingerprint', sa.String(64), nullable=False),
+        sa.Column('pattern', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop pattern_discovery_cache table"""
+    op.drop_table('pattern_discovery_cache')
@@ -0,0 +1,54 @@
+"""add_tasks_hierarchy_path
+
+Revision ID: 20260206000001
+Revises: 20260205000001
+Create Date: 2026-02-06 10:00:00.000000
+
+Adds tasks.hierarchy_path, a materialized path of id hex segments from the
+root ("<epic>/<story>/<task>/"), with a text_pattern_ops btree index so
+subtree lookups are indexed prefix LIKE queries. Existing rows are
+backfilled with a recursive CTE; rows in a parent_id cycle keep NULL and
+are walked via parent_id by the application.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260206000001'
+down_revision: Union[str, None] = '20260205000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add hierarchy_path to tasks and backfill it"""
+    op.add_column('tasks', sa.Column('hierarchy_path', sa.String(2000), nullable=True))
+
+    op.execute("""
+        WITH RECURSIVE tree AS (
+            SELECT id, replace(id::text, '-', '') || '/' AS path, 0 AS depth
+            FROM tasks
+            WHERE parent_id IS NULL
+            UNION ALL
+            SELECT t.id, tree.path || replace(t.id::text, '-', '') || '/', tree.depth + 1
+            FROM tasks t
+            JOIN tree ON t.parent_id = tree.id
+            WHERE tree.depth < 32
+        )
+        UPDATE tasks SET hierarchy_path = tree.path
+        FROM tree
+        WHERE tasks.id = tree.id
+    """)
+
+    op.create_index(
+        'ix_tasks_hierarchy_path', 'tasks', ['hierarchy_path'],
+        postgresql_ops={'hierarchy_path': 'text_pattern_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Drop hierarchy_path from tasks"""
+    op.drop_index('ix_tasks_hierarchy_path', table_name='tasks')
+    op.drop_column('tasks', 'hierarchy_path')
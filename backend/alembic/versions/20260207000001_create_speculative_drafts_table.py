@@ -0,0 +1,50 @@
+"""create_speculative_drafts_table
+
+Revision ID: 20260207000001
+Revises: 20260206000001
+Create Date: 2026-02-07 10:00:00.000000
+
+Creates the speculative_drafts table (full content of suggested items,
+generated in the background before activation) and adds
+'speculative_generation' to the jobtype ENUM.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = '20260207000001'
+down_revision: Union[str, None] = '20260206000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create speculative_drafts table and the speculative_generation job type"""
+    op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'speculative_generation'")
+
+    op.create_table(
+        'speculative_drafts',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('task_id', UUID(as_uuid=True), sa.ForeignKey('tasks.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('project_id', UUID(as_uuid=True), sa.ForeignKey('projects.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('fingerprint', sa.String(64), nullable=False),
+        sa.Column('content', sa.JSON(), nullable=True),
+        sa.Column('tokens_used', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('status', sa.String(20), server_default='ready', nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+        sa.Column('consumed_at', sa.DateTime(), nullable=True),
+    )
+    op.create_index('ix_speculative_drafts_task_id', 'speculative_drafts', ['task_id'])
+    op.create_index('ix_speculative_drafts_project_created', 'speculative_drafts', ['project_id', 'created_at'])
+
+
+def downgrade() -> None:
+    """Drop speculative_drafts table"""
+    op.drop_index('ix_speculative_drafts_project_created', table_name='speculative_drafts')
+    op.drop_index('ix_speculative_drafts_task_id', table_name='speculative_drafts')
+    op.drop_table('speculative_drafts')
+    # PostgreSQL does not support removing ENUM values directly.
+    # Leaving the extra 'speculative_generation' value in place is harmless.
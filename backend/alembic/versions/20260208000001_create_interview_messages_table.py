@@ -0,0 +1,111 @@
+"""create_interview_messages_table
+
+Revision ID: 20260208000001
+Revises: 20260207000001
+Create Date: 2026-02-08 10:00:00.000000
+
+Moves interview conversations from the interviews.conversation_data JSON
+column (rewritten on every turn) to the append-only interview_messages
+table, one row per message:
+- creates interview_messages, indexed on (interview_id, seq)
+- copies every conversation (message order -> seq; role and content to
+  columns, the other message fields to metadata)
+- adds interviews.message_count (next seq)
+- replaces the column with the interview_conversations view, which
+  rebuilds the old JSON array for SQL consumers
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+# revision identifiers, used by Alembic.
+revision: str = '20260208000001'
+down_revision: Union[str, None] = '20260207000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CONVERSATIONS_VIEW = """
+CREATE VIEW interview_conversations AS
+SELECT
+    i.id AS interview_id,
+    COALESCE(
+        json_agg(
+            (jsonb_build_object('role', m.role, 'content', m.content)
+             || COALESCE(m.metadata::jsonb, '{}'::jsonb))::json
+            ORDER BY m.seq
+        ) FILTER (WHERE m.id IS NOT NULL),
+        '[]'::json
+    ) AS conversation_data
+FROM interviews i
+LEFT JOIN interview_messages m ON m.interview_id = i.id
+GROUP BY i.id
+"""
+
+
+def upgrade() -> None:
+    """Create interview_messages, copy conversations, replace the JSON column with a view"""
+    op.create_table(
+        'interview_messages',
+        sa.Column('id', UUID(as_uuid=True), primary_key=True),
+        sa.Column('interview_id', UUID(as_uuid=True), sa.ForeignKey('interviews.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('role', sa.String(20), nullable=False),
+        sa.Column('content', sa.Text(), server_default='', nullable=False),
+        sa.Column('metadata', sa.JSON(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('NOW()'), nullable=False),
+    )
+    op.create_index(
+        'ix_interview_messages_interview_seq', 'interview_messages', ['interview_id', 'seq'], unique=True
+    )
+
+    op.add_column(
+        'interviews',
+        sa.Column('message_count', sa.Integer(), server_default='0', nullable=False)
+    )
+
+    op.execute("""
+        INSERT INTO interview_messages (id, interview_id, seq, role, content, metadata, created_at)
+        SELECT
+            gen_random_uuid(),
+            i.id,
+            (ROW_NUMBER() OVER (PARTITION BY i.id ORDER BY m.ordinality) - 1)::int,
+            COALESCE(m.value->>'role', 'user'),
+            COALESCE(m.value->>'content', ''),
+            (m.value::jsonb - 'role' - 'content')::json,
+            i.created_at
+        FROM interviews i
+        CROSS JOIN LATERAL json_array_elements(
+            CASE WHEN json_typeof(i.conversation_data) = 'array' THEN i.conversation_data ELSE '[]'::json END
+        ) WITH ORDINALITY AS m(value, ordinality)
+        WHERE json_typeof(m.value) = 'object'
+    """)
+    op.execute("""
+        UPDATE interviews i
+        SET message_count = c.total
+        FROM (SELECT interview_id, COUNT(*) AS total FROM interview_messages GROUP BY interview_id) c
+        WHERE c.interview_id = i.id
+    """)
+
+    op.drop_column('interviews', 'conversation_data')
+    op.execute(CONVERSATIONS_VIEW)
+
+
+def downgrade() -> None:
+    """Restore interviews.conversation_data from interview_messages"""
+    op.add_column(
+        'interviews',
+        sa.Column('conversation_data', sa.JSON(), server_default='[]', nullable=False)
+    )
+    op.execute("""
+        UPDATE interviews i
+        SET conversation_data = c.conversation_data
+        FROM interview_conversations c
+        WHERE c.interview_id = i.id
+    """)
+    op.execute("DROP VIEW interview_conversations")
+    op.drop_column('interviews', 'message_count')
+    op.drop_index('ix_interview_messages_interview_seq', table_name='interview_messages')
+    op.drop_table('interview_messages')
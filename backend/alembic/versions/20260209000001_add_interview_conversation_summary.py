@@ -0,0 +1,35 @@
+"""add_interview_conversation_summary
+
+Revision ID: 20260209000001
+Revises: 20260208000001
+Create Date: 2026-02-09 10:00:00.000000
+
+Rolling conversation summary of interviews: messages before
+summarized_until are sent to the AI as conversation_summary plus
+summary_facts instead of verbatim.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260209000001'
+down_revision: Union[str, None] = '20260208000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('interviews', sa.Column('conversation_summary', sa.Text(), nullable=True))
+    op.add_column('interviews', sa.Column('summary_facts', sa.JSON(), nullable=True))
+    op.add_column(
+        'interviews',
+        sa.Column('summarized_until', sa.Integer(), nullable=False, server_default='0')
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('interviews', 'summarized_until')
+    op.drop_column('interviews', 'summary_facts')
+    op.drop_column('interviews', 'conversation_summary')
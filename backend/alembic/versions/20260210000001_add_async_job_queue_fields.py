@@ -0,0 +1,49 @@
+"""add_async_job_queue_fields
+
+Revision ID: 20260210000001
+Revises: 20260209000001
+Create Date: 2026-02-10 10:00:00.000000
+
+Turns async_jobs into a durable work queue: the handler that runs a job
+and its arguments, priority, attempts and the worker heartbeat used to
+re-queue jobs of crashed workers. Adds 'project_analysis' to the jobtype
+ENUM.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260210000001'
+down_revision: Union[str, None] = '20260209000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add queue columns to async_jobs and the project_analysis job type"""
+    op.execute("ALTER TYPE jobtype ADD VALUE IF NOT EXISTS 'project_analysis'")
+
+    op.add_column('async_jobs', sa.Column('handler', sa.String(255), nullable=True))
+    op.add_column('async_jobs', sa.Column('handler_kwargs', sa.JSON(), nullable=True))
+    op.add_column('async_jobs', sa.Column('priority', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('async_jobs', sa.Column('attempts', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('async_jobs', sa.Column('max_attempts', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('async_jobs', sa.Column('worker_id', sa.String(255), nullable=True))
+    op.add_column('async_jobs', sa.Column('heartbeat_at', sa.DateTime(), nullable=True))
+    op.create_index('ix_async_jobs_queue', 'async_jobs', ['status', 'priority', 'created_at'])
+
+
+def downgrade() -> None:
+    """Remove queue columns from async_jobs"""
+    op.drop_index('ix_async_jobs_queue', table_name='async_jobs')
+    op.drop_column('async_jobs', 'heartbeat_at')
+    op.drop_column('async_jobs', 'worker_id')
+    op.drop_column('async_jobs', 'max_attempts')
+    op.drop_column('async_jobs', 'attempts')
+    op.drop_column('async_jobs', 'priority')
+    op.drop_column('async_jobs', 'handler_kwargs')
+    op.drop_column('async_jobs', 'handler')
+    # PostgreSQL does not support removing ENUM values directly.
+    # Leaving the extra 'project_analysis' value in place is harmless.
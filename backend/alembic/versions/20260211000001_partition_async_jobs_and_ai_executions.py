@@ -0,0 +1,145 @@
+"""partition_async_jobs_and_ai_executions
+
+Revision ID: 20260211000001
+Revises: 20260210000001
+Create Date: 2026-02-11 10:00:00.000000
+
+Recreates async_jobs and ai_executions as tables partitioned by month on
+created_at (PARTITION BY RANGE), so retention detaches and drops whole
+partitions instead of bulk DELETEs (see app/services/data_retention.py).
+
+The primary key becomes (id, created_at) - a partitioned table's unique
+constraints must include the partition key; the ORM still identifies
+rows by id. Monthly partitions are created from the oldest row up to
+PARTITION_MONTHS_AHEAD months ahead; later ones are created by
+ensure_partitions on startup and by the job workers (DEFAULT partitions
+for the months in between: 20260214000001). Existing rows are copied.
+
+prompts is not partitioned: tasks.prompt_id and prompts.parent_id
+reference it, and a partitioned table cannot be referenced by id alone.
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260211000001'
+down_revision: Union[str, None] = '20260210000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PARTITIONED_TABLES = ('async_jobs', 'ai_executions')
+PARTITION_MONTHS_AHEAD = 3
+
+# Indexes recreated on the partitioned tables (propagated to each partition)
+INDEXES = {
+    'async_jobs': [
+        ('ix_async_jobs_job_type', ['job_type']),
+        ('ix_async_jobs_status', ['status']),
+        ('ix_async_jobs_project_id', ['project_id']),
+        ('ix_async_jobs_interview_id', ['interview_id']),
+        ('ix_async_jobs_queue', ['status', 'priority', 'created_at']),
+    ],
+    'ai_executions': [
+        ('ix_ai_executions_id', ['id']),
+        ('ix_ai_executions_ai_model_id', ['ai_model_id']),
+        ('ix_ai_executions_usage_type', ['usage_type']),
+        ('ix_ai_executions_provider', ['provider']),
+        ('ix_ai_executions_created_at', ['created_at']),
+    ],
+}
+
+FOREIGN_KEYS = {
+    'ai_executions': [
+        ('ai_executions_ai_model_id_fkey', 'ai_model_id', 'ai_models', 'id', 'SET NULL'),
+    ],
+}
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _drop_indexes(table: str) -> None:
+    for name, _ in INDEXES[table]:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def _create_indexes(table: str) -> None:
+    for name, columns in INDEXES[table]:
+        op.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({", ".join(columns)})')
+
+
+def _add_foreign_keys(table: str) -> None:
+    for name, column, target, target_column, ondelete in FOREIGN_KEYS.get(table, []):
+        op.execute(
+            f'ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column}) '
+            f'REFERENCES {target} ({target_column}) ON DELETE {ondelete}'
+        )
+
+
+def _partition(table: str) -> None:
+    bind = op.get_bind()
+    legacy = f'{table}_legacy'
+
+    op.execute(f'ALTER TABLE {table} RENAME TO {legacy}')
+    op.execute(f'ALTER TABLE {legacy} DROP CONSTRAINT IF EXISTS {table}_pkey')
+    for name, *_ in FOREIGN_KEYS.get(table, []):
+        op.execute(f'ALTER TABLE {legacy} DROP CONSTRAINT IF EXISTS {name}')
+    _drop_indexes(table)
+
+    op.execute(
+        f'CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+        f'PARTITION BY RANGE (created_at)'
+    )
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, created_at)')
+
+    oldest = bind.execute(sa.text(f'SELECT min(created_at) FROM {legacy}')).scalar()
+    now = datetime.utcnow()
+    month = datetime((oldest or now).year, (oldest or now).month, 1)
+    last = _add_months(datetime(now.year, now.month, 1), PARTITION_MONTHS_AHEAD)
+    while month <= last:
+        end = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+        )
+        month = end
+
+    op.execute(f'INSERT INTO {table} SELECT * FROM {legacy}')
+    op.execute(f'DROP TABLE {legacy}')
+    _create_indexes(table)
+    _add_foreign_keys(table)
+
+
+def _unpartition(table: str) -> None:
+    partitioned = f'{table}_partitioned'
+
+    op.execute(f'ALTER TABLE {table} RENAME TO {partitioned}')
+    op.execute(f'ALTER TABLE {partitioned} DROP CONSTRAINT IF EXISTS {table}_pkey')
+    for name, *_ in FOREIGN_KEYS.get(table, []):
+        op.execute(f'ALTER TABLE {partitioned} DROP CONSTRAINT IF EXISTS {name}')
+    _drop_indexes(table)
+
+    op.execute(f'CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)')
+    op.execute(f'INSERT INTO {table} SELECT * FROM {partitioned}')
+    op.execute(f'DROP TABLE {partitioned} CASCADE')  # With its partitions
+    op.execute(f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)')
+    _create_indexes(table)
+    _add_foreign_keys(table)
+
+
+def upgrade() -> None:
+    """Partition async_jobs and ai_executions by month of created_at"""
+    for table in PARTITIONED_TABLES:
+        _partition(table)
+
+
+def downgrade() -> None:
+    """Turn async_jobs and ai_executions back into plain tables"""
+    for table in PARTITIONED_TABLES:
+        _unpartition(table)
@@ -0,0 +1,31 @@
+"""add_task_result_interface_summary
+
+Revision ID: 20260212000001
+Revises: 20260211000001
+Create Date: 2026-02-12 10:00:00.000000
+
+Compact interface (signatures, types, routes, schema) of a TaskResult's
+output_code, extracted when the result is saved. Dependent tasks get it in
+their execution context instead of the full code. Existing results have
+none; their summary is extracted when a dependent task needs it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260212000001'
+down_revision: Union[str, None] = '20260211000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add interface_summary to task_results"""
+    op.add_column('task_results', sa.Column('interface_summary', sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove interface_summary from task_results"""
+    op.drop_column('task_results', 'interface_summary')
@@ -0,0 +1,30 @@
+"""add_task_result_execution_metrics
+
+Revision ID: 20260213000001
+Revises: 20260212000001
+Create Date: 2026-02-13 10:00:00.000000
+
+Per-attempt execution metrics of a TaskResult: full generation or repair of
+the previous output, cached prompt tokens, cost, and the estimated savings of
+repair attempts over full regenerations. Existing results have none.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260213000001'
+down_revision: Union[str, None] = '20260212000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add execution_metrics to task_results"""
+    op.add_column('task_results', sa.Column('execution_metrics', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Remove execution_metrics from task_results"""
+    op.drop_column('task_results', 'execution_metrics')
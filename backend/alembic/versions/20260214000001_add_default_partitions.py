@@ -0,0 +1,68 @@
+"""add_default_partitions
+
+Revision ID: 20260214000001
+Revises: 20260213000001
+Create Date: 2026-02-14 10:00:00.000000
+
+DEFAULT partitions for async_jobs and ai_executions (partitioned by month
+in 20260211000001). Monthly partitions are created ahead of time by
+ensure_partitions (app/services/data_retention.py); without a DEFAULT
+partition an INSERT into a month nobody created a partition for fails.
+Rows kept here are moved to their monthly partition when it is created.
+
+Skipped for tables that are not partitioned.
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260214000001'
+down_revision: Union[str, None] = '20260213000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+PARTITIONED_TABLES = ('async_jobs', 'ai_executions')
+
+
+def _add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _is_partitioned(table: str) -> bool:
+    return op.get_bind().execute(
+        sa.text(
+            'SELECT 1 FROM pg_partitioned_table pt '
+            'JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :table'
+        ),
+        {'table': table}
+    ).first() is not None
+
+
+def upgrade() -> None:
+    """Add a DEFAULT partition to async_jobs and ai_executions"""
+    for table in PARTITIONED_TABLES:
+        if _is_partitioned(table):
+            op.execute(f'CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT')
+
+
+def downgrade() -> None:
+    """Move the rows of the DEFAULT partitions to monthly partitions and drop them"""
+    bind = op.get_bind()
+    for table in PARTITIONED_TABLES:
+        if not _is_partitioned(table):
+            continue
+        default = f'{table}_default'
+        op.execute(f'ALTER TABLE {table} DETACH PARTITION {default}')
+        months = bind.execute(sa.text(f"SELECT DISTINCT date_trunc('month', created_at) FROM {default}")).scalars().all()
+        for month in months:
+            op.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}_p{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{_add_months(month, 1):%Y-%m-%d}')"
+            )
+        op.execute(f'INSERT INTO {table} SELECT * FROM {default}')
+        op.execute(f'DROP TABLE {default}')
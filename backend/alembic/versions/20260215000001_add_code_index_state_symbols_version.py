@@ -0,0 +1,38 @@
+"""add_code_index_state_symbols_version
+
+Revision ID: 20260215000001
+Revises: 20260214000001
+Create Date: 2026-02-15 10:00:00.000000
+
+Records on code_index_states that a project's symbol table was backfilled
+(symbols_version, set after a complete indexing run). Whether any file
+symbol is stored is no proof: projects whose files yield no symbols were
+re-parsed in full on every run and never took the git-diff path.
+
+commit_sha becomes nullable: projects outside a git repository get a state
+for the backfill record alone. Existing states have no version; their next
+run backfills once.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '20260215000001'
+down_revision: Union[str, None] = '20260214000001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add symbols_version to code_index_states, make commit_sha nullable"""
+    op.add_column('code_index_states', sa.Column('symbols_version', sa.Integer(), nullable=True))
+    op.alter_column('code_index_states', 'commit_sha', existing_type=sa.String(64), nullable=True)
+
+
+def downgrade() -> None:
+    """Remove symbols_version and the states of projects outside git"""
+    op.execute('DELETE FROM code_index_states WHERE commit_sha IS NULL')
+    op.alter_column('code_index_states', 'commit_sha', existing_type=sa.String(64), nullable=False)
+    op.drop_column('code_index_states', 'symbols_version')
@@ -13,7 +13,7 @@ from datetime import datetime
 from pydantic import BaseModel
 
 from app.database import get_db
-from app.models.task import Task, ItemType, PriorityLevel
+from app.models.task import Task, ItemType, PriorityLevel, TaskStatus
 from app.models.interview import Interview
 from app.models.async_job import JobType
 from app.schemas.task import (
@@ -22,7 +22,9 @@ from app.schemas.task import (
     TaskResponse
 )
 from app.services.backlog_generator import BacklogGeneratorService
+from app.services.hierarchy_writer import HierarchyWriter
 from app.services.job_manager import JobManager
+from app.services.job_queue import job_handler
 import logging
 
 logger = logging.getLogger(__name__)
@@ -75,21 +77,16 @@ async def generate_epic_from_interview(
             "project_id": str(project_id)
         },
         project_id=project_id,
-        interview_id=interview_id
+        interview_id=interview_id,
+        handler=_generate_epic_async,
+        handler_kwargs={
+            "interview_id": interview_id,
+            "project_id": project_id
+        }
     )
 
     logger.info(f"Created backlog job {job.id} for Epic generation from interview {interview_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _generate_epic_async(
-            job_id=job.id,
-            interview_id=interview_id,
-            project_id=project_id
-        )
-    )
-
     # Return job_id immediately
     return BacklogJobResponse(
         job_id=str(job.id),
@@ -135,21 +132,16 @@ async def generate_stories_from_epic(
             "epic_id": str(epic_id),
             "project_id": str(project_id)
         },
-        project_id=project_id
+        project_id=project_id,
+        handler=_generate_stories_async,
+        handler_kwargs={
+            "epic_id": epic_id,
+            "project_id": project_id
+        }
     )
 
     logger.info(f"Created backlog job {job.id} for Story generation from Epic {epic_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _generate_stories_async(
-            job_id=job.id,
-            epic_id=epic_id,
-            project_id=project_id
-        )
-    )
-
     # Return job_id immediately
     return BacklogJobResponse(
         job_id=str(job.id),
@@ -195,21 +187,16 @@ async def generate_tasks_from_story(
             "story_id": str(story_id),
             "project_id": str(project_id)
         },
-        project_id=project_id
+        project_id=project_id,
+        handler=_generate_tasks_async,
+        handler_kwargs={
+            "story_id": story_id,
+            "project_id": project_id
+        }
     )
 
     logger.info(f"Created backlog job {job.id} for Task generation from Story {story_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _generate_tasks_async(
-            job_id=job.id,
-            story_id=story_id,
-            project_id=project_id
-        )
-    )
-
     # Return job_id immediately
     return BacklogJobResponse(
         job_id=str(job.id),
@@ -286,12 +273,13 @@ async def approve_and_create_stories(
     Body: [Story suggestion JSONs from generate-stories endpoint]
 
     User can edit suggestions before approving.
-    Creates all Stories linked to parent Epic.
+    Creates all Stories linked to parent Epic (one INSERT), after the
+    Epic's existing Stories.
     """
     try:
-        created_stories = []
+        writer = HierarchyWriter(db)
 
-        for i, suggestion in enumerate(suggestions):
+        for suggestion in suggestions:
             # PROMPT #85 - Include generated_prompt (semantic output prompt)
             story = Task(
                 id=uuid4(),
@@ -308,18 +296,12 @@ async def approve_and_create_stories(
                 generated_prompt=suggestion.get("generated_prompt"),  # PROMPT #85
                 reporter="system",
                 workflow_state="backlog",
-                order=i,
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow()
             )
+            writer.add(story)
 
-            db.add(story)
-            created_stories.append(story)
-
-        db.commit()
-
-        for story in created_stories:
-            db.refresh(story)
+        created_stories = writer.write()
 
         logger.info(f"✅ Created {len(created_stories)} Stories")
 
@@ -359,10 +341,11 @@ async def approve_and_create_tasks(
             Task.status != TaskStatus.DONE  # Don't compare with archived tasks
         ).all()
 
-        created_tasks = []
+        writer = HierarchyWriter(db)
+        created_tasks = []  # Blocked Tasks, or ids of new ones (written in one INSERT)
         blocked_tasks_count = 0
 
-        for i, suggestion in enumerate(suggestions):
+        for suggestion in suggestions:
             # PROMPT #94 FASE 4 - Check for modification attempts
             is_modification, similar_task, similarity_score = detect_modification_attempt(
                 new_task_title=suggestion["title"],
@@ -413,18 +396,13 @@ async def approve_and_create_tasks(
                 generated_prompt=suggestion.get("generated_prompt"),  # PROMPT #85
                 reporter="system",
                 workflow_state="backlog",
-                order=i,
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow()
             )
+            created_tasks.append(writer.add(task))
 
-            db.add(task)
-            created_tasks.append(task)
-
-        db.commit()
-
-        for task in created_tasks:
-            db.refresh(task)
+        new_tasks = {task.id: task for task in writer.write()}  # also commits the blocked Tasks
+        created_tasks = [new_tasks[item] if isinstance(item, UUID) else item for item in created_tasks]
 
         # PROMPT #94 FASE 4 - Log blocked tasks
         new_tasks_count = len(created_tasks) - blocked_tasks_count
@@ -539,6 +517,7 @@ async def migrate_semantic_to_human_descriptions(
 # PROMPT #108 - BACKGROUND TASK FUNCTIONS
 # ============================================================================
 
+@job_handler
 async def _generate_epic_async(
     job_id: UUID,
     interview_id: UUID,
@@ -585,6 +564,7 @@ async def _generate_epic_async(
         db.close()
 
 
+@job_handler
 async def _generate_stories_async(
     job_id: UUID,
     epic_id: UUID,
@@ -634,6 +614,7 @@ async def _generate_stories_async(
         db.close()
 
 
+@job_handler
 async def _generate_tasks_async(
     job_id: UUID,
     story_id: UUID,
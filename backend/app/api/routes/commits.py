@@ -17,6 +17,7 @@ from app.models.async_job import JobType
 from app.schemas.commit import CommitCreate, CommitResponse, CommitManualGenerateRequest
 from app.api.dependencies import get_commit_or_404
 from app.services.job_manager import JobManager
+from app.services.job_queue import job_handler
 import logging
 
 logger = logging.getLogger(__name__)
@@ -237,21 +238,16 @@ async def auto_generate_commit(
             "chat_session_id": str(chat_session_id),
             "task_id": str(session.task_id)
         },
-        project_id=session.project_id if hasattr(session, 'project_id') else None
+        project_id=session.project_id if hasattr(session, 'project_id') else None,
+        handler=_generate_commit_auto_async,
+        handler_kwargs={
+            "task_id": session.task_id,
+            "chat_session_id": chat_session_id
+        }
     )
 
     logger.info(f"Created commit generation job {job.id} for chat session {chat_session_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _generate_commit_auto_async(
-            job_id=job.id,
-            task_id=session.task_id,
-            chat_session_id=chat_session_id
-        )
-    )
-
     # Return job_id immediately
     return CommitJobResponse(
         job_id=str(job.id),
@@ -303,21 +299,16 @@ async def generate_manual_commit(
             "task_id": str(task_id),
             "description": commit_request.description
         },
-        project_id=task.project_id
+        project_id=task.project_id,
+        handler=_generate_commit_manual_async,
+        handler_kwargs={
+            "task_id": task_id,
+            "description": commit_request.description
+        }
     )
 
     logger.info(f"Created manual commit generation job {job.id} for task {task_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _generate_commit_manual_async(
-            job_id=job.id,
-            task_id=task_id,
-            description=commit_request.description
-        )
-    )
-
     # Return job_id immediately
     return CommitJobResponse(
         job_id=str(job.id),
@@ -330,6 +321,7 @@ async def generate_manual_commit(
 # PROMPT #108 - BACKGROUND TASK FUNCTIONS
 # ============================================================================
 
+@job_handler
 async def _generate_commit_auto_async(
     job_id: UUID,
     task_id: UUID,
@@ -386,6 +378,7 @@ async def _generate_commit_auto_async(
         db.close()
 
 
+@job_handler
 async def _generate_commit_manual_async(
     job_id: UUID,
     task_id: UUID,
@@ -14,7 +14,6 @@ from typing import Dict, Any
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified  # PROMPT #99: JSONB change detection
 from fastapi import HTTPException, status
 import logging
 import os
@@ -23,6 +22,7 @@ from app.models.interview import Interview
 from app.models.project import Project
 from app.services.ai_orchestrator import AIOrchestrator
 from app.services.interview_question_deduplicator import InterviewQuestionDeduplicator
+from app.services.interview_messages import InterviewMessageStore
 from app.api.routes.interviews.option_parser import parse_ai_question_options  # PROMPT #99: Parse AI options
 
 # Prompter Architecture
@@ -154,8 +154,7 @@ async def handle_orchestrator_interview(
             )
 
         # Add fixed question to conversation
-        interview.conversation_data.append(assistant_message)
-        flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+        interview.add_message(assistant_message)
 
         # PROMPT #97 - Store question in RAG for cross-interview deduplication
         try:
@@ -283,7 +282,7 @@ async def handle_meta_prompt_interview(
     elif message_count == 35:
         # User just answered Q18 (topic selection)
         # Extract topics and save them
-        user_answer = interview.conversation_data[-1]["content"]
+        user_answer = InterviewMessageStore(db).recent(interview.id, 1)[-1]["content"]
         focus_topics = _extract_focus_topics(user_answer)
 
         logger.info(f"Extracted focus_topics: {focus_topics}")
@@ -432,8 +431,7 @@ async def handle_task_focused_interview(
                 detail="Failed to get task type question"
             )
 
-        interview.conversation_data.append(assistant_message)
-        flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+        interview.add_message(assistant_message)
 
         # PROMPT #97 - Store question in RAG for cross-interview deduplication
         try:
@@ -469,7 +467,7 @@ async def handle_task_focused_interview(
     elif message_count == 3:
         # User just answered Q1 (task type)
         # Extract task type and save it
-        user_answer = interview.conversation_data[-1]["content"]
+        user_answer = InterviewMessageStore(db).recent(interview.id, 1)[-1]["content"]
         task_type = extract_task_type_func(user_answer)
 
         logger.info(f"Extracted task_type: {task_type}")
@@ -525,8 +523,7 @@ def _handle_fixed_question(
             detail=f"Failed to get fixed question {question_number}"
         )
 
-    interview.conversation_data.append(assistant_message)
-    flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+    interview.add_message(assistant_message)
 
     db.commit()
     db.refresh(interview)
@@ -760,8 +757,7 @@ async def _execute_ai_question(
             logger.info(f"✅ Added structured {parsed_options['question_type']} with {len(parsed_options['options']['choices'])} options")
 
         # Append to conversation
-        interview.conversation_data.append(assistant_message)
-        flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+        interview.add_message(assistant_message)
         interview.ai_model_used = response["model"]
 
         db.commit()
@@ -893,9 +889,7 @@ def _handle_fixed_question_meta(
             detail=f"Failed to get fixed meta prompt question {question_number}"
         )
 
-    interview.conversation_data.append(assistant_message)
-    flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
-    flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+    interview.add_message(assistant_message)
 
     # PROMPT #97 - Store question in RAG for cross-interview deduplication
     try:
@@ -1633,8 +1627,7 @@ async def handle_task_orchestrated_interview(
             )
 
         # Add fixed question to conversation
-        interview.conversation_data.append(assistant_message)
-        flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+        interview.add_message(assistant_message)
 
         db.commit()
         db.refresh(interview)
@@ -1732,8 +1725,7 @@ async def handle_subtask_orchestrated_interview(
             )
 
         # Add fixed question to conversation
-        interview.conversation_data.append(assistant_message)
-        flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+        interview.add_message(assistant_message)
 
         db.commit()
         db.refresh(interview)
@@ -1854,8 +1846,7 @@ async def handle_card_focused_interview(
             interview.motivation_type = previous_answers['q1'].lower()
 
         # Add fixed question to conversation
-        interview.conversation_data.append(assistant_message)
-        flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+        interview.add_message(assistant_message)
 
         db.commit()
         db.refresh(interview)
@@ -1955,8 +1946,7 @@ async def _handle_card_focused_ai_question(
     }
 
     # Add to conversation
-    interview.conversation_data.append(assistant_message)
-    flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+    interview.add_message(assistant_message)
 
     db.commit()
     db.refresh(interview)
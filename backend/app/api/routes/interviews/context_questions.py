@@ -274,7 +274,7 @@ Foque em detalhes que complementem o que já foi descoberto.
     return system_prompt
 
 
-def should_end_context_interview(conversation_data: list) -> bool:
+def should_end_context_interview(message_count: int) -> bool:
     """
     PROMPT #93 - Context interview is UNLIMITED.
 
@@ -282,7 +282,7 @@ def should_end_context_interview(conversation_data: list) -> bool:
     This function always returns False - the interview never ends automatically.
 
     Args:
-        conversation_data: Current conversation
+        message_count: Messages in the conversation (Interview.message_count)
 
     Returns:
         Always False - user decides when to end
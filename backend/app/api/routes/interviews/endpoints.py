@@ -11,7 +11,6 @@ HTTP endpoints for interview management:
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
 from typing import List, Optional
 from uuid import UUID
 from datetime import datetime
@@ -30,6 +29,7 @@ from app.schemas.interview import (
     InterviewUpdate,
     InterviewResponse,
     InterviewMessageCreate,
+    InterviewMessagePage,
     StackConfiguration,
     ProjectInfoUpdate
 )
@@ -38,6 +38,8 @@ from app.api.dependencies import get_interview_or_404
 # Services
 from app.services.provisioning import ProvisioningService
 from app.services.project_state_detector import ProjectStateDetector
+from app.services.interview_messages import InterviewMessageStore
+from app.services.job_queue import job_handler
 # PROMPT #103 - External prompts support
 from app.prompts import get_prompt_service
 from app.api.routes.interview_handlers import (
@@ -327,6 +329,27 @@ async def delete_interview(
     return None
 
 
+@router.get("/{interview_id}/messages", response_model=InterviewMessagePage)
+async def list_interview_messages(
+    after: Optional[int] = Query(None, ge=-1, description="Return messages after this seq"),
+    before: Optional[int] = Query(None, ge=0, description="Return the messages right before this seq"),
+    limit: int = Query(50, ge=1, le=200, description="Page size"),
+    interview: Interview = Depends(get_interview_or_404),
+    db: Session = Depends(get_db)
+):
+    """
+    Page through an interview's conversation without loading all of it.
+
+    - **after**: Forward paging cursor (omit to start at the first message)
+    - **before**: Backward paging cursor (e.g. the oldest seq on screen when scrolling up)
+    - **limit**: Messages per page (max 200)
+    """
+    messages, next_cursor = InterviewMessageStore(db).page(
+        interview.id, after=after, before=before, limit=limit
+    )
+    return {"messages": messages, "next_cursor": next_cursor, "total": interview.message_count}
+
+
 @router.post("/{interview_id}/messages", response_model=InterviewResponse)
 async def add_message_to_interview(
     message_request: MessageRequest,
@@ -341,13 +364,7 @@ async def add_message_to_interview(
     - **interview_id**: UUID of the interview
     - **message**: Message object to add to conversation_data
     """
-    if not isinstance(interview.conversation_data, list):
-        interview.conversation_data = []
-
-    interview.conversation_data.append(message_request.message)
-
-    # Mark the conversation_data as modified for SQLAlchemy to detect the change
-    flag_modified(interview, "conversation_data")  # PROMPT #99: SQLAlchemy JSONB fix
+    interview.add_message(message_request.message)  # one interview_messages row
 
     db.flush()
     db.commit()
@@ -360,18 +377,16 @@ async def add_message_to_interview(
 
             rag_service = RAGService(db)
 
-            # Find the previous assistant message (the question)
+            # Find the previous assistant message (the question) in the tail of the conversation
             question_content = None
-            if len(interview.conversation_data) >= 2:
-                # Look backwards for last assistant message
-                for msg in reversed(interview.conversation_data[:-1]):
-                    if msg.get("role") == "assistant":
-                        question_content = msg.get("content", "")
-                        break
+            for msg in reversed(InterviewMessageStore(db).recent(interview.id, 10)[:-1]):
+                if msg.get("role") == "assistant":
+                    question_content = msg.get("content", "")
+                    break
 
             # Index the answer with metadata
             user_content = message_request.message.get("content", "")
-            message_count = len(interview.conversation_data)
+            message_count = interview.message_count
             question_number = (message_count - 1) // 2  # Approximate question number
 
             rag_service.store(
@@ -485,21 +500,16 @@ async def generate_prompts_async(
             "project_id": str(interview.project_id)
         },
         project_id=interview.project_id,
-        interview_id=interview_id
+        interview_id=interview_id,
+        handler=_generate_backlog_async,
+        handler_kwargs={
+            "interview_id": interview_id,
+            "project_id": interview.project_id
+        }
     )
 
     logger.info(f"Created async job {job.id} for backlog generation from interview {interview_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _generate_backlog_async(
-            job_id=job.id,
-            interview_id=interview_id,
-            project_id=interview.project_id
-        )
-    )
-
     # Return job_id immediately
     return {
         "job_id": str(job.id),
@@ -508,6 +518,7 @@ async def generate_prompts_async(
     }
 
 
+@job_handler
 async def _generate_backlog_async(
     job_id: UUID,
     interview_id: UUID,
@@ -522,10 +533,16 @@ async def _generate_backlog_async(
     - Decompose to Tasks (15-50): ~1-3 min
 
     Updates job progress at each step.
+
+    With HIERARCHY_STREAMING, Stories and Tasks are written (in small batches)
+    and emitted on the project WebSocket as the AI produces them.
     """
+    from app.config import settings
     from app.database import SessionLocal
     from app.services.job_manager import JobManager
     from app.services.backlog_generator import BacklogGeneratorService
+    from app.services.hierarchy_stream import HierarchyBatchWriter
+    from app.services.hierarchy_writer import HierarchyWriter
     from uuid import uuid4
 
     # Create new DB session
@@ -579,14 +596,8 @@ async def _generate_backlog_async(
         job_manager.update_progress(job_id, 35.0, "Decomposing Epic into Stories...")
         logger.info(f"📋 Decomposing Epic {epic.id} into Stories")
 
-        stories_suggestions = await generator.decompose_epic_to_stories(
-            epic_id=epic.id,
-            project_id=project_id
-        )
-
-        created_stories = []
-        for i, story_suggestion in enumerate(stories_suggestions):
-            story = Task(
+        def build_story(story_suggestion: dict, order: int) -> Task:
+            return Task(
                 id=uuid4(),
                 project_id=project_id,
                 created_from_interview_id=interview_id,
@@ -602,20 +613,59 @@ async def _generate_backlog_async(
                 reporter="system",
                 workflow_state="backlog",
                 status=TaskStatus.BACKLOG,
-                order=i,
+                order=order,
                 created_at=datetime.utcnow(),
                 updated_at=datetime.utcnow()
             )
-            db.add(story)
-            created_stories.append(story)
 
-            # Update progress after each story
-            progress = 35.0 + (i + 1) / len(stories_suggestions) * 25.0
-            job_manager.update_progress(job_id, progress, f"Created Story {i+1}/{len(stories_suggestions)}")
+        def build_task(task_suggestion: dict, story: Task, order: int) -> Task:
+            return Task(
+                id=uuid4(),
+                project_id=project_id,
+                created_from_interview_id=interview_id,
+                parent_id=story.id,
+                title=task_suggestion["title"],
+                description=task_suggestion["description"],
+                item_type=ItemType.TASK,
+                priority=PriorityLevel[task_suggestion["priority"].upper()],
+                story_points=task_suggestion.get("story_points"),
+                acceptance_criteria=task_suggestion.get("acceptance_criteria", []),
+                generation_context=task_suggestion.get("_metadata", {}),
+                reporter="system",
+                workflow_state="backlog",
+                status=TaskStatus.BACKLOG,
+                order=order,
+                created_at=datetime.utcnow(),
+                updated_at=datetime.utcnow()
+            )
 
-        db.commit()
-        for story in created_stories:
-            db.refresh(story)
+        created_stories = []
+        if settings.hierarchy_streaming:
+            writer = HierarchyBatchWriter(db, project_id, job_id=job_id)
+
+            async def add_story(story_suggestion: dict):
+                story = build_story(story_suggestion, len(created_stories))
+                created_stories.append(story)
+                await writer.add(story)
+                job_manager.update_progress(job_id, 35.0, f"Created Story {len(created_stories)}: {story.title}")
+
+            await generator.decompose_epic_to_stories(
+                epic_id=epic.id,
+                project_id=project_id,
+                on_item=add_story
+            )
+            await writer.finish()
+        else:
+            stories_suggestions = await generator.decompose_epic_to_stories(
+                epic_id=epic.id,
+                project_id=project_id
+            )
+
+            # One INSERT for all Stories
+            bulk = HierarchyWriter(db)
+            for i, story_suggestion in enumerate(stories_suggestions):
+                bulk.add(build_story(story_suggestion, i))
+            created_stories = bulk.write()
 
         logger.info(f"✅ Created {len(created_stories)} Stories")
         job_manager.update_progress(job_id, 60.0, f"Created {len(created_stories)} Stories")
@@ -632,38 +682,32 @@ async def _generate_backlog_async(
                 f"Decomposing Story {story_idx+1}/{total_stories} into Tasks..."
             )
 
+            if settings.hierarchy_streaming:
+                story_tasks = []
+
+                async def add_task(task_suggestion: dict):
+                    task = build_task(task_suggestion, story, len(story_tasks))
+                    story_tasks.append(task)
+                    await writer.add(task)
+
+                await generator.decompose_story_to_tasks(
+                    story_id=story.id,
+                    project_id=project_id,
+                    on_item=add_task
+                )
+                await writer.flush()
+                all_created_tasks.extend(story_tasks)
+                continue
+
             tasks_suggestions = await generator.decompose_story_to_tasks(
                 story_id=story.id,
                 project_id=project_id
             )
 
+            bulk = HierarchyWriter(db)
             for i, task_suggestion in enumerate(tasks_suggestions):
-                task = Task(
-                    id=uuid4(),
-                    project_id=project_id,
-                    created_from_interview_id=interview_id,
-                    parent_id=story.id,
-                    title=task_suggestion["title"],
-                    description=task_suggestion["description"],
-                    item_type=ItemType.TASK,
-                    priority=PriorityLevel[task_suggestion["priority"].upper()],
-                    story_points=task_suggestion.get("story_points"),
-                    acceptance_criteria=task_suggestion.get("acceptance_criteria", []),
-                    generation_context=task_suggestion.get("_metadata", {}),
-                    reporter="system",
-                    workflow_state="backlog",
-                    status=TaskStatus.BACKLOG,
-                    order=i,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow()
-                )
-                db.add(task)
-                all_created_tasks.append(task)
-
-            db.commit()
-
-        for task in all_created_tasks:
-            db.refresh(task)
+                bulk.add(build_task(task_suggestion, story, i))
+            all_created_tasks.extend(bulk.write())
 
         total_items = 1 + len(created_stories) + len(all_created_tasks)
 
@@ -752,21 +796,16 @@ async def generate_task_direct(
             "task_type": interview.task_type_selection or "feature"
         },
         project_id=interview.project_id,
-        interview_id=interview_id
+        interview_id=interview_id,
+        handler=_generate_task_direct_async,
+        handler_kwargs={
+            "interview_id": interview_id,
+            "project_id": interview.project_id
+        }
     )
 
     logger.info(f"Created async job {job.id} for direct task generation from interview {interview_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _generate_task_direct_async(
-            job_id=job.id,
-            interview_id=interview_id,
-            project_id=interview.project_id
-        )
-    )
-
     # Return job_id immediately
     return {
         "job_id": str(job.id),
@@ -775,6 +814,7 @@ async def generate_task_direct(
     }
 
 
+@job_handler
 async def _generate_task_direct_async(
     job_id: UUID,
     interview_id: UUID,
@@ -1020,21 +1060,16 @@ async def generate_hierarchy_from_meta_prompt(
             "mode": "meta_prompt"  # Distinguish from legacy backlog generation
         },
         project_id=interview.project_id,
-        interview_id=interview_id
+        interview_id=interview_id,
+        handler=_generate_hierarchy_from_meta_async,
+        handler_kwargs={
+            "interview_id": interview_id,
+            "project_id": interview.project_id
+        }
     )
 
     logger.info(f"Created async job {job.id} for {interview.interview_mode} hierarchy generation from interview {interview_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _generate_hierarchy_from_meta_async(
-            job_id=job.id,
-            interview_id=interview_id,
-            project_id=interview.project_id
-        )
-    )
-
     # Return job_id immediately
     return {
         "job_id": str(job.id),
@@ -1043,6 +1078,7 @@ async def generate_hierarchy_from_meta_prompt(
     }
 
 
+@job_handler
 async def _generate_hierarchy_from_meta_async(
     job_id: UUID,
     interview_id: UUID,
@@ -1075,8 +1111,8 @@ async def _generate_hierarchy_from_meta_async(
         # Update progress: Loading interview
         job_manager.update_progress(
             job_id=job_id,
-            progress=10,
-            message="Loading meta prompt interview..."
+            progress_percent=10,
+            progress_message="Loading meta prompt interview..."
         )
 
         # Load interview and project
@@ -1089,15 +1125,16 @@ async def _generate_hierarchy_from_meta_async(
         # Update progress: Processing with AI
         job_manager.update_progress(
             job_id=job_id,
-            progress=20,
-            message="Analyzing meta prompt responses and generating hierarchy with AI..."
+            progress_percent=20,
+            progress_message="Analyzing meta prompt responses and generating hierarchy with AI..."
         )
 
         # Generate hierarchy via MetaPromptProcessor
         processor = MetaPromptProcessor(db)
         result = await processor.generate_complete_hierarchy(
             interview_id=interview_id,
-            project_id=project_id
+            project_id=project_id,
+            job_id=job_id
         )
 
         logger.info(f"✅ Hierarchy generated: {result['metadata']['total_items']} items created")
@@ -1105,8 +1142,8 @@ async def _generate_hierarchy_from_meta_async(
         # Update progress: Complete
         job_manager.update_progress(
             job_id=job_id,
-            progress=100,
-            message="Hierarchy created successfully!"
+            progress_percent=100,
+            progress_message="Hierarchy created successfully!"
         )
 
         # Complete job with result
@@ -1211,8 +1248,7 @@ async def start_interview(
         )
 
     # Add Question 1 to conversation
-    interview.conversation_data.append(assistant_message)
-    flag_modified(interview, "conversation_data")
+    interview.add_message(assistant_message)
 
     # Set model from AI response
     interview.ai_model_used = assistant_message.get("model", "ai/open-ended")
@@ -1429,20 +1465,15 @@ async def save_interview_stack_async(
             }
         },
         project_id=project.id,
-        interview_id=interview_id
+        interview_id=interview_id,
+        handler=_provision_project_async,
+        handler_kwargs={
+            "project_id": project.id
+        }
     )
 
     logger.info(f"Created provisioning job {job.id} for project {project.name}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _provision_project_async(
-            job_id=job.id,
-            project_id=project.id
-        )
-    )
-
     return {
         "job_id": str(job.id),
         "status": "pending",
@@ -1450,6 +1481,7 @@ async def save_interview_stack_async(
     }
 
 
+@job_handler
 async def _provision_project_async(
     job_id: UUID,
     project_id: UUID
@@ -1600,8 +1632,7 @@ async def send_message_to_interview(
         "content": message.content,
         "timestamp": datetime.utcnow().isoformat()
     }
-    interview.conversation_data.append(user_message)
-    flag_modified(interview, "conversation_data")  # CRITICAL: SQLAlchemy needs this for JSONB changes
+    interview.add_message(user_message)
     db.flush()  # PROMPT #99: Flush first to write to DB
 
     # DEBUG: Log state after adding user message
@@ -1923,8 +1954,7 @@ async def send_message_async(
         "content": message.content,
         "timestamp": datetime.utcnow().isoformat()
     }
-    interview.conversation_data.append(user_message)
-    flag_modified(interview, "conversation_data")  # CRITICAL: SQLAlchemy needs this for JSONB changes
+    interview.add_message(user_message)
     db.flush()  # PROMPT #99: Flush first to write to DB
     db.commit()  # PROMPT #99: Then commit the transaction
     db.refresh(interview)  # PROMPT #99: Refresh to ensure data is synced
@@ -1940,21 +1970,16 @@ async def send_message_async(
             "message_content": message.content
         },
         project_id=interview.project_id,
-        interview_id=interview_id
+        interview_id=interview_id,
+        handler=_process_interview_message_async,
+        handler_kwargs={
+            "interview_id": interview_id,
+            "message_content": message.content
+        }
     )
 
     logger.info(f"Created async job {job.id} for interview {interview_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _process_interview_message_async(
-            job_id=job.id,
-            interview_id=interview_id,
-            message_content=message.content
-        )
-    )
-
     # Return job_id immediately
     return {
         "job_id": str(job.id),
@@ -1963,6 +1988,7 @@ async def send_message_async(
     }
 
 
+@job_handler
 async def _process_interview_message_async(
     job_id: UUID,
     interview_id: UUID,
@@ -15,7 +15,6 @@ from typing import Dict, Any, Optional
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy.orm.attributes import flag_modified
 from fastapi import HTTPException, status
 import logging
 
@@ -24,6 +23,8 @@ from app.models.project import Project
 from app.models.task import Task
 from app.services.ai_orchestrator import AIOrchestrator
 from app.services.interview_question_deduplicator import InterviewQuestionDeduplicator
+from app.services.interview_messages import InterviewMessageStore
+from app.services.interview_summarizer import InterviewSummarizer
 # PROMPT #103 - External prompts support
 from app.prompts import get_prompt_service
 from app.prompts.loader import PromptLoader
@@ -37,7 +38,7 @@ from app.api.routes.interviews.context_questions import (
     get_context_ai_prompt,
     should_end_context_interview
 )
-# PROMPT #82: prepare_interview_context NO LONGER used for interviews (full context always sent)
+# PROMPT #82: prepare_interview_context NO LONGER used for interviews (see InterviewSummarizer)
 
 logger = logging.getLogger(__name__)
 
@@ -156,8 +157,7 @@ async def handle_unified_open_interview(
             fixed_question = get_context_fixed_question(question_number, project, db)
             if fixed_question:
                 # Append to conversation
-                interview.conversation_data.append(fixed_question)
-                flag_modified(interview, "conversation_data")
+                interview.add_message(fixed_question)
                 interview.ai_model_used = "system/fixed-question-context"
 
                 db.commit()
@@ -172,7 +172,7 @@ async def handle_unified_open_interview(
                 }
 
         # Check if interview should end
-        if should_end_context_interview(interview.conversation_data):
+        if should_end_context_interview(interview.message_count):
             logger.info(f"✅ Context Interview complete - generating summary")
             # Return completion message
             completion_message = {
@@ -188,8 +188,7 @@ async def handle_unified_open_interview(
                 "is_complete": True
             }
 
-            interview.conversation_data.append(completion_message)
-            flag_modified(interview, "conversation_data")
+            interview.add_message(completion_message)
 
             db.commit()
             db.refresh(interview)
@@ -203,20 +202,13 @@ async def handle_unified_open_interview(
         # After fixed questions, use AI to generate contextual questions
         logger.info(f"📋 Context Interview - generating AI contextual question (Q{question_number})")
 
-    # Extract previous answers from conversation
-    previous_answers = {}
-    for i, msg in enumerate(interview.conversation_data):
-        if msg.get('role') == 'user':
-            question_num = (i + 1) // 2
-            previous_answers[f'q{question_num}'] = msg.get('content', '')
-
     # Build system prompt
+    # (previous answers reach the AI through the messages and the conversation summary)
     system_prompt = build_unified_open_prompt(
         project=project,
         interview=interview,
         message_count=message_count,
-        parent_task=parent_task,
-        previous_answers=previous_answers
+        parent_task=parent_task
     )
 
     # PROMPT #82 - Retrieve previous questions from RAG for deduplication (IMPROVED)
@@ -229,7 +221,7 @@ async def handle_unified_open_interview(
         # PROMPT #82 - Build semantic query from interview context (not empty!)
         interview_context_query = f"""Projeto: {project.name}
 Descrição: {project.description}
-Progresso: {len(interview.conversation_data) // 2} perguntas feitas"""
+Progresso: {interview.message_count // 2} perguntas feitas"""
 
         previous_questions = rag_service.retrieve(
             query=interview_context_query,  # ✅ Semantic context!
@@ -270,13 +262,11 @@ Gere uma pergunta DIFERENTE das acima.
         logger.info(f"📋 RAG context added to system_prompt ({len(previous_questions_context)} chars)")
         system_prompt = previous_questions_context + "\n\n" + system_prompt
 
-    # PROMPT #82 - INTERVIEWS: Always send FULL context (no summarization)
-    # Interviews are short (~15-20 questions = ~40 messages)
-    # Cost increase is minimal, context quality is critical to avoid question repetition
-    messages = [
-        {"role": msg["role"], "content": msg["content"]}
-        for msg in interview.conversation_data
-    ]
+    # Recent turns verbatim + rolling summary and key facts of the older ones
+    # (full conversation when INTERVIEW_SUMMARIZATION is off)
+    summarizer = InterviewSummarizer(db)
+    messages, conversation_memory = summarizer.build_context(interview)
+    system_prompt += conversation_memory
 
     logger.info(f"📝 Interview context: {len(messages)} messages, system_prompt: {len(system_prompt)} chars")
 
@@ -288,7 +278,7 @@ Gere uma pergunta DIFERENTE das acima.
     try:
         response = await orchestrator.execute(
             usage_type="interview",
-            messages=messages,  # PROMPT #82 - Full context (not summarized)
+            messages=messages,
             system_prompt=system_prompt,
             max_tokens=1500,  # PROMPT #109 - Increased from 1000 to prevent truncation
             project_id=interview.project_id,
@@ -330,13 +320,15 @@ Gere uma pergunta DIFERENTE das acima.
             }
 
         # Append to conversation
-        interview.conversation_data.append(assistant_message)
-        flag_modified(interview, "conversation_data")
+        interview.add_message(assistant_message)
         interview.ai_model_used = response["model"]
 
         db.commit()
         db.refresh(interview)
 
+        # Fold older turns into the summary in the background (ready for a later turn)
+        summarizer.schedule(interview)
+
         # Store question in RAG for deduplication
         try:
             deduplicator = InterviewQuestionDeduplicator(db)
@@ -368,7 +360,7 @@ Gere uma pergunta DIFERENTE das acima.
 
         # Get last user response for context
         last_user_response = ""
-        for msg in reversed(interview.conversation_data):
+        for msg in reversed(InterviewMessageStore(db).recent(interview.id, 10)):
             if msg.get('role') == 'user':
                 last_user_response = msg.get('content', '')[:100]
                 break
@@ -402,8 +394,7 @@ Gere uma pergunta DIFERENTE das acima.
         }
 
         # Save fallback message to conversation
-        interview.conversation_data.append(fallback_message)
-        flag_modified(interview, "conversation_data")
+        interview.add_message(fallback_message)
         interview.ai_model_used = "system/fallback"
 
         db.commit()
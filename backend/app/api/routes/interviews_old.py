@@ -849,7 +849,7 @@ async def add_message_to_interview(
     if not isinstance(interview.conversation_data, list):
         interview.conversation_data = []
 
-    interview.conversation_data.append(message_request.message)
+    interview.add_message(message_request.message)
 
     # Mark the conversation_data as modified for SQLAlchemy to detect the change
 
@@ -1450,7 +1450,7 @@ async def start_interview(
         )
 
     # Add Question 1 to conversation
-    interview.conversation_data.append(assistant_message)
+    interview.add_message(assistant_message)
 
     # Set model to indicate fixed question (no AI)
     interview.ai_model_used = "system/fixed-questions"
@@ -1875,7 +1875,7 @@ async def send_message_to_interview(
         "content": message.content,
         "timestamp": datetime.utcnow().isoformat()
     }
-    interview.conversation_data.append(user_message)
+    interview.add_message(user_message)
 
     # DEBUG: Log state after adding user message
     logger.info(f"🔍 DEBUG - After adding user message:")
@@ -2335,7 +2335,7 @@ async def _process_interview_message_async(
             "content": message_content,
             "timestamp": datetime.utcnow().isoformat()
         }
-        interview.conversation_data.append(user_message)
+        interview.add_message(user_message)
         db.commit()
 
         logger.info(f"Added user message to interview {interview_id}")
@@ -2362,7 +2362,7 @@ async def _process_interview_message_async(
                 job_manager.fail_job(job_id, f"Failed to get fixed question {question_number}")
                 return
 
-            interview.conversation_data.append(assistant_message)
+            interview.add_message(assistant_message)
             db.commit()
 
             # Complete job with result
@@ -2431,7 +2431,7 @@ Continue com próxima pergunta relevante!
                 "model": f"{response['provider']}/{response['model']}"
             }
 
-            interview.conversation_data.append(assistant_message)
+            interview.add_message(assistant_message)
             interview.ai_model_used = response["model"]
             db.commit()
 
@@ -3,23 +3,36 @@ Async Jobs API Router
 CRUD operations for tracking background job status.
 
 PROMPT #65 - Async Job System
-Allows clients to poll job status instead of blocking on long operations.
+Allows clients to follow job status instead of blocking on long operations:
+pushed via GET /jobs/{job_id}/events (SSE) or the project WebSocket, with
+GET /jobs/{job_id} polling as the fallback.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
+import json
 import logging
 
 from app.database import get_db
 from app.models.async_job import AsyncJob, JobStatus
+from app.services.job_events import JobEventType, TERMINAL_STATUSES, job_event, job_events
 from app.services.job_manager import JobManager
 from app.services.job_cleanup import JobCleanupService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Seconds between SSE keepalive comments (keeps proxies from closing idle streams)
+SSE_HEARTBEAT_SECONDS = 15
+
+
+def _sse(event: dict) -> str:
+    """Format a job event as a Server-Sent Event."""
+    return f"event: {event['event']}\ndata: {json.dumps(event, default=str)}\n\n"
+
 
 @router.get("/{job_id}")
 async def get_job_status(
@@ -29,7 +42,8 @@ async def get_job_status(
     """
     Get the status of an async job.
 
-    Clients should poll this endpoint periodically (every 1-2 seconds)
+    Fallback for clients that cannot use GET /jobs/{job_id}/events (SSE)
+    or the project WebSocket: poll periodically (every 1-2 seconds)
     to check if a background job has completed.
 
     Args:
@@ -79,6 +93,65 @@ async def get_job_status(
     return job.to_dict()
 
 
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: UUID,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """
+    Stream an async job's status as Server-Sent Events (replaces polling).
+
+    The first event is a "snapshot" of the current state; then one event
+    per change ("started", "progress", "completed", "failed", "cancelled")
+    until the job finishes, when the stream ends. Only the snapshot and
+    "completed" events carry the result.
+
+    Args:
+        job_id: UUID of the async job
+
+    Returns:
+        text/event-stream response
+
+    Example:
+        const source = new EventSource(`/api/v1/jobs/${jobId}/events`)
+        source.addEventListener("progress", e => show(JSON.parse(e.data)))
+        source.addEventListener("completed", e => { use(JSON.parse(e.data).result); source.close() })
+    """
+    # Subscribe before reading the state, so no change falls in between
+    subscription = job_events.subscribe(job_id=job_id)
+
+    job = db.query(AsyncJob).filter(AsyncJob.id == job_id).first()
+    if not job:
+        subscription.close()
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+    snapshot = job_event(job, JobEventType.SNAPSHOT)
+
+    async def events():
+        with subscription:
+            yield _sse(snapshot)
+            if snapshot["status"] in TERMINAL_STATUSES:
+                return
+
+            while not await request.is_disconnected():
+                event = await subscription.get(timeout=SSE_HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": keepalive\n\n"
+                    continue
+                yield _sse(event)
+                if event["status"] in TERMINAL_STATUSES:
+                    return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job(
     job_id: UUID,
@@ -3,7 +3,7 @@ ProjectAnalyses API Router
 Endpoints for uploading projects, analyzing them, and generating orchestrators
 """
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, BackgroundTasks, Query, status
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List, Optional
@@ -11,7 +11,8 @@ from uuid import UUID, uuid4
 from datetime import datetime
 import logging
 
-from app.database import get_db
+from app.database import get_db, SessionLocal
+from app.models.async_job import JobType
 from app.models.project_analysis import ProjectAnalysis
 from app.models.project import Project
 from app.schemas.project_analysis import (
@@ -28,8 +29,11 @@ from app.services.file_processor import FileProcessor
 from app.services.stack_detector import StackDetector
 from app.services.convention_extractor import ConventionExtractor
 from app.services.pattern_recognizer import PatternRecognizer
+from app.services.fs_snapshot import get_snapshot_service
 from app.services.orchestrator_generator import OrchestratorGenerator
 from app.services.orchestrator_manager import OrchestratorManager
+from app.services.job_manager import JobManager
+from app.services.job_queue import job_handler
 
 logger = logging.getLogger(__name__)
 
@@ -89,15 +93,18 @@ async def process_analysis_background(
         analysis.extraction_path = str(extraction_path)
         db.commit()
 
+        # One walk of the extracted tree for every analysis step
+        snapshot = get_snapshot_service().refresh(extraction_path)
+
         # Build file tree
         logger.info("  Building file tree...")
-        file_structure = file_processor.build_file_tree(extraction_path)
+        file_structure = file_processor.build_file_tree(extraction_path, snapshot=snapshot)
         analysis.file_structure = file_structure
         db.commit()
 
         # Detect stack
         logger.info("  Detecting stack...")
-        stack_result = stack_detector.detect(extraction_path)
+        stack_result = stack_detector.detect(extraction_path, snapshot=snapshot)
 
         analysis.detected_stack = stack_result["detected_stack"]
         analysis.confidence_score = stack_result["confidence"]
@@ -109,7 +116,8 @@ async def process_analysis_background(
         logger.info("  Extracting conventions with AI...")
         conventions = await convention_extractor.extract(
             extraction_path,
-            stack_result["detected_stack"]
+            stack_result["detected_stack"],
+            snapshot=snapshot
         )
 
         analysis.conventions = conventions
@@ -119,7 +127,8 @@ async def process_analysis_background(
         logger.info("  Recognizing patterns with AI...")
         patterns = await pattern_recognizer.recognize(
             extraction_path,
-            stack_result["detected_stack"]
+            stack_result["detected_stack"],
+            snapshot=snapshot
         )
 
         analysis.patterns = patterns
@@ -147,9 +156,41 @@ async def process_analysis_background(
             logger.error(f"Failed to cleanup files: {e}")
 
 
+@job_handler
+async def _process_analysis_job(
+    job_id: UUID,
+    analysis_id: UUID,
+    file_path: str
+):
+    """
+    PROJECT_ANALYSIS job: process an uploaded project (own DB session).
+
+    Args:
+        job_id: AsyncJob ID
+        analysis_id: ProjectAnalysis to process
+        file_path: Uploaded archive
+    """
+    db = SessionLocal()
+    try:
+        job_manager = JobManager(db)
+        job_manager.start_job(job_id)
+
+        await process_analysis_background(analysis_id, file_path, db)
+
+        analysis = db.query(ProjectAnalysis).filter(ProjectAnalysis.id == analysis_id).first()
+        if analysis is not None and analysis.status == "completed":
+            job_manager.complete_job(job_id, {
+                "analysis_id": str(analysis_id),
+                "detected_stack": analysis.detected_stack
+            })
+        else:
+            job_manager.fail_job(job_id, (analysis.error_message if analysis else None) or "Analysis failed")
+    finally:
+        db.close()
+
+
 @router.post("/", response_model=ProjectAnalysisResponse, status_code=status.HTTP_201_CREATED)
 async def upload_project(
-    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     project_id: Optional[UUID] = None,
     db: Session = Depends(get_db)
@@ -159,7 +200,7 @@ async def upload_project(
 
     - Accepts .zip, .tar.gz files
     - Max size: configured in settings (default 100MB)
-    - Processing happens in background
+    - Processing happens in background (a PROJECT_ANALYSIS job)
     - Returns immediately with analysis record
 
     **POST** `/api/v1/analyzers/`
@@ -212,12 +253,19 @@ async def upload_project(
         analysis.upload_path = str(file_path)
         db.commit()
 
-        # Start background processing
-        background_tasks.add_task(
-            process_analysis_background,
-            analysis_id,
-            str(file_path),
-            db
+        # Queue background processing
+        JobManager(db).create_job(
+            job_type=JobType.PROJECT_ANALYSIS,
+            input_data={
+                "analysis_id": str(analysis_id),
+                "file_path": str(file_path)
+            },
+            project_id=project_id,
+            handler=_process_analysis_job,
+            handler_kwargs={
+                "analysis_id": analysis_id,
+                "file_path": str(file_path)
+            }
         )
 
         logger.info(f"Uploaded project: {file.filename} (analysis: {analysis_id})")
@@ -23,6 +23,8 @@ from app.services.consistency_validator import ConsistencyValidator
 from app.services.codebase_indexer import CodebaseIndexer
 from app.services.codebase_memory import CodebaseMemoryService
 from app.services.job_manager import JobManager
+from app.services.job_context import JobContext
+from app.models.async_job import JobType
 from app.services.rag_service import RAGService
 from app.services.pattern_discovery import PatternDiscoveryService
 from app.models.spec import Spec, SpecScope
@@ -637,7 +639,7 @@ async def get_consistency_report(
 @router.post("/{project_id}/index-code")
 async def index_project_code(
     project_id: UUID,
-    force: bool = Query(False, description="Force re-indexing of all files"),
+    force: bool = Query(False, description="Drop the existing index and re-index all files"),
     db: Session = Depends(get_db)
 ):
     """
@@ -645,15 +647,20 @@ async def index_project_code(
 
     PROMPT #89 - Code RAG Implementation
 
-    Scans project folder recursively and indexes all code files in RAG.
+    Scans project folder recursively and indexes code files in RAG.
     This enables context-aware code generation during task execution.
 
+    Indexing is incremental: unchanged files are skipped, changed files are
+    re-indexed and files deleted from disk are removed from RAG. In a git
+    repository only the files changed since the last indexed commit (plus
+    working-tree changes) are visited.
+
     Runs as background job for large projects.
 
     **POST** `/api/v1/projects/{project_id}/index-code?force=false`
 
     **Query Parameters:**
-    - `force` (bool): If true, re-index all files even if unchanged
+    - `force` (bool): If true, drop the existing index and rebuild it from scratch
 
     **Response:**
     ```json
@@ -668,8 +675,11 @@ async def index_project_code(
     ```json
     {
         "project_id": "uuid",
+        "mode": "git",
         "files_scanned": 150,
-        "files_indexed": 145,
+        "files_indexed": 12,
+        "files_unchanged": 133,
+        "files_removed": 2,
         "files_skipped": 5,
         "languages": {"php": 80, "typescript": 50, "css": 15},
         "total_lines": 12500
@@ -688,48 +698,45 @@ async def index_project_code(
             detail="Project has no project_folder configured. Cannot index code."
         )
 
-    # Create background job
+    # Create job (progress is reported to it while the pipeline runs)
     job_manager = JobManager(db)
 
     job = job_manager.create_job(
-        job_type="code_indexing",
-        project_id=project_id,
-        metadata={
+        job_type=JobType.CODE_INDEXING,
+        input_data={
             "force": force,
             "project_folder": project.project_folder
-        }
+        },
+        project_id=project_id
     )
+    job_manager.start_job(job.id)
 
-    # Start indexing in background
-    # (In production, this would be picked up by a worker process)
-    # For now, we'll execute it asynchronously
     indexer = CodebaseIndexer(db)
 
     try:
-        result = await indexer.index_project(project_id, force=force)
+        with JobContext(job.id):  # Coalesced progress, in-memory cancellation
+            result = await indexer.index_project(project_id, force=force, job_id=job.id)
 
-        # Update job with result
-        job_manager.complete_job(
-            job_id=job.id,
-            result=result
-        )
+        # Update job with result (a cancelled run keeps its cancelled status)
+        if not result.get("cancelled"):
+            job_manager.complete_job(job.id, result)
 
     except Exception as e:
         logger.error(f"Code indexing failed for project {project_id}: {e}")
-        job_manager.fail_job(
-            job_id=job.id,
-            error_message=str(e)
-        )
+        db.rollback()
+        job_manager.fail_job(job.id, str(e))
 
         raise HTTPException(
             status_code=500,
             detail=f"Code indexing failed: {str(e)}"
         )
 
+    cancelled = bool(result.get("cancelled"))
+
     return {
         "job_id": str(job.id),
-        "status": "completed",
-        "message": "Code indexing completed",
+        "status": "cancelled" if cancelled else "completed",
+        "message": "Code indexing cancelled" if cancelled else "Code indexing completed",
         "result": result
     }
 
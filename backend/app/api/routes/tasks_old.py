@@ -40,6 +40,7 @@ from app.services.task_executor import TaskExecutor
 from app.services.task_hierarchy import TaskHierarchyService
 from app.services.backlog_view import BacklogViewService
 from app.services.workflow_validator import WorkflowValidator
+from app.services.job_queue import job_handler
 import logging
 
 logger = logging.getLogger(__name__)
@@ -543,22 +544,17 @@ async def execute_task(
             "max_attempts": request.max_attempts,
             "task_title": task.title
         },
-        project_id=task.project_id
+        project_id=task.project_id,
+        handler=_execute_task_async,
+        handler_kwargs={
+            "task_id": task_id,
+            "project_id": task.project_id,
+            "max_attempts": request.max_attempts
+        }
     )
 
     logger.info(f"Created task execution job {job.id} for task {task_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _execute_task_async(
-            job_id=job.id,
-            task_id=task_id,
-            project_id=task.project_id,
-            max_attempts=request.max_attempts
-        )
-    )
-
     # Return job_id immediately
     return ExecuteJobResponse(
         job_id=str(job.id),
@@ -617,21 +613,16 @@ async def execute_all_tasks(
             "task_ids": task_ids,
             "total_tasks": len(task_ids)
         },
-        project_id=project_id
+        project_id=project_id,
+        handler=_execute_batch_async,
+        handler_kwargs={
+            "task_ids": task_ids,
+            "project_id": project_id
+        }
     )
 
     logger.info(f"Created batch execution job {job.id} for project {project_id} with {len(task_ids)} tasks")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _execute_batch_async(
-            job_id=job.id,
-            task_ids=task_ids,
-            project_id=project_id
-        )
-    )
-
     # Return job_id immediately
     return ExecuteJobResponse(
         job_id=str(job.id),
@@ -1739,6 +1730,7 @@ class ActivateEpicResponse(BaseModel):
     priority: str
     activated: bool
     children_generated: Optional[int] = 0  # PROMPT #102 - Number of draft children generated
+    descendants_generated: Optional[int] = 0  # Drafts of all expanded levels (expand_depth)
 
 
 class ActivateJobResponse(BaseModel):
@@ -1751,6 +1743,7 @@ class ActivateJobResponse(BaseModel):
 @router.post("/{task_id}/activate", response_model=ActivateJobResponse)
 async def activate_suggested_item(
     task_id: UUID,
+    expand_depth: int = Query(1, ge=1, le=3, description="Epic only: draft levels to generate (1 = stories, 2 = + tasks, 3 = + subtasks)"),
     db: Session = Depends(get_db)
 ):
     """
@@ -1771,7 +1764,11 @@ async def activate_suggested_item(
        - Generates full item content using AI
        - Auto-generates draft children
 
-    POST /api/v1/tasks/{task_id}/activate
+    POST /api/v1/tasks/{task_id}/activate?expand_depth=3
+
+    For Epics, expand_depth > 1 also generates task and subtask drafts. Each
+    level's siblings are generated concurrently; progress is reported on the
+    job and as "draft_expansion_progress" WebSocket events.
 
     Returns immediately:
     {
@@ -1812,23 +1809,20 @@ async def activate_suggested_item(
         input_data={
             "task_id": str(task_id),
             "item_type": task.item_type.value,
-            "title": task.title
+            "title": task.title,
+            "expand_depth": expand_depth
         },
-        project_id=task.project_id
+        project_id=task.project_id,
+        handler=_activate_item_async,
+        handler_kwargs={
+            "task_id": task_id,
+            "item_type": task.item_type,
+            "expand_depth": expand_depth
+        }
     )
 
     logger.info(f"Created activation job {job.id} for {task.item_type.value} {task_id}")
 
-    # Execute in background
-    import asyncio
-    asyncio.create_task(
-        _activate_item_async(
-            job_id=job.id,
-            task_id=task_id,
-            item_type=task.item_type
-        )
-    )
-
     # Return job_id immediately
     return ActivateJobResponse(
         job_id=str(job.id),
@@ -1886,10 +1880,12 @@ async def reject_suggested_epic(
 # PROMPT #108 - BACKGROUND TASK FUNCTIONS
 # ============================================================================
 
+@job_handler
 async def _activate_item_async(
     job_id: UUID,
     task_id: UUID,
-    item_type: ItemType
+    item_type: ItemType,
+    expand_depth: int = 1
 ):
     """
     Background task to activate a suggested item (Epic, Story, Task, Subtask).
@@ -1897,7 +1893,7 @@ async def _activate_item_async(
     PROMPT #108 - Background queue for prompt executions
 
     This can take 30-120 seconds depending on item type:
-    - Epic: Generate content + 15-20 story drafts
+    - Epic: Generate content + 15-20 story drafts (+ task/subtask drafts with expand_depth > 1)
     - Story: Generate content + 5-8 task drafts
     - Task: Generate content + 3-5 subtask drafts
     - Subtask: Generate content only
@@ -1931,7 +1927,9 @@ async def _activate_item_async(
 
         # Call appropriate activation function based on item type
         if item_type == ItemType.EPIC:
-            result = await context_service.activate_suggested_epic(epic_id=task_id)
+            result = await context_service.activate_suggested_epic(
+                epic_id=task_id, expand_depth=expand_depth, job_id=job_id
+            )
         elif item_type == ItemType.STORY:
             result = await context_service.activate_suggested_story(story_id=task_id)
         elif item_type == ItemType.TASK:
@@ -1966,6 +1964,7 @@ async def _activate_item_async(
         db.close()
 
 
+@job_handler
 async def _execute_task_async(
     job_id: UUID,
     task_id: UUID,
@@ -2012,6 +2011,7 @@ async def _execute_task_async(
         db.close()
 
 
+@job_handler
 async def _execute_batch_async(
     job_id: UUID,
     task_ids: list,
@@ -2037,27 +2037,16 @@ async def _execute_batch_async(
 
         executor = TaskExecutor(db)
 
-        # Execute with progress updates
-        results = []
-        for i, task_id in enumerate(task_ids):
-            progress = 10 + (80 * i / total)
-            job_manager.update_progress(job_id, progress, f"Executing task {i+1}/{total}...")
-
-            # Check if job was cancelled
-            if job_manager.is_cancelled(job_id):
-                logger.info(f"⚠️ Batch execution job {job_id} was cancelled at task {i+1}/{total}")
-                break
-
-            try:
-                result = await executor.execute_task(
-                    task_id=task_id,
-                    project_id=str(project_id),
-                    max_attempts=3
-                )
-                results.append(result)
-            except Exception as task_error:
-                logger.error(f"Task {task_id} failed: {task_error}")
-                # Continue with other tasks even if one fails
+        # Independent tasks run concurrently; dependents of a failed task are skipped
+        def report(finished: int, total_tasks: int):
+            job_manager.update_progress(job_id, 10 + 80 * finished / total_tasks, f"Executed {finished}/{total_tasks} tasks...")
+
+        results = await executor.execute_batch(
+            task_ids=[str(task_id) for task_id in task_ids],
+            project_id=str(project_id),
+            on_progress=report,
+            is_cancelled=lambda: job_manager.is_cancelled(job_id)
+        )
 
         job_manager.update_progress(job_id, 95.0, "Finalizing batch results...")
 
@@ -4,6 +4,8 @@ from datetime import datetime
 import json
 import logging
 
+from app.services.job_events import job_events
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
@@ -94,6 +96,8 @@ async def websocket_endpoint(websocket: WebSocket, project_id: str):
     - validation_failed: Validação falhou (vai tentar novamente)
     - batch_progress: Progresso do batch atualizado
     - batch_completed: Batch completou
+    - job_created / job_started / job_progress / job_completed / job_failed /
+      job_cancelled: Ciclo de vida dos async jobs do projeto (data = job event)
     
     Example message:
     {
@@ -154,3 +158,13 @@ async def broadcast_event(
     }
     
     await ConnectionManager.broadcast(project_id, message)
+
+
+async def _forward_job_event(event: dict):
+    """Envia eventos de async jobs para as conexões do projeto do job"""
+    project_id = event.get("project_id")
+    if project_id and project_id in active_connections:
+        await broadcast_event(project_id, f"job_{event['event']}", event)
+
+
+job_events.add_listener(_forward_job_event)
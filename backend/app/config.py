@@ -59,6 +59,91 @@ class Settings(BaseSettings):
         alias="USE_EXTERNAL_PROMPTS"
     )
 
+    # Code watcher (separate process: python -m app.services.code_watcher)
+    # Keeps the code index fresh by re-indexing files changed on disk
+    code_watcher_debounce_seconds: float = Field(default=2.0, alias="CODE_WATCHER_DEBOUNCE_SECONDS")
+    code_watcher_poll_interval_seconds: float = Field(
+        default=5.0,
+        alias="CODE_WATCHER_POLL_INTERVAL_SECONDS"
+    )
+    code_watcher_force_polling: bool = Field(default=False, alias="CODE_WATCHER_FORCE_POLLING")
+    code_watcher_queue_size: int = Field(default=32, alias="CODE_WATCHER_QUEUE_SIZE")
+
+    # Pattern Discovery
+    # Concurrent AI calls per discovery run (keep within provider rate limits)
+    pattern_discovery_concurrency: int = Field(default=4, alias="PATTERN_DISCOVERY_CONCURRENCY")
+    # Split groups into structural clusters (MinHash) and merge near-identical ones
+    pattern_discovery_clustering: bool = Field(default=True, alias="PATTERN_DISCOVERY_CLUSTERING")
+    # Max clusters analyzed per file group (largest first)
+    pattern_discovery_max_clusters: int = Field(default=3, alias="PATTERN_DISCOVERY_MAX_CLUSTERS")
+
+    # Draft hierarchy expansion (Epic -> Stories -> Tasks -> Subtasks)
+    # Concurrent AI calls for sibling drafts of one level
+    draft_generation_concurrency: int = Field(default=5, alias="DRAFT_GENERATION_CONCURRENCY")
+
+    # Batch task execution: tasks whose dependencies are done run concurrently, up to this many
+    task_batch_concurrency: int = Field(default=4, alias="TASK_BATCH_CONCURRENCY")
+    # Dependency outputs enter the execution context as interface summaries (False: full code)
+    task_context_dependency_summaries: bool = Field(default=True, alias="TASK_CONTEXT_DEPENDENCY_SUMMARIES")
+    # Validation retries send the previous output and its issues for a targeted fix (False: full regeneration)
+    task_repair_mode: bool = Field(default=True, alias="TASK_REPAIR_MODE")
+
+    # Speculative pre-generation of suggested items' full content (opt-in)
+    speculative_generation_enabled: bool = Field(default=False, alias="SPECULATIVE_GENERATION_ENABLED")
+    # Max items pre-generated by one background run
+    speculative_max_items_per_run: int = Field(default=10, alias="SPECULATIVE_MAX_ITEMS_PER_RUN")
+    # Max tokens spent on speculation per project per day (UTC)
+    speculative_daily_token_budget: int = Field(default=200000, alias="SPECULATIVE_DAILY_TOKEN_BUDGET")
+
+    # Streamed hierarchy generation: items are written and emitted while the AI is still answering
+    hierarchy_streaming: bool = Field(default=True, alias="HIERARCHY_STREAMING")
+    # Items per commit / WebSocket event while streaming
+    hierarchy_stream_batch_size: int = Field(default=5, alias="HIERARCHY_STREAM_BATCH_SIZE")
+
+    # Rolling interview summary: older messages go to the AI as summary + key facts
+    interview_summarization: bool = Field(default=True, alias="INTERVIEW_SUMMARIZATION")
+    # Turns (question + answer) always sent verbatim
+    interview_recent_turns: int = Field(default=6, alias="INTERVIEW_RECENT_TURNS")
+    # Summarize once this many turns are older than the recent ones
+    interview_summary_every_turns: int = Field(default=4, alias="INTERVIEW_SUMMARY_EVERY_TURNS")
+    # Token targets of the summary (facts included) and of the verbatim messages
+    interview_summary_max_tokens: int = Field(default=800, alias="INTERVIEW_SUMMARY_MAX_TOKENS")
+    interview_recent_max_tokens: int = Field(default=4000, alias="INTERVIEW_RECENT_MAX_TOKENS")
+
+    # Job queue (async_jobs claimed by workers: python -m app.services.job_worker)
+    # Run a worker inside the API process too (disable when workers run separately)
+    job_worker_embedded: bool = Field(default=True, alias="JOB_WORKER_EMBEDDED")
+    # Jobs one worker runs at once, overall and per type without its own limit
+    job_worker_concurrency: int = Field(default=4, alias="JOB_WORKER_CONCURRENCY")
+    # Per-type overrides, e.g. "task_execution=4,batch_execution=2"
+    job_concurrency_limits: str = Field(default="", alias="JOB_CONCURRENCY_LIMITS")
+    # Queue check interval when no job event wakes the worker
+    job_poll_interval_seconds: float = Field(default=2.0, alias="JOB_POLL_INTERVAL_SECONDS")
+    # Heartbeat of running jobs, and the age after which their worker is presumed dead
+    job_heartbeat_seconds: float = Field(default=15.0, alias="JOB_HEARTBEAT_SECONDS")
+    job_stale_after_seconds: float = Field(default=90.0, alias="JOB_STALE_AFTER_SECONDS")
+    # Runs of a job whose worker died before it is failed
+    job_max_attempts: int = Field(default=2, alias="JOB_MAX_ATTEMPTS")
+    # Progress of running jobs is written at most this often, or at once after this many points
+    job_progress_flush_ms: int = Field(default=1000, alias="JOB_PROGRESS_FLUSH_MS")
+    job_progress_min_delta: float = Field(default=10.0, alias="JOB_PROGRESS_MIN_DELTA")
+    # Wait for running jobs on shutdown before handing them back to the queue
+    job_shutdown_grace_seconds: float = Field(default=30.0, alias="JOB_SHUTDOWN_GRACE_SECONDS")
+
+    # Data retention (app/services/data_retention.py), run by job workers
+    data_retention_enabled: bool = Field(default=True, alias="DATA_RETENTION_ENABLED")
+    data_retention_interval_hours: float = Field(default=24.0, alias="DATA_RETENTION_INTERVAL_HOURS")
+    # Days async jobs and AI executions are kept (0 keeps them); monthly partitions are dropped whole
+    async_jobs_retention_days: int = Field(default=30, alias="ASYNC_JOBS_RETENTION_DAYS")
+    ai_executions_retention_days: int = Field(default=90, alias="AI_EXECUTIONS_RETENTION_DAYS")
+    # Days after which the system/user prompt and response of audited prompts are archived and cleared
+    prompts_compaction_days: int = Field(default=90, alias="PROMPTS_COMPACTION_DAYS")
+    # Dropped data is exported to {DATA_ARCHIVE_DIR}/{table}/*.jsonl.gz first
+    data_archive_enabled: bool = Field(default=True, alias="DATA_ARCHIVE_ENABLED")
+    data_archive_dir: str = Field(default="./storage/archives", alias="DATA_ARCHIVE_DIR")
+    # Monthly partitions created ahead of time
+    partition_months_ahead: int = Field(default=3, alias="PARTITION_MONTHS_AHEAD")
+
     # Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
 
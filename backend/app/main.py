@@ -9,6 +9,7 @@ from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from pydantic import ValidationError
+import asyncio
 import logging
 
 from app.config import settings
@@ -114,10 +115,34 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"RAG sync skipped (non-fatal): {e}")
 
+    # Monthly partitions of async_jobs/ai_executions, whether or not data retention runs
+    try:
+        from app.services.data_retention import ensure_partitions
+        created = await asyncio.to_thread(ensure_partitions)
+        if any(created.values()):
+            logger.info(f"Partitions created: {created}")
+    except Exception as e:
+        logger.error(f"Failed to create partitions: {e}")
+
+    # Job events: push to SSE/WebSocket clients, relayed between workers via Redis
+    from app.services.job_events import job_events
+    await job_events.start_relay()
+
+    # Job queue: run queued jobs in this process too unless workers run separately
+    job_worker = job_worker_task = None
+    if settings.job_worker_embedded:
+        from app.services.job_worker import JobWorker
+        job_worker = JobWorker()
+        job_worker_task = asyncio.create_task(job_worker.run())
+
     yield
 
     # Shutdown
     logger.info("Shutting down Orbit API...")
+    if job_worker is not None:
+        await job_worker.stop()
+        job_worker_task.cancel()
+    await job_events.stop_relay()
 
 
 # Create FastAPI application
@@ -24,6 +24,12 @@ from app.models.project_analysis import ProjectAnalysis
 from app.models.ai_execution import AIExecution  # PROMPT #54 - AI Execution Logging
 from app.models.prompt_template import PromptTemplate  # Prompter Architecture - Phase 1
 from app.models.discovery_queue import DiscoveryQueue, DiscoveryQueueStatus  # Project-Specific Specs
+from app.models.code_index_entry import CodeIndexEntry  # Incremental code indexing
+from app.models.code_index_state import CodeIndexState  # Git-aware code indexing
+from app.models.project_symbol import ProjectSymbol  # Project symbol table
+from app.models.pattern_discovery_cache import PatternDiscoveryCache  # Pattern discovery cache
+from app.models.speculative_draft import SpeculativeDraft, SpeculativeDraftStatus  # Speculative pre-generation
+from app.models.interview_message import InterviewMessage  # Append-only interview messages
 
 __all__ = [
     # Models
@@ -45,6 +51,12 @@ __all__ = [
     "AIExecution",  # PROMPT #54 - AI Execution Logging
     "PromptTemplate",  # Prompter Architecture - Phase 1
     "DiscoveryQueue",  # Project-Specific Specs
+    "CodeIndexEntry",  # Incremental code indexing
+    "CodeIndexState",  # Git-aware code indexing
+    "ProjectSymbol",  # Project symbol table
+    "PatternDiscoveryCache",  # Pattern discovery cache
+    "SpeculativeDraft",  # Speculative pre-generation
+    "InterviewMessage",  # Append-only interview messages
     # Enums
     "InterviewStatus",
     "TaskStatus",
@@ -60,4 +72,5 @@ __all__ = [
     "RelationshipType",  # JIRA Transformation
     "CommentType",  # JIRA Transformation
     "DiscoveryQueueStatus",  # Project-Specific Specs
+    "SpeculativeDraftStatus",  # Speculative pre-generation
 ]
@@ -5,7 +5,7 @@ PROMPT #65 - Async Job System
 Tracks status of asynchronous operations like AI calls, provisioning, backlog generation.
 """
 
-from sqlalchemy import Column, String, Text, Enum as SQLEnum, DateTime, JSON, Float
+from sqlalchemy import Column, String, Text, Enum as SQLEnum, DateTime, JSON, Float, Integer, Index
 from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 from uuid import uuid4
@@ -39,6 +39,9 @@ class JobType(str, enum.Enum):
     TASK_EXECUTION = "task_execution"              # Execute single task (code generation)
     BATCH_EXECUTION = "batch_execution"            # Execute multiple tasks in batch
     COMMIT_GENERATION = "commit_generation"        # Generate commit message
+    CODE_INDEXING = "code_indexing"                # Index project codebase in RAG
+    SPECULATIVE_GENERATION = "speculative_generation"  # Pre-generate suggested items' content
+    PROJECT_ANALYSIS = "project_analysis"          # Analyze an uploaded project archive
 
 
 class AsyncJob(Base):
@@ -46,10 +49,10 @@ class AsyncJob(Base):
     Tracks long-running background tasks.
 
     Workflow:
-    1. Client creates job via API endpoint
+    1. Client creates job via API endpoint (with the handler that runs it)
     2. Backend returns job_id immediately
-    3. BackgroundTask executes the actual work
-    4. Client polls /jobs/{job_id} for status
+    3. A job worker claims the job and executes the handler (app/services/job_worker.py)
+    4. Client follows /jobs/{job_id}/events (or polls /jobs/{job_id}) for status
     5. When status=completed, client gets result
 
     Example:
@@ -96,6 +99,19 @@ class AsyncJob(Base):
     project_id = Column(UUID(as_uuid=True), nullable=True, index=True)
     interview_id = Column(UUID(as_uuid=True), nullable=True, index=True)
 
+    # Queue (see app/services/job_queue.py)
+    handler = Column(String(255), nullable=True)              # Registered handler ("module:function")
+    handler_kwargs = Column(JSON, nullable=True)              # Handler arguments besides job_id
+    priority = Column(Integer, nullable=False, default=0)     # Higher is claimed first
+    attempts = Column(Integer, nullable=False, default=0)     # Times claimed by a worker
+    max_attempts = Column(Integer, nullable=False, default=1)
+    worker_id = Column(String(255), nullable=True)            # Worker running the job
+    heartbeat_at = Column(DateTime, nullable=True)            # Last sign of life of that worker
+
+    __table_args__ = (
+        Index("ix_async_jobs_queue", "status", "priority", "created_at"),
+    )
+
     def __repr__(self):
         return f"<AsyncJob {self.id} {self.job_type} {self.status}>"
 
@@ -114,5 +130,7 @@ class AsyncJob(Base):
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
             "project_id": str(self.project_id) if self.project_id else None,
-            "interview_id": str(self.interview_id) if self.interview_id else None
+            "interview_id": str(self.interview_id) if self.interview_id else None,
+            "priority": self.priority,
+            "attempts": self.attempts
         }
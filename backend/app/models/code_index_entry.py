@@ -0,0 +1,70 @@
+"""
+CodeIndexEntry Model
+Per-file manifest of the Code RAG index.
+
+Each row records what was indexed for one project file (size, mtime,
+content hash and the RAG document ids that were produced), so re-indexing
+can skip unchanged files, replace changed ones and drop deleted ones.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import (
+    Column, String, Integer, BigInteger, Float, DateTime, ForeignKey, JSON, UniqueConstraint
+)
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class CodeIndexEntry(Base):
+    """
+    CodeIndexEntry model - One indexed file of a project codebase
+
+    Attributes:
+        id: Unique identifier
+        project_id: Project the file belongs to
+        file_path: Path relative to the indexed root (POSIX separators)
+        language: Detected language
+        size: File size in bytes at indexing time
+        mtime: File modification time at indexing time
+        content_hash: SHA-256 of the file content
+        line_count: Number of lines in the file
+        doc_ids: RAG document ids created for this file (summary + chunks)
+        indexed_at: When the file was last (re)indexed
+    """
+
+    __tablename__ = "code_index_entries"
+    __table_args__ = (
+        UniqueConstraint("project_id", "file_path", name="uq_code_index_entries_project_path"),
+    )
+
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+
+    # Foreign keys
+    project_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    # File identity
+    file_path = Column(String(1000), nullable=False)
+    language = Column(String(50), nullable=True)
+
+    # Change detection
+    size = Column(BigInteger, nullable=False)
+    mtime = Column(Float, nullable=False)
+    content_hash = Column(String(64), nullable=False)
+    line_count = Column(Integer, default=0, nullable=False)
+
+    # RAG documents owned by this file
+    doc_ids = Column(JSON, default=list, nullable=False)
+
+    # Timestamps
+    indexed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<CodeIndexEntry(project_id={self.project_id}, file_path='{self.file_path}')>"
@@ -0,0 +1,55 @@
+"""
+CodeIndexState Model
+Git position of a project's Code RAG index.
+
+Records the commit the index was last brought up to date with, so the next
+run can diff against it and only touch the files that changed instead of
+rescanning the whole tree, and the symbol extraction the index was last
+completed with (projects outside git get a state for this alone).
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey, Integer, JSON
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class CodeIndexState(Base):
+    """
+    CodeIndexState model - Last indexed git commit of a project
+
+    Attributes:
+        project_id: Project the index belongs to (one state per project)
+        root_path: Directory that was indexed (state is ignored if it differs)
+        commit_sha: HEAD commit at the end of the last successful run
+            (None outside a git repository)
+        pending_paths: Paths to re-check next run even if the diff misses them
+            (working-tree changes indexed last time, files that failed)
+        symbols_version: Symbol extraction version of the last complete run
+            (None: index built before the symbol table, symbols not backfilled)
+        indexed_at: When the state was recorded
+    """
+
+    __tablename__ = "code_index_states"
+
+    # Primary key (one row per project)
+    project_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    # Git position
+    root_path = Column(String(1000), nullable=False)
+    commit_sha = Column(String(64), nullable=True)
+    pending_paths = Column(JSON, default=list, nullable=False)
+
+    # Symbol table backfill
+    symbols_version = Column(Integer, nullable=True)
+
+    # Timestamps
+    indexed_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<CodeIndexState(project_id={self.project_id}, commit_sha='{self.commit_sha}')>"
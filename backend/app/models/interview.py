@@ -4,13 +4,16 @@ Represents a conversational interview session with AI
 """
 
 from datetime import datetime
+from typing import Any, Dict, Iterable, List
 from uuid import uuid4
-from sqlalchemy import Column, String, DateTime, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, String, Integer, Text, DateTime, JSON, ForeignKey, Enum as SQLEnum
+from sqlalchemy import event, inspect
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, Session, object_session
 import enum
 
 from app.database import Base
+from app.models.interview_message import InterviewMessage
 
 
 class InterviewStatus(str, enum.Enum):
@@ -27,7 +30,11 @@ class Interview(Base):
     Attributes:
         id: Unique identifier
         project_id: Reference to the project
-        conversation_data: JSON array of conversation messages
+        conversation_data: Conversation messages (list view over interview_messages)
+        message_count: Number of stored messages (next message seq)
+        conversation_summary: Rolling summary of the older messages
+        summary_facts: Key facts extracted from the older messages
+        summarized_until: Seq of the first message not covered by the summary
         ai_model_used: Name of the AI model used for the interview
         status: Current status of the interview
         created_at: Timestamp of creation
@@ -58,7 +65,13 @@ class Interview(Base):
     )
 
     # Basic fields
-    conversation_data = Column(JSON, nullable=False, default=list)
+    # Messages live in interview_messages (one row per message); see conversation_data
+    message_count = Column(Integer, nullable=False, default=0)
+
+    # Rolling summary of the messages before summarized_until (see InterviewSummarizer)
+    conversation_summary = Column(Text, nullable=True)
+    summary_facts = Column(JSON, nullable=True)  # ["Pagamento via Pix", ...]
+    summarized_until = Column(Integer, nullable=False, default=0)
     ai_model_used = Column(String(100), nullable=False)
     status = Column(
         SQLEnum(InterviewStatus, name="interview_status", values_callable=lambda x: [e.value for e in x]),
@@ -113,5 +126,146 @@ class Interview(Base):
         lazy="selectin"
     )
 
+    @property
+    def conversation_data(self) -> "ConversationLog":
+        """
+        All messages, oldest first, as dicts ({"role", "content", ...}).
+
+        Loaded with one query on first access and kept for the instance's
+        lifetime (dropped on refresh and rollback). append() stores a
+        single interview_messages row; nothing is rewritten. To add a
+        message without loading the conversation, use add_message().
+        """
+        log = self.__dict__.get(_LOG_KEY)
+        if log is None:
+            log = ConversationLog(self, _load_messages(self))
+            self.__dict__[_LOG_KEY] = log
+        return log
+
+    @conversation_data.setter
+    def conversation_data(self, messages: Iterable[Dict[str, Any]]):
+        """Replace the whole conversation (deletes the stored messages and their summary)."""
+        session = object_session(self)
+        if session is not None and inspect(self).persistent:
+            session.query(InterviewMessage).filter(
+                InterviewMessage.interview_id == self.id
+            ).delete(synchronize_session=False)
+        self.__dict__.pop(_PENDING_KEY, None)
+        self.message_count = 0
+        self.conversation_summary = None
+        self.summary_facts = None
+        self.summarized_until = 0
+        log = ConversationLog(self, [])
+        self.__dict__[_LOG_KEY] = log
+        log.extend(messages or [])
+
+    def add_message(self, message: Dict[str, Any]):
+        """
+        Append one message without reading the conversation.
+
+        Stores a single interview_messages row; the loaded conversation (if
+        conversation_data was read before) gets the message too.
+
+        Args:
+            message: Conversation message ({"role", "content", ...})
+        """
+        log = self.__dict__.get(_LOG_KEY)
+        if log is not None:
+            log.append(message)
+        else:
+            _store_message(self, message)
+
     def __repr__(self) -> str:
         return f"<Interview(id={self.id}, project_id={self.project_id}, status={self.status})>"
+
+
+# ============================================================================
+# Conversation messages
+# ============================================================================
+
+_LOG_KEY = "_conversation_log"
+_PENDING_KEY = "_pending_messages"
+
+
+class ConversationLog(list):
+    """
+    Append-only list of an interview's messages.
+
+    append()/extend() store each message as a new interview_messages row
+    (seq = Interview.message_count) in the interview's session, or on flush
+    for interviews not yet added to one. Other in-place changes are not
+    supported; assign Interview.conversation_data to replace the conversation.
+    """
+
+    def __init__(self, interview: Interview, messages: List[Dict[str, Any]]):
+        super().__init__(messages)
+        self._interview = interview
+
+    def append(self, message: Dict[str, Any]):
+        _store_message(self._interview, message)
+        super().append(message)
+
+    def extend(self, messages: Iterable[Dict[str, Any]]):
+        for message in list(messages):
+            self.append(message)
+
+    def __iadd__(self, messages):
+        self.extend(messages)
+        return self
+
+    def _append_only(self, *args, **kwargs):
+        raise TypeError("Interview conversations are append-only; assign conversation_data to replace it")
+
+    insert = pop = remove = clear = sort = reverse = _append_only
+    __setitem__ = __delitem__ = _append_only
+
+
+def _store_message(interview: Interview, message: Dict[str, Any]):
+    """New interview_messages row (seq = Interview.message_count) in the interview's session."""
+    seq = interview.message_count or 0
+    row = InterviewMessage.from_dict(message, seq)
+    row.interview = interview
+    interview.message_count = seq + 1
+
+    session = object_session(interview)
+    if session is not None:
+        session.add(row)
+    else:
+        interview.__dict__.setdefault(_PENDING_KEY, []).append(row)
+
+
+def _load_messages(interview: Interview) -> List[Dict[str, Any]]:
+    """Stored messages of a persistent interview (pending ones otherwise), oldest first."""
+    session = object_session(interview)
+    if session is None or not inspect(interview).persistent:
+        return [row.to_dict() for row in interview.__dict__.get(_PENDING_KEY, [])]
+    rows = (
+        session.query(InterviewMessage)
+        .filter(InterviewMessage.interview_id == interview.id)
+        .order_by(InterviewMessage.seq)
+        .all()
+    )
+    return [row.to_dict() for row in rows]
+
+
+@event.listens_for(Session, "before_flush")
+def _add_pending_messages(session, flush_context, instances):
+    """Messages appended before the interview joined a session are written with it."""
+    for obj in list(session.new):
+        if isinstance(obj, Interview):
+            for row in obj.__dict__.pop(_PENDING_KEY, []):
+                session.add(row)
+
+
+@event.listens_for(Interview, "refresh")
+def _drop_loaded_conversation(interview, context, attrs):
+    """An explicit refresh reloads the conversation on next access."""
+    interview.__dict__.pop(_LOG_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_unsaved_conversations(session, previous_transaction):
+    """Rolled back appends must not stay visible in loaded conversations."""
+    for obj in list(session.identity_map.values()):
+        if isinstance(obj, Interview):
+            obj.__dict__.pop(_LOG_KEY, None)
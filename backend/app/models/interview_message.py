@@ -0,0 +1,82 @@
+"""
+InterviewMessage Model
+One message of an interview conversation (append-only).
+
+Interview conversations used to live in one JSON column that was rewritten
+on every turn. Each message is now a row keyed by (interview_id, seq):
+a turn inserts one row, and reads can page through the conversation or
+fetch only its tail. Interview.conversation_data remains available as a
+list view over these rows (see app/models/interview.py).
+"""
+
+from datetime import datetime
+from typing import Any, Dict
+from uuid import uuid4
+from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from app.database import Base
+
+
+class InterviewMessage(Base):
+    """
+    InterviewMessage model - One conversation message of an interview
+
+    Attributes:
+        id: Unique identifier
+        interview_id: Interview the message belongs to
+        seq: Position in the conversation (0-based, gapless per interview)
+        role: "assistant", "user" or "system"
+        content: Message text
+        message_metadata: Remaining message fields (timestamp, model,
+            question_number, question_type, options, ...)
+        created_at: When the message was stored
+    """
+
+    __tablename__ = "interview_messages"
+
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    # Foreign keys
+    interview_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("interviews.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # Message
+    seq = Column(Integer, nullable=False)
+    role = Column(String(20), nullable=False)
+    content = Column(Text, nullable=False, default="")
+    message_metadata = Column("metadata", JSON, nullable=True, default=dict)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships (many-to-one only: new messages are flushed after their interview)
+    interview = relationship("Interview")
+
+    __table_args__ = (
+        # Pagination and tail reads; unique so concurrent appends cannot share a seq
+        Index("ix_interview_messages_interview_seq", "interview_id", "seq", unique=True),
+    )
+
+    @classmethod
+    def from_dict(cls, message: Dict[str, Any], seq: int) -> "InterviewMessage":
+        """Row for a conversation message dict ({"role", "content", ...})."""
+        fields = dict(message)
+        return cls(
+            seq=seq,
+            role=fields.pop("role", "user"),
+            content=fields.pop("content", "") or "",
+            message_metadata=fields
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The message in conversation_data format."""
+        return {"role": self.role, "content": self.content, **(self.message_metadata or {})}
+
+    def __repr__(self) -> str:
+        return f"<InterviewMessage(interview_id={self.interview_id}, seq={self.seq}, role='{self.role}')>"
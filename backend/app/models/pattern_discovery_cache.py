@@ -0,0 +1,47 @@
+"""
+PatternDiscoveryCache Model
+Last AI answer for each file group of a project's pattern discovery.
+
+Keyed by (project, group) and validated by a fingerprint of the sampled
+files' content hashes: re-running discovery on an unchanged group reuses
+the stored answer (pattern or "no pattern") instead of calling the AI.
+"""
+
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime, ForeignKey, JSON
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class PatternDiscoveryCache(Base):
+    """
+    PatternDiscoveryCache model - Cached discovery result of one file group
+
+    Attributes:
+        project_id: Project the group belongs to
+        group_key: File group ("<extension>:<category>")
+        fingerprint: SHA-256 over the sampled files' paths and content hashes
+        pattern: DiscoveredPattern fields, or None if the AI found no pattern
+        created_at: When the AI answer was obtained
+    """
+
+    __tablename__ = "pattern_discovery_cache"
+
+    # Primary key (one row per project group)
+    project_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    group_key = Column(String(255), primary_key=True)
+
+    # Cache validation and payload
+    fingerprint = Column(String(64), nullable=False)
+    pattern = Column(JSON, nullable=True)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<PatternDiscoveryCache(project_id={self.project_id}, group_key='{self.group_key}')>"
@@ -0,0 +1,67 @@
+"""
+ProjectSymbol Model
+Persistent per-project symbol table.
+
+One row per symbol found in a source: a TaskResult's generated code or an
+indexed project file. Rows are replaced per source whenever that source
+changes, so consistency checks and context building can query symbols
+instead of re-parsing every output on each run.
+"""
+
+from sqlalchemy import Column, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from uuid import uuid4
+
+from app.database import Base
+
+
+class ProjectSymbol(Base):
+    """
+    ProjectSymbol model - One symbol defined or used by a project source
+
+    Attributes:
+        id: Unique identifier
+        project_id: Project the source belongs to
+        source: "task" (TaskResult output) or "file" (indexed project file)
+        source_key: Task id for "task" sources, relative path for "file" sources
+        file_path: Target/relative file path of the source (if known)
+        content_hash: SHA-256 of the source content the row was extracted from
+        kind: class, function, method, field, export (definitions) or
+            import, reference, call, access (usages)
+        name: Symbol name (short name for imports)
+        owner: Enclosing class for methods and fields
+        qualified_name: Namespaced class name, or the module of an import
+        language: Language of the syntax the symbol was found in
+    """
+
+    __tablename__ = "project_symbols"
+    __table_args__ = (
+        Index("ix_project_symbols_project_kind_name", "project_id", "kind", "name"),
+        Index("ix_project_symbols_project_source", "project_id", "source", "source_key"),
+    )
+
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    # Foreign keys
+    project_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # Source identity
+    source = Column(String(10), nullable=False)
+    source_key = Column(String(1000), nullable=False)
+    file_path = Column(String(1000), nullable=True)
+    content_hash = Column(String(64), nullable=False)
+
+    # Symbol
+    kind = Column(String(20), nullable=False)
+    name = Column(String(255), nullable=False)
+    owner = Column(String(255), nullable=True)
+    qualified_name = Column(String(1000), nullable=True)
+    language = Column(String(50), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<ProjectSymbol(kind='{self.kind}', name='{self.name}', source_key='{self.source_key}')>"
@@ -0,0 +1,77 @@
+"""
+SpeculativeDraft Model
+Full content of a suggested item, generated in the background before activation.
+
+Each row is one speculative AI generation. While the item is still a
+suggestion its "ready" draft is served by activation instead of calling the
+AI; the fingerprint (item, ancestors and project context) invalidates drafts
+whose inputs changed in the meantime. Rows are kept after use so the tokens
+spent on speculation can be capped per project and day.
+"""
+
+from datetime import datetime
+from uuid import uuid4
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey, JSON, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.database import Base
+
+
+class SpeculativeDraftStatus:
+    """Lifecycle of a speculative draft."""
+    READY = "ready"          # Generated, waiting for activation
+    CONSUMED = "consumed"    # Served by an activation
+    STALE = "stale"          # Inputs changed before activation, discarded
+
+
+class SpeculativeDraft(Base):
+    """
+    SpeculativeDraft model - Pre-generated activation content of one item
+
+    Attributes:
+        id: Unique identifier
+        task_id: Suggested item (Epic, Story, Task, Subtask) the content is for
+        project_id: Project of the item (spend caps are per project)
+        fingerprint: SHA-256 over the item, its ancestors and the project context
+        content: Result of the item's _generate_full_*_content call
+        tokens_used: Tokens spent generating the content
+        status: ready, consumed or stale
+        created_at: When the content was generated
+        consumed_at: When an activation used (or discarded) the draft
+    """
+
+    __tablename__ = "speculative_drafts"
+
+    # Primary key
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
+
+    # Foreign keys
+    task_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("tasks.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+    project_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    # Draft validation and payload
+    fingerprint = Column(String(64), nullable=False)
+    content = Column(JSON, nullable=True)
+    tokens_used = Column(Integer, nullable=False, default=0)
+    status = Column(String(20), nullable=False, default=SpeculativeDraftStatus.READY)
+
+    # Timestamps
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    consumed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Daily spend per project
+        Index("ix_speculative_drafts_project_created", "project_id", "created_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SpeculativeDraft(task_id={self.task_id}, status='{self.status}')>"
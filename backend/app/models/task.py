@@ -5,10 +5,11 @@ Extended for JIRA-like functionality with hierarchy, relationships, and AI orche
 """
 
 from datetime import datetime
-from uuid import uuid4
+from uuid import uuid4, UUID as UUIDValue
 from sqlalchemy import Column, String, Text, Integer, DateTime, ForeignKey, Enum as SQLEnum, JSON, Index
+from sqlalchemy import event, func, literal, update
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, Session, attributes, lazyload
 import enum
 
 from app.database import Base
@@ -148,6 +149,11 @@ class Task(Base):
         nullable=True,
         index=True
     )
+    # Materialized path: id hex of every ancestor and of the task itself,
+    # root first, each followed by "/" (e.g. "<epic>/<story>/<task>/").
+    # Maintained on flush (see _maintain_hierarchy_paths below); subtree
+    # queries are indexed prefix lookups (hierarchy_path LIKE '<path>%').
+    hierarchy_path = Column(String(2000), nullable=True)
 
     # Priority & Planning
     priority = Column(
@@ -307,6 +313,10 @@ class Task(Base):
         Index('ix_tasks_item_type_project', 'item_type', 'project_id'),
         Index('ix_tasks_parent_project', 'parent_id', 'project_id'),
         Index('ix_tasks_priority_status', 'priority', 'status'),
+        Index(
+            'ix_tasks_hierarchy_path', 'hierarchy_path',
+            postgresql_ops={'hierarchy_path': 'text_pattern_ops'}
+        ),
     )
 
     def to_dict(self) -> dict:
@@ -327,3 +337,107 @@ class Task(Base):
 
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title='{self.title}', status={self.status})>"
+
+
+# ============================================================================
+# Materialized path maintenance
+# ============================================================================
+
+PATH_SEPARATOR = "/"
+_PATH_MOVES_KEY = "task_path_moves"
+
+
+def path_segment(task_id) -> str:
+    """Path segment of one task (its id as 32 hex chars + separator)."""
+    return f"{task_id.hex}{PATH_SEPARATOR}"
+
+
+def path_ids(path: str) -> list:
+    """Task ids of a materialized path, root first."""
+    return [UUIDValue(hex=segment) for segment in path.split(PATH_SEPARATOR) if segment]
+
+
+@event.listens_for(Session, "before_flush")
+def _maintain_hierarchy_paths(session, flush_context, instances):
+    """
+    Set hierarchy_path of new and re-parented tasks before they are written.
+
+    Parents may be pending in the same flush (whole trees created at once).
+    Subtrees of re-parented tasks are rebased after the flush.
+    """
+    new = [obj for obj in session.new if isinstance(obj, Task)]
+    moved = [
+        obj for obj in session.dirty
+        if isinstance(obj, Task) and attributes.get_history(obj, "parent_id").has_changes()
+    ]
+    if not new and not moved:
+        return
+
+    for task in new:
+        if task.id is None:
+            task.id = uuid4()
+
+    pending = {task.id: task for task in new + moved}
+    resolved = {}
+
+    with session.no_autoflush:
+        for task in moved:
+            old_path = task.hierarchy_path
+            new_path = _resolve_path(session, task, pending, resolved, set())
+            if old_path and old_path != new_path:
+                session.info.setdefault(_PATH_MOVES_KEY, []).append((old_path, new_path))
+        for task in new:
+            _resolve_path(session, task, pending, resolved, set())
+
+
+def _resolve_path(session, task, pending, resolved, visiting) -> str:
+    """Compute (and assign) the path of a task from its parent's path."""
+    if task.id in resolved:
+        return resolved[task.id]
+    if task.id in visiting:
+        raise ValueError(f"Task hierarchy cycle at {task.id}")
+    visiting.add(task.id)
+
+    parent = task.__dict__.get("parent")
+    parent_id = task.parent_id or (parent.id if parent is not None else None)
+
+    if parent_id is None:
+        path = path_segment(task.id)
+    else:
+        if parent is None or parent.id != parent_id:
+            parent = pending.get(parent_id) or session.get(Task, parent_id, options=[lazyload("*")])
+        if parent is None:
+            path = path_segment(task.id)
+        else:
+            if parent.id in pending or not parent.hierarchy_path:
+                parent_path = _resolve_path(session, parent, pending, resolved, visiting)
+            else:
+                parent_path = parent.hierarchy_path
+            if path_segment(task.id) in parent_path:
+                raise ValueError(f"Task hierarchy cycle: {parent_id} is a descendant of {task.id}")
+            path = parent_path + path_segment(task.id)
+
+    task.hierarchy_path = path
+    resolved[task.id] = path
+    return path
+
+
+@event.listens_for(Session, "after_flush")
+def _rebase_moved_subtrees(session, flush_context):
+    """Rewrite the path prefix of every descendant of a re-parented task."""
+    moves = session.info.pop(_PATH_MOVES_KEY, [])
+    for old_path, new_path in moves:
+        table = Task.__table__
+        session.connection().execute(
+            update(table)
+            .where(table.c.hierarchy_path.like(f"{old_path}%"))
+            .where(table.c.hierarchy_path != old_path)
+            .values(hierarchy_path=literal(new_path) + func.substr(table.c.hierarchy_path, len(old_path) + 1))
+        )
+
+        # Keep already loaded descendants consistent with the database
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, Task):
+                current = obj.__dict__.get("hierarchy_path")
+                if current and current != old_path and current.startswith(old_path):
+                    attributes.set_committed_value(obj, "hierarchy_path", new_path + current[len(old_path):])
@@ -24,6 +24,7 @@ class TaskResult(Base):
     # Output
     output_code = Column(Text, nullable=False)  # Código gerado
     file_path = Column(String(500))  # Onde salvar o arquivo
+    interface_summary = Column(Text, nullable=True)  # Assinaturas/tipos/rotas do código (contexto das tasks dependentes)
 
     # Execution metadata
     model_used = Column(String(100))  # "claude-3-haiku-20240307" ou "claude-sonnet-4-20250514"
@@ -36,6 +37,7 @@ class TaskResult(Base):
     validation_passed = Column(Boolean, default=False)
     validation_issues = Column(JSON, default=list)  # Lista de problemas encontrados
     attempts = Column(Integer, default=1)  # Quantas tentativas foram necessárias
+    execution_metrics = Column(JSON, nullable=True)  # Por tentativa (geração completa/reparo, tokens em cache, custo) e economia estimada dos reparos
 
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow)
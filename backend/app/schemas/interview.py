@@ -54,6 +54,16 @@ class InterviewMessageCreate(BaseModel):
     content: str = Field(..., min_length=1, description="Message content")
 
 
+class InterviewMessagePage(BaseModel):
+    """Schema for a page of interview messages (cursor pagination)"""
+    messages: List[Dict[str, Any]] = Field(..., description="Messages, oldest first, each with its seq")
+    next_cursor: Optional[int] = Field(
+        None,
+        description="seq to pass as `after` (or `before` when paging backwards) for the next page; null on the last page"
+    )
+    total: int = Field(..., description="Number of messages in the conversation")
+
+
 class InterviewResponse(InterviewBase):
     """Schema for Interview response"""
     id: UUID
@@ -327,6 +327,7 @@ class TaskResultResponse(BaseModel):
     validation_passed: bool
     validation_issues: List[str] = Field(default_factory=list)
     attempts: int
+    execution_metrics: Optional[Dict[str, Any]] = None
     created_at: datetime
 
     class Config:
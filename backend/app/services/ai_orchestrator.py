@@ -3,8 +3,10 @@ Service central para orquestração de múltiplos modelos de IA
 Gerencia Anthropic, OpenAI e Google AI de forma inteligente
 """
 
-from typing import Dict, List, Optional, Literal
+from typing import AsyncIterator, Dict, List, Optional, Literal
 from sqlalchemy.orm import Session
+from contextlib import contextmanager
+from contextvars import ContextVar
 import logging
 import time
 import json  # PROMPT #74 - For cache key generation
@@ -29,6 +31,42 @@ UsageType = Literal[
     "general"
 ]
 
+# Token usage accumulator of the current asyncio task (see track_usage)
+_usage_meter: ContextVar[Optional[Dict[str, int]]] = ContextVar("ai_usage_meter", default=None)
+
+
+@contextmanager
+def track_usage():
+    """
+    Accumulate the token usage of every execute() call made inside the block.
+
+    The meter is bound to the current asyncio task (context variable), so
+    concurrent requests sharing the process are not counted.
+
+    Usage:
+        with track_usage() as usage:
+            await service.generate(...)
+        spent = usage["total_tokens"]
+
+    Yields:
+        Dict with input_tokens, output_tokens and total_tokens
+    """
+    meter = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+    token = _usage_meter.set(meter)
+    try:
+        yield meter
+    finally:
+        _usage_meter.reset(token)
+
+
+def _record_usage(usage: Optional[Dict]):
+    """Add one execution's usage to the active meter (if any)."""
+    meter = _usage_meter.get()
+    if meter is None or not usage:
+        return
+    for key in meter:
+        meter[key] += usage.get(key) or 0
+
 
 class AIOrchestrator:
     """
@@ -586,6 +624,7 @@ class AIOrchestrator:
             result["db_model_id"] = model_config["db_model_id"]
             result["db_model_name"] = model_config["db_model_name"]
             result["rag_enhanced"] = rag_context_injected  # PROMPT #83
+            _record_usage(result.get("usage"))
 
             # PROMPT #54 - Log successful execution to database
             # PROMPT #89 - Include RAG metrics
@@ -781,6 +820,216 @@ class AIOrchestrator:
             # Re-raise - removido fallback automático para garantir uso do modelo configurado
             raise
 
+    async def execute_stream(
+        self,
+        usage_type: UsageType,
+        messages: List[Dict],
+        system_prompt: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        project_id: Optional[UUID] = None,
+        interview_id: Optional[UUID] = None,
+        task_id: Optional[UUID] = None,
+        metadata: Optional[Dict] = None
+    ) -> AsyncIterator[str]:
+        """
+        Executa chamada de IA em streaming, produzindo o texto conforme é gerado
+
+        Mesmo modelo e configurações de execute(). Anthropic e OpenAI fazem
+        streaming real; os demais providers produzem a resposta inteira em um
+        único trecho. A execução é registrada (AIExecution/Prompt) ao final.
+
+        Args:
+            usage_type: Tipo de uso para seleção do modelo
+            messages: Lista de mensagens no formato [{"role": "user/assistant", "content": "..."}]
+            system_prompt: System prompt opcional
+            max_tokens: Máximo de tokens (se None, usa configuração do banco)
+            project_id: ID do projeto (para logging de prompts)
+            interview_id: ID da entrevista (para contexto)
+            task_id: ID da task (para contexto)
+            metadata: Metadados adicionais (para contexto)
+
+        Yields:
+            Trechos de texto da resposta, na ordem
+        """
+        model_config = self.choose_model(usage_type)
+        provider = model_config["provider"]
+        model_name = model_config["model"]
+
+        if provider not in ("anthropic", "openai"):
+            result = await self.execute(
+                usage_type=usage_type,
+                messages=messages,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                project_id=project_id,
+                interview_id=interview_id,
+                task_id=task_id,
+                metadata=metadata
+            )
+            yield result.get("content", "")
+            return
+
+        tokens_limit = max_tokens if max_tokens is not None else model_config["max_tokens"]
+        temperature = model_config["temperature"]
+        stream = self._stream_anthropic if provider == "anthropic" else self._stream_openai
+
+        start_time = time.time()
+        usage: Dict[str, int] = {}
+        parts: List[str] = []
+        try:
+            async for text in stream(model_name, messages, system_prompt, tokens_limit, temperature, usage):
+                parts.append(text)
+                yield text
+        except Exception as e:
+            logger.error(f"❌ Error streaming with {provider} ({model_name}): {str(e)}")
+            self._log_stream_execution(
+                model_config, usage_type, messages, system_prompt, None, usage, temperature,
+                tokens_limit, start_time, project_id, interview_id, task_id, metadata, error=str(e)
+            )
+            raise
+
+        _record_usage(usage)
+        self._log_stream_execution(
+            model_config, usage_type, messages, system_prompt, "".join(parts), usage, temperature,
+            tokens_limit, start_time, project_id, interview_id, task_id, metadata
+        )
+
+    async def _stream_anthropic(
+        self,
+        model: str,
+        messages: List[Dict],
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        usage: Dict[str, int]
+    ) -> AsyncIterator[str]:
+        """Streaming com Anthropic Claude; preenche `usage` ao final."""
+        client = self.clients["anthropic"]  # AsyncAnthropic instance
+
+        async with client.messages.stream(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_prompt if system_prompt else "You are a helpful AI assistant.",
+            messages=messages
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+            final = await stream.get_final_message()
+
+        usage["input_tokens"] = final.usage.input_tokens
+        usage["output_tokens"] = final.usage.output_tokens
+        usage["total_tokens"] = final.usage.input_tokens + final.usage.output_tokens
+
+    async def _stream_openai(
+        self,
+        model: str,
+        messages: List[Dict],
+        system_prompt: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        usage: Dict[str, int]
+    ) -> AsyncIterator[str]:
+        """Streaming com OpenAI GPT; preenche `usage` ao final."""
+        client = self.clients["openai"]  # AsyncOpenAI instance
+
+        openai_messages = []
+        if system_prompt:
+            openai_messages.append({"role": "system", "content": system_prompt})
+        openai_messages.extend(messages)
+
+        stream = await client.chat.completions.create(
+            model=model,
+            messages=openai_messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+            if getattr(chunk, "usage", None):
+                usage["input_tokens"] = chunk.usage.prompt_tokens
+                usage["output_tokens"] = chunk.usage.completion_tokens
+                usage["total_tokens"] = chunk.usage.total_tokens
+
+    def _log_stream_execution(
+        self,
+        model_config: Dict,
+        usage_type: str,
+        messages: List[Dict],
+        system_prompt: Optional[str],
+        content: Optional[str],
+        usage: Dict[str, int],
+        temperature: float,
+        tokens_limit: int,
+        start_time: float,
+        project_id: Optional[UUID],
+        interview_id: Optional[UUID],
+        task_id: Optional[UUID],
+        metadata: Optional[Dict],
+        error: Optional[str] = None
+    ):
+        """Registra uma execução em streaming (AIExecution e, com project_id, Prompt)."""
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        provider = model_config["provider"]
+        model_name = model_config["model"]
+        try:
+            self.db.add(AIExecution(
+                ai_model_id=UUID(model_config["db_model_id"]) if model_config.get("db_model_id") else None,
+                usage_type=usage_type,
+                input_messages=messages,
+                system_prompt=system_prompt,
+                response_content=content,
+                input_tokens=usage.get("input_tokens"),
+                output_tokens=usage.get("output_tokens"),
+                total_tokens=usage.get("total_tokens"),
+                provider=provider,
+                model_name=model_name,
+                temperature=str(temperature),
+                max_tokens=tokens_limit,
+                execution_metadata={"streamed": True},
+                error_message=error,
+                execution_time_ms=execution_time_ms,
+                created_at=datetime.utcnow()
+            ))
+
+            if project_id:
+                user_prompt_text = next(
+                    (msg.get("content", "") for msg in reversed(messages) if msg.get("role") == "user"), ""
+                )
+                input_tokens = usage.get("input_tokens", 0)
+                output_tokens = usage.get("output_tokens", 0)
+                prompt_metadata = dict(metadata or {}, streamed=True)
+                if task_id:
+                    prompt_metadata["task_id"] = str(task_id)
+                self.db.add(Prompt(
+                    project_id=project_id,
+                    created_from_interview_id=interview_id,
+                    content=content or "",
+                    type=usage_type,
+                    ai_model_used=f"{provider}/{model_name}",
+                    system_prompt=system_prompt,
+                    user_prompt=user_prompt_text,
+                    response=content or "",
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    # Rough estimate: $3/million input, $15/million output for Claude Sonnet
+                    total_cost_usd=(input_tokens * 3 / 1_000_000) + (output_tokens * 15 / 1_000_000),
+                    execution_time_ms=execution_time_ms,
+                    execution_metadata=prompt_metadata,
+                    status="error" if error else "success",
+                    error_message=error,
+                    created_at=datetime.utcnow(),
+                    updated_at=datetime.utcnow()
+                ))
+
+            self.db.commit()
+        except Exception as log_error:
+            logger.error(f"⚠️  Failed to log streamed execution to database: {log_error}")
+            self.db.rollback()
+
     async def _execute_anthropic(
         self,
         model: str,
@@ -4,7 +4,7 @@ AI-powered backlog generation (Epic → Story → Task decomposition)
 JIRA Transformation - Phase 2
 """
 
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 import json
@@ -15,6 +15,8 @@ from app.models.interview import Interview
 from app.models.spec import Spec, SpecScope
 from app.models.project import Project
 from app.services.ai_orchestrator import AIOrchestrator
+from app.services.hierarchy_loader import HierarchyLoader
+from app.services.streaming_json import IncrementalJSONParser
 from app.prompter.facade import PrompterFacade
 from app.prompts import PromptService, get_prompt_service
 
@@ -113,6 +115,8 @@ class BacklogGeneratorService:
         self.orchestrator = AIOrchestrator(db)
         # PROMPT #103 - Use PromptService for external prompts
         self.prompt_service = get_prompt_service(db)
+        # Tasks cached by id for this service (shared hierarchy loader)
+        self.hierarchy = HierarchyLoader(db)
 
     async def generate_epic_from_interview(
         self,
@@ -345,7 +349,8 @@ LEMBRE-SE:
     async def decompose_epic_to_stories(
         self,
         epic_id: UUID,
-        project_id: UUID
+        project_id: UUID,
+        on_item: Optional[Callable[[Dict], Awaitable[None]]] = None
     ) -> List[Dict]:
         """
         Decompose Epic into Story suggestions using AI
@@ -359,6 +364,8 @@ LEMBRE-SE:
         Args:
             epic_id: Epic ID to decompose
             project_id: Project ID
+            on_item: Streams the AI answer and awaits this with each Story
+                as soon as its JSON object is complete (bypasses the prompt cache)
 
         Returns:
             List of Story suggestions:
@@ -379,12 +386,9 @@ LEMBRE-SE:
             ValueError: If Epic not found or not an Epic type
         """
         # 1. Fetch Epic
-        epic = self.db.query(Task).filter(
-            Task.id == epic_id,
-            Task.item_type == ItemType.EPIC
-        ).first()
+        epic = self.hierarchy.get(epic_id)
 
-        if not epic:
+        if not epic or epic.item_type != ItemType.EPIC:
             raise ValueError(f"Epic {epic_id} not found or is not an Epic")
 
         # 2. Build AI prompt (EM PORTUGUÊS - PROMPT #83 - Semantic References Methodology)
@@ -551,6 +555,25 @@ LEMBRE-SE:
         # 3. Call AI (PROMPT #54.3 - Using PrompterFacade for cache support)
         logger.info(f"🎯 Decomposing Epic {epic_id} into Stories... (RAG: {rag_story_count} similar stories)")
 
+        story_metadata = {
+            "source": "epic_decomposition",
+            "epic_id": str(epic_id),
+            "rag_enhanced": rag_story_count > 0,  # PROMPT #85 - Phase 3
+            "rag_similar_stories": rag_story_count,  # PROMPT #85 - Phase 3
+        }
+
+        if on_item is not None:
+            stories_suggestions = await self._stream_suggestions(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                project_id=project_id,
+                metadata={"operation": "decompose_epic_to_stories", "epic_id": str(epic_id)},
+                finalize=lambda story: self._finalize_suggestion(story, epic_id, story_metadata),
+                on_item=on_item
+            )
+            logger.info(f"✅ Streamed {len(stories_suggestions)} Stories from Epic")
+            return stories_suggestions
+
         try:
             result = await self.prompter.execute_prompt(
                 prompt=user_prompt,
@@ -589,40 +612,14 @@ LEMBRE-SE:
 
             # Add metadata and parent_id to each Story
             for story in stories_suggestions:
-                # PROMPT #85 - Dual output: Semantic prompt + Human description
-                if "description_markdown" in story and "semantic_map" in story:
-                    # Store semantic markdown as the output prompt (Prompt tab)
-                    story["generated_prompt"] = story["description_markdown"]
-
-                    # Convert semantic to human-readable text (Description tab)
-                    story["description"] = _convert_semantic_to_human(
-                        story["description_markdown"],
-                        story["semantic_map"]
-                    )
-                elif "description_markdown" in story:
-                    # Fallback: no semantic_map, use description_markdown as-is
-                    story["description"] = story["description_markdown"]
-                    story["generated_prompt"] = story["description_markdown"]
-
-                # Add semantic_map to interview_insights for traceability
-                if "semantic_map" in story:
-                    if "interview_insights" not in story:
-                        story["interview_insights"] = {}
-                    story["interview_insights"]["semantic_map"] = story["semantic_map"]
-
-                story["parent_id"] = str(epic_id)
-                story["_metadata"] = {
-                    "source": "epic_decomposition",
-                    "epic_id": str(epic_id),
-                    "ai_model": result.get("model", "unknown"),
-                    "input_tokens": result.get("input_tokens", 0),
-                    "output_tokens": result.get("output_tokens", 0),
-                    "cache_hit": result.get("cache_hit", False),
-                    "cache_type": result.get("cache_type", None),
-                    "rag_enhanced": rag_story_count > 0,  # PROMPT #85 - Phase 3
-                    "rag_similar_stories": rag_story_count,  # PROMPT #85 - Phase 3
-                    "uses_semantic_references": "semantic_map" in story  # PROMPT #83
-                }
+                self._finalize_suggestion(story, epic_id, dict(
+                    story_metadata,
+                    ai_model=result.get("model", "unknown"),
+                    input_tokens=result.get("input_tokens", 0),
+                    output_tokens=result.get("output_tokens", 0),
+                    cache_hit=result.get("cache_hit", False),
+                    cache_type=result.get("cache_type", None)
+                ))
 
             logger.info(f"✅ Generated {len(stories_suggestions)} Stories from Epic (cache: {result.get('cache_hit', False)})")
             return stories_suggestions
@@ -635,7 +632,8 @@ LEMBRE-SE:
     async def decompose_story_to_tasks(
         self,
         story_id: UUID,
-        project_id: UUID
+        project_id: UUID,
+        on_item: Optional[Callable[[Dict], Awaitable[None]]] = None
     ) -> List[Dict]:
         """
         Decompose Story into Task suggestions using AI (FUNCTIONAL ONLY)
@@ -653,6 +651,8 @@ LEMBRE-SE:
         Args:
             story_id: Story ID to decompose
             project_id: Project ID
+            on_item: Streams the AI answer and awaits this with each Task
+                as soon as its JSON object is complete (bypasses the prompt cache)
 
         Returns:
             List of Task suggestions:
@@ -672,12 +672,9 @@ LEMBRE-SE:
             ValueError: If Story not found or not a Story type
         """
         # 1. Fetch Story
-        story = self.db.query(Task).filter(
-            Task.id == story_id,
-            Task.item_type == ItemType.STORY
-        ).first()
+        story = self.hierarchy.get(story_id)
 
-        if not story:
+        if not story or story.item_type != ItemType.STORY:
             raise ValueError(f"Story {story_id} not found or is not a Story")
 
         # 2. Build AI prompt (EM PORTUGUÊS - PROMPT #83 - Semantic References Methodology)
@@ -843,6 +840,25 @@ LEMBRE-SE:
         # 4. Call AI (PROMPT #54.3 - Using PrompterFacade for cache support)
         logger.info(f"🎯 Decomposing Story {story_id} into Tasks... (RAG: {rag_task_count} similar tasks)")
 
+        task_metadata = {
+            "source": "story_decomposition",
+            "story_id": str(story_id),
+            "rag_enhanced": rag_task_count > 0,  # PROMPT #85 - Phase 3
+            "rag_similar_tasks": rag_task_count,  # PROMPT #85 - Phase 3
+        }
+
+        if on_item is not None:
+            tasks_suggestions = await self._stream_suggestions(
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                project_id=project_id,
+                metadata={"operation": "decompose_story_to_tasks", "story_id": str(story_id)},
+                finalize=lambda task: self._finalize_suggestion(task, story_id, task_metadata),
+                on_item=on_item
+            )
+            logger.info(f"✅ Streamed {len(tasks_suggestions)} Tasks from Story")
+            return tasks_suggestions
+
         try:
             result = await self.prompter.execute_prompt(
                 prompt=user_prompt,
@@ -881,40 +897,14 @@ LEMBRE-SE:
 
             # Add metadata and parent_id to each Task
             for task in tasks_suggestions:
-                # PROMPT #85 - Dual output: Semantic prompt + Human description
-                if "description_markdown" in task and "semantic_map" in task:
-                    # Store semantic markdown as the output prompt (Prompt tab)
-                    task["generated_prompt"] = task["description_markdown"]
-
-                    # Convert semantic to human-readable text (Description tab)
-                    task["description"] = _convert_semantic_to_human(
-                        task["description_markdown"],
-                        task["semantic_map"]
-                    )
-                elif "description_markdown" in task:
-                    # Fallback: no semantic_map, use description_markdown as-is
-                    task["description"] = task["description_markdown"]
-                    task["generated_prompt"] = task["description_markdown"]
-
-                # Add semantic_map to interview_insights for traceability (Tasks don't have interview_insights by default)
-                if "semantic_map" in task:
-                    if "interview_insights" not in task:
-                        task["interview_insights"] = {}
-                    task["interview_insights"]["semantic_map"] = task["semantic_map"]
-
-                task["parent_id"] = str(story_id)
-                task["_metadata"] = {
-                    "source": "story_decomposition",
-                    "story_id": str(story_id),
-                    "ai_model": result.get("model", "unknown"),
-                    "input_tokens": result.get("input_tokens", 0),
-                    "output_tokens": result.get("output_tokens", 0),
-                    "cache_hit": result.get("cache_hit", False),
-                    "cache_type": result.get("cache_type", None),
-                    "rag_enhanced": rag_task_count > 0,  # PROMPT #85 - Phase 3
-                    "rag_similar_tasks": rag_task_count,  # PROMPT #85 - Phase 3
-                    "uses_semantic_references": "semantic_map" in task  # PROMPT #83
-                }
+                self._finalize_suggestion(task, story_id, dict(
+                    task_metadata,
+                    ai_model=result.get("model", "unknown"),
+                    input_tokens=result.get("input_tokens", 0),
+                    output_tokens=result.get("output_tokens", 0),
+                    cache_hit=result.get("cache_hit", False),
+                    cache_type=result.get("cache_type", None)
+                ))
 
             logger.info(f"✅ Generated {len(tasks_suggestions)} Tasks from Story (cache: {result.get('cache_hit', False)})")
             return tasks_suggestions
@@ -924,6 +914,93 @@ LEMBRE-SE:
             logger.error(f"AI response: {result.get('response', result.get('content', ''))}")
             raise ValueError(f"AI did not return valid JSON: {str(e)}")
 
+    def _finalize_suggestion(self, item: Dict, parent_id: UUID, metadata: Dict) -> Dict:
+        """
+        Complete one Story/Task suggestion parsed from the AI answer.
+
+        Args:
+            item: Suggestion as returned by the AI (modified in place)
+            parent_id: Epic (for Stories) or Story (for Tasks) ID
+            metadata: Generation metadata stored as _metadata
+
+        Returns:
+            The suggestion with description, generated_prompt, parent_id and _metadata
+        """
+        # PROMPT #85 - Dual output: Semantic prompt + Human description
+        if "description_markdown" in item and "semantic_map" in item:
+            # Store semantic markdown as the output prompt (Prompt tab)
+            item["generated_prompt"] = item["description_markdown"]
+
+            # Convert semantic to human-readable text (Description tab)
+            item["description"] = _convert_semantic_to_human(
+                item["description_markdown"],
+                item["semantic_map"]
+            )
+        elif "description_markdown" in item:
+            # Fallback: no semantic_map, use description_markdown as-is
+            item["description"] = item["description_markdown"]
+            item["generated_prompt"] = item["description_markdown"]
+
+        # Add semantic_map to interview_insights for traceability
+        if "semantic_map" in item:
+            if "interview_insights" not in item:
+                item["interview_insights"] = {}
+            item["interview_insights"]["semantic_map"] = item["semantic_map"]
+
+        item["parent_id"] = str(parent_id)
+        item["_metadata"] = dict(metadata, uses_semantic_references="semantic_map" in item)  # PROMPT #83
+        return item
+
+    async def _stream_suggestions(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        project_id: UUID,
+        metadata: Dict,
+        finalize: Callable[[Dict], Dict],
+        on_item: Callable[[Dict], Awaitable[None]]
+    ) -> List[Dict]:
+        """
+        Stream a JSON array of suggestions, handing each one over as soon as it closes.
+
+        Args:
+            system_prompt: System prompt
+            user_prompt: User prompt
+            project_id: Project ID (prompt audit)
+            metadata: Audit metadata of the AI call
+            finalize: Completes a parsed suggestion (see _finalize_suggestion)
+            on_item: Awaited with each finalized suggestion, in order
+
+        Returns:
+            All finalized suggestions
+
+        Raises:
+            ValueError: If the AI answer is not a (complete) JSON array
+        """
+        parser = IncrementalJSONParser()
+        suggestions: List[Dict] = []
+        try:
+            async for chunk in self.orchestrator.execute_stream(
+                usage_type="prompt_generation",
+                messages=[{"role": "user", "content": user_prompt}],
+                system_prompt=system_prompt,
+                project_id=project_id,
+                metadata=dict(metadata, streamed=True)
+            ):
+                for event in parser.feed(chunk):
+                    if event.path == ():
+                        if not isinstance(event.value, list):
+                            raise ValueError("AI response is not a list")
+                    elif event.kind == "end" and len(event.path) == 1 and isinstance(event.value, dict):
+                        suggestion = finalize(event.value)
+                        suggestions.append(suggestion)
+                        await on_item(suggestion)
+            parser.finish()
+        except ValueError as e:
+            logger.error(f"❌ Failed to parse streamed AI response as JSON: {e}")
+            raise ValueError(f"AI did not return valid JSON: {str(e)}")
+        return suggestions
+
     def _format_conversation(self, conversation: List[Dict]) -> str:
         """
         Format interview conversation for AI consumption
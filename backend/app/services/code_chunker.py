@@ -0,0 +1,377 @@
+"""
+Code Chunker
+
+Structure-aware chunking of source files for Code RAG.
+
+Instead of storing one diluted embedding per file, files are split along
+class/function boundaries so retrieval can return the exact region that is
+relevant to a task.
+
+Supported structure detection:
+- Python (indentation based: class / def / async def, with decorators)
+- PHP (class / interface / trait / enum / function, brace depth tracking)
+- TypeScript / JavaScript (class / interface / enum / type / function /
+  arrow function constants / class methods, brace depth tracking)
+
+Other languages fall back to fixed-size line windows.
+
+Usage:
+    from app.services.code_chunker import CodeChunker
+
+    chunker = CodeChunker()
+    for chunk in chunker.chunk(content, "php"):
+        print(chunk.symbol, chunk.start_line, chunk.end_line)
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+@dataclass
+class CodeChunk:
+    """
+    A contiguous region of a source file.
+
+    Line numbers are 1-based and inclusive.
+    """
+
+    index: int
+    symbol: str          # e.g. "UserController.store", "module", "helpers (part 2)"
+    kind: str            # module, class, function, method, window
+    start_line: int
+    end_line: int
+    content: str
+
+    @property
+    def line_count(self) -> int:
+        return self.end_line - self.start_line + 1
+
+
+class CodeChunker:
+    """
+    Splits source code into chunks that follow code structure.
+
+    Chunks never exceed MAX_CHUNK_LINES; oversized declarations are split into
+    windows that overlap by OVERLAP_LINES so a boundary never cuts context
+    completely. Tiny adjacent declarations are merged to avoid a flood of
+    near-empty embeddings.
+    """
+
+    # Hard upper bound for a single chunk (lines)
+    MAX_CHUNK_LINES = 120
+
+    # Segments smaller than this are merged into the previous chunk
+    MIN_CHUNK_LINES = 6
+
+    # Overlap between consecutive windows of an oversized declaration
+    OVERLAP_LINES = 10
+
+    # Hard upper bound for a single chunk (chars) - protects the embedder
+    MAX_CHUNK_CHARS = 8000
+
+    STRUCTURED_LANGUAGES = {"python", "php", "typescript", "javascript"}
+
+    # Python declarations (indentation defines scope)
+    _PY_DECL = re.compile(r"^(\s*)(async\s+def|def|class)\s+(\w+)")
+
+    # PHP declarations
+    _PHP_CLASS = re.compile(
+        r"^\s*(?:(?:abstract|final|readonly)\s+)*(class|interface|trait|enum)\s+(\w+)"
+    )
+    _PHP_FUNCTION = re.compile(
+        r"^\s*(?:(?:public|protected|private|static|abstract|final)\s+)*function\s+&?(\w+)\s*\("
+    )
+
+    # TypeScript / JavaScript declarations
+    _TS_CLASS = re.compile(
+        r"^\s*(?:export\s+)?(?:default\s+)?(?:declare\s+)?(?:abstract\s+)?(class|interface|enum)\s+(\w+)"
+    )
+    _TS_FUNCTION = re.compile(
+        r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s*\*?\s*(\w+)"
+    )
+    _TS_ARROW = re.compile(
+        r"^\s*(?:export\s+)?(?:const|let|var)\s+(\w+)\s*(?::[^=]+)?=\s*(?:async\s*)?"
+        r"(?:function\b|\([^)]*\)?\s*(?::[^=]+)?(?:=>|$)|\w+\s*=>)"
+    )
+    _TS_TYPE = re.compile(r"^\s*(?:export\s+)?type\s+(\w+)\s*(?:<[^>]*>)?\s*=")
+    _TS_METHOD = re.compile(
+        r"^\s*(?:(?:public|private|protected|static|async|readonly|override|abstract|get|set)\s+)*"
+        r"\*?\s*(#?\w+)\s*(?:<[^>]*>)?\s*\("
+    )
+
+    # Identifiers that look like calls/methods but are control flow
+    _NOT_METHODS = {
+        "if", "for", "while", "switch", "catch", "return", "function",
+        "super", "new", "await", "typeof", "else",
+    }
+
+    # Leading lines attached to the following declaration
+    _ATTACHED_PREFIXES = ("@", "#[", "/**", "/*", "*", "//", "#")
+
+    _STRING_LITERAL = re.compile(r"'(?:\\.|[^'\\])*'|\"(?:\\.|[^\"\\])*\"|`(?:\\.|[^`\\])*`")
+
+    def chunk(self, content: str, language: Optional[str]) -> List[CodeChunk]:
+        """
+        Split file content into structure-aware chunks.
+
+        Args:
+            content: Full file content
+            language: Language name as detected by CodebaseIndexer
+
+        Returns:
+            List of CodeChunk ordered by position (empty for empty files)
+        """
+        lines = content.splitlines()
+        if not any(line.strip() for line in lines):
+            return []
+
+        if language == "python":
+            boundaries = self._python_boundaries(lines)
+        elif language == "php":
+            boundaries = self._brace_boundaries(lines, php=True)
+        elif language in ("typescript", "javascript"):
+            boundaries = self._brace_boundaries(lines, php=False)
+        else:
+            boundaries = []
+
+        segments = self._build_segments(lines, boundaries)
+        segments = self._merge_small_segments(segments)
+
+        chunks: List[CodeChunk] = []
+        for symbol, kind, start, end in segments:
+            for part_symbol, part_kind, part_start, part_end in self._split_oversized(
+                symbol, kind, start, end
+            ):
+                text = "\n".join(lines[part_start:part_end + 1])
+                if not text.strip():
+                    continue
+                chunks.append(CodeChunk(
+                    index=len(chunks),
+                    symbol=part_symbol,
+                    kind=part_kind,
+                    start_line=part_start + 1,
+                    end_line=part_end + 1,
+                    content=text[:self.MAX_CHUNK_CHARS]
+                ))
+
+        return chunks
+
+    # ------------------------------------------------------------------
+    # Boundary detection
+    # ------------------------------------------------------------------
+
+    def _python_boundaries(self, lines: List[str]) -> List[Tuple[int, str, str]]:
+        """Find top-level and class-member declarations in Python code."""
+        boundaries = []
+        class_stack: List[Tuple[int, str]] = []  # (indent, class name)
+
+        for i, line in enumerate(lines):
+            match = self._PY_DECL.match(line)
+            if not match:
+                continue
+
+            indent = len(match.group(1).expandtabs(4))
+            keyword, name = match.group(2), match.group(3)
+
+            while class_stack and indent <= class_stack[-1][0]:
+                class_stack.pop()
+
+            if not class_stack and indent == 0:
+                kind = "class" if keyword == "class" else "function"
+                boundaries.append((i, name, kind))
+            elif len(class_stack) == 1 and indent > class_stack[0][0] and keyword != "class":
+                # Method directly inside a top-level class
+                boundaries.append((i, f"{class_stack[0][1]}.{name}", "method"))
+
+            if keyword == "class":
+                class_stack.append((indent, name))
+
+        return self._attach_leading_lines(lines, boundaries)
+
+    def _brace_boundaries(self, lines: List[str], php: bool) -> List[Tuple[int, str, str]]:
+        """Find top-level and class-member declarations in brace languages."""
+        boundaries = []
+        depth = 0
+        class_name: Optional[str] = None
+        class_depth = 0
+        pending_class: Optional[str] = None
+        in_block_comment = False
+
+        for i, line in enumerate(lines):
+            stripped = line.strip()
+
+            if in_block_comment:
+                if "*/" in stripped:
+                    in_block_comment = False
+                continue
+            if stripped.startswith("/*") and "*/" not in stripped:
+                in_block_comment = True
+                continue
+
+            if class_name is not None and depth < class_depth:
+                class_name = None
+
+            if depth == 0:
+                decl = self._match_top_level(stripped, php)
+                if decl:
+                    name, kind = decl
+                    boundaries.append((i, name, kind))
+                    if kind == "class":
+                        pending_class = name
+            elif class_name is not None and depth == class_depth:
+                method = self._match_method(stripped, php)
+                if method:
+                    boundaries.append((i, f"{class_name}.{method}", "method"))
+
+            opens, closes = self._count_braces(line)
+            if pending_class is not None and opens > 0:
+                class_name = pending_class
+                class_depth = depth + 1
+                pending_class = None
+            depth = max(depth + opens - closes, 0)
+
+        return self._attach_leading_lines(lines, boundaries)
+
+    def _match_top_level(self, stripped: str, php: bool) -> Optional[Tuple[str, str]]:
+        """Match a top-level declaration, returning (name, kind)."""
+        if php:
+            match = self._PHP_CLASS.match(stripped)
+            if match:
+                return match.group(2), "class"
+            match = self._PHP_FUNCTION.match(stripped)
+            if match:
+                return match.group(1), "function"
+            return None
+
+        match = self._TS_CLASS.match(stripped)
+        if match:
+            return match.group(2), "class"
+        for pattern in (self._TS_FUNCTION, self._TS_ARROW, self._TS_TYPE):
+            match = pattern.match(stripped)
+            if match:
+                return match.group(1), "function"
+        return None
+
+    def _match_method(self, stripped: str, php: bool) -> Optional[str]:
+        """Match a method declaration inside a class body."""
+        if php:
+            match = self._PHP_FUNCTION.match(stripped)
+            return match.group(1) if match else None
+
+        match = self._TS_METHOD.match(stripped)
+        if not match:
+            match = self._TS_ARROW.match(stripped.replace("readonly ", ""))
+            if not match:
+                return None
+        name = match.group(1)
+        if name in self._NOT_METHODS or stripped.endswith(";"):
+            return None
+        return name
+
+    def _count_braces(self, line: str) -> Tuple[int, int]:
+        """Count braces on a line, ignoring string literals and line comments."""
+        code = self._STRING_LITERAL.sub("", line)
+        comment_at = code.find("//")
+        if comment_at != -1:
+            code = code[:comment_at]
+        return code.count("{"), code.count("}")
+
+    def _attach_leading_lines(
+        self,
+        lines: List[str],
+        boundaries: List[Tuple[int, str, str]]
+    ) -> List[Tuple[int, str, str]]:
+        """Move boundaries up to include decorators and doc comments."""
+        attached = []
+        previous = -1
+        for start, name, kind in boundaries:
+            while start - 1 > previous and lines[start - 1].strip().startswith(self._ATTACHED_PREFIXES):
+                start -= 1
+            attached.append((start, name, kind))
+            previous = start
+        return attached
+
+    # ------------------------------------------------------------------
+    # Segment shaping
+    # ------------------------------------------------------------------
+
+    def _build_segments(
+        self,
+        lines: List[str],
+        boundaries: List[Tuple[int, str, str]]
+    ) -> List[Tuple[str, str, int, int]]:
+        """Turn boundary starts into (symbol, kind, start, end) segments (0-based)."""
+        total = len(lines)
+        if not boundaries:
+            return [("module", "module", 0, total - 1)]
+
+        segments = []
+        if boundaries[0][0] > 0:
+            segments.append(("module", "module", 0, boundaries[0][0] - 1))
+
+        for idx, (start, name, kind) in enumerate(boundaries):
+            end = boundaries[idx + 1][0] - 1 if idx + 1 < len(boundaries) else total - 1
+            if end >= start:
+                segments.append((name, kind, start, end))
+
+        return segments
+
+    def _merge_small_segments(
+        self,
+        segments: List[Tuple[str, str, int, int]]
+    ) -> List[Tuple[str, str, int, int]]:
+        """
+        Merge tiny segments while staying under the size cap.
+
+        A tiny segment is carried forward into the next one (so a class header
+        stays with its first member); a trailing tiny segment joins its predecessor.
+        """
+        merged: List[Tuple[str, str, int, int]] = []
+        carry: Optional[Tuple[str, str, int, int]] = None
+
+        for symbol, kind, start, end in segments:
+            if carry is not None:
+                if end - carry[2] + 1 <= self.MAX_CHUNK_LINES:
+                    symbol, kind, start = carry[0], carry[1], carry[2]
+                else:
+                    merged.append(carry)
+                carry = None
+
+            if end - start + 1 < self.MIN_CHUNK_LINES:
+                carry = (symbol, kind, start, end)
+                continue
+            merged.append((symbol, kind, start, end))
+
+        if carry is not None:
+            if merged and carry[3] - merged[-1][2] + 1 <= self.MAX_CHUNK_LINES:
+                prev_symbol, prev_kind, prev_start, _ = merged[-1]
+                merged[-1] = (prev_symbol, prev_kind, prev_start, carry[3])
+            else:
+                merged.append(carry)
+
+        return merged
+
+    def _split_oversized(
+        self,
+        symbol: str,
+        kind: str,
+        start: int,
+        end: int
+    ) -> List[Tuple[str, str, int, int]]:
+        """Split a segment larger than MAX_CHUNK_LINES into overlapping windows."""
+        if end - start + 1 <= self.MAX_CHUNK_LINES:
+            return [(symbol, kind, start, end)]
+
+        step = self.MAX_CHUNK_LINES - self.OVERLAP_LINES
+        parts = []
+        window_start = start
+        part = 1
+        while window_start <= end:
+            window_end = min(window_start + self.MAX_CHUNK_LINES - 1, end)
+            parts.append((f"{symbol} (part {part})", kind if kind != "module" else "window", window_start, window_end))
+            if window_end == end:
+                break
+            window_start += step
+            part += 1
+        return parts
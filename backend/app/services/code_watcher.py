@@ -0,0 +1,423 @@
+"""
+Code Watcher Service
+
+Keeps the Code RAG index fresh while files change on disk.
+
+Watches the project_folder of every project (inotify/FSEvents through
+watchdog when installed, os.scandir polling otherwise), debounces bursts of
+writes, and pushes the changed paths through a bounded work queue into the
+incremental CodebaseIndexer. Runs as its own process so API workers never pay
+for file watching or embedding:
+
+    python -m app.services.code_watcher
+
+Features:
+- Native file events via watchdog (optional dependency), polling fallback
+- CodebaseIndexer.IGNORE_DIRS and unsupported extensions filtered at the source
+- Per-project debounce: a burst of writes becomes one indexing batch
+- Bounded work queue; while it is full, new events coalesce per project
+- Directory moves/deletes trigger an incremental re-index of the project
+"""
+
+import os
+import time
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.project import Project
+from app.models.code_index_entry import CodeIndexEntry
+from app.services.codebase_indexer import CodebaseIndexer
+from app.services.fs_snapshot import EXTENSION_LANGUAGES, get_snapshot_service
+
+# Native file events are optional - fall back to polling without watchdog
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+# Extensions the indexer understands (other files never reach the queue)
+INDEXED_EXTENSIONS = set(EXTENSION_LANGUAGES)
+
+
+@dataclass
+class WatchedProject:
+    """
+    Watch state of one project folder.
+
+    pending collects changed relative paths until the project has been quiet
+    for the debounce interval; rescan asks for an incremental re-index of the
+    whole folder (directory moved/deleted, paths no longer enumerable).
+    """
+
+    project_id: UUID
+    root_path: Path
+    pending: Set[str] = field(default_factory=set)
+    rescan: bool = False
+    first_event: float = 0.0
+    last_event: float = 0.0
+    snapshot: Optional[Dict[str, Tuple[int, float]]] = None   # polling fallback
+    watch: Any = None                                         # watchdog handle
+
+
+class _ProjectEventHandler(FileSystemEventHandler):
+    """watchdog handler forwarding events of one project to the event loop."""
+
+    def __init__(self, watcher: "CodeWatcher", project_id: UUID):
+        super().__init__()
+        self.watcher = watcher
+        self.project_id = project_id
+
+    def on_any_event(self, event):
+        if event.event_type not in ("created", "modified", "deleted", "moved", "closed"):
+            return
+
+        # Called on the observer thread
+        paths = [event.src_path]
+        if getattr(event, "dest_path", None):
+            paths.append(event.dest_path)
+
+        for path in paths:
+            self.watcher.loop.call_soon_threadsafe(
+                self.watcher.record, self.project_id, os.fsdecode(path),
+                event.is_directory, event.event_type
+            )
+
+
+class CodeWatcher:
+    """
+    File watcher daemon feeding the incremental code indexer.
+
+    Usage:
+        watcher = CodeWatcher()
+        await watcher.run()
+    """
+
+    PROJECT_REFRESH_SECONDS = 60.0   # pick up new / removed projects
+    MAX_DELAY_FACTOR = 10            # flush a continuous burst after 10x debounce
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        debounce_seconds: Optional[float] = None,
+        poll_interval_seconds: Optional[float] = None,
+        force_polling: Optional[bool] = None,
+        queue_size: Optional[int] = None
+    ):
+        """
+        Initialize the watcher (settings are used for unspecified values).
+
+        Args:
+            session_factory: Creates a DB session per indexing batch
+            debounce_seconds: Quiet time before a project's changes are indexed
+            poll_interval_seconds: Scan interval of the polling fallback
+            force_polling: Poll even if watchdog is installed (e.g. network/bind mounts)
+            queue_size: Maximum indexing batches waiting for the worker
+        """
+        self.session_factory = session_factory
+        self.debounce_seconds = (
+            debounce_seconds if debounce_seconds is not None else settings.code_watcher_debounce_seconds
+        )
+        self.poll_interval_seconds = (
+            poll_interval_seconds if poll_interval_seconds is not None
+            else settings.code_watcher_poll_interval_seconds
+        )
+        force_polling = force_polling if force_polling is not None else settings.code_watcher_force_polling
+        self.use_polling = force_polling or not WATCHDOG_AVAILABLE
+        self.queue_size = queue_size or settings.code_watcher_queue_size
+
+        self.projects: Dict[UUID, WatchedProject] = {}
+        self.queue: Optional[asyncio.Queue] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._observer = None
+
+    async def run(self):
+        """Watch all projects until cancelled."""
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+
+        if not self.use_polling:
+            self._observer = Observer()
+            self._observer.start()
+
+        logger.info(
+            f"Code watcher started ({'polling' if self.use_polling else 'native events'}, "
+            f"debounce={self.debounce_seconds}s)"
+        )
+
+        loops = [self._refresh_loop(), self._debounce_loop(), self._index_worker()]
+        if self.use_polling:
+            loops.append(self._poll_loop())
+
+        try:
+            await asyncio.gather(*loops)
+        finally:
+            if self._observer is not None:
+                self._observer.stop()
+                self._observer.join(timeout=5)
+
+    # ------------------------------------------------------------------
+    # Project discovery
+    # ------------------------------------------------------------------
+
+    async def _refresh_loop(self):
+        """Periodically sync the watched set with the projects table."""
+        while True:
+            try:
+                self.refresh_projects(self._load_project_folders())
+            except Exception as e:
+                logger.error(f"Code watcher could not load projects: {e}")
+            await asyncio.sleep(self.PROJECT_REFRESH_SECONDS)
+
+    def _load_project_folders(self) -> Dict[UUID, Path]:
+        """Projects with an existing project_folder."""
+        db = self.session_factory()
+        try:
+            rows = db.query(Project.id, Project.project_folder).filter(
+                Project.project_folder.isnot(None)
+            ).all()
+        finally:
+            db.close()
+
+        return {
+            project_id: Path(folder)
+            for project_id, folder in rows
+            if folder and Path(folder).is_dir()
+        }
+
+    def refresh_projects(self, folders: Dict[UUID, Path]):
+        """
+        Start watching new project folders and stop watching removed ones.
+
+        Args:
+            folders: Project id -> folder to watch
+        """
+        for project_id in list(self.projects):
+            project = self.projects[project_id]
+            if folders.get(project_id) != project.root_path:
+                if project.watch is not None:
+                    self._observer.unschedule(project.watch)
+                del self.projects[project_id]
+
+        for project_id, root_path in folders.items():
+            if project_id in self.projects:
+                continue
+
+            project = WatchedProject(project_id=project_id, root_path=root_path)
+            if self._observer is not None:
+                project.watch = self._observer.schedule(
+                    _ProjectEventHandler(self, project_id), str(root_path), recursive=True
+                )
+            self.projects[project_id] = project
+            logger.info(f"Watching project {project_id} at {root_path}")
+
+    # ------------------------------------------------------------------
+    # Event intake + debounce
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        project_id: UUID,
+        path: str,
+        is_directory: bool = False,
+        event_type: str = "modified"
+    ):
+        """
+        Record a change reported for a project (runs on the event loop).
+
+        Args:
+            project_id: Project the path belongs to
+            path: Absolute path reported by the watcher
+            is_directory: Whether the path is a directory
+            event_type: watchdog event type (created, modified, deleted, moved)
+        """
+        project = self.projects.get(project_id)
+        if project is None:
+            return
+
+        try:
+            rel_path = Path(path).relative_to(project.root_path).as_posix()
+        except ValueError:
+            return
+
+        parts = rel_path.split("/")
+        directories = parts if is_directory else parts[:-1]
+        if any(part in CodebaseIndexer.IGNORE_DIRS for part in directories):
+            return
+
+        # Cached tree walks of this folder are stale now
+        get_snapshot_service().invalidate(project.root_path)
+
+        if is_directory:
+            # A directory modification is just an entry added/removed inside it
+            # (reported separately); created/moved/deleted trees are not enumerated
+            if event_type == "modified" or rel_path == ".":
+                return
+            project.rescan = True
+        elif Path(rel_path).suffix.lower() in INDEXED_EXTENSIONS:
+            project.pending.add(rel_path)
+        else:
+            return
+
+        now = time.monotonic()
+        if not project.first_event:
+            project.first_event = now
+        project.last_event = now
+
+    async def _debounce_loop(self):
+        """Hand quiet projects' pending changes to the work queue."""
+        max_delay = self.debounce_seconds * self.MAX_DELAY_FACTOR
+
+        while True:
+            await asyncio.sleep(max(self.debounce_seconds / 2, 0.05))
+            now = time.monotonic()
+
+            for project in list(self.projects.values()):
+                if not project.pending and not project.rescan:
+                    continue
+                quiet = now - project.last_event >= self.debounce_seconds
+                overdue = now - project.first_event >= max_delay
+                if not (quiet or overdue):
+                    continue
+
+                paths = None if project.rescan else project.pending
+                project.pending, project.rescan = set(), False
+                project.first_event = 0.0
+
+                # Blocks while the queue is full; meanwhile new events keep
+                # coalescing in project.pending
+                await self.queue.put((project.project_id, project.root_path, paths))
+
+    # ------------------------------------------------------------------
+    # Polling fallback
+    # ------------------------------------------------------------------
+
+    async def _poll_loop(self):
+        """Detect changes by comparing periodic (size, mtime) snapshots."""
+        while True:
+            for project in list(self.projects.values()):
+                try:
+                    snapshot = await self.loop.run_in_executor(None, self._snapshot, project.root_path)
+                except Exception as e:
+                    logger.warning(f"Cannot poll {project.root_path}: {e}")
+                    continue
+
+                if project.snapshot is not None and project.project_id in self.projects:
+                    for rel_path in self._diff_snapshots(project.snapshot, snapshot):
+                        self.record(project.project_id, str(project.root_path / rel_path))
+                project.snapshot = snapshot
+
+            await asyncio.sleep(self.poll_interval_seconds)
+
+    def _snapshot(self, root_path: Path) -> Dict[str, Tuple[int, float]]:
+        """
+        (size, mtime) of every indexable file under root_path.
+
+        Args:
+            root_path: Project folder
+
+        Returns:
+            Dict relative POSIX path -> (size, mtime)
+        """
+        snapshot = get_snapshot_service().refresh(root_path)
+
+        return {
+            info.path: (info.size, info.mtime)
+            for info in snapshot.files
+            if info.ext in INDEXED_EXTENSIONS
+        }
+
+    @staticmethod
+    def _diff_snapshots(
+        previous: Dict[str, Tuple[int, float]],
+        current: Dict[str, Tuple[int, float]]
+    ) -> Set[str]:
+        """Paths added, removed or modified between two snapshots."""
+        changed = {path for path, info in current.items() if previous.get(path) != info}
+        changed.update(path for path in previous if path not in current)
+        return changed
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    async def _index_worker(self):
+        """Consume the work queue, one indexing batch at a time."""
+        while True:
+            project_id, root_path, paths = await self.queue.get()
+            try:
+                await self.index_changes(project_id, root_path, paths)
+            except Exception as e:
+                logger.error(f"Code watcher failed to index project {project_id}: {e}")
+            finally:
+                self.queue.task_done()
+
+    async def index_changes(
+        self,
+        project_id: UUID,
+        root_path: Path,
+        paths: Optional[Set[str]]
+    ) -> Dict:
+        """
+        Apply one batch of changes to the code index.
+
+        Args:
+            project_id: Project UUID
+            root_path: Project folder
+            paths: Changed relative paths, or None for a full incremental run
+
+        Returns:
+            Indexing statistics
+        """
+        db = self.session_factory()
+        try:
+            indexer = CodebaseIndexer(db)
+
+            # Never indexed: build the index instead of indexing a few files
+            has_index = db.query(CodeIndexEntry.id).filter(
+                CodeIndexEntry.project_id == project_id
+            ).first() is not None
+
+            if paths is None or not has_index:
+                stats = await indexer.index_directory(project_id, root_path)
+            else:
+                stats = await indexer.index_paths(project_id, root_path, paths)
+
+            logger.info(
+                f"Code watcher: project {project_id} - {stats['files_indexed']} indexed, "
+                f"{stats['files_removed']} removed"
+            )
+            return stats
+        finally:
+            db.close()
+
+
+def main():
+    """Process entry point."""
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    try:
+        asyncio.run(CodeWatcher().run())
+    except KeyboardInterrupt:
+        logger.info("Code watcher stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,10 +7,14 @@ This service indexes project codebases in RAG for context-aware code generation.
 Scans project files, extracts metadata, and stores in RAG for semantic search.
 
 Features:
-- Recursive file scanning with extension filtering
+- Recursive file scanning via the shared filesystem snapshot (os.scandir)
+- Pipelined indexing: threaded reads/parsing, batched embeddings, bulk writes
 - Metadata extraction (imports, exports, classes, functions)
-- Incremental indexing (only changed files)
+- Project symbol table kept in sync with indexed files
+- Incremental indexing via a per-project manifest (size, mtime, content hash)
+- Git-aware re-indexing: only files changed since the last indexed commit
 - Language-specific parsers
+- Structure-aware chunking (one embedding per class/function region)
 - Background job integration
 
 Usage:
@@ -21,7 +25,7 @@ Usage:
     # Index entire project
     result = await indexer.index_project(project_id)
 
-    # Index single file
+    # Re-index a single file (no-op if unchanged)
     await indexer.index_file(project_id, file_path)
 
     # Search code
@@ -34,18 +38,63 @@ Usage:
 
 import os
 import re
+import stat as stat_module
+import time
+import asyncio
+import hashlib
 import logging
-from typing import Dict, List, Optional, Set
-from uuid import UUID
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
 from pathlib import Path
 
 from sqlalchemy.orm import Session
 
 from app.services.rag_service import RAGService
+from app.services.code_chunker import CodeChunker, CodeChunk
+from app.services.job_manager import JobManager
+from app.services.symbol_index import ProjectSymbolIndex, Symbol, extract_symbols
+from app.services.fs_snapshot import (
+    FileInfo, FileSnapshot, IGNORE_DIRS, LANGUAGE_EXTENSIONS, get_snapshot_service
+)
 from app.models.project import Project
+from app.models.code_index_entry import CodeIndexEntry
+from app.models.code_index_state import CodeIndexState
 
 logger = logging.getLogger(__name__)
 
+# Symbol extraction recorded on CodeIndexState; bump to re-parse unchanged files once
+SYMBOLS_VERSION = 1
+
+
+class IndexingCancelled(Exception):
+    """Raised inside the indexing pipeline when its job was cancelled."""
+    pass
+
+
+@dataclass
+class PreparedFile:
+    """
+    Output of the read/parse stage for one file.
+
+    documents is None when the file is unchanged; touched marks unchanged
+    content whose stat info (size/mtime) must still be refreshed. symbols is
+    set whenever the content was parsed (changed files, symbol backfill).
+    """
+
+    rel_path: str
+    language: str
+    size: int
+    mtime: float
+    content_hash: Optional[str] = None
+    line_count: int = 0
+    documents: Optional[List[Dict]] = None
+    touched: bool = False
+    symbols: Optional[List[Symbol]] = None
+
 
 class CodebaseIndexer:
     """
@@ -54,35 +103,11 @@ class CodebaseIndexer:
     Indexes project files for semantic search during task execution.
     """
 
-    # Supported languages and extensions
-    LANGUAGE_EXTENSIONS = {
-        "php": [".php"],
-        "typescript": [".ts", ".tsx"],
-        "javascript": [".js", ".jsx"],
-        "python": [".py"],
-        "css": [".css", ".scss", ".sass"],
-        "html": [".html", ".blade.php"],
-        "sql": [".sql"],
-        "yaml": [".yaml", ".yml"],
-        "json": [".json"]
-    }
+    # Supported languages and extensions (shared with the snapshot service)
+    LANGUAGE_EXTENSIONS = LANGUAGE_EXTENSIONS
 
     # Directories to ignore
-    IGNORE_DIRS = {
-        "node_modules",
-        ".venv",
-        "venv",
-        "vendor",
-        ".git",
-        ".next",
-        "dist",
-        "build",
-        "__pycache__",
-        ".pytest_cache",
-        "coverage",
-        ".idea",
-        ".vscode"
-    }
+    IGNORE_DIRS = IGNORE_DIRS
 
     # File patterns to ignore
     IGNORE_PATTERNS = {
@@ -93,6 +118,13 @@ class CodebaseIndexer:
         "yarn.lock"
     }
 
+    # Pipeline sizing
+    IO_WORKERS = min(16, (os.cpu_count() or 1) + 4)   # reader/parser threads
+    EMBED_BATCH_SIZE = 64                               # documents per embedding call
+    QUEUE_SIZE = 256                                    # bound for inter-stage queues
+    PROGRESS_INTERVAL_SECONDS = 1.0                     # job progress/cancel checkpoint
+    GIT_TIMEOUT_SECONDS = 30
+
     def __init__(self, db: Session):
         """
         Initialize codebase indexer.
@@ -102,18 +134,28 @@ class CodebaseIndexer:
         """
         self.db = db
         self.rag = RAGService(db)
+        self.chunker = CodeChunker()
+        self.symbols = ProjectSymbolIndex(db)
 
     async def index_project(
         self,
         project_id: UUID,
-        force: bool = False
+        force: bool = False,
+        job_id: Optional[UUID] = None
     ) -> Dict:
         """
         Index entire project codebase.
 
+        Incremental by default: files whose size/mtime (or content hash) match
+        the manifest are skipped, changed files are re-indexed and their old
+        documents replaced, and files removed from disk are dropped from RAG.
+        When the project folder is a git repository and was indexed before,
+        only the files changed since the last indexed commit are visited.
+
         Args:
             project_id: Project UUID
-            force: If True, re-index all files even if unchanged
+            force: If True, drop the existing index and re-index all files
+            job_id: Optional code_indexing AsyncJob to report progress to
 
         Returns:
             Dict with indexing statistics
@@ -123,13 +165,435 @@ class CodebaseIndexer:
             # {
             #     "project_id": "uuid",
             #     "files_scanned": 150,
-            #     "files_indexed": 145,
+            #     "files_indexed": 12,
+            #     "files_unchanged": 133,
+            #     "files_removed": 2,
             #     "files_skipped": 5,
             #     "languages": {"php": 80, "typescript": 50, "css": 15},
             #     "total_lines": 12500
             # }
         """
-        # Get project
+        project_path = self._get_project_path(project_id)
+
+        return await self.index_directory(project_id, project_path, force=force, job_id=job_id)
+
+    async def index_directory(
+        self,
+        project_id: UUID,
+        root_path: Path,
+        force: bool = False,
+        job_id: Optional[UUID] = None,
+        snapshot: Optional[FileSnapshot] = None
+    ) -> Dict:
+        """
+        Incrementally index a directory for a project against its manifest.
+
+        In a git repository with a recorded state, the candidate files come from
+        `git diff --name-status <last>..HEAD` plus the working-tree changes
+        instead of a full tree walk; otherwise (no state, state for another
+        root, last commit no longer reachable, force) the whole tree is walked.
+
+        Runs as a staged pipeline connected by bounded queues:
+        1. walker      - filesystem snapshot or git change list (ignore rules applied)
+        2. readers     - thread pool: read, hash, extract metadata, chunk
+        3. embedder    - batches documents into one model call per batch
+        4. writer      - bulk delete/insert + manifest upsert, one commit per batch
+
+        Args:
+            project_id: Project UUID
+            root_path: Root directory to index (manifest paths are relative to it)
+            force: If True, drop the existing index and re-index all files
+            job_id: Optional code_indexing AsyncJob to report progress to
+            snapshot: Snapshot of root_path already taken by the caller
+                (a fresh one is taken otherwise)
+
+        Returns:
+            Dict with indexing statistics
+        """
+        logger.info(f"Starting codebase indexing for project {project_id} at {root_path} (force={force})")
+
+        stats = self._new_stats(project_id)
+
+        loop = asyncio.get_running_loop()
+
+        # Git position before reading anything: changes made during the run
+        # are picked up by the next one
+        git_snapshot = await loop.run_in_executor(None, self._git_snapshot, root_path)
+
+        # Index built before the symbol table existed (or with an older
+        # extraction): one full pass parses unchanged files for their symbols
+        # (no re-embedding). Recorded on the state once the pass completes,
+        # whether or not the files had any symbols.
+        state = None if force else self._load_state(project_id, root_path)
+        refresh_symbols = not force and (state is None or state.symbols_version != SYMBOLS_VERSION)
+
+        changed_paths = None
+        if not refresh_symbols and git_snapshot is not None and state is not None and state.commit_sha:
+            head, dirty_paths = git_snapshot
+            changed_paths = await loop.run_in_executor(
+                None, self._git_changed_paths, root_path, state.commit_sha, head
+            )
+            if changed_paths is not None:
+                changed_paths |= dirty_paths | set(state.pending_paths or [])
+
+        if changed_paths is not None:
+            # Git mode: manifest and walk limited to files changed since last run
+            stats["mode"] = "git"
+            manifest = self._load_manifest(project_id, changed_paths)
+            files = self._iter_paths(root_path, changed_paths)
+        else:
+            stats["mode"] = "full"
+            manifest = self._load_manifest(project_id)
+
+            # Full rebuild: explicit force, or first run without a manifest
+            # (drops code documents stored before the manifest existed)
+            if force or not manifest:
+                self._purge_code_index(project_id)
+                manifest = {}
+
+            # Manifest comparison needs exact size/mtime: never reuse an old walk
+            if snapshot is None:
+                snapshot = await loop.run_in_executor(None, get_snapshot_service().refresh, root_path)
+            files = snapshot.files
+
+        seen_paths = await self._sync_files(
+            project_id, root_path, files, manifest, stats, job_id,
+            refresh_symbols=refresh_symbols and bool(manifest)
+        )
+        if seen_paths is None:
+            return stats
+
+        self._save_state(project_id, root_path, git_snapshot, seen_paths, manifest)
+
+        logger.info(
+            f"Codebase indexing complete: {stats['files_indexed']} indexed, "
+            f"{stats['files_unchanged']} unchanged, {stats['files_removed']} removed"
+        )
+
+        return stats
+
+    async def index_paths(
+        self,
+        project_id: UUID,
+        root_path: Path,
+        rel_paths: Iterable[str]
+    ) -> Dict:
+        """
+        Re-index specific files of a project (e.g. reported by the file watcher).
+
+        Changed files are re-indexed, unchanged ones skipped, and paths that no
+        longer exist (or are no longer indexable) are removed from the index.
+        The git state is left untouched: the next full run still diffs from
+        the last indexed commit.
+
+        Args:
+            project_id: Project UUID
+            root_path: Indexed root the paths are relative to
+            rel_paths: POSIX paths relative to root_path
+
+        Returns:
+            Dict with indexing statistics
+        """
+        rel_paths = set(rel_paths)
+        stats = self._new_stats(project_id)
+        stats["mode"] = "paths"
+
+        manifest = self._load_manifest(project_id, rel_paths)
+        files = self._iter_paths(root_path, rel_paths)
+
+        await self._sync_files(project_id, root_path, files, manifest, stats)
+
+        return stats
+
+    async def _sync_files(
+        self,
+        project_id: UUID,
+        root_path: Path,
+        files: Iterable[FileInfo],
+        manifest: Dict[str, CodeIndexEntry],
+        stats: Dict,
+        job_id: Optional[UUID] = None,
+        refresh_symbols: bool = False
+    ) -> Optional[Set[str]]:
+        """
+        Run the indexing pipeline over files and reconcile the manifest.
+
+        Manifest entries whose path was not produced by files are treated as
+        deleted, so manifest must cover exactly the scope of files.
+
+        Args:
+            project_id: Project UUID
+            root_path: Indexed root
+            files: Files from a snapshot or _iter_paths
+            manifest: Manifest entries in scope, updated in place
+            stats: Statistics dict, updated in place
+            job_id: Optional code_indexing AsyncJob to report progress to
+            refresh_symbols: Also parse unchanged files to backfill their symbols
+
+        Returns:
+            Supported paths that were visited, or None if the job was cancelled
+        """
+        # Plain snapshot for reader threads (ORM instances must stay on this thread)
+        known = {
+            path: (entry.size, entry.mtime, entry.content_hash, entry.line_count)
+            for path, entry in manifest.items()
+        }
+        seen_paths: Set[str] = set()
+        progress = {"discovered": 0, "processed": 0, "last_report": 0.0, "walk_done": False}
+        file_queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        prepared_queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        batch_queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        cancelled = False
+        with ThreadPoolExecutor(max_workers=self.IO_WORKERS, thread_name_prefix="code-indexer") as pool:
+            readers = [
+                asyncio.create_task(
+                    self._read_stage(
+                        project_id, file_queue, prepared_queue, known, pool, stats, refresh_symbols
+                    )
+                )
+                for _ in range(self.IO_WORKERS)
+            ]
+            stages = [
+                asyncio.create_task(
+                    self._walk_stage(root_path, files, file_queue, stats, seen_paths, progress)
+                ),
+                *readers,
+                asyncio.create_task(self._close_when_done(readers, prepared_queue)),
+                asyncio.create_task(self._embed_stage(prepared_queue, batch_queue)),
+                asyncio.create_task(
+                    self._write_stage(project_id, batch_queue, manifest, stats, progress, job_id)
+                ),
+            ]
+
+            try:
+                await asyncio.gather(*stages)
+            except IndexingCancelled:
+                cancelled = True
+                logger.info(f"Codebase indexing for project {project_id} cancelled")
+            finally:
+                for stage in stages:
+                    stage.cancel()
+
+        if cancelled:
+            # Walk was interrupted - unseen files are not necessarily deleted
+            stats["cancelled"] = True
+            return None
+
+        # Drop files that no longer exist on disk
+        removed = [entry for path, entry in manifest.items() if path not in seen_paths]
+        if removed:
+            self._remove_entries(removed)
+            stats["files_removed"] = len(removed)
+
+        return seen_paths
+
+    async def _walk_stage(
+        self,
+        root_path: Path,
+        files: Iterable[FileInfo],
+        file_queue: asyncio.Queue,
+        stats: Dict,
+        seen_paths: Set[str],
+        progress: Dict
+    ):
+        """Pipeline stage 1: feed supported files (tree walk or git changes) to the readers."""
+        for info in files:
+            file_path = root_path / info.path
+
+            # Check if file should be ignored
+            if self._should_ignore_file(file_path):
+                continue
+
+            stats["files_scanned"] += 1
+
+            if not info.language:
+                stats["files_skipped"] += 1
+                continue
+
+            seen_paths.add(info.path)
+            progress["discovered"] += 1
+
+            await file_queue.put((file_path, info))
+
+        progress["walk_done"] = True
+        for _ in range(self.IO_WORKERS):
+            await file_queue.put(None)
+
+    async def _read_stage(
+        self,
+        project_id: UUID,
+        file_queue: asyncio.Queue,
+        prepared_queue: asyncio.Queue,
+        known: Dict[str, Tuple[int, float, str, int]],
+        pool: ThreadPoolExecutor,
+        stats: Dict,
+        refresh_symbols: bool = False
+    ):
+        """Pipeline stage 2: read and parse files on the thread pool."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            item = await file_queue.get()
+            if item is None:
+                break
+
+            file_path, info = item
+            try:
+                prepared = await loop.run_in_executor(
+                    pool,
+                    self._prepare_file,
+                    project_id, file_path, info, known.get(info.path), refresh_symbols
+                )
+            except Exception as e:
+                logger.error(f"Error indexing file {file_path}: {e}")
+                stats["errors"].append(str(file_path))
+                stats["files_skipped"] += 1
+                continue
+
+            await prepared_queue.put(prepared)
+
+    async def _close_when_done(self, readers: List[asyncio.Task], queue: asyncio.Queue):
+        """Signal end-of-stream to the next stage once all readers finished."""
+        await asyncio.gather(*readers)
+        await queue.put(None)
+
+    async def _embed_stage(
+        self,
+        prepared_queue: asyncio.Queue,
+        batch_queue: asyncio.Queue
+    ):
+        """Pipeline stage 3: embed documents of several files in one model call."""
+        loop = asyncio.get_running_loop()
+        batch: List[PreparedFile] = []
+        document_count = 0
+
+        async def flush():
+            contents = [doc["content"] for prepared in batch for doc in (prepared.documents or [])]
+            embeddings = await loop.run_in_executor(None, self.rag.embed_many, contents) if contents else []
+            await batch_queue.put((list(batch), embeddings))
+
+        while True:
+            prepared = await prepared_queue.get()
+            if prepared is None:
+                break
+
+            batch.append(prepared)
+            document_count += len(prepared.documents or [])
+
+            # Flush on a full batch, or when readers have nothing queued
+            if document_count >= self.EMBED_BATCH_SIZE or prepared_queue.empty():
+                await flush()
+                batch, document_count = [], 0
+
+        if batch:
+            await flush()
+        await batch_queue.put(None)
+
+    async def _write_stage(
+        self,
+        project_id: UUID,
+        batch_queue: asyncio.Queue,
+        manifest: Dict[str, CodeIndexEntry],
+        stats: Dict,
+        progress: Dict,
+        job_id: Optional[UUID]
+    ):
+        """Pipeline stage 4: bulk-write documents and manifest entries."""
+        job_manager = JobManager(self.db) if job_id else None
+
+        while True:
+            item = await batch_queue.get()
+            if item is None:
+                break
+
+            batch, embeddings = item
+            try:
+                self._write_batch(project_id, batch, embeddings, manifest)
+            except Exception as e:
+                logger.error(f"Error writing indexing batch: {e}")
+                self.db.rollback()
+                for prepared in batch:
+                    stats["errors"].append(prepared.rel_path)
+                    stats["files_skipped"] += 1
+                progress["processed"] += len(batch)
+                continue
+
+            for prepared in batch:
+                if prepared.documents is None:
+                    stats["files_unchanged"] += 1
+                else:
+                    stats["files_indexed"] += 1
+                stats["languages"][prepared.language] = stats["languages"].get(prepared.language, 0) + 1
+                stats["total_lines"] += prepared.line_count
+            progress["processed"] += len(batch)
+
+            if job_manager:
+                self._report_progress(job_manager, job_id, progress)
+
+    def _report_progress(self, job_manager: JobManager, job_id: UUID, progress: Dict):
+        """Throttled progress/cancellation checkpoint for the code_indexing job."""
+        now = time.monotonic()
+        if now - progress["last_report"] < self.PROGRESS_INTERVAL_SECONDS:
+            return
+        progress["last_report"] = now
+
+        if job_manager.is_cancelled(job_id):
+            raise IndexingCancelled()
+
+        discovered = max(progress["discovered"], 1)
+        processed = progress["processed"]
+        # Keep headroom while the walker is still discovering files
+        ceiling = 95.0 if progress["walk_done"] else 50.0
+        percent = min(5.0 + 90.0 * processed / discovered, ceiling)
+        job_manager.update_progress(job_id, percent, f"Indexed {processed}/{progress['discovered']} files")
+
+    async def index_file(
+        self,
+        project_id: UUID,
+        file_path: Path
+    ) -> bool:
+        """
+        Re-index a single project file if it changed since it was last indexed.
+
+        Args:
+            project_id: Project UUID
+            file_path: Absolute path, or path relative to the project folder
+
+        Returns:
+            True if the file was (re)indexed, False if unchanged or unsupported
+        """
+        root_path = self._get_project_path(project_id)
+        file_path = Path(file_path)
+        if not file_path.is_absolute():
+            file_path = root_path / file_path
+
+        language = self._detect_language(file_path)
+        if not language or self._should_ignore_file(file_path):
+            return False
+
+        rel_path = self._relative_path(file_path, root_path)
+        entry = self.db.query(CodeIndexEntry).filter(
+            CodeIndexEntry.project_id == project_id,
+            CodeIndexEntry.file_path == rel_path
+        ).first()
+
+        changed, _ = await self._index_if_changed(project_id, file_path, rel_path, language, entry)
+        return changed
+
+    def _get_project_path(self, project_id: UUID) -> Path:
+        """
+        Resolve and validate the project folder to index.
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Project folder path
+
+        Raises:
+            ValueError: If project, folder config or folder is missing
+        """
         project = self.db.query(Project).filter(Project.id == project_id).first()
         if not project:
             raise ValueError(f"Project {project_id} not found")
@@ -141,76 +605,435 @@ class CodebaseIndexer:
         if not project_path.exists():
             raise ValueError(f"Project folder does not exist: {project_path}")
 
-        logger.info(f"Starting codebase indexing for project {project_id} at {project_path}")
+        return project_path
 
-        # Statistics
-        stats = {
+    def _new_stats(self, project_id: UUID) -> Dict:
+        """Empty indexing statistics."""
+        return {
             "project_id": str(project_id),
             "files_scanned": 0,
             "files_indexed": 0,
+            "files_unchanged": 0,
+            "files_removed": 0,
             "files_skipped": 0,
             "languages": {},
             "total_lines": 0,
             "errors": []
         }
 
-        # Scan files recursively
-        for file_path in self._scan_directory(project_path):
-            stats["files_scanned"] += 1
+    def _relative_path(self, file_path: Path, root_path: Path) -> str:
+        """Manifest key for a file: POSIX path relative to the indexed root."""
+        try:
+            return file_path.relative_to(root_path).as_posix()
+        except ValueError:
+            return file_path.as_posix()
 
-            try:
-                # Detect language
-                language = self._detect_language(file_path)
-                if not language:
-                    stats["files_skipped"] += 1
-                    continue
+    def _load_manifest(
+        self,
+        project_id: UUID,
+        paths: Optional[Set[str]] = None
+    ) -> Dict[str, CodeIndexEntry]:
+        """
+        Load the index manifest for a project.
+
+        Args:
+            project_id: Project UUID
+            paths: Only load entries for these relative paths (None = all)
 
-                # Index file
-                await self._index_file(project_id, file_path, language)
+        Returns:
+            Dict mapping relative file path to its CodeIndexEntry
+        """
+        query = self.db.query(CodeIndexEntry).filter(
+            CodeIndexEntry.project_id == project_id
+        )
+        if paths is not None:
+            if not paths:
+                return {}
+            query = query.filter(CodeIndexEntry.file_path.in_(list(paths)))
 
-                stats["files_indexed"] += 1
-                stats["languages"][language] = stats["languages"].get(language, 0) + 1
+        return {entry.file_path: entry for entry in query.all()}
 
-                # Count lines
-                with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = len(f.readlines())
-                    stats["total_lines"] += lines
+    def _load_state(self, project_id: UUID, root_path: Path) -> Optional[CodeIndexState]:
+        """
+        Load the git state of the project index, if it applies to root_path.
 
-            except Exception as e:
-                logger.error(f"Error indexing file {file_path}: {e}")
-                stats["errors"].append(str(file_path))
-                stats["files_skipped"] += 1
+        Args:
+            project_id: Project UUID
+            root_path: Directory about to be indexed
+
+        Returns:
+            CodeIndexState or None (never indexed, or indexed from another root)
+        """
+        state = self.db.query(CodeIndexState).filter(
+            CodeIndexState.project_id == project_id
+        ).first()
 
-        logger.info(f"Codebase indexing complete: {stats['files_indexed']} files indexed")
+        if state is None or state.root_path != str(root_path):
+            return None
 
-        return stats
+        return state
+
+    def _save_state(
+        self,
+        project_id: UUID,
+        root_path: Path,
+        git_snapshot: Optional[Tuple[str, Set[str]]],
+        seen_paths: Set[str],
+        manifest: Dict[str, CodeIndexEntry]
+    ):
+        """
+        Record the commit the index is now in sync with, after a complete run.
+
+        Working-tree changes indexed in this run and files that failed to index
+        are kept as pending paths, so the next run re-checks them even if the
+        commit diff does not mention them (e.g. a reverted local edit).
+
+        Args:
+            project_id: Project UUID
+            root_path: Indexed directory
+            git_snapshot: (HEAD sha, working-tree changed paths) taken before the run
+                (None outside a git repository)
+            seen_paths: Supported files visited by this run
+            manifest: Manifest after the run
+        """
+        head, dirty_paths = git_snapshot if git_snapshot is not None else (None, set())
+        failed_paths = {path for path in seen_paths if path not in manifest}
+
+        state = self.db.query(CodeIndexState).filter(
+            CodeIndexState.project_id == project_id
+        ).first()
+        if state is None:
+            state = CodeIndexState(project_id=project_id)
+            self.db.add(state)
+
+        state.root_path = str(root_path)
+        state.commit_sha = head
+        state.pending_paths = sorted(dirty_paths | failed_paths)
+        state.symbols_version = SYMBOLS_VERSION  # Every file was parsed or already had its symbols
+        state.indexed_at = datetime.utcnow()
+        self.db.commit()
+
+    def _git(self, root_path: Path, args: List[str]) -> Optional[str]:
+        """
+        Run a git command in root_path.
+
+        Args:
+            root_path: Working directory
+            args: Git arguments
+
+        Returns:
+            Raw stdout, or None if git failed (not a repository, unknown commit...)
+        """
+        try:
+            result = subprocess.run(
+                ["git"] + args,
+                cwd=str(root_path),
+                capture_output=True,
+                text=True,
+                timeout=self.GIT_TIMEOUT_SECONDS
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.warning(f"Git command failed in {root_path}: {e}")
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        return result.stdout
 
-    def _scan_directory(self, directory: Path) -> List[Path]:
+    def _git_snapshot(self, root_path: Path) -> Optional[Tuple[str, Set[str]]]:
         """
-        Recursively scan directory for code files.
+        Current HEAD and working-tree changes (staged, unstaged, untracked).
+
+        Paths are relative to root_path, which may be a subdirectory of the
+        repository.
 
         Args:
-            directory: Root directory to scan
+            root_path: Directory being indexed
 
         Returns:
-            List of file paths
+            Tuple (HEAD sha, changed paths) or None if not a git repository
+            with at least one commit
+        """
+        head = self._git(root_path, ["rev-parse", "--verify", "HEAD"])
+        if not head:
+            return None
+
+        modified = self._git(root_path, ["diff", "--name-only", "-z", "--no-renames", "--relative", "HEAD", "--"])
+        untracked = self._git(root_path, ["ls-files", "--others", "--exclude-standard", "-z"])
+        if modified is None or untracked is None:
+            return None
+
+        paths = {path for path in (modified + untracked).split("\0") if path}
+
+        return head.strip(), paths
+
+    def _git_changed_paths(self, root_path: Path, since: str, head: str) -> Optional[Set[str]]:
+        """
+        Files added, modified or deleted between two commits.
+
+        Args:
+            root_path: Directory being indexed
+            since: Last indexed commit
+            head: Current HEAD commit
+
+        Returns:
+            Set of paths relative to root_path, or None if the diff is not
+            possible (e.g. history rewritten and `since` no longer exists)
+        """
+        if since == head:
+            return set()
+
+        output = self._git(
+            root_path,
+            ["diff", "--name-status", "-z", "--no-renames", "--relative", f"{since}..{head}", "--"]
+        )
+        if output is None:
+            logger.info(f"Cannot diff from indexed commit {since[:8]}, falling back to full scan")
+            return None
+
+        # -z --name-status without renames: status\0path\0status\0path...
+        fields = [field for field in output.split("\0") if field]
+
+        return set(fields[1::2])
+
+    def _prepare_file(
+        self,
+        project_id: UUID,
+        file_path: Path,
+        info: FileInfo,
+        known: Optional[Tuple[int, float, str, int]],
+        refresh_symbols: bool = False
+    ) -> "PreparedFile":
         """
-        files = []
+        Read and parse a file unless the manifest shows it is unchanged.
 
-        for root, dirs, filenames in os.walk(directory):
-            # Filter out ignored directories
-            dirs[:] = [d for d in dirs if d not in self.IGNORE_DIRS]
+        Size + mtime is checked first (no read needed); if those differ, the
+        content hash decides whether the file really changed. Runs on worker
+        threads, so it must not touch the DB session.
 
-            for filename in filenames:
-                file_path = Path(root) / filename
+        Args:
+            project_id: Project UUID
+            file_path: Absolute file path
+            info: Snapshot entry (path = manifest key, size, mtime, language)
+            known: Manifest state (size, mtime, content_hash, line_count) or None
+            refresh_symbols: Parse symbols even if the file is unchanged
 
-                # Check if file should be ignored
-                if self._should_ignore_file(file_path):
-                    continue
+        Returns:
+            PreparedFile (documents is None when the file is unchanged)
+        """
+        prepared = PreparedFile(
+            rel_path=info.path,
+            language=info.language,
+            size=info.size,
+            mtime=info.mtime
+        )
 
-                files.append(file_path)
+        if (
+            known is not None and known[0] == info.size and known[1] == info.mtime
+            and not refresh_symbols
+        ):
+            prepared.content_hash, prepared.line_count = known[2], known[3]
+            return prepared
+
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        prepared.content_hash = hashlib.sha256(raw).hexdigest()
+
+        if known is not None and known[2] == prepared.content_hash:
+            # Touched but not modified - only stat info needs refreshing
+            prepared.line_count = known[3]
+            prepared.touched = True
+            if refresh_symbols:
+                content = raw.decode("utf-8", errors="ignore")
+                prepared.symbols = extract_symbols(content, info.language, usages=False)
+            return prepared
+
+        content = raw.decode("utf-8", errors="ignore")
+        prepared.line_count = len(content.splitlines())
+        prepared.documents = self._build_documents(project_id, file_path, content, info.language)
+        prepared.symbols = extract_symbols(content, info.language, usages=False)
+
+        return prepared
+
+    def _write_batch(
+        self,
+        project_id: UUID,
+        batch: List["PreparedFile"],
+        embeddings: List[List[float]],
+        manifest: Dict[str, CodeIndexEntry]
+    ):
+        """
+        Persist a batch of prepared files in a single transaction.
 
-        return files
+        Old documents of changed files are deleted, new documents inserted with
+        one executemany, manifest entries upserted and file symbols replaced.
+
+        Args:
+            project_id: Project UUID
+            batch: Prepared files (unchanged ones only refresh stat info)
+            embeddings: Embeddings for all documents of the batch, in order
+            manifest: Manifest dict, updated in place with new entries
+        """
+        stale_doc_ids = []
+        documents = []
+        symbols = {}
+
+        for prepared in batch:
+            entry = manifest.get(prepared.rel_path)
+            if prepared.symbols is not None:
+                symbols[prepared.rel_path] = (prepared.content_hash, prepared.symbols)
+
+            if prepared.documents is None:
+                if prepared.touched and entry is not None:
+                    entry.size = prepared.size
+                    entry.mtime = prepared.mtime
+                continue
+
+            if entry is None:
+                entry = CodeIndexEntry(project_id=project_id, file_path=prepared.rel_path)
+                self.db.add(entry)
+                manifest[prepared.rel_path] = entry
+            else:
+                stale_doc_ids.extend(entry.doc_ids or [])
+
+            entry.language = prepared.language
+            entry.size = prepared.size
+            entry.mtime = prepared.mtime
+            entry.content_hash = prepared.content_hash
+            entry.line_count = prepared.line_count
+            entry.doc_ids = [str(doc["id"]) for doc in prepared.documents]
+            entry.indexed_at = datetime.utcnow()
+            documents.extend(prepared.documents)
+
+        if stale_doc_ids:
+            self.rag.delete_many(stale_doc_ids, commit=False)
+        if documents:
+            self.rag.store_many(documents, embeddings, commit=False)
+        self.symbols.replace_file_symbols(project_id, symbols)
+        self.db.commit()
+
+    async def _index_if_changed(
+        self,
+        project_id: UUID,
+        file_path: Path,
+        rel_path: str,
+        language: str,
+        entry: Optional[CodeIndexEntry]
+    ) -> Tuple[bool, CodeIndexEntry]:
+        """
+        Index a single file unless the manifest shows it is unchanged.
+
+        Uses the pipeline's read/parse and write steps (_prepare_file,
+        _write_batch) for one file, without the queues.
+
+        Args:
+            project_id: Project UUID
+            file_path: Absolute file path
+            rel_path: Manifest key
+            language: Programming language
+            entry: Existing manifest entry (None if never indexed)
+
+        Returns:
+            Tuple (changed, manifest entry)
+        """
+        known = (entry.size, entry.mtime, entry.content_hash, entry.line_count) if entry else None
+        info = self._file_info(rel_path, language, file_path.stat())
+        prepared = self._prepare_file(project_id, file_path, info, known)
+
+        if prepared.documents is None and not prepared.touched:
+            return False, entry
+
+        contents = [doc["content"] for doc in (prepared.documents or [])]
+        manifest = {rel_path: entry} if entry is not None else {}
+        self._write_batch(project_id, [prepared], self.rag.embed_many(contents), manifest)
+
+        return prepared.documents is not None, manifest[rel_path]
+
+    def _remove_entries(self, entries: Iterable[CodeIndexEntry]):
+        """
+        Remove manifest entries and the RAG documents they own.
+
+        Args:
+            entries: Manifest entries to remove
+        """
+        entries = list(entries)
+        doc_ids = [doc_id for entry in entries for doc_id in (entry.doc_ids or [])]
+        self.rag.delete_many(doc_ids, commit=False)
+
+        by_project: Dict[UUID, List[str]] = {}
+        for entry in entries:
+            by_project.setdefault(entry.project_id, []).append(entry.file_path)
+        for project_id, rel_paths in by_project.items():
+            self.symbols.remove_file_symbols(project_id, rel_paths)
+
+        for entry in entries:
+            self.db.delete(entry)
+        self.db.commit()
+
+        logger.info(f"Removed {len(entries)} deleted files from code index")
+
+    def _purge_code_index(self, project_id: UUID):
+        """
+        Drop all code documents, manifest entries and file symbols for a project.
+
+        Args:
+            project_id: Project UUID
+        """
+        for doc_type in ("code_file", "code_chunk"):
+            self.rag.delete_by_filter({"project_id": project_id, "type": doc_type})
+
+        self.db.query(CodeIndexEntry).filter(
+            CodeIndexEntry.project_id == project_id
+        ).delete()
+        self.db.query(CodeIndexState).filter(
+            CodeIndexState.project_id == project_id
+        ).delete()
+        self.symbols.remove_file_symbols(project_id)
+        self.db.commit()
+
+    def _iter_paths(
+        self,
+        root_path: Path,
+        rel_paths: Iterable[str]
+    ) -> Iterator[FileInfo]:
+        """
+        Yield existing files among the given relative paths.
+
+        Same directory rules as the snapshot walk; paths that no longer exist
+        are skipped (their manifest entries are removed as deleted files).
+
+        Args:
+            root_path: Indexed root
+            rel_paths: POSIX paths relative to root_path
+
+        Yields:
+            FileInfo per existing regular file
+        """
+        for rel_path in sorted(rel_paths):
+            parts = rel_path.split("/")
+            if any(part in self.IGNORE_DIRS for part in parts[:-1]):
+                continue
+
+            file_path = root_path / rel_path
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            if not stat_module.S_ISREG(stat.st_mode):
+                continue
+
+            yield self._file_info(rel_path, self._detect_language(file_path), stat)
+
+    def _file_info(self, rel_path: str, language: Optional[str], stat: os.stat_result) -> FileInfo:
+        """FileInfo for a file stat'ed outside of a snapshot."""
+        return FileInfo(
+            path=rel_path,
+            size=stat.st_size,
+            mtime=stat.st_mtime,
+            ext=Path(rel_path).suffix.lower(),
+            language=language
+        )
 
     def _should_ignore_file(self, file_path: Path) -> bool:
         """
@@ -247,44 +1070,107 @@ class CodebaseIndexer:
 
         return None
 
-    async def _index_file(
+    def _build_documents(
         self,
         project_id: UUID,
         file_path: Path,
+        content: str,
         language: str
-    ):
+    ) -> List[Dict]:
         """
-        Index single file in RAG.
+        Build the RAG documents for a file, with client-side ids.
+
+        Produces one file-level summary document (type "code_file") plus one
+        document per structural chunk (type "code_chunk"). Chunks reference
+        the summary document through "parent_id" in their metadata.
 
         Args:
             project_id: Project UUID
             file_path: File path
+            content: File content
             language: Programming language
-        """
-        # Read file content
-        with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-            content = f.read()
 
+        Returns:
+            List of document dicts (id, content, metadata, project_id)
+        """
         # Extract metadata based on language
         metadata_extractor = self._get_metadata_extractor(language)
         metadata = metadata_extractor(content, file_path)
 
+        # Split along class/function boundaries
+        chunks = self.chunker.chunk(content, language)
+
         # Build content for RAG
         # Include file path + content summary + key structures
         rag_content = self._build_rag_content(file_path, content, metadata, language)
 
-        # Store in RAG
-        self.rag.store(
-            content=rag_content,
-            metadata={
+        parent_id = uuid4()
+        documents = [{
+            "id": parent_id,
+            "project_id": project_id,
+            "content": rag_content,
+            "metadata": {
                 "type": "code_file",
                 "project_id": str(project_id),
                 "file_path": str(file_path),
                 "language": language,
+                "chunk_count": len(chunks),
                 **metadata
-            },
-            project_id=project_id
-        )
+            }
+        }]
+
+        # One embedding per chunk
+        for chunk in chunks:
+            documents.append({
+                "id": uuid4(),
+                "project_id": project_id,
+                "content": self._build_chunk_content(file_path, chunk, language),
+                "metadata": {
+                    "type": "code_chunk",
+                    "project_id": str(project_id),
+                    "file_path": str(file_path),
+                    "language": language,
+                    "parent_id": str(parent_id),
+                    "chunk_index": chunk.index,
+                    "chunk_count": len(chunks),
+                    "symbol": chunk.symbol,
+                    "kind": chunk.kind,
+                    "start_line": chunk.start_line,
+                    "end_line": chunk.end_line
+                }
+            })
+
+        return documents
+
+    def _build_chunk_content(
+        self,
+        file_path: Path,
+        chunk: CodeChunk,
+        language: str
+    ) -> str:
+        """
+        Build RAG content for a single code chunk.
+
+        The short header anchors the embedding to the file and symbol; the code
+        itself follows the "Code:" marker so it can be pasted back verbatim.
+
+        Args:
+            file_path: File path
+            chunk: CodeChunk from CodeChunker
+            language: Programming language
+
+        Returns:
+            Chunk content string
+        """
+        return "\n".join([
+            f"File: {file_path}",
+            f"Language: {language}",
+            f"Symbol: {chunk.symbol} ({chunk.kind})",
+            f"Lines: {chunk.start_line}-{chunk.end_line}",
+            "",
+            "Code:",
+            chunk.content
+        ])
 
     def _build_rag_content(
         self,
@@ -473,7 +1359,8 @@ class CodebaseIndexer:
         query: str,
         language: Optional[str] = None,
         file_type: Optional[str] = None,
-        top_k: int = 5
+        top_k: int = 5,
+        granularity: str = "chunk"
     ) -> List[Dict]:
         """
         Search code in project via semantic search.
@@ -484,9 +1371,12 @@ class CodebaseIndexer:
             language: Filter by language (php, typescript, etc.)
             file_type: Filter by file type (model, controller, component, etc.)
             top_k: Number of results
+            granularity: "chunk" returns code regions (falls back to file
+                summaries for projects indexed before chunking), "file"
+                returns file summaries only
 
         Returns:
-            List of similar code files
+            List of similar code chunks or files
 
         Example:
             results = await indexer.search_code(
@@ -498,13 +1388,13 @@ class CodebaseIndexer:
 
             for r in results:
                 print(f"File: {r['metadata']['file_path']}")
+                print(f"Lines: {r['metadata']['start_line']}-{r['metadata']['end_line']}")
                 print(f"Similarity: {r['similarity']:.2f}")
-                print(f"Classes: {r['metadata']['classes']}")
         """
         # Build filter
         filter_dict = {
             "project_id": project_id,
-            "type": "code_file"
+            "type": "code_chunk" if granularity == "chunk" else "code_file"
         }
 
         if language:
@@ -521,6 +1411,17 @@ class CodebaseIndexer:
             similarity_threshold=0.7  # Only relevant results
         )
 
+        # Projects indexed before chunking only have file summaries
+        if not results and granularity == "chunk":
+            return await self.search_code(
+                project_id=project_id,
+                query=query,
+                language=language,
+                file_type=file_type,
+                top_k=top_k,
+                granularity="file"
+            )
+
         return results
 
     async def get_indexing_stats(self, project_id: UUID) -> Dict:
@@ -30,7 +30,6 @@ Usage:
     # }
 """
 
-import os
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -40,6 +39,7 @@ from sqlalchemy.orm import Session
 
 from app.services.stack_detector import StackDetector
 from app.services.codebase_indexer import CodebaseIndexer
+from app.services.fs_snapshot import FileSnapshot, get_snapshot_service
 from app.services.rag_service import RAGService
 from app.services.ai_orchestrator import AIOrchestrator
 
@@ -178,15 +178,18 @@ class CodebaseMemoryService:
             "scan_summary": {}
         }
 
+        # One walk of the tree, shared by every step below
+        snapshot = get_snapshot_service().refresh(path)
+
         # Step 1: Detect technology stack
         logger.info("📊 Step 1: Detecting technology stack...")
-        stack_info = self.stack_detector.detect(path)
+        stack_info = self.stack_detector.detect(path, snapshot=snapshot)
         result["stack_info"] = stack_info
         logger.info(f"   Detected stack: {stack_info.get('detected_stack', 'unknown')}")
 
         # Step 2: Scan and collect file information
         logger.info("📂 Step 2: Scanning codebase structure...")
-        scan_data = await self._scan_codebase(path)
+        scan_data = await self._scan_codebase(path, snapshot)
         result["scan_summary"] = {
             "total_files": scan_data["total_files"],
             "code_files": scan_data["code_files"],
@@ -201,7 +204,7 @@ class CodebaseMemoryService:
             try:
                 indexer = CodebaseIndexer(self.db)
                 # Create a temporary project reference for indexing
-                indexing_result = await self._index_for_memory(indexer, project_id, path)
+                indexing_result = await self._index_for_memory(indexer, project_id, path, snapshot)
                 result["files_indexed"] = indexing_result.get("files_indexed", 0)
                 logger.info(f"   Indexed {result['files_indexed']} files")
             except Exception as e:
@@ -238,18 +241,26 @@ class CodebaseMemoryService:
         logger.info("✅ Codebase memory scan complete!")
         return result
 
-    async def _scan_codebase(self, root_path: Path) -> Dict[str, Any]:
+    async def _scan_codebase(
+        self,
+        root_path: Path,
+        snapshot: Optional[FileSnapshot] = None
+    ) -> Dict[str, Any]:
         """
         Scan codebase to collect file statistics and structure.
 
         Args:
             root_path: Root path of the codebase
+            snapshot: Filesystem snapshot of root_path (taken if not given)
 
         Returns:
             Dict with scan statistics
         """
+        if snapshot is None:
+            snapshot = get_snapshot_service().get(root_path)
+
         stats = {
-            "total_files": 0,
+            "total_files": len(snapshot.files),
             "code_files": 0,
             "languages": {},
             "config_files": [],
@@ -257,43 +268,28 @@ class CodebaseMemoryService:
             "key_files": []
         }
 
-        ignore_dirs = {
-            "node_modules", ".git", ".venv", "venv", "vendor",
-            "__pycache__", ".next", "dist", "build", ".idea",
-            ".vscode", "coverage", ".pytest_cache"
-        }
-
-        for root, dirs, files in os.walk(root_path):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
-
-            rel_root = Path(root).relative_to(root_path)
-
-            # Track directory structure (first 2 levels)
-            if len(rel_root.parts) <= 2:
-                stats["directory_structure"].append(str(rel_root))
-
-            for filename in files:
-                stats["total_files"] += 1
-                file_path = Path(root) / filename
+        # Track directory structure (first 2 levels)
+        stats["directory_structure"].append(".")
+        stats["directory_structure"].extend(
+            directory for directory in snapshot.directories if directory.count("/") < 2
+        )
 
-                # Check if it's a config file
-                if filename in self.CONFIG_FILES:
-                    stats["config_files"].append(str(file_path.relative_to(root_path)))
+        for info in snapshot.files:
+            # Check if it's a config file
+            if info.name in self.CONFIG_FILES:
+                stats["config_files"].append(info.path)
 
-                # Check if it's a code file
-                ext = file_path.suffix.lower()
-                if ext in self.ANALYSIS_EXTENSIONS:
-                    stats["code_files"] += 1
+            # Check if it's a code file
+            if info.ext in self.ANALYSIS_EXTENSIONS:
+                stats["code_files"] += 1
 
-                    # Count by language
-                    lang = self._extension_to_language(ext)
-                    stats["languages"][lang] = stats["languages"].get(lang, 0) + 1
+                # Count by language
+                lang = self._extension_to_language(info.ext)
+                stats["languages"][lang] = stats["languages"].get(lang, 0) + 1
 
-                    # Identify key files (models, controllers, main files)
-                    if self._is_key_file(filename, file_path):
-                        rel_path = str(file_path.relative_to(root_path))
-                        stats["key_files"].append(rel_path)
+                # Identify key files (models, controllers, main files)
+                if self._is_key_file(info.name, root_path / info.path):
+                    stats["key_files"].append(info.path)
 
         return stats
 
@@ -656,44 +652,25 @@ IMPORTANTE: Seja PROFUNDO e DETALHADO. Uma análise superficial não serve. Extr
         self,
         indexer: CodebaseIndexer,
         project_id: UUID,
-        root_path: Path
+        root_path: Path,
+        snapshot: Optional[FileSnapshot] = None
     ) -> Dict:
         """
         Index codebase files for memory/RAG.
 
+        Goes through the indexer manifest, so re-scanning a project only
+        re-indexes changed files instead of storing duplicates.
+
         Args:
             indexer: CodebaseIndexer instance
             project_id: Project UUID
             root_path: Root path of codebase
+            snapshot: Snapshot taken at the start of the scan (reused, no new walk)
 
         Returns:
             Indexing statistics
         """
-        stats = {
-            "files_indexed": 0,
-            "errors": []
-        }
-
-        ignore_dirs = indexer.IGNORE_DIRS
-
-        for root, dirs, files in os.walk(root_path):
-            dirs[:] = [d for d in dirs if d not in ignore_dirs]
-
-            for filename in files:
-                file_path = Path(root) / filename
-
-                # Detect language
-                language = indexer._detect_language(file_path)
-                if not language:
-                    continue
-
-                try:
-                    await indexer._index_file(project_id, file_path, language)
-                    stats["files_indexed"] += 1
-                except Exception as e:
-                    stats["errors"].append(f"{file_path}: {e}")
-
-        return stats
+        return await indexer.index_directory(project_id, root_path, snapshot=snapshot)
 
     async def _store_business_rules(
         self,
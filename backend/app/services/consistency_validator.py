@@ -7,6 +7,7 @@ from app.services.validators import (
     NamingValidator,
     ImportValidator,
 )
+from app.services.symbol_index import ProjectSymbolIndex
 from app.orchestrators.registry import OrchestratorRegistry
 import logging
 import re
@@ -23,10 +24,12 @@ class ConsistencyValidator:
     - Detecta inconsistências entre tasks
     - Auto-corrige issues quando possível
     - Gera relatórios detalhados
+    - Consulta a tabela de símbolos do projeto (só re-parseia tasks alteradas)
     """
 
     def __init__(self, db: Session):
         self.db = db
+        self.symbol_index = ProjectSymbolIndex(db)
 
     async def validate_batch(
         self,
@@ -80,18 +83,26 @@ class ConsistencyValidator:
             except Exception as e:
                 logger.warning(f"  Could not get conventions: {e}")
 
+        # Símbolos: extrair só o que mudou, depois carregar definições do projeto
+        # + usos das tasks do batch
+        refreshed = self.symbol_index.sync_task_results(project_id, task_results)
+        symbols = self.symbol_index.load_table(
+            project_id, [result.task_id for result in task_results]
+        )
+        logger.info(f"  Symbol table loaded ({len(symbols.rows)} symbols, {refreshed} results re-parsed)")
+
         # Executar validators
         all_issues = []
 
         logger.info("  Running NamingValidator...")
         naming_validator = NamingValidator(conventions)
-        naming_issues = naming_validator.validate(task_results)
+        naming_issues = naming_validator.validate(task_results, symbols)
         all_issues.extend(naming_issues)
         logger.info(f"    Found {len(naming_issues)} naming issues")
 
         logger.info("  Running ImportValidator...")
         import_validator = ImportValidator()
-        import_issues = import_validator.validate(task_results)
+        import_issues = import_validator.validate(task_results, symbols)
         all_issues.extend(import_issues)
         logger.info(f"    Found {len(import_issues)} import issues")
 
@@ -107,6 +118,10 @@ class ConsistencyValidator:
         # Tentar auto-fix
         auto_fixed = await self._auto_fix_issues(task_results, all_issues)
 
+        # Código corrigido -> atualizar símbolos das tasks alteradas
+        if auto_fixed:
+            self.symbol_index.sync_task_results(project_id, task_results)
+
         result = {
             'total_issues': len(all_issues),
             'critical': critical,
@@ -25,6 +25,9 @@ from app.models.project import Project
 from app.models.interview import Interview, InterviewStatus
 from app.models.task import Task, TaskStatus, ItemType, PriorityLevel
 from app.services.ai_orchestrator import AIOrchestrator
+from app.services.draft_expansion import DraftHierarchyExpander
+from app.services.hierarchy_loader import HierarchyLoader
+from app.services.speculative_generation import SpeculativeGenerator
 from app.prompter.facade import PrompterFacade
 from app.prompts import PromptService, get_prompt_service
 
@@ -96,6 +99,10 @@ class ContextGeneratorService:
         self.orchestrator = AIOrchestrator(db)
         # PROMPT #103 - Use PromptService for external prompts
         self.prompt_service = get_prompt_service(db)
+        # Ancestor chains in one query, tasks cached by id for this service
+        self.hierarchy = HierarchyLoader(db)
+        # Full content pre-generated for suggestions (opt-in)
+        self.speculation = SpeculativeGenerator(db, self)
 
     async def generate_context_from_interview(
         self,
@@ -456,6 +463,7 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
 
         # Save epics to database
         saved_epics = []
+        created_epics = []
         priority_map = {
             "critical": PriorityLevel.CRITICAL,
             "high": PriorityLevel.HIGH,
@@ -481,6 +489,7 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
                     updated_at=datetime.utcnow()
                 )
                 self.db.add(epic)
+                created_epics.append(epic)
                 saved_epics.append({
                     "id": str(epic.id),
                     "title": epic.title,
@@ -496,6 +505,9 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
 
         logger.info(f"✅ Generated {len(saved_epics)} suggested epics for project {project_id}")
 
+        # Pre-generate full content in the background (no-op unless enabled)
+        self.speculation.schedule(project_id, sorted(created_epics, key=lambda e: e.order or 0))
+
         return saved_epics
 
     async def lock_context(self, project_id: UUID) -> bool:
@@ -566,7 +578,12 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
 
         return project.context_locked
 
-    async def activate_suggested_epic(self, epic_id: UUID) -> Dict:
+    async def activate_suggested_epic(
+        self,
+        epic_id: UUID,
+        expand_depth: int = 1,
+        job_id: Optional[UUID] = None
+    ) -> Dict:
         """
         PROMPT #94 - Activate a suggested item by generating full content.
 
@@ -585,6 +602,9 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
 
         Args:
             epic_id: Item ID to activate (named epic_id for backwards compatibility)
+            expand_depth: Draft levels generated for an Epic (1 = stories only,
+                2 = + tasks, 3 = + subtasks); siblings of a level run concurrently
+            job_id: AsyncJob receiving draft expansion progress (optional)
 
         Returns:
             Dict with activated item data:
@@ -597,14 +617,16 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
                 "acceptance_criteria": List[str],
                 "story_points": int,
                 "priority": str,
-                "activated": True
+                "activated": True,
+                "children_generated": int,
+                "descendants_generated": int
             }
 
         Raises:
             ValueError: If item not found, not suggested, or project has no context
         """
         # 1. Fetch item
-        epic = self.db.query(Task).filter(Task.id == epic_id).first()
+        epic = self.hierarchy.get(epic_id)
         if not epic:
             raise ValueError(f"Item {epic_id} not found")
 
@@ -630,12 +652,14 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
                 "Please complete the Context Interview first."
             )
 
-        # 3. Generate full epic content using AI
-        epic_content = await self._generate_full_epic_content(
-            project=project,
-            epic_title=epic.title,
-            epic_description=epic.description
-        )
+        # 3. Generate full epic content using AI (unless pre-generated)
+        epic_content = self.speculation.take(epic, project)
+        if epic_content is None:
+            epic_content = await self._generate_full_epic_content(
+                project=project,
+                epic_title=epic.title,
+                epic_description=epic.description
+            )
 
         # 4. Update epic with generated content
         epic.description = epic_content["description"]
@@ -689,14 +713,22 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
             logger.info(f"   - Technical Constraints: {len(epic.interview_insights.get('technical_constraints', []))} items")
 
         # PROMPT #102 - Auto-generate draft stories after epic activation
-        draft_stories = []
+        # Deeper levels (tasks, subtasks) are expanded level by level, siblings in parallel
+        draft_levels = []
         if epic.item_type == ItemType.EPIC:
             try:
-                draft_stories = await self._generate_draft_stories(epic, project)
-                logger.info(f"📝 Generated {len(draft_stories)} draft stories for epic: {epic.title}")
+                draft_levels = await DraftHierarchyExpander(self.db, self).expand(
+                    epic, project, depth=expand_depth, job_id=job_id
+                )
+                logger.info(
+                    f"📝 Generated {sum(len(level) for level in draft_levels)} drafts "
+                    f"({len(draft_levels)} levels) for epic: {epic.title}"
+                )
             except Exception as e:
                 logger.error(f"❌ Error generating draft stories: {str(e)}")
                 # Don't fail the activation if story generation fails
+        draft_stories = draft_levels[0] if draft_levels else []
+        self.speculation.schedule(project.id, [draft for level in draft_levels for draft in level])
 
         return {
             "id": str(epic.id),
@@ -708,9 +740,45 @@ Gere a lista de Épicos (módulos macro) que cubra 100% do escopo deste projeto.
             "story_points": epic.story_points,
             "priority": epic.priority.value if epic.priority else "medium",
             "activated": True,
-            "children_generated": len(draft_stories)  # PROMPT #102 - Report how many children were generated
+            "children_generated": len(draft_stories),  # PROMPT #102 - Report how many children were generated
+            "descendants_generated": sum(len(level) for level in draft_levels)
         }
 
+    async def _generate_full_item_content(self, item: Task, project: Project) -> Dict:
+        """
+        Full activation content of an item, with the context its activation uses.
+
+        Shared by activation and speculative pre-generation, so both produce
+        the same content for the same item.
+
+        Args:
+            item: Suggested Epic, Story, Task or Subtask
+            project: The project with context
+
+        Returns:
+            Dict with full item content
+        """
+        if item.item_type == ItemType.STORY:
+            return await self._generate_full_story_content(item, project)
+
+        if item.item_type == ItemType.TASK:
+            # Parent story and grandparent epic for full context (one query)
+            _, parent_story, grandparent_epic = self.hierarchy.chain(item, 3)
+            return await self._generate_full_task_content(item, project, parent_story, grandparent_epic)
+
+        if item.item_type == ItemType.SUBTASK:
+            # Full hierarchy for complete context (one query)
+            _, parent_task, grandparent_story, great_grandparent_epic = self.hierarchy.chain(item, 4)
+            return await self._generate_full_subtask_content(
+                item, project, parent_task, grandparent_story, great_grandparent_epic
+            )
+
+        return await self._generate_full_epic_content(
+            project=project,
+            epic_title=item.title,
+            epic_description=item.description
+        )
+
     async def _generate_full_epic_content(
         self,
         project: Project,
@@ -1595,7 +1663,7 @@ Por favor, edite manualmente para adicionar os detalhes técnicos necessários.
             ValueError: If item not found or not a suggested item
         """
         # Fetch item
-        epic = self.db.query(Task).filter(Task.id == epic_id).first()
+        epic = self.hierarchy.get(epic_id)
         if not epic:
             raise ValueError(f"Item {epic_id} not found")
 
@@ -1615,6 +1683,7 @@ Por favor, edite manualmente para adicionar os detalhes técnicos necessários.
         # Delete the item
         self.db.delete(epic)
         self.db.commit()
+        self.hierarchy.forget(epic_id)
 
         logger.info(f"❌ Suggested item rejected and deleted: {item_title}")
 
@@ -1629,7 +1698,8 @@ Por favor, edite manualmente para adicionar os detalhes técnicos necessários.
     async def _generate_draft_stories(
         self,
         epic: Task,
-        project: Project
+        project: Project,
+        persist: bool = True
     ) -> List[Task]:
         """
         PROMPT #102 - Generate 15-20 stories with FULL EPIC-LEVEL content.
@@ -1643,6 +1713,8 @@ Por favor, edite manualmente para adicionar os detalhes técnicos necessários.
         Args:
             epic: The activated epic
             project: The project with context
+            persist: Add and commit the drafts; False returns them unsaved so
+                DraftHierarchyExpander can write a whole level at once
 
         Returns:
             List of created Story tasks with FULL content
@@ -1743,14 +1815,16 @@ Retorne APENAS o array JSON com 15-20 títulos de Stories no formato User Story.
                         created_at=datetime.utcnow(),
                         updated_at=datetime.utcnow()
                     )
-                    self.db.add(story)
+                    if persist:
+                        self.db.add(story)
                     created_stories.append(story)
                     logger.info(f"📝 Created draft story {i+1}/{len(story_titles)}: {title[:50] if isinstance(title, str) else 'Story'}...")
 
                 except Exception as story_error:
                     logger.error(f"❌ Error creating draft story '{title}': {str(story_error)}")
 
-            self.db.commit()
+            if persist:
+                self.db.commit()
             logger.info(f"✅ Created {len(created_stories)} story DRAFTS (lightweight, content on approval)")
             return created_stories
 
@@ -1779,10 +1853,12 @@ Retorne APENAS o array JSON com 15-20 títulos de Stories no formato User Story.
                     order=i,
                     interview_insights={"derived_from_epic": str(epic.id)}
                 )
-                self.db.add(story)
+                if persist:
+                    self.db.add(story)
                 created_stories.append(story)
 
-            self.db.commit()
+            if persist:
+                self.db.commit()
             return created_stories
 
     def _generate_fallback_story_titles(self, epic: Task) -> List[str]:
@@ -1830,7 +1906,8 @@ Retorne APENAS o array JSON com 15-20 títulos de Stories no formato User Story.
     async def _generate_draft_tasks(
         self,
         story: Task,
-        project: Project
+        project: Project,
+        persist: bool = True
     ) -> List[Task]:
         """
         PROMPT #102 - Generate 5-8 DETAILED draft tasks for an activated story.
@@ -1845,6 +1922,8 @@ Retorne APENAS o array JSON com 15-20 títulos de Stories no formato User Story.
         Args:
             story: The activated story
             project: The project with context
+            persist: Add and commit the drafts; False returns them unsaved so
+                DraftHierarchyExpander can write a whole level at once
 
         Returns:
             List of created draft Task items
@@ -1857,7 +1936,7 @@ Retorne APENAS o array JSON com 15-20 títulos de Stories no formato User Story.
         story_semantic_map = {}
 
         if story.parent_id:
-            parent_epic = self.db.query(Task).filter(Task.id == story.parent_id).first()
+            parent_epic = self.hierarchy.get(story.parent_id)
             if parent_epic and parent_epic.interview_insights:
                 epic_semantic_map = parent_epic.interview_insights.get("semantic_map", {})
 
@@ -1960,14 +2039,16 @@ Retorne APENAS o array JSON com 5-8 títulos de Tasks técnicas."""
                         created_at=datetime.utcnow(),
                         updated_at=datetime.utcnow()
                     )
-                    self.db.add(task)
+                    if persist:
+                        self.db.add(task)
                     created_tasks.append(task)
                     logger.info(f"📝 Created draft task {i+1}/{len(task_titles)}: {title[:50] if isinstance(title, str) else 'Task'}...")
 
                 except Exception as task_error:
                     logger.error(f"❌ Error creating draft task '{title}': {str(task_error)}")
 
-            self.db.commit()
+            if persist:
+                self.db.commit()
             logger.info(f"✅ Created {len(created_tasks)} task DRAFTS (lightweight, content on approval)")
             return created_tasks
 
@@ -1993,7 +2074,8 @@ Retorne APENAS o array JSON com 5-8 títulos de Tasks técnicas."""
     async def _generate_draft_subtasks(
         self,
         task: Task,
-        project: Project
+        project: Project,
+        persist: bool = True
     ) -> List[Task]:
         """
         PROMPT #102 - Generate 3-5 DETAILED draft subtasks for an activated task.
@@ -2008,6 +2090,8 @@ Retorne APENAS o array JSON com 5-8 títulos de Tasks técnicas."""
         Args:
             task: The activated task
             project: The project with context
+            persist: Add and commit the drafts; False returns them unsaved so
+                DraftHierarchyExpander can write a whole level at once
 
         Returns:
             List of created draft Subtask items
@@ -2020,12 +2104,7 @@ Retorne APENAS o array JSON com 5-8 títulos de Tasks técnicas."""
             task_semantic_map = task.interview_insights.get("semantic_map", {})
 
         # Get parent story and great-grandparent epic for full hierarchy context
-        parent_story = None
-        great_grandparent_epic = None
-        if task.parent_id:
-            parent_story = self.db.query(Task).filter(Task.id == task.parent_id).first()
-            if parent_story and parent_story.parent_id:
-                great_grandparent_epic = self.db.query(Task).filter(Task.id == parent_story.parent_id).first()
+        _, parent_story, great_grandparent_epic = self.hierarchy.chain(task, 3)
 
         # ============================================================
         # STEP 1: Generate only TITLES (3-5 subtask titles)
@@ -2114,14 +2193,16 @@ Retorne APENAS o array JSON com 3-5 títulos de Subtasks."""
                         created_at=datetime.utcnow(),
                         updated_at=datetime.utcnow()
                     )
-                    self.db.add(subtask)
+                    if persist:
+                        self.db.add(subtask)
                     created_subtasks.append(subtask)
                     logger.info(f"📝 Created draft subtask {i+1}/{len(subtask_titles)}: {title[:50] if isinstance(title, str) else 'Subtask'}...")
 
                 except Exception as subtask_error:
                     logger.error(f"❌ Error creating draft subtask '{title}': {str(subtask_error)}")
 
-            self.db.commit()
+            if persist:
+                self.db.commit()
             logger.info(f"✅ Created {len(created_subtasks)} subtask DRAFTS (lightweight, content on approval)")
             return created_subtasks
 
@@ -2155,7 +2236,7 @@ Retorne APENAS o array JSON com 3-5 títulos de Subtasks."""
             Dict with activated story data and children_generated count
         """
         # Fetch story
-        story = self.db.query(Task).filter(Task.id == story_id).first()
+        story = self.hierarchy.get(story_id)
         if not story:
             raise ValueError(f"Story {story_id} not found")
 
@@ -2172,8 +2253,10 @@ Retorne APENAS o array JSON com 3-5 títulos de Subtasks."""
         if not project:
             raise ValueError(f"Project {story.project_id} not found")
 
-        # Generate full story content
-        story_content = await self._generate_full_story_content(story, project)
+        # Generate full story content (unless pre-generated)
+        story_content = self.speculation.take(story, project)
+        if story_content is None:
+            story_content = await self._generate_full_item_content(story, project)
 
         # Update story
         story.description = story_content.get("description", story.description)
@@ -2200,6 +2283,7 @@ Retorne APENAS o array JSON com 3-5 títulos de Subtasks."""
 
         # Generate draft tasks
         draft_tasks = await self._generate_draft_tasks(story, project)
+        self.speculation.schedule(project.id, draft_tasks)
 
         return {
             "id": str(story.id),
@@ -2228,7 +2312,7 @@ Retorne APENAS o array JSON com 3-5 títulos de Subtasks."""
 
         # Get parent epic for context - use passed epic or fetch from DB
         if not parent_epic and story.parent_id:
-            parent_epic = self.db.query(Task).filter(Task.id == story.parent_id).first()
+            parent_epic = self.hierarchy.get(story.parent_id)
 
         epic_semantic_map = {}
         if parent_epic and parent_epic.interview_insights:
@@ -2518,7 +2602,7 @@ Retorne APENAS o JSON, sem explicações."""
             Dict with activated task data and children_generated count
         """
         # Fetch task
-        task = self.db.query(Task).filter(Task.id == task_id).first()
+        task = self.hierarchy.get(task_id)
         if not task:
             raise ValueError(f"Task {task_id} not found")
 
@@ -2535,16 +2619,10 @@ Retorne APENAS o JSON, sem explicações."""
         if not project:
             raise ValueError(f"Project {task.project_id} not found")
 
-        # Fetch parent story and grandparent epic for full context
-        parent_story = None
-        grandparent_epic = None
-        if task.parent_id:
-            parent_story = self.db.query(Task).filter(Task.id == task.parent_id).first()
-            if parent_story and parent_story.parent_id:
-                grandparent_epic = self.db.query(Task).filter(Task.id == parent_story.parent_id).first()
-
-        # Generate full task content with complete hierarchy context
-        task_content = await self._generate_full_task_content(task, project, parent_story, grandparent_epic)
+        # Generate full task content with complete hierarchy context (unless pre-generated)
+        task_content = self.speculation.take(task, project)
+        if task_content is None:
+            task_content = await self._generate_full_item_content(task, project)
 
         # Update task
         task.description = task_content.get("description", task.description)
@@ -2570,6 +2648,7 @@ Retorne APENAS o JSON, sem explicações."""
 
         # Generate draft subtasks
         draft_subtasks = await self._generate_draft_subtasks(task, project)
+        self.speculation.schedule(project.id, draft_subtasks)
 
         return {
             "id": str(task.id),
@@ -2602,14 +2681,13 @@ Retorne APENAS o JSON, sem explicações."""
         story_semantic_map = {}
         epic_semantic_map = {}
 
-        if not parent_story and task.parent_id:
-            parent_story = self.db.query(Task).filter(Task.id == task.parent_id).first()
+        if not parent_story or not grandparent_epic:
+            _, chain_story, chain_epic = self.hierarchy.chain(task, 3)
+            parent_story = parent_story or chain_story
+            grandparent_epic = grandparent_epic or chain_epic
 
-        if parent_story:
-            if parent_story.interview_insights:
-                story_semantic_map = parent_story.interview_insights.get("semantic_map", {})
-            if not grandparent_epic and parent_story.parent_id:
-                grandparent_epic = self.db.query(Task).filter(Task.id == parent_story.parent_id).first()
+        if parent_story and parent_story.interview_insights:
+            story_semantic_map = parent_story.interview_insights.get("semantic_map", {})
 
         if grandparent_epic and grandparent_epic.interview_insights:
             epic_semantic_map = grandparent_epic.interview_insights.get("semantic_map", {})
@@ -2909,7 +2987,7 @@ Retorne APENAS o JSON, sem explicações."""
             Dict with activated subtask data
         """
         # Fetch subtask
-        subtask = self.db.query(Task).filter(Task.id == subtask_id).first()
+        subtask = self.hierarchy.get(subtask_id)
         if not subtask:
             raise ValueError(f"Subtask {subtask_id} not found")
 
@@ -2926,19 +3004,10 @@ Retorne APENAS o JSON, sem explicações."""
         if not project:
             raise ValueError(f"Project {subtask.project_id} not found")
 
-        # Fetch full hierarchy for complete context
-        parent_task = None
-        grandparent_story = None
-        great_grandparent_epic = None
-        if subtask.parent_id:
-            parent_task = self.db.query(Task).filter(Task.id == subtask.parent_id).first()
-            if parent_task and parent_task.parent_id:
-                grandparent_story = self.db.query(Task).filter(Task.id == parent_task.parent_id).first()
-                if grandparent_story and grandparent_story.parent_id:
-                    great_grandparent_epic = self.db.query(Task).filter(Task.id == grandparent_story.parent_id).first()
-
-        # Generate FULL subtask content with complete hierarchy context
-        subtask_content = await self._generate_full_subtask_content(subtask, project, parent_task, grandparent_story, great_grandparent_epic)
+        # Generate FULL subtask content with complete hierarchy context (unless pre-generated)
+        subtask_content = self.speculation.take(subtask, project)
+        if subtask_content is None:
+            subtask_content = await self._generate_full_item_content(subtask, project)
 
         # Update subtask with generated content
         subtask.description = subtask_content.get("description", subtask.description)
@@ -2999,20 +3068,17 @@ Retorne APENAS o JSON, sem explicações."""
         story_semantic_map = {}
         epic_semantic_map = {}
 
-        if not parent_task and subtask.parent_id:
-            parent_task = self.db.query(Task).filter(Task.id == subtask.parent_id).first()
+        if not parent_task or not grandparent_story or not great_grandparent_epic:
+            _, chain_task, chain_story, chain_epic = self.hierarchy.chain(subtask, 4)
+            parent_task = parent_task or chain_task
+            grandparent_story = grandparent_story or chain_story
+            great_grandparent_epic = great_grandparent_epic or chain_epic
 
-        if parent_task:
-            if parent_task.interview_insights:
-                task_semantic_map = parent_task.interview_insights.get("semantic_map", {})
-            if not grandparent_story and parent_task.parent_id:
-                grandparent_story = self.db.query(Task).filter(Task.id == parent_task.parent_id).first()
+        if parent_task and parent_task.interview_insights:
+            task_semantic_map = parent_task.interview_insights.get("semantic_map", {})
 
-        if grandparent_story:
-            if grandparent_story.interview_insights:
-                story_semantic_map = grandparent_story.interview_insights.get("semantic_map", {})
-            if not great_grandparent_epic and grandparent_story.parent_id:
-                great_grandparent_epic = self.db.query(Task).filter(Task.id == grandparent_story.parent_id).first()
+        if grandparent_story and grandparent_story.interview_insights:
+            story_semantic_map = grandparent_story.interview_insights.get("semantic_map", {})
 
         if great_grandparent_epic and great_grandparent_epic.interview_insights:
             epic_semantic_map = great_grandparent_epic.interview_insights.get("semantic_map", {})
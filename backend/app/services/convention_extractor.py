@@ -10,6 +10,7 @@ from typing import Dict, List, Any, Optional
 from anthropic import Anthropic
 
 from app.config import settings
+from app.services.fs_snapshot import FileSnapshot, get_snapshot_service
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,8 @@ class ConventionExtractor:
     async def extract(
         self,
         extraction_path: Path,
-        detected_stack: Optional[str] = None
+        detected_stack: Optional[str] = None,
+        snapshot: Optional[FileSnapshot] = None
     ) -> Dict[str, Any]:
         """
         Extract conventions from project
@@ -38,6 +40,7 @@ class ConventionExtractor:
         Args:
             extraction_path: Path to extracted project
             detected_stack: Detected stack (for targeted file selection)
+            snapshot: Filesystem snapshot of extraction_path (taken if not given)
 
         Returns:
             {
@@ -64,7 +67,7 @@ class ConventionExtractor:
         logger.info(f"Extracting conventions from {extraction_path}")
 
         # Sample files
-        sampled_files = self._sample_files(extraction_path, detected_stack)
+        sampled_files = self._sample_files(extraction_path, detected_stack, snapshot=snapshot)
 
         if not sampled_files:
             logger.warning("No files to sample for convention extraction")
@@ -100,7 +103,8 @@ class ConventionExtractor:
         self,
         root_path: Path,
         detected_stack: Optional[str],
-        max_files: int = 10
+        max_files: int = 10,
+        snapshot: Optional[FileSnapshot] = None
     ) -> List[Dict[str, str]]:
         """
         Sample representative files from project
@@ -148,30 +152,32 @@ class ConventionExtractor:
 
         patterns = priority_patterns.get(detected_stack, ["**/*.py", "**/*.js", "**/*.ts", "**/*.php"])
 
+        if snapshot is None:
+            snapshot = get_snapshot_service().get(root_path)
+
         sampled = []
 
         for pattern in patterns:
-            for file_path in root_path.glob(pattern):
-                if file_path.is_file():
-                    # Skip very large files (>50KB)
-                    try:
-                        size = file_path.stat().st_size
-                        if size > 50 * 1024:
-                            continue
-
-                        content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-                        sampled.append({
-                            "path": str(file_path.relative_to(root_path)),
-                            "content": content[:5000]  # Limit to 5000 chars
-                        })
-
-                        if len(sampled) >= max_files:
-                            return sampled
-
-                    except Exception as e:
-                        logger.debug(f"Skipping file {file_path}: {e}")
-                        continue
+            for info in snapshot.glob(pattern):
+                # Skip very large files (>50KB)
+                if info.size > 50 * 1024:
+                    continue
+
+                file_path = root_path / info.path
+                try:
+                    content = file_path.read_text(encoding="utf-8", errors="ignore")
+
+                    sampled.append({
+                        "path": info.path,
+                        "content": content[:5000]  # Limit to 5000 chars
+                    })
+
+                    if len(sampled) >= max_files:
+                        return sampled
+
+                except Exception as e:
+                    logger.debug(f"Skipping file {file_path}: {e}")
+                    continue
 
         return sampled
 
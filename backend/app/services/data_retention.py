@@ -0,0 +1,535 @@
+"""
+Data Retention
+Archives and drops expired rows of the tables that grow with every run.
+
+async_jobs (result, handler_kwargs) and ai_executions (input_messages,
+response) gain rows with each job and AI call, and prompts keeps the full
+system/user prompt and response of every audited call. Cleanup used to be
+on demand only (POST /jobs/cleanup, DELETE /ai-executions/), deleting
+row by row.
+
+async_jobs and ai_executions are partitioned by month of created_at
+(migration 20260211000001). The retention task:
+- creates the monthly partitions PARTITION_MONTHS_AHEAD months ahead (also
+  done on startup and when retention is disabled, see ensure_partitions);
+  rows of months without a partition are kept by a DEFAULT partition
+  (migration 20260214000001) and moved out when their partition is created
+- for each partition entirely older than the retention window, exports its
+  rows to {DATA_ARCHIVE_DIR}/{table}/{partition}.jsonl.gz, then detaches and
+  drops it - no DELETE, no dead tuples left for vacuum
+- async_jobs partitions that still hold pending or running jobs are kept
+
+prompts is referenced by tasks.prompt_id and prompts.parent_id and cannot
+be partitioned; its audit payload (system_prompt, user_prompt, response)
+is archived and cleared after PROMPTS_COMPACTION_DAYS, keeping the row,
+its content, token counts and cost.
+
+On a database created without the migration (or not Postgres) expired rows
+are archived and deleted in batches instead.
+
+Job workers run it every DATA_RETENTION_INTERVAL_HOURS; to run it once:
+
+    python -m app.services.data_retention
+"""
+
+import enum
+import gzip
+import json
+import logging
+import os
+import re
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy import bindparam, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.ai_execution import AIExecution
+from app.models.async_job import AsyncJob, JobStatus
+from app.models.prompt import Prompt
+
+logger = logging.getLogger(__name__)
+
+
+# Tables partitioned by month: model and retention days (0 keeps everything)
+PARTITIONED_TABLES: Dict[str, Any] = {
+    "async_jobs": (AsyncJob, lambda: settings.async_jobs_retention_days),
+    "ai_executions": (AIExecution, lambda: settings.ai_executions_retention_days),
+}
+
+# Prompt columns cleared by compaction
+PROMPT_PAYLOAD_COLUMNS = ("system_prompt", "user_prompt", "response")
+
+# Rows per statement when rows are archived and deleted or compacted
+BATCH_SIZE = 500
+
+# Session-level advisory lock: one retention run at a time across workers
+RETENTION_LOCK_ID = 4704701
+
+UNFINISHED_JOB_STATUSES = (JobStatus.PENDING.value, JobStatus.RUNNING.value)
+
+
+class Partition(NamedTuple):
+    """Monthly partition: rows with start <= created_at < end."""
+    name: str
+    start: datetime
+    end: datetime
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of the month of a timestamp."""
+    return datetime(moment.year, moment.month, 1)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """First day of the month a number of months away."""
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def default_partition(table: str) -> str:
+    """DEFAULT partition of a table: rows of months without a partition of their own."""
+    return f"{table}_default"
+
+
+def partition_for(table: str, month: datetime) -> Partition:
+    """Partition of a table holding the given month."""
+    start = month_start(month)
+    return Partition(f"{table}_p{start:%Y_%m}", start, add_months(start, 1))
+
+
+def parse_partition(table: str, name: str) -> Optional[Partition]:
+    """Partition from its name ({table}_pYYYY_MM), None for other tables."""
+    match = re.fullmatch(rf"{re.escape(table)}_p(\d{{4}})_(\d{{2}})", name)
+    if not match:
+        return None
+    return partition_for(table, datetime(int(match.group(1)), int(match.group(2)), 1))
+
+
+def expired_partitions(partitions: Iterable[Partition], cutoff: datetime) -> List[Partition]:
+    """Partitions whose rows are all older than the cutoff, oldest first."""
+    return sorted((p for p in partitions if p.end <= cutoff), key=lambda p: p.start)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", errors="replace")
+    return str(value)
+
+
+class ArchiveWriter:
+    """
+    Gzip-compressed JSONL file, one row per line (context manager).
+
+    Written to a temporary name and renamed when closed without error, so a
+    half-written archive never looks complete. Nothing is created for zero rows.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Final archive path (*.jsonl.gz)
+        """
+        self.path = Path(path)
+        self.rows = 0
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._file = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Append one row."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = gzip.open(self._tmp, "wt", encoding="utf-8")
+        self._file.write(json.dumps(dict(row), default=_json_default, ensure_ascii=False))
+        self._file.write("\n")
+        self.rows += 1
+
+    def write_all(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Append rows; returns how many."""
+        for row in rows:
+            self.write(row)
+        return self.rows
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if self._file is None:
+            return
+        self._file.close()
+        if exc_type is None:
+            os.replace(self._tmp, self.path)
+        else:
+            self._tmp.unlink(missing_ok=True)
+
+
+class DataRetentionService:
+    """
+    Partition maintenance, retention and prompt compaction.
+
+    Example:
+        service = DataRetentionService(db)
+        summary = service.run()
+        # {"async_jobs": {...}, "ai_executions": {...}, "prompts": {...}}
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        archive_dir: Optional[str] = None,
+        archive: Optional[bool] = None,
+        now: Optional[datetime] = None
+    ):
+        """
+        Args:
+            db: Database session
+            archive_dir: Root of archive files (default: DATA_ARCHIVE_DIR)
+            archive: Export rows before dropping them (default: DATA_ARCHIVE_ENABLED)
+            now: Reference time (default: utcnow)
+        """
+        self.db = db
+        self.archive_dir = Path(archive_dir or settings.data_archive_dir)
+        self.archive = settings.data_archive_enabled if archive is None else archive
+        self.now = now or datetime.utcnow()
+
+    @property
+    def is_postgres(self) -> bool:
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    # ------------------------------------------------------------------
+    # Partitions
+    # ------------------------------------------------------------------
+
+    def is_partitioned(self, table: str) -> bool:
+        """Whether a table is partitioned (migration 20260211000001 applied)."""
+        if not self.is_postgres:
+            return False
+        return self.db.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :table"
+            ),
+            {"table": table}
+        ).first() is not None
+
+    def _child_tables(self, table: str) -> List[str]:
+        return list(self.db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = :table"
+            ),
+            {"table": table}
+        ).scalars())
+
+    def list_partitions(self, table: str) -> List[Partition]:
+        """Monthly partitions of a partitioned table, oldest first (the DEFAULT partition excluded)."""
+        partitions = [parse_partition(table, name) for name in self._child_tables(table)]
+        return sorted((p for p in partitions if p is not None), key=lambda p: p.start)
+
+    def _default_months(self, table: str) -> List[datetime]:
+        """Months of the rows the DEFAULT partition holds."""
+        return [
+            month_start(month) for month in self.db.execute(
+                text(f"SELECT DISTINCT date_trunc('month', created_at) FROM {default_partition(table)}")
+            ).scalars()
+        ]
+
+    def ensure_partitions(self, table: str, months_ahead: Optional[int] = None) -> List[str]:
+        """
+        Create the partitions of the current month and the next ones.
+
+        Rows that landed in the DEFAULT partition (months without a partition
+        at the time) are moved to the partition of their month, created here.
+
+        Args:
+            table: Partitioned table
+            months_ahead: Months after the current one (default: PARTITION_MONTHS_AHEAD)
+
+        Returns:
+            Names of the partitions created
+        """
+        months_ahead = settings.partition_months_ahead if months_ahead is None else months_ahead
+        children = set(self._child_tables(table))
+        default_months = set(self._default_months(table)) if default_partition(table) in children else set()
+        months = {add_months(month_start(self.now), offset) for offset in range(months_ahead + 1)}
+        created = []
+        for month in sorted(months | default_months):
+            partition = partition_for(table, month)
+            if partition.name in children:
+                continue
+            bounds = f"FOR VALUES FROM ('{partition.start:%Y-%m-%d}') TO ('{partition.end:%Y-%m-%d}')"
+            if month in default_months:
+                self._move_from_default(table, partition, bounds)
+            else:
+                self.db.execute(text(f"CREATE TABLE IF NOT EXISTS {partition.name} PARTITION OF {table} {bounds}"))
+            created.append(partition.name)
+        self.db.commit()
+        if created:
+            logger.info(f"🗂️  Created partitions {', '.join(created)}")
+        return created
+
+    def _move_from_default(self, table: str, partition: Partition, bounds: str) -> None:
+        """
+        Create a partition for rows held by the DEFAULT partition.
+
+        A partition cannot be created while the DEFAULT partition holds rows of
+        its range: it is created standalone, filled with those rows, then attached.
+        """
+        self.db.execute(text(
+            f"CREATE TABLE {partition.name} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+        ))
+        moved = self.db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default_partition(table)} "
+                f"WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                f"INSERT INTO {partition.name} SELECT * FROM moved"
+            ),
+            {"start": partition.start, "end": partition.end}
+        ).rowcount
+        self.db.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {partition.name} {bounds}"))
+        logger.info(f"🗂️  Moved {moved} rows of {table} from the default partition to {partition.name}")
+
+    def drop_partition(self, table: str, partition: Partition) -> Optional[int]:
+        """
+        Archive a partition, then detach and drop it.
+
+        Args:
+            table: Partitioned table
+            partition: Expired partition
+
+        Returns:
+            Rows archived (None if the partition was kept)
+        """
+        if table == "async_jobs":
+            unfinished = self.db.execute(
+                text(f"SELECT count(*) FROM {partition.name} WHERE status::text IN :statuses").bindparams(
+                    bindparam("statuses", value=list(UNFINISHED_JOB_STATUSES), expanding=True)
+                )
+            ).scalar()
+            if unfinished:
+                logger.warning(f"⚠️  Keeping {partition.name}: {unfinished} jobs still pending or running")
+                return None
+
+        rows = 0
+        if self.archive:
+            result = self.db.connection().execution_options(stream_results=True, yield_per=BATCH_SIZE).execute(
+                text(f"SELECT * FROM {partition.name}")
+            )
+            with ArchiveWriter(self.archive_dir / table / f"{partition.name}.jsonl.gz") as writer:
+                rows = writer.write_all(result.mappings())
+
+        self.db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {partition.name}"))
+        self.db.execute(text(f"DROP TABLE {partition.name}"))
+        self.db.commit()
+        logger.info(f"🗑️  Dropped partition {partition.name} ({rows} rows archived)")
+        return rows
+
+    # ------------------------------------------------------------------
+    # Retention
+    # ------------------------------------------------------------------
+
+    def expire(self, table: str, retention_days: int) -> Dict[str, Any]:
+        """
+        Apply the retention window of a table.
+
+        Args:
+            table: async_jobs or ai_executions
+            retention_days: Days rows are kept (0 keeps everything)
+
+        Returns:
+            Summary: partitions created and dropped, rows archived and deleted
+        """
+        summary = {"partitions_created": [], "partitions_dropped": [], "rows_archived": 0, "rows_deleted": 0}
+        partitioned = self.is_partitioned(table)
+        if partitioned:
+            summary["partitions_created"] = self.ensure_partitions(table)
+        if retention_days <= 0:
+            return summary
+
+        cutoff = self.now - timedelta(days=retention_days)
+        if partitioned:
+            for partition in expired_partitions(self.list_partitions(table), cutoff):
+                rows = self.drop_partition(table, partition)
+                if rows is not None:
+                    summary["partitions_dropped"].append(partition.name)
+                    summary["rows_archived"] += rows
+        else:
+            archived, deleted = self._expire_rows(table, cutoff)
+            summary["rows_archived"], summary["rows_deleted"] = archived, deleted
+        return summary
+
+    def _expire_rows(self, table: str, cutoff: datetime) -> tuple:
+        """Archive and delete expired rows in batches (table not partitioned)."""
+        model = PARTITIONED_TABLES[table][0]
+        conditions = [model.created_at < cutoff]
+        if model is AsyncJob:
+            conditions.append(AsyncJob.status.notin_([JobStatus.PENDING, JobStatus.RUNNING]))
+
+        deleted = 0
+        path = self.archive_dir / table / f"{table}_{self.now:%Y%m%d%H%M%S}.jsonl.gz"
+        with ArchiveWriter(path) as writer:
+            while True:
+                rows = self.db.execute(
+                    select(model.__table__).where(*conditions).order_by(model.created_at).limit(BATCH_SIZE)
+                ).mappings().all()
+                if not rows:
+                    break
+                if self.archive:
+                    writer.write_all(rows)
+                deleted += self.db.query(model).filter(
+                    model.id.in_([row["id"] for row in rows])
+                ).delete(synchronize_session=False)
+                self.db.commit()
+        if deleted:
+            logger.info(f"🗑️  Deleted {deleted} rows of {table} older than {cutoff:%Y-%m-%d}")
+        return writer.rows, deleted
+
+    def compact_prompts(self, older_than_days: Optional[int] = None) -> Dict[str, int]:
+        """
+        Archive and clear the audit payload of old prompts.
+
+        Args:
+            older_than_days: Age of compacted prompts (default: PROMPTS_COMPACTION_DAYS; 0 disables)
+
+        Returns:
+            Summary: prompts compacted
+        """
+        days = settings.prompts_compaction_days if older_than_days is None else older_than_days
+        if days <= 0:
+            return {"prompts_compacted": 0}
+
+        cutoff = self.now - timedelta(days=days)
+        payload = [getattr(Prompt, column) for column in PROMPT_PAYLOAD_COLUMNS]
+        compacted = 0
+        path = self.archive_dir / "prompts" / f"prompts_{self.now:%Y%m%d%H%M%S}.jsonl.gz"
+        with ArchiveWriter(path) as writer:
+            while True:
+                rows = self.db.execute(
+                    select(Prompt.__table__)
+                    .where(Prompt.created_at < cutoff, or_(*[column.isnot(None) for column in payload]))
+                    .order_by(Prompt.created_at)
+                    .limit(BATCH_SIZE)
+                ).mappings().all()
+                if not rows:
+                    break
+                if self.archive:
+                    writer.write_all(rows)
+                compacted += self.db.query(Prompt).filter(
+                    Prompt.id.in_([row["id"] for row in rows])
+                ).update({column: None for column in payload}, synchronize_session=False)
+                self.db.commit()
+        if compacted:
+            logger.info(f"🗜️  Compacted {compacted} prompts older than {cutoff:%Y-%m-%d}")
+        return {"prompts_compacted": compacted}
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Maintain partitions, expire async_jobs and ai_executions, compact prompts.
+
+        Returns:
+            Summary per table
+        """
+        summary: Dict[str, Any] = {}
+        for table, (_, retention_days) in PARTITIONED_TABLES.items():
+            try:
+                summary[table] = self.expire(table, retention_days())
+            except Exception as e:
+                self.db.rollback()
+                logger.error(f"❌ Retention of {table} failed: {e}")
+                summary[table] = {"error": str(e)}
+        try:
+            summary["prompts"] = self.compact_prompts()
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"❌ Prompt compaction failed: {e}")
+            summary["prompts"] = {"error": str(e)}
+        return summary
+
+
+def run_data_retention(session_factory: Callable = SessionLocal) -> Optional[Dict[str, Any]]:
+    """
+    One retention run (blocking; workers call it in a thread).
+
+    On Postgres only one run at a time holds the advisory lock; others skip.
+
+    Args:
+        session_factory: Creates database sessions
+
+    Returns:
+        Summary per table, None if another run holds the lock
+    """
+    db = session_factory()
+    lock = None
+    locked = False
+    try:
+        if db.get_bind().dialect.name == "postgresql":
+            # Held on its own connection: the session's connection changes between commits
+            lock = db.get_bind().connect().execution_options(isolation_level="AUTOCOMMIT")
+            locked = lock.execute(text("SELECT pg_try_advisory_lock(:id)"), {"id": RETENTION_LOCK_ID}).scalar()
+            if not locked:
+                logger.info("Data retention already running elsewhere; skipped")
+                return None
+        return DataRetentionService(db).run()
+    finally:
+        db.close()
+        if lock is not None:
+            try:
+                if locked:
+                    # Session-level lock: closing only returns the connection to the pool, still holding it
+                    lock.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": RETENTION_LOCK_ID})
+            finally:
+                lock.close()
+
+
+def ensure_partitions(session_factory: Callable = SessionLocal) -> Dict[str, List[str]]:
+    """
+    Create the upcoming monthly partitions of the partitioned tables.
+
+    Independent of DATA_RETENTION_ENABLED: the API and the job workers run it
+    on startup and workers every DATA_RETENTION_INTERVAL_HOURS. Rows of months
+    without a partition go to the DEFAULT partition until then.
+
+    Args:
+        session_factory: Creates database sessions
+
+    Returns:
+        Partitions created per table (empty when the tables are not partitioned)
+    """
+    db = session_factory()
+    try:
+        service = DataRetentionService(db)
+        return {
+            table: service.ensure_partitions(table)
+            for table in PARTITIONED_TABLES
+            if service.is_partitioned(table)
+        }
+    finally:
+        db.close()
+
+
+def main():
+    """Process entry point: one retention run."""
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    summary = run_data_retention()
+    logger.info(f"Data retention: {json.dumps(summary, default=str)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Draft Hierarchy Expansion
+Level-by-level fan-out of draft generation (Epic -> Stories -> Tasks -> Subtasks).
+
+Once a parent exists its children are independent, so the hierarchy is
+expanded as a DAG, one level at a time:
+- every parent of the current level generates its drafts concurrently
+  (bounded by DRAFT_GENERATION_CONCURRENCY)
+- the whole level is written in one batch (add_all + single commit), which
+  also assigns the ids the next level needs as parent_id; the new drafts are
+  primed into the generator's HierarchyLoader so their ancestor lookups
+  need no query
+- progress goes to the AsyncJob (if any) and to the project WebSocket
+
+Wall-clock time of a full expansion is roughly one AI call per level
+instead of one per item.
+
+Usage:
+    expander = DraftHierarchyExpander(db, context_service)
+    levels = await expander.expand(epic, project, depth=3, job_id=job.id)
+"""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.api.websocket import broadcast_event
+from app.config import settings
+from app.models.project import Project
+from app.models.task import Task, ItemType
+from app.services.job_manager import JobManager
+
+logger = logging.getLogger(__name__)
+
+
+# Draft generator (ContextGeneratorService method) for the children of each item type
+CHILD_GENERATORS = {
+    ItemType.EPIC: "_generate_draft_stories",
+    ItemType.STORY: "_generate_draft_tasks",
+    ItemType.TASK: "_generate_draft_subtasks",
+}
+
+MAX_DEPTH = len(CHILD_GENERATORS)
+
+
+class DraftHierarchyExpander:
+    """
+    Expands a draft hierarchy level by level with concurrent siblings.
+    """
+
+    def __init__(self, db: Session, context_service):
+        """
+        Args:
+            db: Database session
+            context_service: ContextGeneratorService providing the draft generators
+        """
+        self.db = db
+        self.context_service = context_service
+
+    async def expand(
+        self,
+        root: Task,
+        project: Project,
+        depth: int = 1,
+        job_id: Optional[UUID] = None,
+        progress_range: Tuple[float, float] = (40.0, 90.0)
+    ) -> List[List[Task]]:
+        """
+        Generate draft descendants of root, `depth` levels deep.
+
+        Args:
+            root: Activated item whose descendants are generated
+            project: The project with context
+            depth: Number of levels to generate (1 = direct children only)
+            job_id: AsyncJob to report progress to (optional)
+            progress_range: Job percent band covered by the expansion
+
+        Returns:
+            Created drafts per level (level 0 = direct children of root)
+        """
+        depth = max(0, min(depth, MAX_DEPTH))
+        job_manager = JobManager(self.db) if job_id else None
+        semaphore = asyncio.Semaphore(max(1, settings.draft_generation_concurrency))
+        start, end = progress_range
+        band = (end - start) / depth if depth else 0
+
+        # Next level's ancestor lookups are served from the generator's identity cache
+        hierarchy = getattr(self.context_service, "hierarchy", None)
+        if hierarchy is not None:
+            hierarchy.prime([root])
+
+        levels: List[List[Task]] = []
+        parents = [root]
+
+        for level in range(depth):
+            parents = [parent for parent in parents if parent.item_type in CHILD_GENERATORS]
+            if not parents:
+                break
+
+            if job_manager and job_manager.is_cancelled(job_id):
+                logger.info(f"🛑 Draft expansion cancelled after {level} levels")
+                break
+
+            progress = {"done": 0}
+
+            async def generate(parent: Task) -> List[Task]:
+                async with semaphore:
+                    children = await self._generate_children(parent, project)
+                progress["done"] += 1
+                await self._report(
+                    project, job_manager, job_id,
+                    start + band * (level + progress["done"] / len(parents)),
+                    f"Level {level + 1}/{depth}: {progress['done']}/{len(parents)} items expanded",
+                    level
+                )
+                return children
+
+            results = await asyncio.gather(*[generate(parent) for parent in parents])
+
+            # One batch write per level (ids are assigned for the next level)
+            created = [child for children in results for child in children]
+            if created:
+                self.db.add_all(created)
+                self.db.flush()
+                if hierarchy is not None:
+                    hierarchy.prime(created)
+                self.db.commit()
+
+            logger.info(f"✅ Draft level {level + 1}: {len(created)} items from {len(parents)} parents")
+            levels.append(created)
+            parents = created
+
+        return levels
+
+    async def _generate_children(self, parent: Task, project: Project) -> List[Task]:
+        """Unsaved drafts of one parent (failures are logged, never raised)."""
+        generator = getattr(self.context_service, CHILD_GENERATORS[parent.item_type])
+        try:
+            return await generator(parent, project, persist=False)
+        except Exception as e:
+            logger.error(f"❌ Error generating drafts for {parent.title}: {e}")
+            return []
+
+    async def _report(
+        self,
+        project: Project,
+        job_manager: Optional[JobManager],
+        job_id: Optional[UUID],
+        percent: float,
+        message: str,
+        level: int
+    ):
+        """Progress to the AsyncJob and the project WebSocket."""
+        if job_manager:
+            job_manager.update_progress(job_id, percent, message)
+
+        try:
+            await broadcast_event(
+                project_id=str(project.id),
+                event_type="draft_expansion_progress",
+                data={
+                    "job_id": str(job_id) if job_id else None,
+                    "level": level + 1,
+                    "progress_percent": percent,
+                    "message": message
+                }
+            )
+        except Exception as e:
+            logger.debug(f"Could not broadcast draft expansion progress: {e}")
@@ -10,11 +10,12 @@ import shutil
 import magic
 import logging
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from uuid import UUID
 from fastapi import UploadFile, HTTPException
 
 from app.config import settings
+from app.services.fs_snapshot import FileSnapshot, get_snapshot_service
 
 logger = logging.getLogger(__name__)
 
@@ -29,26 +30,6 @@ ALLOWED_MIME_TYPES = {
     "application/x-compressed-tar"
 }
 
-# Directories to ignore during file tree building
-IGNORED_DIRS = {
-    "node_modules",
-    "vendor",
-    ".git",
-    ".svn",
-    ".hg",
-    "__pycache__",
-    ".venv",
-    "venv",
-    "env",
-    "dist",
-    "build",
-    ".next",
-    ".nuxt",
-    "coverage",
-    ".pytest_cache",
-    ".mypy_cache",
-}
-
 # Extensions to ignore
 IGNORED_EXTENSIONS = {
     ".pyc",
@@ -268,7 +249,12 @@ class FileProcessor:
             # Extract all
             tar_ref.extractall(extract_path)
 
-    def build_file_tree(self, root_path: Path, max_depth: int = 10) -> Dict:
+    def build_file_tree(
+        self,
+        root_path: Path,
+        max_depth: int = 10,
+        snapshot: Optional[FileSnapshot] = None
+    ) -> Dict:
         """
         Build JSON tree structure of files
 
@@ -280,6 +266,7 @@ class FileProcessor:
         Args:
             root_path: Root directory to scan
             max_depth: Maximum directory depth
+            snapshot: Filesystem snapshot of root_path (taken if not given)
 
         Returns:
             {
@@ -288,60 +275,47 @@ class FileProcessor:
                 "children": [...]
             }
         """
+        if snapshot is None:
+            snapshot = get_snapshot_service().get(root_path)
+
+        tree = {"name": root_path.name, "type": "directory", "path": ".", "children": []}
+        nodes = {"": tree}
+
+        def parent_of(rel_path: str) -> Optional[Dict]:
+            return nodes.get(rel_path.rsplit("/", 1)[0] if "/" in rel_path else "")
+
+        # Sorted paths: a parent directory always comes before its children
+        for rel_dir in snapshot.directories:
+            parent = parent_of(rel_dir)
+            if parent is None or rel_dir.count("/") + 1 > max_depth:
+                continue
+
+            node = {
+                "name": rel_dir.rsplit("/", 1)[-1],
+                "type": "directory",
+                "path": rel_dir,
+                "children": []
+            }
+            parent["children"].append(node)
+            nodes[rel_dir] = node
+
+        for info in snapshot.files:
+            # Skip ignored extensions and very large files (>10MB)
+            if info.ext in IGNORED_EXTENSIONS or info.size > 10 * 1024 * 1024:
+                continue
+
+            parent = parent_of(info.path)
+            if parent is None or info.depth > max_depth:
+                continue
+
+            parent["children"].append({
+                "name": info.name,
+                "type": "file",
+                "path": info.path,
+                "size": info.size,
+            })
 
-        def build_tree(path: Path, depth: int = 0) -> Dict:
-            """Recursive helper"""
-
-            if depth > max_depth:
-                return None
-
-            name = path.name
-
-            # Skip ignored directories
-            if path.is_dir() and name in IGNORED_DIRS:
-                return None
-
-            # Skip ignored extensions
-            if path.is_file() and path.suffix in IGNORED_EXTENSIONS:
-                return None
-
-            if path.is_file():
-                # Skip very large files (>10MB)
-                try:
-                    size = path.stat().st_size
-                    if size > 10 * 1024 * 1024:
-                        return None
-                except:
-                    return None
-
-                return {
-                    "name": name,
-                    "type": "file",
-                    "path": str(path.relative_to(root_path)),
-                    "size": size,
-                }
-
-            elif path.is_dir():
-                children = []
-                try:
-                    for child in path.iterdir():
-                        child_node = build_tree(child, depth + 1)
-                        if child_node:
-                            children.append(child_node)
-                except PermissionError:
-                    pass
-
-                return {
-                    "name": name,
-                    "type": "directory",
-                    "path": str(path.relative_to(root_path)),
-                    "children": children
-                }
-
-            return None
-
-        tree = build_tree(root_path)
-        return tree if tree else {"name": root_path.name, "type": "directory", "children": []}
+        return tree
 
     def cleanup(self, analysis_id: UUID):
         """
@@ -361,6 +335,7 @@ class FileProcessor:
             extract_path = self.extraction_dir / str(analysis_id)
             if extract_path.exists():
                 shutil.rmtree(extract_path)
+                get_snapshot_service().invalidate(extract_path)
                 logger.info(f"Removed extraction dir: {extract_path}")
 
         except Exception as e:
@@ -405,11 +380,5 @@ class FileProcessor:
     def _get_dir_size(path: Path) -> int:
         """Calculate total size of directory"""
 
-        total = 0
-        for item in path.rglob("*"):
-            if item.is_file():
-                try:
-                    total += item.stat().st_size
-                except:
-                    pass
-        return total
+        # Nothing is pruned: every extracted byte counts towards the limit
+        return get_snapshot_service().scan(path, ignore_dirs=()).total_size
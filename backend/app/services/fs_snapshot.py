@@ -0,0 +1,380 @@
+"""
+Filesystem Snapshot Service
+
+One os.scandir walk of a project tree, shared by every flow that needs the
+file list: code indexing, codebase memory scan, pattern discovery, project
+analysis (file tree, stack detection, convention/pattern sampling).
+
+A snapshot is an immutable, sorted tuple of FileInfo (path, size, mtime,
+ext, language) plus the directories that were walked. Snapshots are cached
+per root and reused while they are young enough and no walked directory
+changed its mtime (files added, removed or renamed). The file watcher, or
+any caller that just wrote files, can invalidate a root explicitly.
+
+Usage:
+    from app.services.fs_snapshot import get_snapshot_service
+
+    snapshot = get_snapshot_service().get(project_path)
+    for info in snapshot.files:
+        print(info.path, info.size, info.language)
+
+    # Same walk for several consumers in one operation
+    stack_detector.detect(project_path, snapshot=snapshot)
+    snapshot.glob("app/**/*.php")
+"""
+
+import os
+import re
+import time
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# Languages understood by the code indexer, by extension
+LANGUAGE_EXTENSIONS = {
+    "php": [".php"],
+    "typescript": [".ts", ".tsx"],
+    "javascript": [".js", ".jsx"],
+    "python": [".py"],
+    "css": [".css", ".scss", ".sass"],
+    "html": [".html", ".blade.php"],
+    "sql": [".sql"],
+    "yaml": [".yaml", ".yml"],
+    "json": [".json"]
+}
+
+EXTENSION_LANGUAGES = {
+    extension: language
+    for language, extensions in LANGUAGE_EXTENSIONS.items()
+    for extension in extensions
+}
+
+# Dependency, build, VCS and tooling directories never worth walking
+IGNORE_DIRS = frozenset({
+    "node_modules",
+    ".venv",
+    "venv",
+    "env",
+    "vendor",
+    ".git",
+    ".svn",
+    ".hg",
+    ".next",
+    ".nuxt",
+    "dist",
+    "build",
+    "__pycache__",
+    ".pytest_cache",
+    ".mypy_cache",
+    "coverage",
+    ".idea",
+    ".vscode"
+})
+
+
+@dataclass(frozen=True)
+class FileInfo:
+    """
+    One file of a snapshot.
+
+    path is relative to the snapshot root with POSIX separators; ext is the
+    lower-cased suffix ("" if none); language is the indexer language or None.
+    """
+
+    path: str
+    size: int
+    mtime: float
+    ext: str
+    language: Optional[str]
+
+    @property
+    def name(self) -> str:
+        return self.path.rsplit("/", 1)[-1]
+
+    @property
+    def depth(self) -> int:
+        """Number of path components (1 for files at the root)."""
+        return self.path.count("/") + 1
+
+
+@dataclass(frozen=True)
+class FileSnapshot:
+    """
+    Immutable view of a directory tree at one point in time.
+
+    Attributes:
+        root: Directory that was walked
+        files: Files sorted by path
+        directories: Walked directories (relative POSIX paths, root excluded), sorted
+        dir_mtimes: st_mtime_ns of every walked directory ("" = root), for validation
+        ignore_dirs: Directory names that were pruned
+        taken_at: time.monotonic() when the walk finished
+    """
+
+    root: Path
+    files: Tuple[FileInfo, ...]
+    directories: Tuple[str, ...]
+    dir_mtimes: Tuple[Tuple[str, int], ...] = field(repr=False)
+    ignore_dirs: FrozenSet[str] = field(repr=False)
+    taken_at: float = 0.0
+
+    @cached_property
+    def by_path(self) -> Dict[str, FileInfo]:
+        """Files indexed by relative path."""
+        return {info.path: info for info in self.files}
+
+    @cached_property
+    def directory_set(self) -> FrozenSet[str]:
+        return frozenset(self.directories)
+
+    @property
+    def total_size(self) -> int:
+        return sum(info.size for info in self.files)
+
+    def has_file(self, rel_path: str) -> bool:
+        return rel_path in self.by_path
+
+    def has_dir(self, rel_path: str) -> bool:
+        return rel_path.strip("/") in self.directory_set
+
+    def top_level_dirs(self) -> List[str]:
+        """Directories directly under the root."""
+        return [path for path in self.directories if "/" not in path]
+
+    def glob(self, pattern: str) -> List[FileInfo]:
+        """
+        Files matching a Path.glob-style pattern ("*", "?", "**/").
+
+        Args:
+            pattern: Pattern relative to the root, e.g. "app/**/*.tsx"
+
+        Returns:
+            Matching files in path order
+        """
+        regex = _compile_glob(pattern)
+        return [info for info in self.files if regex.match(info.path)]
+
+
+_glob_cache: Dict[str, Pattern] = {}
+
+
+def _compile_glob(pattern: str) -> Pattern:
+    """Translate a glob pattern to a regex over POSIX relative paths."""
+    regex = _glob_cache.get(pattern)
+    if regex is not None:
+        return regex
+
+    parts = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")      # zero or more directories
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+
+    regex = re.compile("".join(parts) + r"\Z")
+    _glob_cache[pattern] = regex
+    return regex
+
+
+class FileSnapshotService:
+    """
+    Builds and caches FileSnapshots (thread-safe, bounded LRU per root).
+    """
+
+    DEFAULT_MAX_AGE_SECONDS = 30.0
+    MAX_CACHED_ROOTS = 32
+
+    def __init__(self):
+        self._cache: "OrderedDict[Tuple[str, FrozenSet[str]], FileSnapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        root: Path,
+        max_age: Optional[float] = None,
+        ignore_dirs: Optional[Iterable[str]] = None
+    ) -> FileSnapshot:
+        """
+        Cached snapshot of root, walking the tree only when needed.
+
+        A cached snapshot is reused while it is younger than max_age and none
+        of its directories changed mtime. In-place edits do not change
+        directory mtimes, so callers that need exact file size/mtime should
+        use refresh() (or a small max_age).
+
+        Args:
+            root: Directory to snapshot
+            max_age: Maximum age in seconds (default DEFAULT_MAX_AGE_SECONDS)
+            ignore_dirs: Directory names to prune (default IGNORE_DIRS)
+
+        Returns:
+            FileSnapshot
+        """
+        ignore = frozenset(ignore_dirs) if ignore_dirs is not None else IGNORE_DIRS
+        key = (str(root), ignore)
+        max_age = self.DEFAULT_MAX_AGE_SECONDS if max_age is None else max_age
+
+        with self._lock:
+            cached = self._cache.get(key)
+
+        if cached is not None and self._is_fresh(cached, max_age):
+            with self._lock:
+                self._cache.move_to_end(key)
+            return cached
+
+        return self.refresh(root, ignore_dirs=ignore)
+
+    def refresh(self, root: Path, ignore_dirs: Optional[Iterable[str]] = None) -> FileSnapshot:
+        """
+        Walk root now and cache the result.
+
+        Args:
+            root: Directory to snapshot
+            ignore_dirs: Directory names to prune (default IGNORE_DIRS)
+
+        Returns:
+            FileSnapshot
+        """
+        ignore = frozenset(ignore_dirs) if ignore_dirs is not None else IGNORE_DIRS
+        snapshot = self.scan(root, ignore)
+
+        with self._lock:
+            key = (str(root), ignore)
+            self._cache[key] = snapshot
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.MAX_CACHED_ROOTS:
+                self._cache.popitem(last=False)
+
+        return snapshot
+
+    def invalidate(self, root: Optional[Path] = None):
+        """
+        Drop cached snapshots of root (all roots if None).
+
+        Args:
+            root: Directory whose snapshots are stale
+        """
+        with self._lock:
+            if root is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[0] == str(root)]:
+                del self._cache[key]
+
+    def scan(self, root: Path, ignore_dirs: Iterable[str] = IGNORE_DIRS) -> FileSnapshot:
+        """
+        Walk root with os.scandir (uncached).
+
+        Ignored directories are pruned before descending, symlinked
+        directories are not followed, and stat results come from the
+        directory entries.
+
+        Args:
+            root: Directory to walk
+            ignore_dirs: Directory names to prune
+
+        Returns:
+            FileSnapshot
+        """
+        ignore = frozenset(ignore_dirs)
+        root_str = str(root)
+        prefix_len = len(root_str.rstrip(os.sep)) + 1
+
+        files: List[FileInfo] = []
+        directories: List[str] = []
+        dir_mtimes: List[Tuple[str, int]] = []
+        stack = [(root_str, "")]
+
+        while stack:
+            current, rel_dir = stack.pop()
+            try:
+                dir_mtimes.append((rel_dir, os.stat(current).st_mtime_ns))
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in ignore:
+                                rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                                directories.append(rel_path)
+                                stack.append((entry.path, rel_path))
+                            continue
+
+                        if not entry.is_file():
+                            continue
+
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+
+                        ext = os.path.splitext(entry.name)[1].lower()
+                        files.append(FileInfo(
+                            path=entry.path[prefix_len:].replace(os.sep, "/"),
+                            size=stat.st_size,
+                            mtime=stat.st_mtime,
+                            ext=ext,
+                            language=EXTENSION_LANGUAGES.get(ext)
+                        ))
+            except OSError as e:
+                logger.warning(f"Cannot scan directory {current}: {e}")
+
+        files.sort(key=lambda info: info.path)
+        directories.sort()
+
+        return FileSnapshot(
+            root=Path(root),
+            files=tuple(files),
+            directories=tuple(directories),
+            dir_mtimes=tuple(dir_mtimes),
+            ignore_dirs=ignore,
+            taken_at=time.monotonic()
+        )
+
+    def _is_fresh(self, snapshot: FileSnapshot, max_age: float) -> bool:
+        """Young enough and no walked directory changed (one stat per directory)."""
+        if time.monotonic() - snapshot.taken_at > max_age:
+            return False
+
+        for rel_dir, mtime_ns in snapshot.dir_mtimes:
+            try:
+                if os.stat(snapshot.root / rel_dir).st_mtime_ns != mtime_ns:
+                    return False
+            except OSError:
+                return False
+
+        return True
+
+
+# Process-wide instance
+_snapshot_service: Optional[FileSnapshotService] = None
+
+
+def get_snapshot_service() -> FileSnapshotService:
+    """
+    Get the process-wide FileSnapshotService.
+
+    Returns:
+        FileSnapshotService instance
+    """
+    global _snapshot_service
+    if _snapshot_service is None:
+        _snapshot_service = FileSnapshotService()
+    return _snapshot_service
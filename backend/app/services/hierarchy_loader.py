@@ -0,0 +1,319 @@
+"""
+Hierarchy Loader
+Task ancestor chains and subtrees in a single query, memoized per unit of work.
+
+Walking parent -> grandparent -> great-grandparent with one
+`db.query(Task).filter(Task.id == ...).first()` per hop costs a round-trip
+per level, per item. The loader instead:
+- reads ancestors from the task's materialized path (Task.hierarchy_path)
+  and loads them with one primary-key IN lookup
+- loads a subtree with one indexed prefix lookup on the path
+- falls back to a recursive CTE for rows without a path
+- keeps every loaded task in an identity cache keyed by id, so repeated
+  lookups inside one unit of work (request, background job) hit memory
+- skips Task's selectin relationships (children, chat_sessions, commits);
+  they still load lazily on first access
+
+The cache lives as long as the loader: create one per service/session and
+call clear() (or forget()) after deleting or re-parenting tasks.
+
+Usage:
+    loader = HierarchyLoader(db)
+    task, story, epic = loader.chain(task, 3)
+    path = loader.path(task_id)          # root -> task
+    subtree = loader.descendants(epic_id)
+"""
+
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Union
+from uuid import UUID
+
+from sqlalchemy import literal, select
+from sqlalchemy.orm import Session, lazyload
+
+from app.models.task import Task, path_ids
+
+logger = logging.getLogger(__name__)
+
+
+class HierarchyLoader:
+    """
+    Loads task hierarchies with recursive CTEs and an identity cache.
+    """
+
+    # Guard against cycles in corrupted data (real hierarchies are 4 levels deep)
+    MAX_DEPTH = 32
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: Database session
+        """
+        self.db = db
+        self._cache: Dict[UUID, Task] = {}
+
+    def get(self, task_id: Optional[UUID]) -> Optional[Task]:
+        """
+        Load one task by id (cached).
+
+        Args:
+            task_id: Task ID (None returns None)
+
+        Returns:
+            Task or None if not found
+        """
+        if task_id is None:
+            return None
+        task = self._cache.get(task_id)
+        if task is None:
+            task = self._query().filter(Task.id == task_id).first()
+            if task is not None:
+                self._cache[task.id] = task
+        return task
+
+    def ancestors(self, task_id: UUID) -> List[Task]:
+        """
+        All ancestors of a task, ordered from immediate parent to root.
+
+        Args:
+            task_id: Starting task ID
+
+        Returns:
+            Ancestor tasks (empty if the task is a root or does not exist)
+        """
+        return self._load_chain(task_id)[1:]
+
+    def path(self, task_id: UUID) -> List[Task]:
+        """
+        Hierarchy path from root to the task (inclusive).
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Tasks from root to current (empty if the task does not exist)
+        """
+        return list(reversed(self._load_chain(task_id)))
+
+    def chain(self, task: Union[Task, UUID], length: int) -> List[Optional[Task]]:
+        """
+        The task followed by its ancestors, padded with None to `length`.
+
+        Convenient for unpacking: `subtask, task, story, epic = loader.chain(subtask, 4)`
+
+        Args:
+            task: Starting task, or its ID (a Task instance need not be persisted:
+                its ancestors are loaded from parent_id)
+            length: Number of entries to return
+
+        Returns:
+            [task, parent, grandparent, ...] of exactly `length` entries
+        """
+        if isinstance(task, UUID):
+            chain = self._load_chain(task)
+        else:
+            chain = [task] + (self._load_chain(task.parent_id) if task.parent_id else [])
+        chain = chain[:length]
+        return chain + [None] * (length - len(chain))
+
+    def descendants(self, task_id: UUID) -> List[Task]:
+        """
+        All descendants of a task (children, grandchildren, ...).
+
+        Args:
+            task_id: Root task ID
+
+        Returns:
+            Descendants in depth-first pre-order, siblings by `order`
+        """
+        root = self.get(task_id)
+        if root is None:
+            return []
+
+        if root.hierarchy_path:
+            tasks = (
+                self._query()
+                .filter(Task.hierarchy_path.like(f"{root.hierarchy_path}%"), Task.id != root.id)
+                .order_by(Task.order)
+                .all()
+            )
+        else:
+            tasks = self._cte_subtree(task_id)
+        self.prime(tasks)
+
+        children: Dict[UUID, List[Task]] = defaultdict(list)
+        for task in tasks:
+            children[task.parent_id].append(task)
+
+        result: List[Task] = []
+        visited = set()
+        stack = list(reversed(children.get(task_id, [])))
+        while stack:
+            task = stack.pop()
+            if task.id in visited:
+                continue
+            visited.add(task.id)
+            result.append(task)
+            stack.extend(reversed(children.get(task.id, [])))
+        return result
+
+    def count_descendants(self, task_id: UUID) -> int:
+        """
+        Number of descendants of a task (one COUNT on the path index).
+
+        Args:
+            task_id: Root task ID
+
+        Returns:
+            Descendant count (0 if the task does not exist)
+        """
+        root = self.get(task_id)
+        if root is None:
+            return 0
+        if not root.hierarchy_path:
+            return len(self.descendants(task_id))
+        return (
+            self.db.query(Task)
+            .filter(Task.hierarchy_path.like(f"{root.hierarchy_path}%"), Task.id != root.id)
+            .count()
+        )
+
+    def depth(self, task_id: UUID) -> int:
+        """
+        Number of ancestors of a task (0 = root), read from its path.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Depth level (0 if the task does not exist)
+        """
+        task = self.get(task_id)
+        if task is None:
+            return 0
+        if task.hierarchy_path:
+            return len(path_ids(task.hierarchy_path)) - 1
+        return len(self.ancestors(task_id))
+
+    def is_descendant(self, task_id: UUID, ancestor_id: UUID) -> bool:
+        """
+        Whether task_id lies in the subtree below ancestor_id.
+
+        Args:
+            task_id: Candidate descendant
+            ancestor_id: Candidate ancestor
+
+        Returns:
+            True if ancestor_id is a (transitive) parent of task_id
+        """
+        task, ancestor = self.get(task_id), self.get(ancestor_id)
+        if task is None or ancestor is None or task.id == ancestor.id:
+            return False
+        if task.hierarchy_path and ancestor.hierarchy_path:
+            return task.hierarchy_path.startswith(ancestor.hierarchy_path)
+        return any(a.id == ancestor_id for a in self.ancestors(task_id))
+
+    def prime(self, tasks: Iterable[Task]):
+        """Add already loaded tasks to the identity cache."""
+        for task in tasks:
+            if task is not None and task.id is not None:
+                self._cache[task.id] = task
+
+    def forget(self, task_id: UUID):
+        """Drop one task from the cache (e.g. after deleting it)."""
+        self._cache.pop(task_id, None)
+
+    def clear(self):
+        """Drop the whole cache (e.g. after re-parenting tasks)."""
+        self._cache.clear()
+
+    def _query(self):
+        """Task query without the eager (selectin) relationship loads."""
+        return self.db.query(Task).options(lazyload("*"))
+
+    def _load_chain(self, task_id: UUID) -> List[Task]:
+        """[task, parent, ..., root] from the cache, the materialized path or a CTE."""
+        chain = self._cached_chain(task_id)
+        if chain is not None:
+            return chain
+
+        task = self.get(task_id)
+        if task is None:
+            return []
+
+        if task.hierarchy_path:
+            ids = path_ids(task.hierarchy_path)
+            missing = [i for i in ids if i not in self._cache]
+            if missing:
+                self.prime(self._query().filter(Task.id.in_(missing)).all())
+            if ids[-1] == task.id and all(i in self._cache for i in ids):
+                return [self._cache[i] for i in reversed(ids)]
+            logger.warning(f"Stale hierarchy_path on task {task_id}, walking parent_id instead")
+
+        return self._cte_chain(task_id)
+
+    def _cte_chain(self, task_id: UUID) -> List[Task]:
+        """[task, parent, ..., root] with one recursive CTE over parent_id."""
+        ancestry = (
+            select(Task.id, Task.parent_id, literal(0).label("depth"))
+            .where(Task.id == task_id)
+            .cte("ancestry", recursive=True)
+        )
+        ancestry = ancestry.union_all(
+            select(Task.id, Task.parent_id, ancestry.c.depth + 1)
+            .where(Task.id == ancestry.c.parent_id)
+            .where(ancestry.c.depth < self.MAX_DEPTH)
+        )
+
+        rows = (
+            self._query()
+            .join(ancestry, Task.id == ancestry.c.id)
+            .order_by(ancestry.c.depth)
+            .all()
+        )
+        self.prime(rows)
+
+        # A cycle repeats ids: keep the chain up to the first repetition
+        chain, seen = [], set()
+        for task in rows:
+            if task.id in seen:
+                logger.warning(f"Cycle in task hierarchy at {task.id}")
+                break
+            seen.add(task.id)
+            chain.append(task)
+        return chain
+
+    def _cte_subtree(self, task_id: UUID) -> List[Task]:
+        """Root and subtree with one recursive CTE over parent_id."""
+        subtree = (
+            select(Task.id, literal(0).label("depth"))
+            .where(Task.id == task_id)
+            .cte("subtree", recursive=True)
+        )
+        subtree = subtree.union_all(
+            select(Task.id, subtree.c.depth + 1)
+            .where(Task.parent_id == subtree.c.id)
+            .where(subtree.c.depth < self.MAX_DEPTH)
+        )
+
+        return (
+            self._query()
+            .join(subtree, Task.id == subtree.c.id)
+            .order_by(subtree.c.depth, Task.order)
+            .all()
+        )
+
+    def _cached_chain(self, task_id: UUID) -> Optional[List[Task]]:
+        """Chain built from the cache alone, or None if any hop is missing."""
+        chain, seen = [], set()
+        current = self._cache.get(task_id)
+        while current is not None:
+            if current.id in seen:
+                return chain
+            seen.add(current.id)
+            chain.append(current)
+            if current.parent_id is None:
+                return chain
+            current = self._cache.get(current.parent_id)
+        return None
@@ -0,0 +1,285 @@
+"""
+Hierarchy Stream
+Materializes backlog items from a streamed AI completion as soon as they are known.
+
+Generating a whole hierarchy (Epic -> Stories -> Tasks -> Subtasks) is one
+long completion. Instead of waiting for the full JSON:
+- HierarchyStream feeds the chunks to an IncrementalJSONParser and releases
+  each item when its object closes, or earlier, when its first child array
+  opens (its own fields precede its children in the JSON), so parents are
+  always released before their children
+- every item gets its id on release (client-side UUID), so children can
+  reference it before anything is written
+- HierarchyBatchWriter persists the items in small batches (one commit per
+  HIERARCHY_STREAM_BATCH_SIZE items) and emits each batch on the project
+  WebSocket as "hierarchy_items_created"
+
+Usage:
+    stream = HierarchyStream(META_PROMPT_LEVELS)
+    writer = HierarchyBatchWriter(db, project_id, job_id=job_id)
+    async for chunk in orchestrator.execute_stream(...):
+        for item in stream.feed(chunk):
+            await writer.add(build_task(item))
+    stream.finish()
+    tasks = await writer.finish()
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy.orm import Session
+
+from app.api.websocket import broadcast_event
+from app.config import settings
+from app.models.task import Task, ItemType
+from app.services.streaming_json import IncrementalJSONParser, PathKey
+
+logger = logging.getLogger(__name__)
+
+Path = Tuple[PathKey, ...]
+
+
+@dataclass
+class StreamLevel:
+    """
+    One item level of a streamed document.
+
+    Attributes:
+        pattern: Path of the level's objects, "*" matching any array index
+        item_type: Type of the items at this level
+        parent: Path of an item's parent, from the item's path (None = root level)
+    """
+    pattern: Tuple[str, ...]
+    item_type: ItemType
+    parent: Optional[Callable[[Path], Path]] = None
+
+    def matches(self, path: Path, prefix: bool = False) -> bool:
+        """Whether path is an item of this level (or, with prefix, lies above one)."""
+        if len(path) > len(self.pattern) or (not prefix and len(path) < len(self.pattern)):
+            return False
+        return all(p == "*" and isinstance(k, int) or p == k for p, k in zip(self.pattern, path))
+
+
+# Meta prompt hierarchy: {"epic": {...}, "stories": [{..., "tasks": [{..., "subtasks": [...]}]}]}
+META_PROMPT_LEVELS = [
+    StreamLevel(("epic",), ItemType.EPIC),
+    StreamLevel(("stories", "*"), ItemType.STORY, lambda path: ("epic",)),
+    StreamLevel(("stories", "*", "tasks", "*"), ItemType.TASK, lambda path: path[:2]),
+    StreamLevel(("stories", "*", "tasks", "*", "subtasks", "*"), ItemType.SUBTASK, lambda path: path[:4]),
+]
+
+
+@dataclass
+class StreamedItem:
+    """
+    An item released by HierarchyStream.
+
+    Attributes:
+        id: Id assigned to the item
+        parent_id: Id of its parent item (or the stream's root_parent_id)
+        item_type: Item level
+        path: Position in the document
+        order: Index among its siblings
+        data: The item's own fields (children arrays excluded)
+        update: True if the item was released before and fields arrived
+            after its children (apply to the existing item)
+    """
+    id: UUID
+    parent_id: Optional[UUID]
+    item_type: ItemType
+    path: Path
+    order: int
+    data: Dict[str, Any]
+    update: bool = False
+
+
+class HierarchyStream:
+    """
+    Releases hierarchy items from streamed JSON, parents before children.
+    """
+
+    def __init__(self, levels: List[StreamLevel], root_parent_id: Optional[UUID] = None):
+        """
+        Args:
+            levels: Item levels of the document
+            root_parent_id: parent_id of items whose level has no parent
+        """
+        self.levels = levels
+        self.root_parent_id = root_parent_id
+        self.parser = IncrementalJSONParser()
+        self._released: Dict[Path, StreamedItem] = {}
+        self._child_keys: Dict[Path, set] = {}
+        self._waiting: Dict[Path, List[Tuple[Path, StreamLevel, Dict]]] = {}
+
+    def feed(self, chunk: str) -> List[StreamedItem]:
+        """
+        Consume the next completion chunk.
+
+        Args:
+            chunk: Streamed text
+
+        Returns:
+            Items that became known with this chunk
+        """
+        items: List[StreamedItem] = []
+        for event in self.parser.feed(chunk):
+            if event.kind == "start":
+                if not any(level.matches(event.path, prefix=True) for level in self.levels):
+                    continue
+                # An opening child item container: the enclosing items' own fields precede it
+                for depth in range(1, len(event.path)):
+                    prefix = event.path[:depth]
+                    level = self._level(prefix)
+                    if level is None:
+                        continue
+                    self._child_keys.setdefault(prefix, set()).add(event.path[depth])
+                    if prefix not in self._released:
+                        self._release(prefix, level, self._fields(prefix, self._container(prefix)), items)
+            elif isinstance(event.value, dict):
+                level = self._level(event.path)
+                if level is None:
+                    continue
+                fields = self._fields(event.path, event.value)
+                released = self._released.get(event.path)
+                if released is None:
+                    self._release(event.path, level, fields, items)
+                elif fields != released.data:
+                    released.data = fields
+                    items.append(StreamedItem(
+                        released.id, released.parent_id, released.item_type, released.path,
+                        released.order, fields, update=True
+                    ))
+        return items
+
+    def finish(self) -> Any:
+        """
+        The complete document.
+
+        Raises:
+            ValueError: If the stream ended before the JSON was complete
+        """
+        if self._waiting:
+            logger.warning(f"⚠️  {sum(len(w) for w in self._waiting.values())} streamed items had no parent")
+        return self.parser.finish()
+
+    @property
+    def items(self) -> List[StreamedItem]:
+        """All released items, in release order."""
+        return list(self._released.values())
+
+    def _level(self, path: Path) -> Optional[StreamLevel]:
+        return next((level for level in self.levels if level.matches(path)), None)
+
+    def _fields(self, path: Path, data: Dict[str, Any]) -> Dict[str, Any]:
+        """The item's own fields (child item arrays excluded)."""
+        children = self._child_keys.get(path, ())
+        return {key: value for key, value in data.items() if key not in children}
+
+    def _container(self, path: Path) -> Any:
+        value = self.parser.value
+        for key in path:
+            value = value[key]
+        return value
+
+    def _release(self, path: Path, level: StreamLevel, fields: Dict, items: List[StreamedItem]):
+        """Release an item, or park it until its parent is released."""
+        parent_path = level.parent(path) if level.parent else None
+        if parent_path is not None and parent_path not in self._released:
+            self._waiting.setdefault(parent_path, []).append((path, level, fields))
+            return
+
+        parent_id = self._released[parent_path].id if parent_path is not None else self.root_parent_id
+        item = StreamedItem(
+            id=uuid4(),
+            parent_id=parent_id,
+            item_type=level.item_type,
+            path=path,
+            order=path[-1] if isinstance(path[-1], int) else 0,
+            data=fields
+        )
+        self._released[path] = item
+        items.append(item)
+
+        for child_path, child_level, child_fields in self._waiting.pop(path, []):
+            self._release(child_path, child_level, child_fields, items)
+
+
+class HierarchyBatchWriter:
+    """
+    Persists streamed tasks in small batches and emits them on the project WebSocket.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        project_id: UUID,
+        batch_size: Optional[int] = None,
+        job_id: Optional[UUID] = None
+    ):
+        """
+        Args:
+            db: Database session
+            project_id: Project receiving the items (WebSocket channel)
+            batch_size: Items per commit (default HIERARCHY_STREAM_BATCH_SIZE)
+            job_id: AsyncJob the items belong to (included in events)
+        """
+        self.db = db
+        self.project_id = project_id
+        self.batch_size = max(1, batch_size or settings.hierarchy_stream_batch_size)
+        self.job_id = job_id
+        self.tasks: List[Task] = []
+        self._pending: List[Task] = []
+
+    async def add(self, task: Task):
+        """Queue a task; the batch is written once full."""
+        self.tasks.append(task)
+        self._pending.append(task)
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self):
+        """Write and emit the pending batch."""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+
+        # Read before the commit expires the instances
+        summaries = [
+            {
+                "id": str(task.id),
+                "parent_id": str(task.parent_id) if task.parent_id else None,
+                "item_type": task.item_type.value,
+                "title": task.title,
+                "order": task.order
+            }
+            for task in batch
+        ]
+
+        self.db.add_all(batch)
+        self.db.commit()
+        logger.info(f"💾 Streamed batch of {len(batch)} items ({len(self.tasks)} total)")
+
+        try:
+            await broadcast_event(
+                project_id=str(self.project_id),
+                event_type="hierarchy_items_created",
+                data={
+                    "job_id": str(self.job_id) if self.job_id else None,
+                    "items": summaries,
+                    "total_created": len(self.tasks)
+                }
+            )
+        except Exception as e:
+            logger.debug(f"Could not broadcast streamed items: {e}")
+
+    async def finish(self) -> List[Task]:
+        """
+        Write the last batch.
+
+        Returns:
+            All tasks written by this writer, in creation order
+        """
+        await self.flush()
+        return self.tasks
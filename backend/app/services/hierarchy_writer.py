@@ -0,0 +1,227 @@
+"""
+Hierarchy Writer
+Inserts a generated hierarchy with one statement in one transaction.
+
+Creating a generated backlog item by item (add, commit, refresh) costs a
+transaction and two round-trips per item - hundreds for a 100-item tree.
+The writer instead:
+- assigns ids client-side, so children can reference parents that are
+  not written yet
+- resolves parent links and materialized paths (Task.hierarchy_path) in
+  memory; only parents that already exist are read, with one query
+- computes missing orders once: one grouped MAX(order) query for all
+  parents, then appends in memory
+- writes every row with a single executemany INSERT and commits once
+  (rolls back everything on failure)
+
+Bulk inserts bypass the ORM flush, so the before_flush path listener does
+not run; the writer sets hierarchy_path itself.
+
+Usage:
+    writer = HierarchyWriter(db)
+    epic_id = writer.add(Task(title="Checkout", item_type=ItemType.EPIC, project_id=project_id))
+    writer.add({"title": "Pay by card", "item_type": ItemType.STORY,
+                "project_id": project_id, "parent_id": epic_id})
+    epic, story = writer.write()
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Union
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, func, insert, inspect, or_
+from sqlalchemy.orm import Session, lazyload
+
+from app.models.task import Task, path_segment
+
+logger = logging.getLogger(__name__)
+
+
+# Task attributes and their Python-side defaults: executemany needs the same
+# keys in every row, so omitted attributes get their column default here
+_COLUMNS = [attr.key for attr in inspect(Task).column_attrs]
+
+
+def _column_default(column):
+    default = column.default
+    if default is None:
+        return lambda: None
+    if default.is_callable:
+        return lambda: default.arg(None)
+    if default.is_scalar:
+        return lambda: default.arg
+    return lambda: None
+
+
+_DEFAULTS = {
+    attr.key: _column_default(attr.columns[0])
+    for attr in inspect(Task).column_attrs
+}
+
+
+class HierarchyWriter:
+    """
+    Collects new tasks and inserts them in bulk.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: Database session
+        """
+        self.db = db
+        self._rows: List[Dict[str, Any]] = []
+        self._by_id: Dict[UUID, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, item: Union[Task, Dict[str, Any]]) -> UUID:
+        """
+        Queue one new task.
+
+        Args:
+            item: Unsaved Task (never added to the session) or dict of Task
+                attributes. parent_id may reference a queued item or an
+                existing task; without an order, the item is appended after
+                its siblings.
+
+        Returns:
+            Id of the task (assigned if missing)
+        """
+        if isinstance(item, Task):
+            row = {key: item.__dict__[key] for key in _COLUMNS if key in item.__dict__}
+        else:
+            row = dict(item)
+
+        if row.get("id") is None:
+            row["id"] = uuid4()
+        if row["id"] in self._by_id:
+            raise ValueError(f"Task {row['id']} queued twice")
+
+        self._rows.append(row)
+        self._by_id[row["id"]] = row
+        return row["id"]
+
+    def write(self, commit: bool = True) -> List[Task]:
+        """
+        Insert every queued task.
+
+        Args:
+            commit: Commit the transaction (False leaves it to the caller)
+
+        Returns:
+            The created tasks, in the order they were added
+
+        Raises:
+            ValueError: If the queued parent links form a cycle
+        """
+        rows, self._rows, self._by_id = self._rows, [], {}
+        if not rows:
+            if commit:
+                self.db.commit()
+            return []
+        by_id = {row["id"]: row for row in rows}
+
+        try:
+            self._assign_orders(rows, by_id)
+            self._assign_paths(rows, by_id)
+            for row in rows:
+                for key, default in _DEFAULTS.items():
+                    if key not in row:
+                        row[key] = default()
+
+            # render_nulls: rows with different None columns stay in one batch
+            self.db.execute(insert(Task).execution_options(render_nulls=True), rows)
+            if commit:
+                self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        logger.info(f"💾 Bulk inserted {len(rows)} tasks")
+
+        tasks = {
+            task.id: task
+            for task in self.db.query(Task)
+            .options(lazyload("*"))
+            .filter(Task.id.in_(list(by_id)))
+        }
+        return [tasks[row["id"]] for row in rows]
+
+    def _assign_orders(self, rows: List[Dict], by_id: Dict[UUID, Dict]):
+        """Append rows without an order after their siblings (one MAX query)."""
+        unordered = [row for row in rows if row.get("order") is None]
+        if not unordered:
+            return
+
+        def siblings(row):
+            return (row.get("project_id"), row.get("parent_id"))
+
+        # Highest order among existing siblings, for parents outside this batch
+        last: Dict[tuple, int] = {}
+        external = {siblings(row) for row in unordered if row.get("parent_id") not in by_id}
+        if external:
+            parents = {parent_id for _, parent_id in external if parent_id is not None}
+            root_projects = {project_id for project_id, parent_id in external if parent_id is None}
+            conditions = []
+            if parents:
+                conditions.append(Task.parent_id.in_(parents))
+            if root_projects:
+                conditions.append(and_(Task.parent_id.is_(None), Task.project_id.in_(root_projects)))
+            last = {
+                (project_id, parent_id): highest
+                for project_id, parent_id, highest in self.db.query(
+                    Task.project_id, Task.parent_id, func.max(Task.order)
+                )
+                .filter(or_(*conditions))
+                .group_by(Task.project_id, Task.parent_id)
+            }
+
+        # Siblings in this batch that already have an order
+        for row in rows:
+            if row.get("order") is not None:
+                key = siblings(row)
+                last[key] = max(last.get(key, -1), row["order"])
+
+        for row in unordered:
+            key = siblings(row)
+            row["order"] = last.get(key, -1) + 1
+            last[key] = row["order"]
+
+    def _assign_paths(self, rows: List[Dict], by_id: Dict[UUID, Dict]):
+        """Materialized paths from queued parents and one lookup of existing ones."""
+        external = {
+            row["parent_id"] for row in rows
+            if row.get("parent_id") is not None and row["parent_id"] not in by_id
+        }
+        existing = dict(
+            self.db.query(Task.id, Task.hierarchy_path).filter(Task.id.in_(external)).all()
+        ) if external else {}
+
+        def resolve(row, visiting) -> Optional[str]:
+            if "hierarchy_path" in row:
+                return row["hierarchy_path"]
+            if row["id"] in visiting:
+                raise ValueError(f"Task hierarchy cycle at {row['id']}")
+            visiting.add(row["id"])
+
+            parent_id = row.get("parent_id")
+            if parent_id is None:
+                path = path_segment(row["id"])
+            elif parent_id in by_id:
+                parent_path = resolve(by_id[parent_id], visiting)
+                path = parent_path + path_segment(row["id"]) if parent_path else None
+            elif parent_id in existing:
+                # Parents without a path (legacy rows) leave it to the loader's CTE fallback
+                parent_path = existing[parent_id]
+                path = parent_path + path_segment(row["id"]) if parent_path else None
+            else:
+                path = path_segment(row["id"])
+
+            row["hierarchy_path"] = path
+            return path
+
+        for row in rows:
+            resolve(row, set())
+
@@ -0,0 +1,132 @@
+"""
+Interview Message Store
+Cursor-paginated and tail reads of interview conversations.
+
+Messages are rows of interview_messages keyed by (interview_id, seq)
+(see app/models/interview_message.py), so a reader never needs the whole
+conversation:
+- page() walks the conversation forwards (after=<seq>) or backwards
+  (before=<seq>) with an index range scan; the cursor is the last seq seen
+- recent() returns only the tail (e.g. the last 5 messages for a prompt),
+  between() a seq range (e.g. the messages not yet summarized)
+
+Writes go through Interview.add_message(), which inserts one row per
+message without reading the conversation.
+
+Usage:
+    store = InterviewMessageStore(db)
+    messages, cursor = store.page(interview_id, limit=50)
+    while cursor is not None:
+        more, cursor = store.page(interview_id, after=cursor, limit=50)
+    last_five = store.recent(interview_id, 5)
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.interview_message import InterviewMessage
+
+logger = logging.getLogger(__name__)
+
+# Larger than any seq: "before the end"
+_END = 2 ** 31 - 1
+
+
+class InterviewMessageStore:
+    """
+    Reads interview messages without loading whole conversations.
+    """
+
+    MAX_PAGE_SIZE = 200
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: Database session
+        """
+        self.db = db
+
+    def page(
+        self,
+        interview_id: UUID,
+        after: Optional[int] = None,
+        before: Optional[int] = None,
+        limit: int = 50
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        One page of messages, oldest first.
+
+        Args:
+            interview_id: Interview ID
+            after: Return messages after this seq (forward paging; default: from the start)
+            before: Return the messages right before this seq (backward paging,
+                e.g. scrolling up from the newest); takes precedence over after
+            limit: Page size (1..MAX_PAGE_SIZE)
+
+        Returns:
+            (messages with their "seq", cursor for the next page in the same
+            direction or None when there is none)
+        """
+        limit = max(1, min(limit, self.MAX_PAGE_SIZE))
+        query = self.db.query(InterviewMessage).filter(InterviewMessage.interview_id == interview_id)
+
+        if before is not None:
+            rows = (
+                query.filter(InterviewMessage.seq < before)
+                .order_by(InterviewMessage.seq.desc())
+                .limit(limit + 1)
+                .all()
+            )
+            has_more = len(rows) > limit
+            rows = list(reversed(rows[:limit]))
+            cursor = rows[0].seq if has_more else None
+        else:
+            if after is not None:
+                query = query.filter(InterviewMessage.seq > after)
+            rows = query.order_by(InterviewMessage.seq).limit(limit + 1).all()
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            cursor = rows[-1].seq if has_more else None
+
+        return [self._to_dict(row) for row in rows], cursor
+
+    def recent(self, interview_id: UUID, limit: int = 5) -> List[Dict[str, Any]]:
+        """
+        The last messages of a conversation, oldest first.
+
+        Args:
+            interview_id: Interview ID
+            limit: Number of messages
+
+        Returns:
+            Up to limit messages with their "seq"
+        """
+        messages, _ = self.page(interview_id, before=_END, limit=limit)
+        return messages
+
+    def between(self, interview_id: UUID, start: int, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Messages with start <= seq < end, oldest first.
+
+        Args:
+            interview_id: Interview ID
+            start: First seq
+            end: Seq after the last message (default: up to the newest)
+
+        Returns:
+            Messages with their "seq"
+        """
+        query = self.db.query(InterviewMessage).filter(
+            InterviewMessage.interview_id == interview_id,
+            InterviewMessage.seq >= start
+        )
+        if end is not None:
+            query = query.filter(InterviewMessage.seq < end)
+        return [self._to_dict(row) for row in query.order_by(InterviewMessage.seq)]
+
+    def _to_dict(self, row: InterviewMessage) -> Dict[str, Any]:
+        return {"seq": row.seq, **row.to_dict()}
+
@@ -4,20 +4,28 @@ PROMPT #97 - RAG Anti-Duplicação Cross-Interview
 
 Previne perguntas duplicadas/similares entre TODAS as entrevistas do mesmo projeto.
 Reutiliza a arquitetura de anti-duplicação de tasks (similarity_detector + RAG).
+
+Verificação em memória: os embeddings das perguntas do projeto ficam numa
+matriz NumPy (QuestionEmbeddingIndex, compartilhada via Redis); o Postgres
+(rag_documents) só é usado para persistência e para a carga inicial.
 """
 
 import re
 import logging
 from typing import Tuple, Optional, Dict, Any
-from uuid import UUID
+from uuid import UUID, uuid4
 from datetime import datetime
 from sqlalchemy.orm import Session
 
 from app.services.similarity_detector import calculate_semantic_similarity
 from app.services.rag_service import RAGService
+from app.services.question_embedding_index import QuestionEmbeddingIndex
 
 logger = logging.getLogger(__name__)
 
+# Pré-filtro: abaixo disso nem é candidato a duplicata
+CANDIDATE_THRESHOLD = 0.70
+
 
 class InterviewQuestionDeduplicator:
     """
@@ -45,6 +53,7 @@ class InterviewQuestionDeduplicator:
         """
         self.db = db
         self.rag_service = RAGService(db)
+        self.index = QuestionEmbeddingIndex(db)
         self.threshold = similarity_threshold
 
         logger.info(f"✅ InterviewQuestionDeduplicator initialized (threshold={self.threshold:.0%})")
@@ -74,20 +83,32 @@ class InterviewQuestionDeduplicator:
         """
         # Limpar pergunta (remover emojis, formatação, opções)
         cleaned_question = self._clean_question(question_text)
+        embedding = self._embed(cleaned_question)  # reutiliza o embedding do check_duplicate
+        document_id = uuid4()
+        metadata = {
+            "type": "interview_question",
+            "project_id": str(project_id),  # ← CRITICAL for cross-interview dedup!
+            "interview_id": str(interview_id),
+            "interview_mode": interview_mode,
+            "question_number": question_number,
+            "is_fixed": is_fixed,
+            "timestamp": datetime.utcnow().isoformat()
+        }
 
         # Armazenar no RAG com PROJECT_ID (scoped por projeto, igual às tasks!)
-        self.rag_service.store(
-            content=cleaned_question,
-            metadata={
-                "type": "interview_question",
-                "project_id": str(project_id),  # ← CRITICAL for cross-interview dedup!
-                "interview_id": str(interview_id),
-                "interview_mode": interview_mode,
-                "question_number": question_number,
-                "is_fixed": is_fixed,
-                "timestamp": datetime.utcnow().isoformat()
-            },
-            project_id=project_id  # ← SCOPED por projeto!
+        self.rag_service.store_many(
+            [{
+                "id": document_id,
+                "content": cleaned_question,
+                "metadata": metadata,
+                "project_id": project_id  # ← SCOPED por projeto!
+            }],
+            embeddings=[embedding.tolist()]
+        )
+        self.index.add(
+            project_id,
+            embedding,
+            {"id": document_id, "content": cleaned_question, "metadata": metadata}
         )
 
         logger.info(
@@ -125,25 +146,15 @@ class InterviewQuestionDeduplicator:
         # Limpar pergunta candidata
         cleaned = self._clean_question(candidate_question)
 
-        # Buscar perguntas similares em TODAS as entrevistas do projeto
-        # Usa RAGService (igual ao sistema de tasks)
-        similar_questions = self.rag_service.retrieve(
-            query=cleaned,
-            filter={
-                "type": "interview_question",
-                "project_id": str(project_id)  # ← CROSS-INTERVIEW!
-            },
-            top_k=5,
-            similarity_threshold=0.70  # Pré-filtro baixo para capturar candidatos
-        )
+        # Comparar com TODAS as perguntas do projeto (CROSS-INTERVIEW!)
+        # Um produto matriz-vetor em memória, sem consulta ao pgvector
+        best_match, similarity = self.index.best_match(project_id, self._embed(cleaned))
 
-        if not similar_questions:
+        if best_match is None or similarity < CANDIDATE_THRESHOLD:
             logger.debug(f"✅ No similar questions found for project {project_id}")
             return (False, None, 0.0)
 
-        # Verificar se alguma está acima do threshold crítico
-        best_match = similar_questions[0]
-        similarity = best_match["similarity"]
+        # Verificar se está acima do threshold crítico
 
         is_duplicate = similarity >= self.threshold  # >= 0.85
 
@@ -160,6 +171,13 @@ class InterviewQuestionDeduplicator:
 
         return (is_duplicate, best_match if is_duplicate else None, similarity)
 
+    def _embed(self, cleaned_question: str):
+        """Embedding normalizado da pergunta limpa (cacheado entre check e store)."""
+        return self.index.embedding(
+            cleaned_question,
+            lambda content: self.rag_service.embed_many([content])[0]
+        )
+
     def _clean_question(self, question_text: str) -> str:
         """
         Remove formatação para análise semântica pura.
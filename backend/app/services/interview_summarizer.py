@@ -0,0 +1,277 @@
+"""
+Interview Summarizer
+Rolling conversation summary that bounds the per-turn prompt of interviews.
+
+Each interview turn used to send the whole conversation to the AI, so late
+turns were slower and more expensive than early ones. Instead:
+- the last INTERVIEW_RECENT_TURNS turns (question + answer) are sent verbatim
+- once INTERVIEW_SUMMARY_EVERY_TURNS more turns have piled up behind them,
+  a background call ("general" model) folds those older messages into
+  Interview.conversation_summary and Interview.summary_facts; messages
+  before Interview.summarized_until are covered by the summary
+- each turn's prompt is summary + facts (appended to the system prompt)
+  plus the messages not yet summarized, trimmed to
+  INTERVIEW_RECENT_MAX_TOKENS
+
+The verbatim tail stays between N and N + K turns, so the input size (and
+latency) per turn is roughly constant. If a summary fails or lags, the
+token target still bounds the verbatim messages.
+
+Usage:
+    summarizer = InterviewSummarizer(db)
+    messages, memory = summarizer.build_context(interview)
+    system_prompt += memory
+    ...
+    summarizer.schedule(interview)  # after the turn is committed
+"""
+
+import asyncio
+import json
+import logging
+import re
+from typing import Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.interview import Interview
+from app.prompts.loader import PromptLoader
+from app.services.ai_orchestrator import AIOrchestrator
+from app.services.interview_messages import InterviewMessageStore
+
+logger = logging.getLogger(__name__)
+
+
+# Rough token estimate for budgeting (no tokenizer dependency)
+CHARS_PER_TOKEN = 4
+
+# Key facts kept in the summary
+MAX_FACTS = 30
+
+# Interviews with a summary being generated (one background run per interview)
+_running: Set[UUID] = set()
+# Background summary tasks: the event loop only keeps weak references to tasks
+_tasks: Set[asyncio.Task] = set()
+
+
+def estimate_tokens(text: Optional[str]) -> int:
+    """Approximate token count of a text."""
+    return len(text or "") // CHARS_PER_TOKEN + 1
+
+
+def _strip_markdown_json(content: str) -> str:
+    """Remove ```json ... ``` markers around an AI JSON response."""
+    content = re.sub(r'^```json\s*\n?', '', content, flags=re.MULTILINE)
+    content = re.sub(r'\n?```\s*$', '', content, flags=re.MULTILINE)
+    return content.strip()
+
+
+class InterviewSummarizer:
+    """
+    Builds bounded interview prompts and maintains the rolling summary.
+    """
+
+    def __init__(self, db: Session, orchestrator: Optional[AIOrchestrator] = None):
+        """
+        Args:
+            db: Database session
+            orchestrator: AI orchestrator for summaries (created on first use)
+        """
+        self.db = db
+        self.store = InterviewMessageStore(db)
+        self._orchestrator = orchestrator
+
+    @property
+    def orchestrator(self) -> AIOrchestrator:
+        if self._orchestrator is None:
+            self._orchestrator = AIOrchestrator(self.db)
+        return self._orchestrator
+
+    def build_context(self, interview: Interview) -> Tuple[List[Dict[str, str]], str]:
+        """
+        Messages and memory block for the next interview turn.
+
+        Args:
+            interview: Interview with its latest messages committed
+
+        Returns:
+            (verbatim messages as {"role", "content"}, memory block for the
+            system prompt - "" when there is no summary yet)
+        """
+        if not settings.interview_summarization:
+            messages = self.store.between(interview.id, 0)
+            return [{"role": m["role"], "content": m["content"]} for m in messages], ""
+
+        messages = self.store.between(interview.id, interview.summarized_until or 0)
+
+        # Newest first until the token target; the latest message is always kept
+        kept, used = [], 0
+        for message in reversed(messages):
+            cost = estimate_tokens(message["content"])
+            if kept and used + cost > settings.interview_recent_max_tokens:
+                break
+            kept.append(message)
+            used += cost
+        kept.reverse()
+
+        if len(kept) < len(messages):
+            logger.info(
+                f"✂️  Interview {interview.id}: {len(messages) - len(kept)} unsummarized "
+                f"messages over the {settings.interview_recent_max_tokens} token target left out"
+            )
+
+        return [{"role": m["role"], "content": m["content"]} for m in kept], self.render_memory(interview)
+
+    def render_memory(self, interview: Interview) -> str:
+        """Summary and key facts as a system prompt block ("" if there are none)."""
+        if not interview.conversation_summary and not interview.summary_facts:
+            return ""
+        memory, _ = PromptLoader().render(
+            "interviews/conversation_memory",
+            {
+                "summary": interview.conversation_summary,
+                "facts": interview.summary_facts or []
+            }
+        )
+        return "\n\n" + memory.strip()
+
+    def pending_until(self, interview: Interview) -> Optional[int]:
+        """
+        End (exclusive seq) of the messages due for summarization.
+
+        Args:
+            interview: Interview
+
+        Returns:
+            Seq up to which to summarize, or None if no summary is due
+        """
+        every = settings.interview_summary_every_turns
+        if not settings.interview_summarization or every <= 0:
+            return None
+
+        end = (interview.message_count or 0) - settings.interview_recent_turns * 2
+        if end - (interview.summarized_until or 0) < every * 2:
+            return None
+        return end
+
+    async def summarize(self, interview: Interview) -> bool:
+        """
+        Fold the messages due for summarization into the interview's summary.
+
+        The update only applies if no other run moved summarized_until in
+        the meantime.
+
+        Args:
+            interview: Interview
+
+        Returns:
+            True if the summary was updated
+        """
+        end = self.pending_until(interview)
+        if end is None:
+            return False
+        start = interview.summarized_until or 0
+
+        messages = self.store.between(interview.id, start, end)
+        transcript = "\n\n".join(f"[{m['role']}] {m['content']}" for m in messages)
+        max_tokens = settings.interview_summary_max_tokens
+
+        system_prompt, user_prompt = PromptLoader().render(
+            "interviews/conversation_summary",
+            {
+                "transcript": transcript,
+                "previous_summary": interview.conversation_summary,
+                "previous_facts": "\n".join(f"- {fact}" for fact in interview.summary_facts or []),
+                "max_words": max_tokens // 2,  # ~half of the target, the rest for the facts
+                "max_facts": MAX_FACTS
+            }
+        )
+
+        response = await self.orchestrator.execute(
+            usage_type="general",
+            messages=[{"role": "user", "content": user_prompt}],
+            system_prompt=system_prompt,
+            max_tokens=max_tokens * 2,  # headroom so the JSON is never cut off
+            project_id=interview.project_id,
+            interview_id=interview.id,
+            metadata={"purpose": "interview_summary", "summarized_until": end}
+        )
+
+        data = json.loads(_strip_markdown_json(response["content"]))
+        summary = str(data.get("summary") or "").strip()
+        facts = [str(fact).strip() for fact in data.get("facts") or [] if str(fact).strip()]
+        if not summary:
+            raise ValueError("AI returned an empty summary")
+
+        updated = (
+            self.db.query(Interview)
+            .filter(Interview.id == interview.id, Interview.summarized_until == start)
+            .update(
+                {
+                    "conversation_summary": summary[:max_tokens * CHARS_PER_TOKEN],
+                    "summary_facts": facts[:MAX_FACTS],
+                    "summarized_until": end
+                },
+                synchronize_session=False
+            )
+        )
+        self.db.commit()
+
+        if updated:
+            logger.info(
+                f"🧾 Interview {interview.id}: summarized messages {start}-{end - 1} "
+                f"({len(facts[:MAX_FACTS])} key facts)"
+            )
+        return bool(updated)
+
+    def schedule(self, interview: Interview) -> bool:
+        """
+        Start a background summary of the interview if one is due.
+
+        Must be called from a running event loop, after the turn is committed.
+
+        Args:
+            interview: Interview
+
+        Returns:
+            True if a summary run was started
+        """
+        if self.pending_until(interview) is None or interview.id in _running:
+            return False
+
+        interview_id = interview.id
+        _running.add(interview_id)
+        task = asyncio.create_task(run_interview_summary(interview_id))
+        _tasks.add(task)
+        task.add_done_callback(lambda done: _summary_done(done, interview_id))
+        return True
+
+
+def _summary_done(task: asyncio.Task, interview_id: UUID) -> None:
+    _tasks.discard(task)
+    _running.discard(interview_id)
+
+
+async def run_interview_summary(interview_id: UUID):
+    """
+    Background summary of one interview (own DB session).
+
+    Failures are logged only: the next turn falls back to the token target
+    and the summary is retried after the following turn.
+
+    Args:
+        interview_id: Interview ID
+    """
+    from app.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        interview = db.query(Interview).filter(Interview.id == interview_id).first()
+        if interview:
+            await InterviewSummarizer(db).summarize(interview)
+    except Exception as e:
+        logger.warning(f"⚠️  Interview {interview_id} summary failed: {e}")
+        db.rollback()
+    finally:
+        db.close()
@@ -0,0 +1,228 @@
+"""
+Job Context
+In-memory progress buffer and cancellation token of a running job.
+
+JobManager.update_progress() and is_cancelled() used to SELECT the job by
+id on every call, and update_progress() committed each time. Long loops
+(batch execution, code indexing, hierarchy and draft generation) call them
+per item. While a job runs inside a JobContext:
+- progress is pushed to clients (job events) immediately, but written to
+  async_jobs at most every JOB_PROGRESS_FLUSH_MS, or at once when it moved
+  by JOB_PROGRESS_MIN_DELTA points; a buffered update is written when the
+  interval ends even if no other update follows
+- is_cancelled() reads an in-memory token; PATCH /jobs/{id}/cancel sets it
+  through the "cancelled" job event (relayed between processes via Redis)
+- a checkpoint write only applies to a running job, so a write that
+  matches no row also sets the token (cancellation without Redis)
+
+The job is read once when the context opens; afterwards the database is only
+written at checkpoints.
+
+JobWorker runs every handler in a JobContext; other long-running jobs can
+open one themselves. JobManager delegates to the active context of a job:
+
+    with JobContext(job.id):
+        job_manager.update_progress(job.id, 40.0, "...")  # buffered
+        if job_manager.is_cancelled(job.id):               # no query
+            ...
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.async_job import AsyncJob, JobStatus
+from app.services.job_events import JobEventType, job_event, job_events
+
+logger = logging.getLogger(__name__)
+
+
+# Open contexts by job ID (str)
+_active: Dict[str, "JobContext"] = {}
+
+
+def get_job_context(job_id: UUID) -> Optional["JobContext"]:
+    """Open JobContext of a job in this process, if any."""
+    return _active.get(str(job_id))
+
+
+class JobContext:
+    """
+    Buffered progress and cancellation token of one running job (context manager).
+    """
+
+    def __init__(
+        self,
+        job_id: UUID,
+        session_factory: Callable = SessionLocal,
+        flush_interval_ms: Optional[int] = None,
+        min_delta: Optional[float] = None
+    ):
+        """
+        Args:
+            job_id: Running job
+            session_factory: Creates database sessions (one per checkpoint)
+            flush_interval_ms: Min time between progress writes (default: JOB_PROGRESS_FLUSH_MS)
+            min_delta: Progress points written at once (default: JOB_PROGRESS_MIN_DELTA)
+        """
+        self.job_id = job_id
+        self.session_factory = session_factory
+        self.flush_interval = (settings.job_progress_flush_ms if flush_interval_ms is None else flush_interval_ms) / 1000
+        self.min_delta = settings.job_progress_min_delta if min_delta is None else min_delta
+        self.writes = 0  # Checkpoints written
+
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._job: Optional[AsyncJob] = None  # Detached snapshot for events
+        self._pending: Optional[Dict[str, Any]] = None
+        self._flushed_percent: Optional[float] = None
+        self._flushed_at = 0.0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """Signal cancellation to the job's loops."""
+        if not self._cancelled.is_set():
+            logger.info(f"🛑 Cancellation received for job {self.job_id}")
+        self._cancelled.set()
+
+    def open(self) -> "JobContext":
+        """Read the job once and start handling its progress and cancellation."""
+        db = self.session_factory()
+        try:
+            job = db.query(AsyncJob).filter(AsyncJob.id == self.job_id).first()
+            if job is not None:
+                db.expunge(job)
+                self._flushed_percent = job.progress_percent
+                if job.status == JobStatus.CANCELLED:
+                    self._cancelled.set()
+            self._job = job
+        finally:
+            db.close()
+        _active[str(self.job_id)] = self
+        return self
+
+    def report(self, progress_percent: float, progress_message: Optional[str] = None) -> None:
+        """
+        Record progress: pushed to clients now, written at the next checkpoint.
+
+        Args:
+            progress_percent: Progress percentage (0-100)
+            progress_message: Human-readable message (None keeps the last one)
+        """
+        with self._lock:
+            pending = dict(self._pending or {}, progress_percent=progress_percent)
+            if progress_message:
+                pending["progress_message"] = progress_message
+            self._pending = pending
+
+            due = (
+                self._flushed_percent is None
+                or abs(progress_percent - self._flushed_percent) >= self.min_delta
+                or time.monotonic() - self._flushed_at >= self.flush_interval
+            )
+
+        self._push(progress_percent, progress_message)
+        if due:
+            self.flush()
+        else:
+            self._schedule_flush()
+
+    def flush(self) -> bool:
+        """
+        Write buffered progress (one conditional UPDATE).
+
+        Returns:
+            False if the job is no longer running (the token is set)
+        """
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not pending:
+            return not self.cancelled
+
+        db = self.session_factory()
+        try:
+            updated = db.query(AsyncJob).filter(
+                AsyncJob.id == self.job_id,
+                AsyncJob.status == JobStatus.RUNNING
+            ).update(pending, synchronize_session=False)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"⚠️  Progress checkpoint of job {self.job_id} failed: {e}")
+            return True
+        finally:
+            db.close()
+
+        with self._lock:
+            self.writes += 1
+            self._flushed_percent = pending["progress_percent"]
+            self._flushed_at = time.monotonic()
+        if not updated:
+            self.cancel()  # Cancelled (or finished) elsewhere
+            return False
+        return True
+
+    def discard(self) -> None:
+        """Drop buffered progress (the job is being completed or failed)."""
+        with self._lock:
+            self._pending = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def close(self) -> None:
+        """Write what is buffered and stop handling the job."""
+        self.flush()
+        if _active.get(str(self.job_id)) is self:
+            del _active[str(self.job_id)]
+
+    def __enter__(self) -> "JobContext":
+        return self.open()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _push(self, progress_percent: float, progress_message: Optional[str]) -> None:
+        if self._job is None:
+            return
+        self._job.progress_percent = progress_percent
+        if progress_message:
+            self._job.progress_message = progress_message
+        try:
+            job_events.publish(job_event(self._job, JobEventType.PROGRESS))
+        except Exception as e:
+            logger.warning(f"Failed to publish progress of job {self.job_id}: {e}")
+
+    def _schedule_flush(self) -> None:
+        """Write the buffered update when the interval ends (event loop thread only)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Written by the next due report or on close
+        with self._lock:
+            if self._timer is None:
+                delay = max(self.flush_interval - (time.monotonic() - self._flushed_at), 0)
+                self._timer = loop.call_later(delay, self.flush)
+
+
+async def _cancel_on_event(event: Dict[str, Any]) -> None:
+    """Set the token of a job cancelled in any process."""
+    if event.get("event") == JobEventType.CANCELLED.value:
+        context = _active.get(event.get("id"))
+        if context is not None:
+            context.cancel()
+
+
+job_events.add_listener(_cancel_on_event)
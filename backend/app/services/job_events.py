@@ -0,0 +1,289 @@
+"""
+Job Events
+Push delivery of async job lifecycle events.
+
+Clients used to poll GET /jobs/{job_id} every 1-2 seconds: one DB query
+and a full to_dict() (result included) per poll and client, for nothing
+most of the time. JobManager now publishes every lifecycle change
+(created, started, progress, completed, failed, cancelled) to an
+in-process broker:
+- subscribers (the GET /jobs/{job_id}/events SSE stream) receive the
+  events of one job or project through a bounded asyncio queue
+- listeners (the /ws/projects/{project_id} WebSocket) receive every event
+- with REDIS_HOST set, events are also published on the "job_events"
+  Redis channel and relayed to the other workers (start_relay() runs in
+  the app lifespan), so a client connected to any worker sees jobs that
+  run on any other
+
+Polling GET /jobs/{job_id} remains as the fallback.
+
+publish() is synchronous and thread-safe: JobManager is synchronous and
+may run outside the event loop thread.
+
+Usage:
+    job_events.publish(job_event(job, JobEventType.PROGRESS))
+
+    with job_events.subscribe(job_id=job.id) as subscription:
+        event = await subscription.get(timeout=15)
+"""
+
+import asyncio
+import enum
+import json
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from uuid import UUID, uuid4
+
+from app.models.async_job import AsyncJob, JobStatus
+from app.services.redis_client import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+
+# Redis pub/sub channel shared by all workers
+REDIS_CHANNEL = "job_events"
+
+# Events a slow subscriber may have queued; the oldest are dropped first
+MAX_QUEUED_EVENTS = 100
+
+# Statuses after which a job emits no more events
+TERMINAL_STATUSES = {JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value}
+
+
+class JobEventType(str, enum.Enum):
+    """Lifecycle event of an async job."""
+    CREATED = "created"
+    STARTED = "started"
+    PROGRESS = "progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    SNAPSHOT = "snapshot"  # Current state, sent first to a new subscriber
+
+
+def job_event(job: AsyncJob, event_type: JobEventType) -> Dict[str, Any]:
+    """
+    Event payload for a job: its status fields, without input_data.
+
+    The result is only included in completed (and snapshot) events, so
+    progress events stay small.
+
+    Args:
+        job: Async job (after the change was committed)
+        event_type: Lifecycle event
+
+    Returns:
+        JSON-serializable event dict
+    """
+    event = {
+        "event": event_type.value,
+        "id": str(job.id),
+        "job_type": job.job_type.value,
+        "status": job.status.value,
+        "progress_percent": job.progress_percent,
+        "progress_message": job.progress_message,
+        "error": job.error,
+        "project_id": str(job.project_id) if job.project_id else None,
+        "interview_id": str(job.interview_id) if job.interview_id else None,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    if event_type in (JobEventType.COMPLETED, JobEventType.SNAPSHOT):
+        event["result"] = job.result
+    return event
+
+
+class JobEventSubscription:
+    """
+    Queue of the events of one job or project (use as a context manager).
+    """
+
+    def __init__(
+        self,
+        broker: "JobEventBroker",
+        job_id: Optional[UUID] = None,
+        project_id: Optional[UUID] = None
+    ):
+        self.broker = broker
+        self.job_id = str(job_id) if job_id else None
+        self.project_id = str(project_id) if project_id else None
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=MAX_QUEUED_EVENTS)
+
+    def matches(self, event: Dict[str, Any]) -> bool:
+        if self.job_id and event.get("id") != self.job_id:
+            return False
+        if self.project_id and event.get("project_id") != self.project_id:
+            return False
+        return True
+
+    def put(self, event: Dict[str, Any]):
+        """Queue an event; when full, the oldest event is dropped (the latest state wins)."""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Next event.
+
+        Args:
+            timeout: Seconds to wait (None = until an event arrives)
+
+        Returns:
+            Event dict, or None on timeout
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self):
+        self.broker._subscriptions.discard(self)
+
+    def __enter__(self) -> "JobEventSubscription":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JobEventBroker:
+    """
+    In-process publish/subscribe of job events, relayed across workers via Redis.
+    """
+
+    def __init__(self, channel: str = REDIS_CHANNEL):
+        """
+        Args:
+            channel: Redis pub/sub channel
+        """
+        self.channel = channel
+        self._subscriptions: Set[JobEventSubscription] = set()
+        self._listeners: List[Callable[[Dict[str, Any]], Awaitable[None]]] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._origin = uuid4().hex  # Skips this worker's own events coming back from Redis
+        self._relay: Optional[asyncio.Task] = None
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], Awaitable[None]]):
+        """
+        Call an async function with every event (local and relayed).
+
+        Args:
+            listener: Coroutine function taking the event dict
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Dict[str, Any]], Awaitable[None]]):
+        """Stop calling a listener added with add_listener()."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def subscribe(self, job_id: Optional[UUID] = None, project_id: Optional[UUID] = None) -> JobEventSubscription:
+        """
+        Start receiving the events of a job or a project.
+
+        Must be called from the event loop. Close the subscription when done.
+
+        Args:
+            job_id: Only this job's events
+            project_id: Only this project's events
+
+        Returns:
+            JobEventSubscription
+        """
+        self._loop = asyncio.get_running_loop()
+        subscription = JobEventSubscription(self, job_id=job_id, project_id=project_id)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def publish(self, event: Dict[str, Any]):
+        """
+        Deliver an event locally and to the other workers (thread-safe).
+
+        Args:
+            event: Event dict (see job_event)
+        """
+        redis = get_redis()
+        if redis is not None:
+            try:
+                redis.publish(self.channel, json.dumps({"origin": self._origin, "event": event}, default=str))
+            except Exception as e:
+                logger.warning(f"⚠️  Job event not relayed via Redis: {e}")
+
+        self._dispatch(event)
+
+    def _dispatch(self, event: Dict[str, Any]):
+        """Hand the event to the event loop thread."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if self._loop is None or self._loop.is_closed():
+            self._loop = running
+        if self._loop is None:
+            return  # No event loop yet: nobody can be listening
+
+        if running is self._loop:
+            self._deliver(event)
+        else:
+            self._loop.call_soon_threadsafe(self._deliver, event)
+
+    def _deliver(self, event: Dict[str, Any]):
+        """Queue the event for matching subscribers and notify listeners (event loop thread)."""
+        for subscription in list(self._subscriptions):
+            if subscription.matches(event):
+                subscription.put(event)
+        for listener in self._listeners:
+            self._loop.create_task(self._notify(listener, event))
+
+    async def _notify(self, listener, event: Dict[str, Any]):
+        try:
+            await listener(event)
+        except Exception as e:
+            logger.warning(f"⚠️  Job event listener failed: {e}")
+
+    async def start_relay(self):
+        """Bind to the running loop and relay other workers' events from Redis (if configured)."""
+        self._loop = asyncio.get_running_loop()
+        client = get_async_redis()
+        if client is not None and self._relay is None:
+            self._relay = asyncio.create_task(self._relay_loop(client))
+            logger.info(f"📡 Relaying job events from Redis channel '{self.channel}'")
+
+    async def stop_relay(self):
+        """Stop the Redis relay."""
+        if self._relay is not None:
+            self._relay.cancel()
+            try:
+                await self._relay
+            except asyncio.CancelledError:
+                pass
+            self._relay = None
+
+    async def _relay_loop(self, client):
+        """Deliver events published by other workers; reconnects after errors."""
+        while True:
+            pubsub = client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") != self._origin:
+                        self._deliver(payload["event"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"⚠️  Job event relay interrupted: {e}. Reconnecting in 5s")
+                await asyncio.sleep(5)
+            finally:
+                try:
+                    await pubsub.reset()
+                except Exception:
+                    pass
+
+
+# Process-wide broker
+job_events = JobEventBroker()
@@ -4,15 +4,29 @@ Utility functions for managing async jobs.
 
 PROMPT #65 - Async Job System
 Provides helpers for creating, updating, and completing jobs.
+
+Every change is also published as a job event (see app/services/job_events.py),
+so clients are pushed updates instead of polling GET /jobs/{job_id}.
+
+Jobs created with a handler are queued and run by a job worker
+(see app/services/job_queue.py and app/services/job_worker.py).
+
+While a job runs in a JobContext (app/services/job_context.py),
+update_progress() and is_cancelled() use its in-memory buffer and
+cancellation token instead of querying the job.
 """
 
 from sqlalchemy.orm import Session
 from uuid import UUID, uuid4
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 import logging
 
+from app.config import settings
 from app.models.async_job import AsyncJob, JobStatus, JobType
+from app.services.job_context import get_job_context
+from app.services.job_events import JobEventType, job_event, job_events
+from app.services.job_queue import JOB_HANDLERS, encode_kwargs, handler_name, job_priority
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +42,15 @@ class JobManager:
             job_type=JobType.INTERVIEW_MESSAGE,
             input_data={"interview_id": str(interview_id), "message": "..."},
             project_id=project.id,
-            interview_id=interview.id
+            interview_id=interview.id,
+            handler=_process_interview_message_async,  # @job_handler
+            handler_kwargs={"interview_id": interview.id, "message_content": "..."}
         )
 
         # Return job_id to client immediately
         return {"job_id": str(job.id), "status": "pending"}
 
-        # In background task:
+        # In the handler (run by a job worker with job_id=job.id):
         job_manager.start_job(job.id)
         try:
             result = await do_work()
@@ -46,12 +62,22 @@ class JobManager:
     def __init__(self, db: Session):
         self.db = db
 
+    def _publish(self, job: AsyncJob, event_type: JobEventType) -> None:
+        """Push a committed change to subscribers (never fails the job operation)."""
+        try:
+            job_events.publish(job_event(job, event_type))
+        except Exception as e:
+            logger.warning(f"Failed to publish {event_type.value} event of job {job.id}: {e}")
+
     def create_job(
         self,
         job_type: JobType,
         input_data: Dict[str, Any],
         project_id: Optional[UUID] = None,
-        interview_id: Optional[UUID] = None
+        interview_id: Optional[UUID] = None,
+        handler: Optional[Callable] = None,
+        handler_kwargs: Optional[Dict[str, Any]] = None,
+        priority: Optional[int] = None
     ) -> AsyncJob:
         """
         Create a new pending job.
@@ -61,10 +87,17 @@ class JobManager:
             input_data: Parameters for the job
             project_id: Optional project ID
             interview_id: Optional interview ID
+            handler: @job_handler coroutine a worker runs the job with
+                (None = the caller runs the job itself)
+            handler_kwargs: Handler arguments besides job_id
+            priority: Queue priority (default: per job type)
 
         Returns:
             AsyncJob instance with status=PENDING
         """
+        if handler is not None and handler_name(handler) not in JOB_HANDLERS:
+            raise ValueError(f"{handler_name(handler)} is not a registered job handler")
+
         job = AsyncJob(
             id=uuid4(),
             job_type=job_type,
@@ -72,12 +105,18 @@ class JobManager:
             input_data=input_data,
             project_id=project_id,
             interview_id=interview_id,
-            created_at=datetime.utcnow()
+            created_at=datetime.utcnow(),
+            handler=handler_name(handler) if handler is not None else None,
+            handler_kwargs=encode_kwargs(handler_kwargs or {}) if handler is not None else None,
+            priority=job_priority(job_type) if priority is None else priority,
+            attempts=0,
+            max_attempts=settings.job_max_attempts
         )
 
         self.db.add(job)
         self.db.commit()
         self.db.refresh(job)
+        self._publish(job, JobEventType.CREATED)
 
         logger.info(f"Created job {job.id} ({job_type.value})")
         return job
@@ -98,6 +137,7 @@ class JobManager:
         job.started_at = datetime.utcnow()
 
         self.db.commit()
+        self._publish(job, JobEventType.STARTED)
         logger.info(f"Started job {job_id}")
 
     def update_progress(
@@ -109,11 +149,19 @@ class JobManager:
         """
         Update job progress.
 
+        Inside a JobContext the update is pushed to clients at once and
+        written to the database at the next throttled checkpoint.
+
         Args:
             job_id: UUID of the job
             progress_percent: Progress percentage (0-100)
             progress_message: Optional human-readable message
         """
+        context = get_job_context(job_id)
+        if context is not None:
+            context.report(progress_percent, progress_message)
+            return
+
         job = self.db.query(AsyncJob).filter(AsyncJob.id == job_id).first()
         if not job:
             logger.error(f"Job {job_id} not found")
@@ -124,6 +172,7 @@ class JobManager:
             job.progress_message = progress_message
 
         self.db.commit()
+        self._publish(job, JobEventType.PROGRESS)
         logger.debug(f"Job {job_id} progress: {progress_percent}% - {progress_message}")
 
     def complete_job(self, job_id: UUID, result: Dict[str, Any]) -> None:
@@ -134,6 +183,10 @@ class JobManager:
             job_id: UUID of the job
             result: Result data to return to client
         """
+        context = get_job_context(job_id)
+        if context is not None:
+            context.discard()  # Superseded by this write
+
         job = self.db.query(AsyncJob).filter(AsyncJob.id == job_id).first()
         if not job:
             logger.error(f"Job {job_id} not found")
@@ -145,6 +198,7 @@ class JobManager:
         job.progress_percent = 100.0
 
         self.db.commit()
+        self._publish(job, JobEventType.COMPLETED)
         logger.info(f"Completed job {job_id}")
 
     def fail_job(self, job_id: UUID, error: str) -> None:
@@ -155,6 +209,10 @@ class JobManager:
             job_id: UUID of the job
             error: Error message
         """
+        context = get_job_context(job_id)
+        if context is not None:
+            context.discard()  # Superseded by this write
+
         job = self.db.query(AsyncJob).filter(AsyncJob.id == job_id).first()
         if not job:
             logger.error(f"Job {job_id} not found")
@@ -165,6 +223,7 @@ class JobManager:
         job.completed_at = datetime.utcnow()
 
         self.db.commit()
+        self._publish(job, JobEventType.FAILED)
         logger.error(f"Failed job {job_id}: {error}")
 
     def get_job(self, job_id: UUID) -> Optional[AsyncJob]:
@@ -205,6 +264,10 @@ class JobManager:
         job.error = "Job was cancelled by user"
 
         self.db.commit()
+        context = get_job_context(job_id)
+        if context is not None:
+            context.cancel()  # Running in this process (others: via the cancelled event)
+        self._publish(job, JobEventType.CANCELLED)
         logger.info(f"Cancelled job {job_id}")
         return True
 
@@ -213,12 +276,18 @@ class JobManager:
         Check if a job has been cancelled.
         Background tasks should call this periodically to detect cancellation.
 
+        Inside a JobContext this reads its cancellation token (no query).
+
         Args:
             job_id: UUID of the job
 
         Returns:
             True if job was cancelled, False otherwise
         """
+        context = get_job_context(job_id)
+        if context is not None:
+            return context.cancelled
+
         job = self.db.query(AsyncJob).filter(AsyncJob.id == job_id).first()
         if not job:
             return False
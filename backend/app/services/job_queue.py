@@ -0,0 +1,334 @@
+"""
+Job Queue
+Durable queue of async jobs on the async_jobs table.
+
+Background work used to be started with asyncio.create_task() inside the
+API process: nothing bounded concurrency, heavy jobs shared the event loop
+with request handling, and jobs of a restarted process stayed RUNNING
+forever. The AsyncJob row is now the queue entry:
+- JobManager.create_job(..., handler=fn, handler_kwargs={...}) records
+  which registered handler runs the job, with which arguments
+- job workers (app/services/job_worker.py) claim pending jobs with
+  SELECT ... FOR UPDATE SKIP LOCKED, highest priority first, within
+  per-JobType concurrency limits
+- the worker refreshes heartbeat_at of its running jobs; jobs whose
+  heartbeat stops (worker crashed or was killed) are re-queued, or failed
+  once max_attempts is used up
+
+Handlers are module-level coroutine functions decorated with @job_handler.
+They receive job_id plus their handler_kwargs and report through
+JobManager as before (start_job, update_progress, complete_job, fail_job).
+
+Usage:
+    @job_handler
+    async def _generate_epic_async(job_id: UUID, interview_id: UUID, project_id: UUID):
+        ...
+
+    JobManager(db).create_job(
+        job_type=JobType.BACKLOG_GENERATION,
+        input_data={...},
+        handler=_generate_epic_async,
+        handler_kwargs={"interview_id": interview_id, "project_id": project_id}
+    )
+"""
+
+import enum
+import importlib
+import logging
+import typing
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.async_job import AsyncJob, JobStatus, JobType
+from app.services.job_events import JobEventType, job_event, job_events
+
+logger = logging.getLogger(__name__)
+
+
+# Claimed first when several job types are pending (higher first): a user
+# waits on interview answers and commits, nobody waits on speculation
+JOB_PRIORITIES: Dict[JobType, int] = {
+    JobType.INTERVIEW_MESSAGE: 100,
+    JobType.COMMIT_GENERATION: 80,
+    JobType.EPIC_ACTIVATION: 60,
+    JobType.STORY_ACTIVATION: 60,
+    JobType.TASK_ACTIVATION: 60,
+    JobType.SUBTASK_ACTIVATION: 60,
+    JobType.TASK_GENERATION: 50,
+    JobType.BACKLOG_GENERATION: 50,
+    JobType.PROJECT_PROVISIONING: 40,
+    JobType.PROJECT_ANALYSIS: 40,
+    JobType.TASK_EXECUTION: 30,
+    JobType.BATCH_EXECUTION: 20,
+    JobType.CODE_INDEXING: 10,
+    JobType.SPECULATIVE_GENERATION: 0,
+}
+
+# Jobs of one type a worker runs at once (others: JOB_WORKER_CONCURRENCY)
+JOB_CONCURRENCY: Dict[JobType, int] = {
+    JobType.INTERVIEW_MESSAGE: 8,
+    JobType.PROJECT_PROVISIONING: 1,
+    JobType.PROJECT_ANALYSIS: 1,
+    JobType.TASK_EXECUTION: 2,
+    JobType.BATCH_EXECUTION: 1,
+    JobType.CODE_INDEXING: 1,
+    JobType.SPECULATIVE_GENERATION: 1,
+}
+
+# Registered handlers by name ("module:function")
+JOB_HANDLERS: Dict[str, Callable[..., Awaitable[Any]]] = {}
+
+
+def handler_name(handler: Callable) -> str:
+    """Name under which a handler is stored on the job ("module:function")."""
+    return f"{handler.__module__}:{handler.__qualname__}"
+
+
+def job_handler(handler: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Register a coroutine function as a job handler (decorator).
+
+    Only registered handlers can be stored on a job or run by a worker.
+    """
+    JOB_HANDLERS[handler_name(handler)] = handler
+    return handler
+
+
+def resolve_handler(name: str) -> Callable[..., Awaitable[Any]]:
+    """
+    Registered handler by name, importing its module if needed.
+
+    Args:
+        name: "module:function" as stored on the job
+
+    Returns:
+        Handler coroutine function
+
+    Raises:
+        LookupError: Unknown or unregistered handler
+    """
+    if name not in JOB_HANDLERS:
+        module_name = name.split(":", 1)[0]
+        if not module_name.startswith("app."):
+            raise LookupError(f"Job handler outside the app package: {name}")
+        importlib.import_module(module_name)  # Registers its handlers
+    try:
+        return JOB_HANDLERS[name]
+    except KeyError:
+        raise LookupError(f"Unknown job handler: {name}")
+
+
+def job_priority(job_type: JobType) -> int:
+    """Default priority of a job type."""
+    return JOB_PRIORITIES.get(job_type, 0)
+
+
+def concurrency_limits() -> Dict[JobType, int]:
+    """
+    Jobs of each type one worker runs at once.
+
+    JOB_CONCURRENCY_LIMITS overrides the defaults, e.g.
+    "task_execution=4,batch_execution=2".
+
+    Returns:
+        Limit per JobType
+    """
+    limits = {
+        job_type: JOB_CONCURRENCY.get(job_type, settings.job_worker_concurrency)
+        for job_type in JobType
+    }
+    for entry in filter(None, (part.strip() for part in settings.job_concurrency_limits.split(","))):
+        try:
+            name, value = entry.split("=", 1)
+            limits[JobType(name.strip())] = int(value)
+        except ValueError:
+            logger.warning(f"⚠️  Ignoring invalid JOB_CONCURRENCY_LIMITS entry: {entry!r}")
+    return limits
+
+
+def encode_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Handler arguments as JSON (UUIDs and enums by value)."""
+    def encode(value):
+        if isinstance(value, UUID):
+            return str(value)
+        if isinstance(value, enum.Enum):
+            return value.value
+        if isinstance(value, (list, tuple)):
+            return [encode(item) for item in value]
+        if isinstance(value, dict):
+            return {key: encode(item) for key, item in value.items()}
+        return value
+
+    return {name: encode(value) for name, value in kwargs.items()}
+
+
+def decode_kwargs(handler: Callable, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Handler arguments from JSON, converted back per the handler's annotations."""
+    hints = typing.get_type_hints(handler)
+
+    def decode(hint, value):
+        if value is None or hint is None:
+            return value
+        origin = typing.get_origin(hint)
+        if origin is typing.Union:
+            options = [arg for arg in typing.get_args(hint) if arg is not type(None)]
+            return decode(options[0], value) if len(options) == 1 else value
+        if origin in (list, List) and isinstance(value, list):
+            (item_hint,) = typing.get_args(hint) or (None,)
+            return [decode(item_hint, item) for item in value]
+        if isinstance(hint, type) and issubclass(hint, (UUID, enum.Enum)) and not isinstance(value, hint):
+            return hint(value)
+        return value
+
+    return {name: decode(hints.get(name), value) for name, value in (kwargs or {}).items()}
+
+
+def claim_job(db: Session, worker_id: str, job_types: Sequence[JobType]) -> Optional[AsyncJob]:
+    """
+    Claim the next pending job of the given types for a worker.
+
+    SELECT ... FOR UPDATE SKIP LOCKED: concurrent workers never wait on
+    or claim the same row.
+
+    Args:
+        db: Database session
+        worker_id: Claiming worker
+        job_types: Types the worker has capacity for
+
+    Returns:
+        Claimed job (RUNNING) or None
+    """
+    if not job_types:
+        return None
+
+    job = (
+        db.query(AsyncJob)
+        .filter(
+            AsyncJob.status == JobStatus.PENDING,
+            AsyncJob.handler.isnot(None),
+            AsyncJob.job_type.in_(list(job_types))
+        )
+        .order_by(AsyncJob.priority.desc(), AsyncJob.created_at)
+        .with_for_update(skip_locked=True)
+        .limit(1)
+        .first()
+    )
+    if job is None:
+        db.rollback()
+        return None
+
+    now = datetime.utcnow()
+    job.status = JobStatus.RUNNING
+    job.worker_id = worker_id
+    job.heartbeat_at = now
+    job.started_at = now
+    job.attempts = (job.attempts or 0) + 1
+    db.commit()
+    return job
+
+
+def heartbeat(db: Session, worker_id: str, job_ids: Sequence[UUID]) -> None:
+    """
+    Refresh heartbeat_at of a worker's running jobs.
+
+    Args:
+        db: Database session
+        worker_id: Worker
+        job_ids: Jobs it is running
+    """
+    if not job_ids:
+        return
+    db.query(AsyncJob).filter(
+        AsyncJob.id.in_(list(job_ids)),
+        AsyncJob.worker_id == worker_id,
+        AsyncJob.status == JobStatus.RUNNING
+    ).update({AsyncJob.heartbeat_at: datetime.utcnow()}, synchronize_session=False)
+    db.commit()
+
+
+def release_jobs(db: Session, worker_id: str, job_ids: Sequence[UUID]) -> None:
+    """
+    Put a stopping worker's unfinished jobs back in the queue (attempt not counted).
+
+    Args:
+        db: Database session
+        worker_id: Worker
+        job_ids: Jobs it was running
+    """
+    if not job_ids:
+        return
+    jobs = db.query(AsyncJob).filter(
+        AsyncJob.id.in_(list(job_ids)),
+        AsyncJob.worker_id == worker_id,
+        AsyncJob.status == JobStatus.RUNNING
+    ).all()
+    for job in jobs:
+        _requeue(job, "Re-queued: worker stopped")
+        job.attempts = max((job.attempts or 1) - 1, 0)
+    db.commit()
+    for job in jobs:
+        _publish(job, JobEventType.PROGRESS)
+
+
+def requeue_stale_jobs(db: Session, stale_after_seconds: float) -> int:
+    """
+    Re-queue running jobs whose worker stopped sending heartbeats.
+
+    Jobs that used up max_attempts are failed instead.
+
+    Args:
+        db: Database session
+        stale_after_seconds: Heartbeat age after which the worker is presumed dead
+
+    Returns:
+        Number of jobs re-queued or failed
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=stale_after_seconds)
+    jobs = (
+        db.query(AsyncJob)
+        .filter(
+            AsyncJob.status == JobStatus.RUNNING,
+            AsyncJob.handler.isnot(None),
+            AsyncJob.heartbeat_at < cutoff
+        )
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not jobs:
+        db.rollback()
+        return 0
+
+    events = []
+    for job in jobs:
+        if (job.attempts or 0) < (job.max_attempts or 1):
+            _requeue(job, f"Re-queued after worker {job.worker_id} stopped responding")
+            events.append((job, JobEventType.PROGRESS))
+        else:
+            job.status = JobStatus.FAILED
+            job.error = f"Worker {job.worker_id} stopped responding (attempt {job.attempts} of {job.max_attempts})"
+            job.completed_at = datetime.utcnow()
+            events.append((job, JobEventType.FAILED))
+        logger.warning(f"⚠️  Stale job {job.id} ({job.job_type.value}): {job.status.value}")
+    db.commit()
+
+    for job, event_type in events:
+        _publish(job, event_type)
+    return len(jobs)
+
+
+def _requeue(job: AsyncJob, message: str) -> None:
+    job.status = JobStatus.PENDING
+    job.worker_id = None
+    job.heartbeat_at = None
+    job.progress_message = message
+
+
+def _publish(job: AsyncJob, event_type: JobEventType) -> None:
+    try:
+        job_events.publish(job_event(job, event_type))
+    except Exception as e:
+        logger.warning(f"Failed to publish {event_type.value} event of job {job.id}: {e}")
@@ -0,0 +1,280 @@
+"""
+Job Worker
+
+Runs queued async jobs (see app/services/job_queue.py). Runs as its own
+process so heavy jobs never share the event loop of API request handling,
+and scales out by starting more of them:
+
+    python -m app.services.job_worker
+
+With JOB_WORKER_EMBEDDED (the default) the API process runs one too, so a
+single-process setup keeps working without a separate worker.
+
+Loop:
+- re-queue jobs of workers that stopped sending heartbeats
+- claim pending jobs (SKIP LOCKED) while a type has free slots, highest
+  priority first, and run each handler as an asyncio task
+- sleep until a job is created (job events, relayed between processes
+  through Redis) or JOB_POLL_INTERVAL_SECONDS pass
+- a separate loop refreshes the heartbeat of the running jobs
+- another runs data retention (app/services/data_retention.py) every
+  DATA_RETENTION_INTERVAL_HOURS, in a thread; one worker at a time. With
+  retention disabled it still creates the upcoming monthly partitions
+
+Handlers run inside a JobContext: their progress updates are coalesced and
+cancellation is an in-memory token.
+
+On shutdown running jobs get JOB_SHUTDOWN_GRACE_SECONDS to finish; the rest
+are cancelled and handed back to the queue.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Tuple
+from uuid import UUID, uuid4
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.data_retention import ensure_partitions, run_data_retention
+from app.models.async_job import AsyncJob, JobStatus, JobType
+from app.services.job_context import JobContext
+from app.services.job_events import JobEventType, job_events
+from app.services.job_manager import JobManager
+from app.services.job_queue import (
+    claim_job,
+    concurrency_limits,
+    decode_kwargs,
+    heartbeat,
+    release_jobs,
+    requeue_stale_jobs,
+    resolve_handler,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """
+    Claims and runs queued jobs within per-type concurrency limits.
+    """
+
+    def __init__(
+        self,
+        worker_id: Optional[str] = None,
+        limits: Optional[Dict[JobType, int]] = None,
+        concurrency: Optional[int] = None,
+        session_factory: Callable = SessionLocal
+    ):
+        """
+        Args:
+            worker_id: Name stored on claimed jobs (default: host:pid:random)
+            limits: Jobs per type at once (default: concurrency_limits())
+            concurrency: Jobs at once overall (default: JOB_WORKER_CONCURRENCY)
+            session_factory: Creates database sessions
+        """
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+        self.limits = limits if limits is not None else concurrency_limits()
+        self.concurrency = concurrency or settings.job_worker_concurrency
+        self.session_factory = session_factory
+        self.running: Dict[UUID, Tuple[JobType, asyncio.Task]] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._stopping = False
+
+    def free_types(self) -> list:
+        """Job types with a free slot (none when the worker is full)."""
+        if len(self.running) >= self.concurrency:
+            return []
+        counts = Counter(job_type for job_type, _ in self.running.values())
+        return [job_type for job_type in JobType if counts[job_type] < self.limits.get(job_type, 0)]
+
+    def claim_available(self) -> int:
+        """
+        Claim and start pending jobs until the queue is empty or no slot is free.
+
+        Returns:
+            Number of jobs started
+        """
+        started = 0
+        db = self.session_factory()
+        try:
+            while not self._stopping:
+                job = claim_job(db, self.worker_id, self.free_types())
+                if job is None:
+                    break
+                self._start(job)
+                started += 1
+        finally:
+            db.close()
+        return started
+
+    def _start(self, job: AsyncJob) -> None:
+        # Plain values: the next claim's commit expires the instance and claim_available detaches it
+        job_id, job_type, attempts = job.id, job.job_type, job.attempts
+        task = asyncio.create_task(self._execute(job_id, job.handler, job.handler_kwargs or {}))
+        self.running[job_id] = (job_type, task)
+        task.add_done_callback(lambda _, job_id=job_id: self._finished(job_id))
+        logger.info(f"▶️  Worker {self.worker_id} claimed job {job_id} ({job_type.value}, attempt {attempts})")
+
+    def _finished(self, job_id: UUID) -> None:
+        self.running.pop(job_id, None)
+        if self._wakeup is not None:
+            self._wakeup.set()  # A slot is free
+
+    async def _execute(self, job_id: UUID, name: str, kwargs: Dict[str, Any]) -> None:
+        """Run a job's handler; a job the handler left running is completed or failed here."""
+        error = None
+        try:
+            handler = resolve_handler(name)
+            with JobContext(job_id, self.session_factory):  # Buffered progress, cancellation token
+                await handler(job_id=job_id, **decode_kwargs(handler, kwargs))
+        except asyncio.CancelledError:
+            raise  # Shutdown: released back to the queue by stop()
+        except Exception as e:
+            logger.exception(f"❌ Job {job_id} handler {name} failed: {e}")
+            error = str(e)
+
+        db = self.session_factory()
+        try:
+            job_manager = JobManager(db)
+            job = job_manager.get_job(job_id)
+            if job is not None and job.status == JobStatus.RUNNING and job.worker_id == self.worker_id:
+                if error is not None:
+                    job_manager.fail_job(job_id, error)
+                else:
+                    job_manager.complete_job(job_id, job.result or {})
+        finally:
+            db.close()
+
+    async def _on_job_event(self, event: Dict[str, Any]) -> None:
+        if event.get("event") in (JobEventType.CREATED.value, JobEventType.PROGRESS.value) \
+                and event.get("status") == JobStatus.PENDING.value and self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.job_heartbeat_seconds)
+            if not self.running:
+                continue
+            db = self.session_factory()
+            try:
+                heartbeat(db, self.worker_id, list(self.running))
+            except Exception as e:
+                logger.warning(f"⚠️  Job heartbeat failed: {e}")
+            finally:
+                db.close()
+
+    async def _retention_loop(self) -> None:
+        while True:
+            try:
+                if settings.data_retention_enabled:
+                    await asyncio.to_thread(run_data_retention, self.session_factory)
+                else:
+                    # Inserts need the partitions whether or not old rows expire
+                    await asyncio.to_thread(ensure_partitions, self.session_factory)
+            except Exception as e:
+                logger.error(f"❌ Data retention failed: {e}")
+            await asyncio.sleep(settings.data_retention_interval_hours * 3600)
+
+    def _requeue_stale(self) -> None:
+        db = self.session_factory()
+        try:
+            requeue_stale_jobs(db, settings.job_stale_after_seconds)
+        finally:
+            db.close()
+
+    async def run(self) -> None:
+        """Claim and run jobs until stopped."""
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        job_events.add_listener(self._on_job_event)
+        heartbeats = asyncio.create_task(self._heartbeat_loop())
+        retention = asyncio.create_task(self._retention_loop())
+        logger.info(f"🛠️  Job worker {self.worker_id} started (limits: {self.concurrency} jobs)")
+
+        loop = asyncio.get_running_loop()
+        next_stale_check = 0.0
+        try:
+            while not self._stopping:
+                self._wakeup.clear()
+                try:
+                    if loop.time() >= next_stale_check:
+                        self._requeue_stale()
+                        next_stale_check = loop.time() + settings.job_heartbeat_seconds
+                    self.claim_available()
+                except Exception as e:
+                    logger.error(f"❌ Job worker {self.worker_id} queue check failed: {e}")
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), settings.job_poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            heartbeats.cancel()
+            retention.cancel()
+            job_events.remove_listener(self._on_job_event)
+
+    async def stop(self, grace_seconds: Optional[float] = None) -> None:
+        """
+        Stop claiming, let running jobs finish, then release the rest to the queue.
+
+        Args:
+            grace_seconds: Wait for running jobs (default: JOB_SHUTDOWN_GRACE_SECONDS)
+        """
+        self._stopping = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+        tasks = [task for _, task in self.running.values()]
+        if not tasks:
+            return
+        grace = settings.job_shutdown_grace_seconds if grace_seconds is None else grace_seconds
+        _, pending = await asyncio.wait(tasks, timeout=grace)
+        if not pending:
+            return
+
+        unfinished = [job_id for job_id, (_, task) in self.running.items() if task in pending]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        db = self.session_factory()
+        try:
+            release_jobs(db, self.worker_id, unfinished)
+        finally:
+            db.close()
+        logger.info(f"⏹️  Job worker {self.worker_id} released {len(unfinished)} unfinished jobs")
+
+
+async def _run_worker() -> None:
+    worker = JobWorker()
+    await job_events.start_relay()
+    run = asyncio.create_task(worker.run())
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, run.cancel)
+    try:
+        await run
+    except asyncio.CancelledError:
+        pass
+    finally:
+        await worker.stop()
+        run.cancel()
+        await job_events.stop_relay()
+
+
+def main():
+    """Process entry point."""
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+    try:
+        asyncio.run(_run_worker())
+    except KeyboardInterrupt:
+        logger.info("Job worker stopped")
+
+
+if __name__ == "__main__":
+    main()
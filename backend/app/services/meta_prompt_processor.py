@@ -10,7 +10,7 @@ This service analyzes meta prompt interview responses and automatically generate
 - Atomic prompts for each Task/Subtask
 """
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 from sqlalchemy.orm import Session
 import json
@@ -19,7 +19,10 @@ import logging
 from app.models.task import Task, ItemType, PriorityLevel, TaskStatus
 from app.models.interview import Interview
 from app.models.project import Project
+from app.config import settings
 from app.services.ai_orchestrator import AIOrchestrator
+from app.services.hierarchy_stream import HierarchyStream, HierarchyBatchWriter, META_PROMPT_LEVELS, StreamedItem
+from app.services.hierarchy_writer import HierarchyWriter
 from app.prompter.facade import PrompterFacade
 # PROMPT #103 - External prompts support
 from app.prompts import get_prompt_service
@@ -51,7 +54,8 @@ class MetaPromptProcessor:
     async def generate_complete_hierarchy(
         self,
         interview_id: UUID,
-        project_id: UUID
+        project_id: UUID,
+        job_id: Optional[UUID] = None
     ) -> Dict:
         """
         Generate complete project hierarchy from meta prompt interview.
@@ -67,9 +71,14 @@ class MetaPromptProcessor:
         - Subtasks as needed (granular work items)
         - Atomic prompts for each Task/Subtask
 
+        With HIERARCHY_STREAMING (default) the AI answer is streamed: each item
+        is created as soon as its JSON is known, in small batches, and emitted
+        on the project WebSocket ("hierarchy_items_created").
+
         Args:
             interview_id: ID of the completed meta prompt interview
             project_id: Project ID
+            job_id: AsyncJob the generation runs in (included in WebSocket events)
 
         Returns:
             Dict containing:
@@ -116,62 +125,32 @@ class MetaPromptProcessor:
         qa_pairs = self._extract_qa_pairs(interview.conversation_data)
         focus_topics = interview.focus_topics or []
 
-        # 3. Generate complete hierarchy using AI
-        hierarchy_data = await self._generate_hierarchy_with_ai(
-            qa_pairs=qa_pairs,
-            focus_topics=focus_topics,
-            project=project,
-            interview_id=interview_id
-        )
-
-        # 4. Create Epic in database
-        epic = await self._create_epic(
-            hierarchy_data["epic"],
-            project_id=project_id,
-            interview_id=interview_id
-        )
-
-        # 5. Create Stories under Epic
-        stories = []
-        tasks_by_story = {}
-
-        for story_data in hierarchy_data["stories"]:
-            story = await self._create_story(
-                story_data,
-                epic_id=epic.id,
-                project_id=project_id
+        # 3-7. Generate the hierarchy with AI and create it in the database
+        if settings.hierarchy_streaming:
+            created, ai_metadata = await self._stream_hierarchy_with_ai(
+                qa_pairs=qa_pairs,
+                focus_topics=focus_topics,
+                project=project,
+                interview_id=interview_id,
+                job_id=job_id
             )
-            stories.append(story)
-
-            # 6. Create Tasks under each Story
-            tasks_for_story = []
-            for task_data in story_data.get("tasks", []):
-                task = await self._create_task(
-                    task_data,
-                    story_id=story.id,
-                    project_id=project_id
-                )
-                tasks_for_story.append(task)
-
-                # 7. Create Subtasks under each Task (if any)
-                for subtask_data in task_data.get("subtasks", []):
-                    subtask = await self._create_subtask(
-                        subtask_data,
-                        task_id=task.id,
-                        project_id=project_id
-                    )
-                    tasks_for_story.append(subtask)  # Track subtasks too
-
-            tasks_by_story[story.id] = tasks_for_story
-
-        # 8. Flatten all tasks/subtasks for response
-        all_tasks = []
-        for tasks_list in tasks_by_story.values():
-            all_tasks.extend(tasks_list)
+        else:
+            hierarchy_data = await self._generate_hierarchy_with_ai(
+                qa_pairs=qa_pairs,
+                focus_topics=focus_topics,
+                project=project,
+                interview_id=interview_id
+            )
+            created = await self._create_hierarchy(hierarchy_data, project_id, interview_id)
+            ai_metadata = hierarchy_data["metadata"]
 
-        # 9. Count subtasks separately
-        subtasks = [t for t in all_tasks if t.item_type == ItemType.SUBTASK]
-        tasks = [t for t in all_tasks if t.item_type == ItemType.TASK]
+        # 8. Split created items by type for the response
+        epic = next((t for t in created if t.item_type == ItemType.EPIC), None)
+        if epic is None:
+            raise ValueError("AI did not return an epic")
+        stories = [t for t in created if t.item_type == ItemType.STORY]
+        tasks = [t for t in created if t.item_type == ItemType.TASK]
+        subtasks = [t for t in created if t.item_type == ItemType.SUBTASK]
 
         logger.info(f"✅ Meta prompt processing complete!")
         logger.info(f"   Created: 1 Epic, {len(stories)} Stories, {len(tasks)} Tasks, {len(subtasks)} Subtasks")
@@ -187,13 +166,136 @@ class MetaPromptProcessor:
                 "story_count": len(stories),
                 "task_count": len(tasks),
                 "subtask_count": len(subtasks),
-                "ai_model": hierarchy_data["metadata"]["ai_model"],
+                "ai_model": ai_metadata.get("ai_model", "unknown"),
                 "focus_topics": focus_topics,
                 "interview_id": str(interview_id),
                 "project_id": str(project_id)
             }
         }
 
+    async def _create_hierarchy(self, hierarchy_data: Dict, project_id: UUID, interview_id: UUID) -> List[Task]:
+        """
+        Create a fully parsed hierarchy in the database.
+
+        Args:
+            hierarchy_data: Parsed AI response (epic, stories with tasks and subtasks)
+            project_id: Project ID
+            interview_id: Interview the Epic was created from
+
+        Returns:
+            Created items, parents before children
+        """
+        writer = HierarchyWriter(self.db)
+        epic_id = writer.add(self._build_item(
+            hierarchy_data["epic"], ItemType.EPIC, project_id, interview_id=interview_id
+        ))
+
+        for story_order, story_data in enumerate(hierarchy_data["stories"]):
+            story_id = writer.add(self._build_item(
+                story_data, ItemType.STORY, project_id, parent_id=epic_id, order=story_order
+            ))
+
+            for task_order, task_data in enumerate(story_data.get("tasks", [])):
+                task_id = writer.add(self._build_item(
+                    task_data, ItemType.TASK, project_id, parent_id=story_id, order=task_order
+                ))
+
+                for subtask_order, subtask_data in enumerate(task_data.get("subtasks", [])):
+                    writer.add(self._build_item(
+                        subtask_data, ItemType.SUBTASK, project_id, parent_id=task_id, order=subtask_order
+                    ))
+
+        # One INSERT, one transaction for the whole tree
+        return writer.write()
+
+    async def _stream_hierarchy_with_ai(
+        self,
+        qa_pairs: Dict,
+        focus_topics: List[str],
+        project: Project,
+        interview_id: UUID,
+        job_id: Optional[UUID] = None
+    ) -> Tuple[List[Task], Dict]:
+        """
+        Stream the hierarchy from the AI, creating items while it is generated.
+
+        Items are released by HierarchyStream as their JSON becomes known
+        (parents first), written by HierarchyBatchWriter in small batches and
+        emitted on the project WebSocket.
+
+        Returns:
+            (created items in creation order, AI metadata)
+
+        Raises:
+            ValueError: If the AI call fails or returns invalid/incomplete JSON
+        """
+        system_prompt, user_prompt = self._build_hierarchy_prompts(qa_pairs, focus_topics, project)
+
+        stream = HierarchyStream(META_PROMPT_LEVELS)
+        writer = HierarchyBatchWriter(self.db, project.id, job_id=job_id)
+        by_id: Dict[UUID, Task] = {}
+
+        logger.info("🤖 Streaming complete hierarchy from AI...")
+
+        try:
+            async for chunk in self.orchestrator.execute_stream(
+                usage_type="prompt_generation",
+                messages=[{"role": "user", "content": user_prompt}],
+                system_prompt=system_prompt,
+                project_id=project.id,
+                interview_id=interview_id,
+                metadata={"operation": "generate_hierarchy_from_meta_prompt"}
+            ):
+                for item in stream.feed(chunk):
+                    task = self._build_streamed_item(item, project.id, interview_id)
+                    if item.update:
+                        self._apply_fields(by_id[item.id], task)
+                    else:
+                        by_id[item.id] = task
+                        await writer.add(task)
+            document = stream.finish()
+        except ValueError as e:
+            await writer.finish()
+            logger.error(f"❌ Failed to parse streamed AI response as JSON: {e}")
+            raise ValueError(f"AI did not return valid JSON: {str(e)}")
+        except Exception as e:
+            await writer.finish()
+            logger.error(f"❌ AI call failed: {e}", exc_info=True)
+            raise ValueError(f"Failed to generate hierarchy: {str(e)}")
+
+        created = await writer.finish()
+        self.db.commit()  # fields that arrived after an item's children (updates)
+
+        ai_metadata = dict(document.get("metadata") or {}) if isinstance(document, dict) else {}
+        try:
+            ai_metadata["ai_model"] = self.orchestrator.choose_model("prompt_generation").get("db_model_name", "unknown")
+        except Exception:
+            ai_metadata["ai_model"] = "unknown"
+
+        logger.info(f"✅ Hierarchy streamed: {len(created)} items created")
+        return created, ai_metadata
+
+    def _build_streamed_item(self, item: StreamedItem, project_id: UUID, interview_id: UUID) -> Task:
+        """Task (not yet persisted) for an item released by the stream."""
+        data = dict(item.data)
+        data.setdefault("title", f"{item.item_type.value.capitalize()} {item.order + 1}")
+        data.setdefault("description", "")
+        return self._build_item(
+            data,
+            item.item_type,
+            project_id=project_id,
+            parent_id=item.parent_id,
+            interview_id=interview_id if item.item_type == ItemType.EPIC else None,
+            task_id=item.id,
+            order=item.order
+        )
+
+    def _apply_fields(self, task: Task, fresh: Task):
+        """Copy the AI-provided fields of a rebuilt item onto the created one."""
+        for attr in ("title", "description", "story_points", "priority", "interview_insights",
+                     "acceptance_criteria", "labels", "generated_prompt"):
+            setattr(task, attr, getattr(fresh, attr))
+
     def _extract_qa_pairs(self, conversation_data: list) -> Dict:
         """
         Extract Q&A pairs from meta prompt conversation.
@@ -273,6 +375,70 @@ class MetaPromptProcessor:
         - Subtasks for complex Tasks
         - Atomic prompts for each Task/Subtask
         """
+        system_prompt, user_prompt = self._build_hierarchy_prompts(qa_pairs, focus_topics, project)
+
+        # Call AI
+        logger.info("🤖 Calling AI to generate complete hierarchy...")
+
+        try:
+            if self.prompter:
+                result = await self.prompter.execute_prompt(
+                    prompt=user_prompt,
+                    usage_type="prompt_generation",
+                    system_prompt=system_prompt,
+                    project_id=str(project.id),
+                    interview_id=str(interview_id),
+                    metadata={"operation": "generate_hierarchy_from_meta_prompt"}
+                )
+            else:
+                result = await self.orchestrator.execute(
+                    usage_type="prompt_generation",
+                    messages=[{"role": "user", "content": user_prompt}],
+                    system_prompt=system_prompt,
+                    project_id=project.id,
+                    interview_id=interview_id,
+                    metadata={"operation": "generate_hierarchy_from_meta_prompt"}
+                )
+                result = {
+                    "response": result["content"],
+                    "model": result.get("db_model_name", "unknown"),
+                    "input_tokens": result.get("usage", {}).get("input_tokens", 0),
+                    "output_tokens": result.get("usage", {}).get("output_tokens", 0)
+                }
+        except Exception as e:
+            logger.error(f"❌ AI call failed: {e}", exc_info=True)
+            raise ValueError(f"Failed to generate hierarchy: {str(e)}")
+
+        # Parse AI response
+        try:
+            clean_json = _strip_markdown_json(result["response"])
+            hierarchy = json.loads(clean_json)
+
+            hierarchy["metadata"]["ai_model"] = result.get("model", "unknown")
+            hierarchy["metadata"]["input_tokens"] = result.get("input_tokens", 0)
+            hierarchy["metadata"]["output_tokens"] = result.get("output_tokens", 0)
+
+            logger.info(f"✅ Hierarchy generated: {hierarchy['metadata']['total_stories']} stories, {hierarchy['metadata']['total_tasks']} tasks")
+
+            return hierarchy
+
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Failed to parse AI response as JSON: {e}")
+            logger.error(f"AI response: {result.get('response', '')[:1000]}")
+            raise ValueError(f"AI did not return valid JSON: {str(e)}")
+
+    def _build_hierarchy_prompts(
+        self,
+        qa_pairs: Dict,
+        focus_topics: List[str],
+        project: Project
+    ) -> Tuple[str, str]:
+        """
+        System and user prompts for the complete hierarchy generation.
+
+        Returns:
+            (system_prompt, user_prompt)
+        """
         # Build topic focus text
         topic_labels = {
             "business_rules": "Regras de Negócio",
@@ -425,167 +591,52 @@ Analise TODAS as respostas abaixo e gere a hierarquia completa."""
 
         user_prompt += "\n\nGere a hierarquia completa seguindo o schema JSON fornecido."
 
-        # Call AI
-        logger.info("🤖 Calling AI to generate complete hierarchy...")
-
-        try:
-            if self.prompter:
-                result = await self.prompter.execute_prompt(
-                    prompt=user_prompt,
-                    usage_type="prompt_generation",
-                    system_prompt=system_prompt,
-                    project_id=str(project.id),
-                    interview_id=str(interview_id),
-                    metadata={"operation": "generate_hierarchy_from_meta_prompt"}
-                )
-            else:
-                result = await self.orchestrator.execute(
-                    usage_type="prompt_generation",
-                    messages=[{"role": "user", "content": user_prompt}],
-                    system_prompt=system_prompt,
-                    project_id=project.id,
-                    interview_id=interview_id,
-                    metadata={"operation": "generate_hierarchy_from_meta_prompt"}
-                )
-                result = {
-                    "response": result["content"],
-                    "model": result.get("db_model_name", "unknown"),
-                    "input_tokens": result.get("usage", {}).get("input_tokens", 0),
-                    "output_tokens": result.get("usage", {}).get("output_tokens", 0)
-                }
-        except Exception as e:
-            logger.error(f"❌ AI call failed: {e}", exc_info=True)
-            raise ValueError(f"Failed to generate hierarchy: {str(e)}")
-
-        # Parse AI response
-        try:
-            clean_json = _strip_markdown_json(result["response"])
-            hierarchy = json.loads(clean_json)
-
-            hierarchy["metadata"]["ai_model"] = result.get("model", "unknown")
-            hierarchy["metadata"]["input_tokens"] = result.get("input_tokens", 0)
-            hierarchy["metadata"]["output_tokens"] = result.get("output_tokens", 0)
-
-            logger.info(f"✅ Hierarchy generated: {hierarchy['metadata']['total_stories']} stories, {hierarchy['metadata']['total_tasks']} tasks")
+        return system_prompt, user_prompt
 
-            return hierarchy
+    # Defaults per level when the AI omits a field
+    ITEM_DEFAULTS = {
+        ItemType.EPIC: {"story_points": 21, "priority": "high"},
+        ItemType.STORY: {"story_points": 5, "priority": "medium"},
+        ItemType.TASK: {"story_points": 3, "priority": "medium"},
+        ItemType.SUBTASK: {"story_points": 2, "priority": "medium"},
+    }
 
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Failed to parse AI response as JSON: {e}")
-            logger.error(f"AI response: {result.get('response', '')[:1000]}")
-            raise ValueError(f"AI did not return valid JSON: {str(e)}")
-
-    async def _create_epic(
+    def _build_item(
         self,
-        epic_data: Dict,
+        data: Dict,
+        item_type: ItemType,
         project_id: UUID,
-        interview_id: UUID
+        parent_id: Optional[UUID] = None,
+        interview_id: Optional[UUID] = None,
+        task_id: Optional[UUID] = None,
+        order: Optional[int] = None
     ) -> Task:
-        """Create Epic in database."""
-        epic = Task(
-            id=uuid4(),
+        """Task (not yet persisted) for one item of the AI hierarchy."""
+        defaults = self.ITEM_DEFAULTS[item_type]
+        fields = dict(
+            id=task_id or uuid4(),
             project_id=project_id,
-            title=epic_data["title"],
-            description=epic_data["description"],
-            item_type=ItemType.EPIC,
-            story_points=epic_data.get("story_points", 21),
-            priority=self._parse_priority(epic_data.get("priority", "high")),
-            business_value=epic_data.get("business_value"),
-            acceptance_criteria=epic_data.get("acceptance_criteria", []),
-            labels=epic_data.get("labels", []),
+            parent_id=parent_id,
+            title=data["title"],
+            description=data["description"],
+            item_type=item_type,
+            story_points=data.get("story_points", defaults["story_points"]),
+            priority=self._parse_priority(data.get("priority", defaults["priority"])),
             status=TaskStatus.TODO,
             created_from_interview_id=interview_id
         )
-
-        self.db.add(epic)
-        self.db.commit()
-        self.db.refresh(epic)
-
-        logger.info(f"   ✅ Created Epic: {epic.title}")
-        return epic
-
-    async def _create_story(
-        self,
-        story_data: Dict,
-        epic_id: UUID,
-        project_id: UUID
-    ) -> Task:
-        """Create Story in database."""
-        story = Task(
-            id=uuid4(),
-            project_id=project_id,
-            parent_id=epic_id,
-            title=story_data["title"],
-            description=story_data["description"],
-            item_type=ItemType.STORY,
-            story_points=story_data.get("story_points", 5),
-            priority=self._parse_priority(story_data.get("priority", "medium")),
-            acceptance_criteria=story_data.get("acceptance_criteria", []),
-            labels=story_data.get("labels", []),
-            status=TaskStatus.TODO
-        )
-
-        self.db.add(story)
-        self.db.commit()
-        self.db.refresh(story)
-
-        logger.info(f"     ✅ Created Story: {story.title}")
-        return story
-
-    async def _create_task(
-        self,
-        task_data: Dict,
-        story_id: UUID,
-        project_id: UUID
-    ) -> Task:
-        """Create Task in database with atomic prompt."""
-        task = Task(
-            id=uuid4(),
-            project_id=project_id,
-            parent_id=story_id,
-            title=task_data["title"],
-            description=task_data["description"],
-            item_type=ItemType.TASK,
-            story_points=task_data.get("story_points", 3),
-            priority=self._parse_priority(task_data.get("priority", "medium")),
-            acceptance_criteria=task_data.get("acceptance_criteria", []),
-            generated_prompt=task_data.get("generated_prompt"),  # Atomic prompt!
-            status=TaskStatus.TODO
-        )
-
-        self.db.add(task)
-        self.db.commit()
-        self.db.refresh(task)
-
-        logger.info(f"       ✅ Created Task: {task.title}")
-        return task
-
-    async def _create_subtask(
-        self,
-        subtask_data: Dict,
-        task_id: UUID,
-        project_id: UUID
-    ) -> Task:
-        """Create Subtask in database with atomic prompt."""
-        subtask = Task(
-            id=uuid4(),
-            project_id=project_id,
-            parent_id=task_id,
-            title=subtask_data["title"],
-            description=subtask_data["description"],
-            item_type=ItemType.SUBTASK,
-            story_points=subtask_data.get("story_points", 2),
-            priority=self._parse_priority(subtask_data.get("priority", "medium")),
-            generated_prompt=subtask_data.get("generated_prompt"),  # Atomic prompt!
-            status=TaskStatus.TODO
-        )
-
-        self.db.add(subtask)
-        self.db.commit()
-        self.db.refresh(subtask)
-
-        logger.info(f"         ✅ Created Subtask: {subtask.title}")
-        return subtask
+        if order is not None:
+            fields["order"] = order
+        if item_type == ItemType.EPIC and data.get("business_value"):
+            # Task has no business_value column
+            fields["interview_insights"] = {"business_value": data["business_value"]}
+        if item_type != ItemType.SUBTASK:
+            fields["acceptance_criteria"] = data.get("acceptance_criteria", [])
+        if item_type in (ItemType.EPIC, ItemType.STORY):
+            fields["labels"] = data.get("labels", [])
+        if item_type in (ItemType.TASK, ItemType.SUBTASK):
+            fields["generated_prompt"] = data.get("generated_prompt")  # Atomic prompt!
+        return Task(**fields)
 
     def _parse_priority(self, priority_str: str) -> PriorityLevel:
         """Parse priority string to enum."""
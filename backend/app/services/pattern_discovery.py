@@ -11,20 +11,34 @@ Key Innovation: Discovers patterns ORGANICALLY without framework assumptions
 Updated: Project-Specific Specs via RAG Discovery
 - Now saves discovered patterns to database (specs table)
 - Patterns stored with project_id for project-specific lookup
+
+Groups are analyzed concurrently (bounded by PATTERN_DISCOVERY_CONCURRENCY)
+and each group's answer is cached by a fingerprint of its sampled files, so
+re-discovery only calls the AI for groups whose samples changed.
+
+Groups are split into structural clusters (MinHash over token shingles, see
+structural_clustering.py) before the AI is called: samples are the most
+central files of a cluster, and near-identical clusters from different groups
+are merged so they cost a single discovery prompt.
 """
 
 import json
+import asyncio
+import hashlib
 import logging
-import os
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Tuple
 from datetime import datetime
 from uuid import UUID, uuid4
 from collections import defaultdict
 
 from app.schemas.pattern_discovery import DiscoveredPattern, FileGroup
 from app.services.ai_orchestrator import AIOrchestrator
+from app.services.fs_snapshot import get_snapshot_service
+from app.services.structural_clustering import FileCluster, StructuralClusterer
+from app.config import settings
 from app.models.spec import Spec, SpecScope
+from app.models.pattern_discovery_cache import PatternDiscoveryCache
 from sqlalchemy.orm import Session
 # PROMPT #103 - External prompts support
 from app.prompts import get_prompt_service
@@ -42,13 +56,16 @@ class PatternDiscoveryService:
     Process:
     1. Build file inventory (recursive scan)
     2. Group files by extension/structure
-    3. Sample representative files
+    3. Cluster groups structurally, sample medoid files
     4. AI analyzes samples to identify patterns
     5. Extract templates with placeholders
     6. AI decides: framework vs project scope
     7. Rank by significance
     """
 
+    # Bump when the discovery prompt changes so cached answers are not reused
+    CACHE_VERSION = "1"
+
     def __init__(self, db: Session):
         """
         Initialize Pattern Discovery Service
@@ -60,6 +77,7 @@ class PatternDiscoveryService:
         self.ai_orchestrator = AIOrchestrator(db)
         # PROMPT #103 - Use PromptService for external prompts
         self.prompt_service = get_prompt_service(db)
+        self.clusterer = StructuralClusterer()
 
         # Default ignore patterns (common noise files)
         self.default_ignore_patterns = [
@@ -74,7 +92,8 @@ class PatternDiscoveryService:
         project_path: Path,
         project_id: UUID,
         max_patterns: int = 20,
-        min_occurrences: int = 3
+        min_occurrences: int = 3,
+        use_cache: bool = True
     ) -> List[DiscoveredPattern]:
         """
         Main pattern discovery pipeline
@@ -84,6 +103,7 @@ class PatternDiscoveryService:
             project_id: Project UUID
             max_patterns: Maximum patterns to discover
             min_occurrences: Minimum file count to consider a pattern
+            use_cache: Reuse cached answers for groups whose samples are unchanged
 
         Returns:
             List of discovered patterns ranked by significance
@@ -99,26 +119,61 @@ class PatternDiscoveryService:
         file_groups = self._group_files(file_inventory)
         logger.info(f"📂 Created {len(file_groups)} file groups")
 
-        # Step 3: AI-powered pattern discovery
-        discovered_patterns = []
-
-        for group_key, file_group in file_groups.items():
+        for group_key, file_group in list(file_groups.items()):
             if len(file_group.file_paths) < min_occurrences:
                 logger.debug(f"⏭️  Skipping {group_key}: only {len(file_group.file_paths)} files")
-                continue
+                del file_groups[group_key]
+
+        # Step 2b: Structural clusters (medoid-first file order, similar groups merged)
+        if settings.pattern_discovery_clustering:
+            file_groups = await asyncio.to_thread(
+                self._cluster_groups, project_path, file_groups, min_occurrences
+            )
+
+        # Step 3: AI-powered pattern discovery (concurrent, cached per group)
+        candidates = []
+        for group_key, file_group in file_groups.items():
+            # Sample representative files (clusters are ordered medoid first)
+            file_paths = file_group.file_paths
+            if settings.pattern_discovery_clustering:
+                file_paths = file_paths[:5]
+            sampled_files = self._sample_files(project_path, file_paths, max_samples=5)
+            candidates.append((group_key, file_group, sampled_files, self._fingerprint(group_key, sampled_files)))
+
+        cache = self._load_cache(project_id) if use_cache else {}
+        semaphore = asyncio.Semaphore(max(1, settings.pattern_discovery_concurrency))
+
+        async def discover_group(group_key, file_group, sampled_files, fingerprint):
+            cached = cache.get(group_key)
+            if cached is not None and cached.fingerprint == fingerprint:
+                try:
+                    pattern = DiscoveredPattern(**cached.pattern) if cached.pattern else None
+                    logger.info(f"♻️  Reusing cached result for group: {group_key}")
+                    return pattern, False
+                except Exception as e:
+                    logger.warning(f"⚠️  Ignoring unreadable cache entry for {group_key}: {e}")
+
+            async with semaphore:
+                logger.info(f"🤖 Analyzing group: {group_key} ({len(file_group.file_paths)} files)")
+
+                # Ask AI to identify pattern
+                pattern, answered = await self._ai_discover_pattern(
+                    group_key,
+                    sampled_files,
+                    file_group,
+                    project_id
+                )
 
-            logger.info(f"🤖 Analyzing group: {group_key} ({len(file_group.file_paths)} files)")
+            return pattern, answered
 
-            # Sample representative files
-            sampled_files = self._sample_files(project_path, file_group.file_paths, max_samples=5)
+        results = await asyncio.gather(*[discover_group(*candidate) for candidate in candidates])
 
-            # Ask AI to identify pattern
-            pattern = await self._ai_discover_pattern(
-                group_key,
-                sampled_files,
-                file_group,
-                project_id
-            )
+        discovered_patterns = []
+        fresh_answers = {}
+
+        for (group_key, file_group, _, fingerprint), (pattern, answered) in zip(candidates, results):
+            if answered:
+                fresh_answers[group_key] = (fingerprint, pattern)
 
             if pattern:
                 pattern.occurrences = len(file_group.file_paths)
@@ -128,6 +183,12 @@ class PatternDiscoveryService:
             else:
                 logger.debug(f"   ❌ No pattern identified for {group_key}")
 
+        self._save_cache(project_id, cache, fresh_answers)
+        logger.info(
+            f"🧠 AI analyzed {len(fresh_answers)} groups, "
+            f"{len(candidates) - len(fresh_answers)} reused or failed"
+        )
+
         # Step 4: Rank patterns by significance
         ranked = self._rank_patterns(discovered_patterns)
 
@@ -156,24 +217,21 @@ class PatternDiscoveryService:
         files = []
 
         try:
-            for root, dirs, filenames in os.walk(project_path):
-                # Filter out ignored directories
-                dirs[:] = [d for d in dirs if not self._should_ignore(d)]
-
-                for filename in filenames:
-                    if self._should_ignore(filename):
-                        continue
-
-                    file_path = Path(root) / filename
-
-                    # Only include code files (has extension, reasonable size)
-                    if file_path.suffix and file_path.stat().st_size < 1_000_000:  # < 1MB
-                        files.append(file_path.relative_to(project_path))
-
+            # Shared (cached) walk - sizes come from the snapshot, no extra stat
+            snapshot = get_snapshot_service().get(project_path)
         except Exception as e:
             logger.error(f"Error scanning directory: {e}")
             return []
 
+        for info in snapshot.files:
+            parts = info.path.split("/")
+            if any(self._should_ignore(part) for part in parts):
+                continue
+
+            # Only include code files (has extension, reasonable size)
+            if info.ext and info.size < 1_000_000:  # < 1MB
+                files.append(Path(info.path))
+
         return files
 
     def _should_ignore(self, name: str) -> bool:
@@ -246,6 +304,68 @@ class PatternDiscoveryService:
 
         return file_groups
 
+    def _cluster_groups(
+        self,
+        project_path: Path,
+        file_groups: Dict[str, FileGroup],
+        min_occurrences: int
+    ) -> Dict[str, FileGroup]:
+        """
+        Split file groups into structural clusters and merge near-identical ones
+
+        The largest cluster of a group keeps the group key, the others get
+        "<group_key>#<n>". Only the largest clusters of each group are kept
+        (PATTERN_DISCOVERY_MAX_CLUSTERS) and clusters still smaller than
+        min_occurrences after merging are dropped.
+
+        Args:
+            project_path: Project root path
+            file_groups: Groups with at least min_occurrences files
+            min_occurrences: Minimum file count to consider a pattern
+
+        Returns:
+            Dictionary of cluster_key -> FileGroup (file_paths medoid first)
+        """
+        clusters: List[FileCluster] = []
+
+        for group_key, file_group in file_groups.items():
+            signatures = {}
+            for file_path in file_group.file_paths:
+                try:
+                    with open(project_path / file_path, 'r', encoding='utf-8', errors='ignore') as f:
+                        signatures[file_path] = self.clusterer.signature(f.read(self.clusterer.MAX_CHARS))
+                except Exception as e:
+                    logger.warning(f"Could not read {file_path}: {e}")
+
+            members = self.clusterer.cluster(signatures)
+            for index, paths in enumerate(members[:max(1, settings.pattern_discovery_max_clusters)]):
+                clusters.append(FileCluster(
+                    key=group_key if index == 0 else f"{group_key}#{index + 1}",
+                    extension=file_group.extension,
+                    category=file_group.estimated_category,
+                    paths=paths,
+                    signature=signatures[paths[0]]
+                ))
+
+        merged = self.clusterer.merge(clusters)
+        kept = [cluster for cluster in merged if cluster.size >= min_occurrences]
+
+        logger.info(
+            f"🧩 {len(file_groups)} groups -> {len(clusters)} structural clusters, "
+            f"{len(clusters) - len(merged)} merged, {len(kept)} analyzed"
+        )
+
+        return {
+            cluster.key: FileGroup(
+                group_key=cluster.key,
+                file_paths=cluster.paths,
+                file_count=cluster.size,
+                extension=cluster.extension,
+                estimated_category=cluster.category
+            )
+            for cluster in kept
+        }
+
     def _sample_files(
         self,
         project_path: Path,
@@ -288,13 +408,89 @@ class PatternDiscoveryService:
 
         return samples
 
+    def _fingerprint(self, group_key: str, sampled_files: List[Dict[str, str]]) -> str:
+        """
+        Fingerprint of a group's AI input: sampled paths + content hashes
+
+        Args:
+            group_key: Group identifier
+            sampled_files: Sample files with content (exactly what the AI sees)
+
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256(f"{self.CACHE_VERSION}\0{group_key}".encode("utf-8"))
+        for sample in sampled_files:
+            content_hash = hashlib.sha256(sample['content'].encode("utf-8")).hexdigest()
+            digest.update(f"\0{sample['path']}\0{content_hash}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _load_cache(self, project_id: UUID) -> Dict[str, PatternDiscoveryCache]:
+        """
+        Load cached group answers of a project
+
+        Args:
+            project_id: Project UUID
+
+        Returns:
+            Dictionary of group_key -> PatternDiscoveryCache
+        """
+        try:
+            rows = self.db.query(PatternDiscoveryCache).filter(
+                PatternDiscoveryCache.project_id == project_id
+            ).all()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not load pattern discovery cache: {e}")
+            self.db.rollback()
+            return {}
+
+        return {row.group_key: row for row in rows}
+
+    def _save_cache(
+        self,
+        project_id: UUID,
+        cache: Dict[str, PatternDiscoveryCache],
+        answers: Dict[str, Tuple[str, Optional[DiscoveredPattern]]]
+    ) -> None:
+        """
+        Store fresh AI answers (failed calls are not cached)
+
+        Args:
+            project_id: Project UUID
+            cache: Rows loaded by _load_cache (updated in place)
+            answers: group_key -> (fingerprint, pattern or None)
+        """
+        if not answers:
+            return
+
+        try:
+            for group_key, (fingerprint, pattern) in answers.items():
+                row = cache.get(group_key)
+                if row is None:
+                    row = self.db.query(PatternDiscoveryCache).filter(
+                        PatternDiscoveryCache.project_id == project_id,
+                        PatternDiscoveryCache.group_key == group_key
+                    ).first()
+                if row is None:
+                    row = PatternDiscoveryCache(project_id=project_id, group_key=group_key)
+                    self.db.add(row)
+
+                row.fingerprint = fingerprint
+                row.pattern = pattern.model_dump() if pattern else None
+                row.created_at = datetime.utcnow()
+
+            self.db.commit()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not save pattern discovery cache: {e}")
+            self.db.rollback()
+
     async def _ai_discover_pattern(
         self,
         group_key: str,
         sampled_files: List[Dict[str, str]],
         file_group: FileGroup,
         project_id: UUID
-    ) -> Optional[DiscoveredPattern]:
+    ) -> Tuple[Optional[DiscoveredPattern], bool]:
         """
         Use AI to discover pattern from code samples
 
@@ -312,10 +508,11 @@ class PatternDiscoveryService:
             project_id: Project UUID
 
         Returns:
-            DiscoveredPattern if pattern found, None otherwise
+            Tuple (DiscoveredPattern if pattern found else None, whether the AI
+            gave a usable answer - False on call/parse errors, which are not cached)
         """
         if not sampled_files:
-            return None
+            return None, False
 
         # Build discovery prompt
         prompt = self._build_discovery_prompt(group_key, sampled_files, file_group)
@@ -332,8 +529,11 @@ class PatternDiscoveryService:
             # Parse AI response
             pattern_data = self._parse_ai_response(response["content"])
 
-            if not pattern_data or not pattern_data.get("pattern_found"):
-                return None
+            if not pattern_data:
+                return None, False
+
+            if not pattern_data.get("pattern_found"):
+                return None, True
 
             # Build DiscoveredPattern
             return DiscoveredPattern(
@@ -348,11 +548,11 @@ class PatternDiscoveryService:
                 reasoning=pattern_data.get("reasoning", ""),
                 key_characteristics=pattern_data.get("key_characteristics", []),
                 is_framework_worthy=pattern_data.get("is_framework_worthy", False)
-            )
+            ), True
 
         except Exception as e:
             logger.error(f"AI pattern discovery failed for {group_key}: {e}")
-            return None
+            return None, False
 
     def _build_discovery_prompt(
         self,
@@ -10,6 +10,7 @@ from typing import Dict, List, Any, Optional
 from anthropic import Anthropic
 
 from app.config import settings
+from app.services.fs_snapshot import FileSnapshot, get_snapshot_service
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,8 @@ class PatternRecognizer:
     async def recognize(
         self,
         extraction_path: Path,
-        detected_stack: Optional[str] = None
+        detected_stack: Optional[str] = None,
+        snapshot: Optional[FileSnapshot] = None
     ) -> Dict[str, str]:
         """
         Extract code patterns from project
@@ -38,6 +40,7 @@ class PatternRecognizer:
         Args:
             extraction_path: Path to extracted project
             detected_stack: Detected stack (for targeted extraction)
+            snapshot: Filesystem snapshot of extraction_path (taken if not given)
 
         Returns:
             {
@@ -53,6 +56,9 @@ class PatternRecognizer:
         # Get pattern types based on stack
         pattern_types = self._get_pattern_types(detected_stack)
 
+        if snapshot is None:
+            snapshot = get_snapshot_service().get(extraction_path)
+
         patterns = {}
 
         for pattern_type, file_patterns in pattern_types.items():
@@ -60,7 +66,8 @@ class PatternRecognizer:
             sampled = self._sample_pattern_files(
                 extraction_path,
                 file_patterns,
-                max_files=5
+                max_files=5,
+                snapshot=snapshot
             )
 
             if not sampled:
@@ -127,36 +134,39 @@ class PatternRecognizer:
         self,
         root_path: Path,
         file_patterns: List[str],
-        max_files: int = 5
+        max_files: int = 5,
+        snapshot: Optional[FileSnapshot] = None
     ) -> List[Dict[str, str]]:
         """
         Sample files matching specific patterns
         """
 
+        if snapshot is None:
+            snapshot = get_snapshot_service().get(root_path)
+
         sampled = []
 
         for pattern in file_patterns:
-            for file_path in root_path.glob(pattern):
-                if file_path.is_file():
-                    try:
-                        # Skip very large files
-                        size = file_path.stat().st_size
-                        if size > 50 * 1024:
-                            continue
-
-                        content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-                        sampled.append({
-                            "path": str(file_path.relative_to(root_path)),
-                            "content": content[:8000]  # Limit to 8000 chars
-                        })
-
-                        if len(sampled) >= max_files:
-                            return sampled
-
-                    except Exception as e:
-                        logger.debug(f"Skipping file {file_path}: {e}")
-                        continue
+            for info in snapshot.glob(pattern):
+                # Skip very large files
+                if info.size > 50 * 1024:
+                    continue
+
+                file_path = root_path / info.path
+                try:
+                    content = file_path.read_text(encoding="utf-8", errors="ignore")
+
+                    sampled.append({
+                        "path": info.path,
+                        "content": content[:8000]  # Limit to 8000 chars
+                    })
+
+                    if len(sampled) >= max_files:
+                        return sampled
+
+                except Exception as e:
+                    logger.debug(f"Skipping file {file_path}: {e}")
+                    continue
 
         return sampled
 
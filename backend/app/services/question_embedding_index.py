@@ -0,0 +1,274 @@
+"""
+Question Embedding Index
+In-memory matrix of interview question embeddings for duplicate detection.
+
+check_duplicate used to embed each candidate question and run a pgvector
+query over rag_documents, and store_question embedded the question again
+before inserting it. The questions of a project are few and only grow, so:
+- each project's question embeddings (L2-normalized, float32) are kept as
+  one NumPy matrix in-process; a duplicate check is one matrix-vector
+  product
+- Redis (REDIS_HOST) is the shared backing store: every question is one
+  entry of a per-project list, so other workers catch up by reading only
+  the entries they have not seen yet; without Redis each process keeps
+  its own matrix
+- the matrix (and the Redis list) is seeded from rag_documents with one
+  query on first use; afterwards Postgres is only written to, for
+  persistence
+- embeddings are cached per text, so the vector computed by a check is
+  reused when the same question is stored
+
+The matrix is per project rather than per interview because duplicate
+detection is cross-interview (PROMPT #97).
+
+Usage:
+    index = QuestionEmbeddingIndex(db)
+    vector = index.embedding(text, lambda t: rag_service.embed_many([t])[0])
+    match, similarity = index.best_match(project_id, vector)
+    index.add(project_id, vector, {"id": doc_id, "content": text, "metadata": metadata})
+"""
+
+import base64
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.services.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+# Projects whose matrix is kept in-process (least recently used are dropped)
+MAX_PROJECTS = 256
+
+# Texts whose embedding is kept for reuse between check and store
+MAX_CACHED_EMBEDDINGS = 512
+
+# Redis list of a project's questions and its generation (bumped on invalidate)
+REDIS_KEY = "interview_questions:{project_id}"
+REDIS_GENERATION_KEY = "interview_questions:{project_id}:generation"
+REDIS_TTL_SECONDS = 7 * 24 * 3600
+
+_matrices: "OrderedDict[str, _ProjectMatrix]" = OrderedDict()
+_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+_lock = threading.Lock()
+
+_UNSET = object()
+
+
+def normalize(vector: Sequence[float]) -> np.ndarray:
+    """Embedding as an L2-normalized float32 vector (dot product = cosine similarity)."""
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm > 0 else vector
+
+
+class _ProjectMatrix:
+    """Question embeddings of one project, one row per question."""
+
+    def __init__(self, generation: Optional[str] = None):
+        self.generation = generation
+        self.vectors: Optional[np.ndarray] = None
+        self.documents: List[Dict[str, Any]] = []
+        self.ids = set()
+        self.seen = 0  # Redis entries consumed
+
+    def extend(self, rows: List[Tuple[np.ndarray, Dict[str, Any]]]):
+        new = [(vector, document) for vector, document in rows if document["id"] not in self.ids]
+        if not new:
+            return
+        block = np.vstack([vector for vector, _ in new])
+        self.vectors = block if self.vectors is None else np.vstack([self.vectors, block])
+        for _, document in new:
+            self.documents.append(document)
+            self.ids.add(document["id"])
+
+
+class QuestionEmbeddingIndex:
+    """
+    Per-project question embedding matrices, shared through Redis.
+    """
+
+    def __init__(self, db: Session, redis_client: Any = _UNSET):
+        """
+        Args:
+            db: Database session (seeds a project's matrix from rag_documents)
+            redis_client: Redis client (default: from REDIS_HOST; None = in-process only)
+        """
+        self.db = db
+        self.redis = get_redis() if redis_client is _UNSET else redis_client
+
+    def embedding(self, content: str, encode: Callable[[str], Sequence[float]]) -> np.ndarray:
+        """
+        Normalized embedding of a text, computed once and cached.
+
+        Args:
+            content: Text (already cleaned)
+            encode: Embedding function for a cache miss
+
+        Returns:
+            L2-normalized float32 vector
+        """
+        with _lock:
+            vector = _embeddings.get(content)
+            if vector is not None:
+                _embeddings.move_to_end(content)
+                return vector
+
+        vector = normalize(encode(content))
+        with _lock:
+            _embeddings[content] = vector
+            while len(_embeddings) > MAX_CACHED_EMBEDDINGS:
+                _embeddings.popitem(last=False)
+        return vector
+
+    def best_match(self, project_id: UUID, vector: np.ndarray) -> Tuple[Optional[Dict[str, Any]], float]:
+        """
+        Most similar stored question of the project.
+
+        Args:
+            project_id: Project ID
+            vector: Normalized embedding of the candidate
+
+        Returns:
+            (document with id, content, metadata and similarity, cosine
+            similarity) or (None, 0.0) if the project has no questions
+        """
+        with _lock:
+            matrix = self._sync(project_id)
+            if matrix.vectors is None:
+                return None, 0.0
+            similarities = matrix.vectors @ vector
+            best = int(np.argmax(similarities))
+            similarity = float(similarities[best])
+            return dict(matrix.documents[best], similarity=similarity), similarity
+
+    def add(self, project_id: UUID, vector: np.ndarray, document: Dict[str, Any]):
+        """
+        Add a stored question to the project's matrix (and the shared Redis list).
+
+        Args:
+            project_id: Project ID
+            vector: Normalized embedding
+            document: {"id", "content", "metadata"} of the rag_documents row
+        """
+        document = dict(document, id=str(document["id"]))
+        with _lock:
+            if self.redis is not None:
+                try:
+                    key = REDIS_KEY.format(project_id=project_id)
+                    self._sync(project_id)  # seeds an empty list from Postgres first
+                    self.redis.rpush(key, self._encode(vector, document))
+                    self.redis.expire(key, REDIS_TTL_SECONDS)
+                    self._sync(project_id)
+                    return
+                except Exception as e:
+                    logger.warning(f"⚠️  Question index Redis write failed: {e}")
+            self._sync(project_id, use_redis=False).extend([(vector, document)])
+
+    def invalidate(self, project_id: UUID):
+        """
+        Forget a project's matrix everywhere (after its questions were deleted).
+
+        Args:
+            project_id: Project ID
+        """
+        with _lock:
+            _matrices.pop(str(project_id), None)
+            if self.redis is not None:
+                try:
+                    self.redis.delete(REDIS_KEY.format(project_id=project_id))
+                    self.redis.incr(REDIS_GENERATION_KEY.format(project_id=project_id))
+                except Exception as e:
+                    logger.warning(f"⚠️  Question index Redis invalidation failed: {e}")
+
+    def _sync(self, project_id: UUID, use_redis: bool = True) -> _ProjectMatrix:
+        """The project's matrix, loaded or caught up with Redis (caller holds _lock)."""
+        key = str(project_id)
+        matrix = _matrices.get(key)
+
+        if use_redis and self.redis is not None:
+            try:
+                matrix = self._sync_redis(project_id, matrix)
+            except Exception as e:
+                logger.warning(f"⚠️  Question index Redis read failed: {e}")
+
+        if matrix is None:
+            matrix = _ProjectMatrix()
+            matrix.extend(self._load_database(project_id))
+
+        _matrices[key] = matrix
+        _matrices.move_to_end(key)
+        while len(_matrices) > MAX_PROJECTS:
+            _matrices.popitem(last=False)
+        return matrix
+
+    def _sync_redis(self, project_id: UUID, matrix: Optional[_ProjectMatrix]) -> _ProjectMatrix:
+        """Read the Redis entries this process has not seen (seeding the list if empty)."""
+        key = REDIS_KEY.format(project_id=project_id)
+        generation, length = (
+            self.redis.pipeline()
+            .get(REDIS_GENERATION_KEY.format(project_id=project_id))
+            .llen(key)
+            .execute()
+        )
+
+        if matrix is None or matrix.generation != generation:
+            matrix = _ProjectMatrix(generation)
+            if not length:
+                rows = self._load_database(project_id)
+                if rows:
+                    self.redis.rpush(key, *[self._encode(vector, document) for vector, document in rows])
+                    self.redis.expire(key, REDIS_TTL_SECONDS)
+                    length = self.redis.llen(key)
+
+        if length > matrix.seen:
+            entries = self.redis.lrange(key, matrix.seen, length - 1)
+            matrix.extend([self._decode(entry) for entry in entries])
+            matrix.seen += len(entries)
+        return matrix
+
+    def _load_database(self, project_id: UUID) -> List[Tuple[np.ndarray, Dict[str, Any]]]:
+        """All stored questions of the project, with one query."""
+        rows = self.db.execute(
+            text("""
+                SELECT id, content, metadata, embedding
+                FROM rag_documents
+                WHERE project_id = :project_id
+                    AND metadata->>'type' = 'interview_question'
+                ORDER BY created_at
+            """),
+            {"project_id": str(project_id)}
+        ).fetchall()
+
+        loaded = []
+        for row in rows:
+            embedding = json.loads(row.embedding) if isinstance(row.embedding, str) else row.embedding
+            metadata = json.loads(row.metadata) if isinstance(row.metadata, str) else row.metadata
+            loaded.append((
+                normalize(embedding),
+                {"id": str(row.id), "content": row.content, "metadata": metadata or {}}
+            ))
+
+        logger.info(f"📥 Loaded {len(loaded)} question embeddings for project {project_id}")
+        return loaded
+
+    @staticmethod
+    def _encode(vector: np.ndarray, document: Dict[str, Any]) -> str:
+        return json.dumps({
+            **document,
+            "embedding": base64.b64encode(np.asarray(vector, dtype="<f4").tobytes()).decode()
+        })
+
+    @staticmethod
+    def _decode(entry: str) -> Tuple[np.ndarray, Dict[str, Any]]:
+        document = json.loads(entry)
+        vector = np.frombuffer(base64.b64decode(document.pop("embedding")), dtype="<f4")
+        return vector.astype(np.float32), document
@@ -36,13 +36,15 @@ Usage:
 import json
 import logging
 from typing import Dict, List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
+from app.services.question_embedding_index import QuestionEmbeddingIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -128,6 +130,71 @@ class RAGService:
 
         return doc_id
 
+    def embed_many(self, contents: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts in one batched model call.
+
+        Safe to call from a worker thread (does not touch the DB session).
+
+        Args:
+            contents: Texts to embed
+
+        Returns:
+            List of embeddings (same order as contents)
+        """
+        if not contents:
+            return []
+
+        return self._embedder.encode(contents, batch_size=64).tolist()
+
+    def store_many(
+        self,
+        documents: List[Dict],
+        embeddings: Optional[List[List[float]]] = None,
+        commit: bool = True
+    ) -> List[UUID]:
+        """
+        Store several documents with a single executemany INSERT.
+
+        Args:
+            documents: Dicts with "content", optional "metadata", "project_id"
+                and "id" (client-side UUID; generated if missing)
+            embeddings: Pre-computed embeddings (computed in one batch if None)
+            commit: Commit the transaction (False lets callers group writes)
+
+        Returns:
+            List of document UUIDs (same order as documents)
+        """
+        if not documents:
+            return []
+
+        if embeddings is None:
+            embeddings = self.embed_many([doc["content"] for doc in documents])
+
+        rows = []
+        for doc, embedding in zip(documents, embeddings):
+            project_id = doc.get("project_id")
+            rows.append({
+                "id": str(doc.get("id") or uuid4()),
+                "project_id": str(project_id) if project_id else None,
+                "content": doc["content"],
+                "embedding": embedding,
+                "metadata": json.dumps(doc.get("metadata") or {})
+            })
+
+        query = text("""
+            INSERT INTO rag_documents (id, project_id, content, embedding, metadata)
+            VALUES (:id, :project_id, :content, :embedding, :metadata)
+        """)
+        self.db.execute(query, rows)
+
+        if commit:
+            self.db.commit()
+
+        logger.info(f"Stored {len(rows)} documents in bulk")
+
+        return [UUID(row["id"]) for row in rows]
+
     def retrieve(
         self,
         query: str,
@@ -298,6 +365,30 @@ class RAGService:
 
         return deleted
 
+    def delete_many(self, document_ids: List[UUID], commit: bool = True) -> int:
+        """
+        Delete several documents in one statement.
+
+        Args:
+            document_ids: UUIDs of documents to delete
+            commit: Commit the transaction (False lets callers group writes)
+
+        Returns:
+            Number of documents deleted
+        """
+        if not document_ids:
+            return 0
+
+        query = text("DELETE FROM rag_documents WHERE id = ANY(CAST(:ids AS uuid[]))")
+        result = self.db.execute(query, {"ids": [str(doc_id) for doc_id in document_ids]})
+        if commit:
+            self.db.commit()
+
+        count = result.rowcount
+        logger.info(f"Deleted {count} documents by id")
+
+        return count
+
     def delete_by_project(self, project_id: UUID) -> int:
         """
         Delete all documents for a project.
@@ -311,6 +402,7 @@ class RAGService:
         query = text("DELETE FROM rag_documents WHERE project_id = :project_id")
         result = self.db.execute(query, {"project_id": str(project_id)})
         self.db.commit()
+        QuestionEmbeddingIndex(self.db).invalidate(project_id)
 
         count = result.rowcount
         logger.info(f"Deleted {count} documents for project {project_id}")
@@ -382,6 +474,10 @@ class RAGService:
         result = self.db.execute(text(sql), params)
         self.db.commit()
 
+        # Interview questions are also held in memory for duplicate checks
+        if filter.get("project_id") and filter.get("type", "interview_question") == "interview_question":
+            QuestionEmbeddingIndex(self.db).invalidate(filter["project_id"])
+
         count = result.rowcount
         logger.info(f"Deleted {count} documents with filter {filter}")
 
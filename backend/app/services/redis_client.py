@@ -0,0 +1,84 @@
+"""
+Redis Client
+Shared Redis connections configured by REDIS_HOST / REDIS_PORT.
+
+Redis is optional: without REDIS_HOST (or when it cannot be reached)
+get_redis() and get_async_redis() return None and callers fall back to
+in-process state. Each client is created once per process.
+
+Usage:
+    redis = get_redis()
+    if redis is not None:
+        redis.publish("channel", "message")
+"""
+
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+_sync_client: Any = _UNSET
+_async_client: Any = _UNSET
+
+
+def _connection_kwargs(redis_host: str) -> dict:
+    return {
+        "host": redis_host,
+        "port": int(os.getenv("REDIS_PORT", 6379)),
+        "db": 0,
+        "decode_responses": True,
+        "socket_connect_timeout": 5,
+        "socket_timeout": 5,
+    }
+
+
+def get_redis():
+    """
+    Synchronous Redis client, or None if Redis is not configured or unreachable.
+
+    Returns:
+        redis.Redis instance or None
+    """
+    global _sync_client
+    if _sync_client is not _UNSET:
+        return _sync_client
+
+    _sync_client = None
+    redis_host = os.getenv("REDIS_HOST")
+    if redis_host:
+        try:
+            import redis
+            client = redis.Redis(**_connection_kwargs(redis_host))
+            client.ping()
+            _sync_client = client
+            logger.info(f"✅ Redis connected: {redis_host}:{os.getenv('REDIS_PORT', 6379)}")
+        except Exception as e:
+            logger.warning(f"⚠️  Redis connection failed: {e}. Using in-process state.")
+    return _sync_client
+
+
+def get_async_redis():
+    """
+    asyncio Redis client (for pub/sub listeners), or None if Redis is not configured.
+
+    The connection is checked on first use, not here.
+
+    Returns:
+        redis.asyncio.Redis instance or None
+    """
+    global _async_client
+    if _async_client is not _UNSET:
+        return _async_client
+
+    _async_client = None
+    redis_host = os.getenv("REDIS_HOST")
+    if redis_host:
+        try:
+            import redis.asyncio
+            # No read timeout: pub/sub connections wait for messages indefinitely
+            _async_client = redis.asyncio.Redis(**dict(_connection_kwargs(redis_host), socket_timeout=None))
+        except Exception as e:
+            logger.warning(f"⚠️  Async Redis client unavailable: {e}")
+    return _async_client
@@ -0,0 +1,315 @@
+"""
+Speculative Generation
+Pre-generates the full content of suggested items before the user activates them.
+
+Activating a suggestion (Epic, Story, Task, Subtask) waits on one large AI
+call for its full content. Once suggestions exist, that call is predictable,
+so - when SPECULATIVE_GENERATION_ENABLED is set - it is made ahead of time:
+- new suggestions are queued as a SPECULATIVE_GENERATION AsyncJob
+- the job runs at low priority: one item at a time, one job per project
+  at a time
+- each result is stored as a SpeculativeDraft with a fingerprint of its
+  inputs (item, ancestors, project context)
+- activation takes a ready draft whose fingerprint still matches and skips
+  the AI call; drafts of items whose parent (or the item itself) changed
+  are discarded as stale and the content is generated live
+
+Spend is capped per run (SPECULATIVE_MAX_ITEMS_PER_RUN) and per project and
+UTC day (SPECULATIVE_DAILY_TOKEN_BUDGET, measured with track_usage).
+
+Usage:
+    speculation = SpeculativeGenerator(db, context_service)
+    speculation.schedule(project.id, suggested_items)
+    content = speculation.take(item, project)  # None -> generate live
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.async_job import JobType
+from app.models.project import Project
+from app.models.speculative_draft import SpeculativeDraft, SpeculativeDraftStatus
+from app.models.task import Task
+from app.services.ai_orchestrator import track_usage
+from app.services.job_manager import JobManager
+from app.services.job_queue import job_handler
+
+logger = logging.getLogger(__name__)
+
+
+# Ancestors that feed an item's full content (subtask -> task -> story -> epic)
+MAX_CHAIN = 4
+
+# Speculative jobs of one project run one after another
+_project_locks: Dict[UUID, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+def is_suggestion(item: Task) -> bool:
+    """Whether the item is a not yet activated suggestion."""
+    return bool(item.labels and "suggested" in item.labels) or item.workflow_state == "draft"
+
+
+class SpeculativeGenerator:
+    """
+    Stores, serves and schedules speculative full-content drafts.
+    """
+
+    def __init__(self, db: Session, context_service):
+        """
+        Args:
+            db: Database session
+            context_service: ContextGeneratorService providing
+                _generate_full_item_content and the hierarchy loader
+        """
+        self.db = db
+        self.context_service = context_service
+
+    def fingerprint(self, item: Task, project: Project) -> str:
+        """
+        SHA-256 over everything the item's full content is generated from.
+
+        Args:
+            item: Suggested item
+            project: Project of the item
+
+        Returns:
+            Hex digest; changes when the item, an ancestor or the project context changes
+        """
+        ancestors = [
+            task for task in self.context_service.hierarchy.chain(item, MAX_CHAIN)[1:]
+            if task is not None
+        ]
+        payload = {
+            "item": [item.item_type.value if item.item_type else None, item.title, item.description],
+            "ancestors": [[task.title, task.description, task.generated_prompt] for task in ancestors],
+            "context": project.context_semantic,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    def take(self, item: Task, project: Project) -> Optional[Dict]:
+        """
+        Content of the item's ready draft, if its fingerprint still matches.
+
+        Every ready draft of the item is closed: the matching one as consumed,
+        the others as stale. Changes are committed with the activation.
+
+        Args:
+            item: Item being activated
+            project: Project of the item
+
+        Returns:
+            Full content dict, or None if it must be generated live
+        """
+        drafts = (
+            self.db.query(SpeculativeDraft)
+            .filter(
+                SpeculativeDraft.task_id == item.id,
+                SpeculativeDraft.status == SpeculativeDraftStatus.READY
+            )
+            .order_by(SpeculativeDraft.created_at.desc())
+            .all()
+        )
+        if not drafts:
+            return None
+
+        fingerprint = self.fingerprint(item, project)
+        content = None
+        for draft in drafts:
+            draft.consumed_at = datetime.utcnow()
+            if content is None and draft.fingerprint == fingerprint:
+                draft.status = SpeculativeDraftStatus.CONSUMED
+                content = draft.content
+            else:
+                draft.status = SpeculativeDraftStatus.STALE
+
+        if content is None:
+            logger.info(f"🗑️  Speculative draft of {item.title} is stale, generating live")
+        else:
+            logger.info(f"⚡ Using speculative draft for {item.title}")
+        return content
+
+    def tokens_spent_today(self, project_id: UUID) -> int:
+        """Tokens spent on speculation for the project since 00:00 UTC."""
+        start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+        spent = (
+            self.db.query(func.coalesce(func.sum(SpeculativeDraft.tokens_used), 0))
+            .filter(SpeculativeDraft.project_id == project_id, SpeculativeDraft.created_at >= start)
+            .scalar()
+        )
+        return int(spent or 0)
+
+    def schedule(self, project_id: UUID, items: Iterable[Task]) -> Optional[UUID]:
+        """
+        Queue speculative generation of suggested items (no-op unless enabled).
+
+        Args:
+            project_id: Project of the items
+            items: Suggested items, most likely to be activated first
+
+        Returns:
+            AsyncJob ID, or None if nothing was scheduled
+        """
+        if not settings.speculative_generation_enabled:
+            return None
+
+        task_ids = [item.id for item in items if item.id is not None]
+        if not task_ids:
+            return None
+
+        job = JobManager(self.db).create_job(
+            job_type=JobType.SPECULATIVE_GENERATION,
+            input_data={"task_ids": [str(task_id) for task_id in task_ids]},
+            project_id=project_id,
+            handler=run_speculative_generation,
+            handler_kwargs={"project_id": project_id, "task_ids": task_ids}
+        )
+
+        logger.info(f"🔮 Scheduled speculative generation of {len(task_ids)} items (job {job.id})")
+        return job.id
+
+    async def generate(
+        self,
+        project: Project,
+        task_ids: List[UUID],
+        job_id: Optional[UUID] = None
+    ) -> Dict:
+        """
+        Pre-generate full content for suggested items, one at a time, within the caps.
+
+        Items that are no longer suggestions, or already have a matching
+        ready draft, are skipped.
+
+        Args:
+            project: Project of the items
+            task_ids: Items in priority order
+            job_id: AsyncJob to report progress to (optional)
+
+        Returns:
+            Dict with generated, skipped, tokens_used and stopped
+            (None, "item_limit", "token_budget" or "cancelled")
+        """
+        job_manager = JobManager(self.db) if job_id else None
+        budget = settings.speculative_daily_token_budget
+        spent = self.tokens_spent_today(project.id)
+        stats = {"generated": 0, "skipped": 0, "tokens_used": 0, "stopped": None}
+
+        for index, task_id in enumerate(task_ids):
+            if job_manager and job_manager.is_cancelled(job_id):
+                stats["stopped"] = "cancelled"
+                break
+            if stats["generated"] >= settings.speculative_max_items_per_run:
+                stats["stopped"] = "item_limit"
+                break
+            if spent >= budget:
+                stats["stopped"] = "token_budget"
+                break
+
+            item = self.context_service.hierarchy.get(task_id)
+            if item is None or not is_suggestion(item):
+                stats["skipped"] += 1
+                continue
+
+            fingerprint = self.fingerprint(item, project)
+            if self._has_ready_draft(item.id, fingerprint):
+                stats["skipped"] += 1
+                continue
+
+            try:
+                with track_usage() as usage:
+                    content = await self.context_service._generate_full_item_content(item, project)
+            except Exception as e:
+                logger.error(f"❌ Speculative generation failed for {item.title}: {e}")
+                stats["skipped"] += 1
+                continue
+
+            tokens = usage["total_tokens"]
+            spent += tokens
+            stats["tokens_used"] += tokens
+
+            # Fallback content (AI error) is not worth serving: keep the row only to count its spend
+            usable = bool(tokens and content and content.get("generated_prompt"))
+            if usable or tokens:
+                self.db.add(SpeculativeDraft(
+                    task_id=item.id,
+                    project_id=project.id,
+                    fingerprint=fingerprint,
+                    content=content if usable else None,
+                    tokens_used=tokens,
+                    status=SpeculativeDraftStatus.READY if usable else SpeculativeDraftStatus.STALE,
+                    created_at=datetime.utcnow()
+                ))
+                self.db.commit()
+            stats["generated" if usable else "skipped"] += 1
+
+            if job_manager:
+                job_manager.update_progress(
+                    job_id,
+                    100.0 * (index + 1) / len(task_ids),
+                    f"Pre-generated {stats['generated']} of {len(task_ids)} items"
+                )
+
+        logger.info(
+            f"🔮 Speculative generation for project {project.id}: {stats['generated']} generated, "
+            f"{stats['skipped']} skipped, {stats['tokens_used']} tokens"
+            + (f" (stopped: {stats['stopped']})" if stats["stopped"] else "")
+        )
+        return stats
+
+    def _has_ready_draft(self, task_id: UUID, fingerprint: str) -> bool:
+        """Whether a usable draft with this fingerprint already exists."""
+        return self.db.query(
+            self.db.query(SpeculativeDraft)
+            .filter(
+                SpeculativeDraft.task_id == task_id,
+                SpeculativeDraft.fingerprint == fingerprint,
+                SpeculativeDraft.status == SpeculativeDraftStatus.READY
+            )
+            .exists()
+        ).scalar()
+
+
+@job_handler
+async def run_speculative_generation(job_id: UUID, project_id: UUID, task_ids: List[UUID]):
+    """
+    Background task of a SPECULATIVE_GENERATION job (own DB session).
+
+    Args:
+        job_id: AsyncJob ID
+        project_id: Project of the items
+        task_ids: Items in priority order
+    """
+    from app.database import SessionLocal
+    from app.services.context_generator import ContextGeneratorService
+
+    async with _project_locks[project_id]:
+        db = SessionLocal()
+        try:
+            job_manager = JobManager(db)
+            if job_manager.is_cancelled(job_id):
+                return
+            job_manager.start_job(job_id)
+
+            project = db.query(Project).filter(Project.id == project_id).first()
+            if not project:
+                raise ValueError(f"Project {project_id} not found")
+
+            context_service = ContextGeneratorService(db)
+            result = await context_service.speculation.generate(project, task_ids, job_id=job_id)
+            job_manager.complete_job(job_id, result)
+
+        except Exception as e:
+            logger.error(f"❌ Speculative generation job {job_id} failed: {e}")
+            JobManager(db).fail_job(job_id, str(e))
+
+        finally:
+            db.close()
@@ -8,6 +8,8 @@ import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from app.services.fs_snapshot import FileSnapshot, get_snapshot_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -123,12 +125,20 @@ class StackDetector:
     Detects technology stack from project structure
     """
 
-    def detect(self, extraction_path: Path) -> Dict[str, Any]:
+    def detect(
+        self,
+        extraction_path: Path,
+        snapshot: Optional[FileSnapshot] = None
+    ) -> Dict[str, Any]:
         """
         Detect stack from extracted project
 
+        All file/directory probes are answered from one filesystem snapshot
+        instead of stat/iterdir calls per signature.
+
         Args:
             extraction_path: Path to extracted project
+            snapshot: Filesystem snapshot of extraction_path (taken if not given)
 
         Returns:
             {
@@ -141,6 +151,9 @@ class StackDetector:
 
         logger.info(f"Detecting stack from {extraction_path}")
 
+        if snapshot is None:
+            snapshot = get_snapshot_service().get(extraction_path)
+
         # Calculate confidence scores for each stack
         scores = {}
         indicators = {}
@@ -148,7 +161,8 @@ class StackDetector:
         for stack_key, signature in STACK_SIGNATURES.items():
             score, found_indicators = self._calculate_stack_score(
                 extraction_path,
-                signature
+                signature,
+                snapshot
             )
             scores[stack_key] = score
             indicators[stack_key] = found_indicators
@@ -189,7 +203,8 @@ class StackDetector:
     def _calculate_stack_score(
         self,
         root_path: Path,
-        signature: Dict
+        signature: Dict,
+        snapshot: FileSnapshot
     ) -> tuple[int, List[str]]:
         """
         Calculate confidence score for a specific stack
@@ -203,7 +218,7 @@ class StackDetector:
 
         # Check required files (30 points each)
         for required_file in signature.get("required_files", []):
-            if self._file_exists(root_path, required_file):
+            if self._file_exists(snapshot, required_file):
                 score += 30
                 indicators.append(f"✓ Required file: {required_file}")
             else:
@@ -212,7 +227,7 @@ class StackDetector:
 
         # Check required directories (20 points each)
         for required_dir in signature.get("required_dirs", []):
-            if self._dir_exists(root_path, required_dir):
+            if self._dir_exists(snapshot, required_dir):
                 score += 20
                 indicators.append(f"✓ Required dir: {required_dir}")
             else:
@@ -222,7 +237,7 @@ class StackDetector:
         # Check optional files (10 points each, max 30)
         optional_score = 0
         for optional_file in signature.get("optional_files", []):
-            if self._file_exists(root_path, optional_file):
+            if self._file_exists(snapshot, optional_file):
                 optional_score += 10
                 indicators.append(f"✓ Optional: {optional_file}")
             if optional_score >= 30:
@@ -232,7 +247,7 @@ class StackDetector:
         # Check package indicators (confidence boost)
         package_indicators = signature.get("package_indicators", {})
         for package_file, required_packages in package_indicators.items():
-            if self._check_packages(root_path, package_file, required_packages):
+            if self._check_packages(root_path, package_file, required_packages, snapshot):
                 boost = signature.get("confidence_boost", 20)
                 score += boost
                 indicators.append(f"✓ Package indicators in {package_file}")
@@ -242,33 +257,37 @@ class StackDetector:
 
         return (score, indicators)
 
-    def _file_exists(self, root_path: Path, file_path: str) -> bool:
-        """Check if file exists in project"""
+    def _find_file(self, snapshot: FileSnapshot, file_path: str) -> Optional[str]:
+        """Relative path of file_path at the root or one level deep, if present"""
 
         # Try exact path
-        if (root_path / file_path).is_file():
-            return True
+        if snapshot.has_file(file_path):
+            return file_path
 
         # Try in subdirectories (one level deep)
-        for subdir in root_path.iterdir():
-            if subdir.is_dir():
-                if (subdir / file_path).is_file():
-                    return True
+        for subdir in snapshot.top_level_dirs():
+            candidate = f"{subdir}/{file_path}"
+            if snapshot.has_file(candidate):
+                return candidate
 
-        return False
+        return None
+
+    def _file_exists(self, snapshot: FileSnapshot, file_path: str) -> bool:
+        """Check if file exists in project"""
 
-    def _dir_exists(self, root_path: Path, dir_path: str) -> bool:
+        return self._find_file(snapshot, file_path) is not None
+
+    def _dir_exists(self, snapshot: FileSnapshot, dir_path: str) -> bool:
         """Check if directory exists in project"""
 
         # Try exact path
-        if (root_path / dir_path).is_dir():
+        if snapshot.has_dir(dir_path):
             return True
 
         # Try in subdirectories (one level deep)
-        for subdir in root_path.iterdir():
-            if subdir.is_dir():
-                if (subdir / dir_path).is_dir():
-                    return True
+        for subdir in snapshot.top_level_dirs():
+            if snapshot.has_dir(f"{subdir}/{dir_path}"):
+                return True
 
         return False
 
@@ -276,7 +295,8 @@ class StackDetector:
         self,
         root_path: Path,
         package_file: str,
-        required_packages: List[str]
+        required_packages: List[str],
+        snapshot: FileSnapshot
     ) -> bool:
         """
         Check if package file contains required packages
@@ -290,19 +310,12 @@ class StackDetector:
         """
 
         # Find package file
-        file_path = None
-        if (root_path / package_file).is_file():
-            file_path = root_path / package_file
-        else:
-            # Check subdirectories
-            for subdir in root_path.iterdir():
-                if subdir.is_dir() and (subdir / package_file).is_file():
-                    file_path = subdir / package_file
-                    break
-
-        if not file_path:
+        rel_path = self._find_file(snapshot, package_file)
+        if not rel_path:
             return False
 
+        file_path = root_path / rel_path
+
         try:
             content = file_path.read_text(encoding="utf-8", errors="ignore")
 
@@ -0,0 +1,228 @@
+"""
+Streaming JSON
+Incremental JSON parsing of streamed AI completions.
+
+The parser is fed the completion chunk by chunk and builds the value in
+place. It reports every object/array as soon as it opens or closes, so
+callers can act on an item before the rest of the document has arrived:
+
+    parser = IncrementalJSONParser()
+    async for chunk in orchestrator.execute_stream(...):
+        for event in parser.feed(chunk):
+            if event.kind == "end" and event.path[:1] == ("stories",):
+                ...
+    document = parser.finish()
+
+- text before the first "{" or "[" (e.g. a ```json fence or a preamble) and
+  after the root value closes is ignored
+- paths are tuples of keys and indices: ("stories", 0, "tasks", 2)
+- the "start" event's value is the (still empty) container, already attached
+  to its parent, so the parent's earlier fields are readable
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
+
+PathKey = Union[str, int]
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_SCALAR_CHARS = frozenset("0123456789+-.eEtruefalsn")
+_WHITESPACE = frozenset(" \t\r\n,:")
+_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+@dataclass
+class JSONEvent:
+    """An object or array opened ("start") or closed ("end")."""
+    kind: str
+    path: Tuple[PathKey, ...]
+    value: Any
+    parent: Any = None
+
+
+class _Frame:
+    """Open container on the parser stack."""
+    __slots__ = ("container", "path", "key")
+
+    def __init__(self, container, path: Tuple[PathKey, ...]):
+        self.container = container
+        self.path = path
+        self.key: Optional[str] = None  # pending key of an object
+
+
+class IncrementalJSONParser:
+    """
+    Push parser for one JSON object or array, fed in arbitrary chunks.
+    """
+
+    def __init__(self):
+        self._stack: List[_Frame] = []
+        self._root: Any = None
+        self._string: Optional[List[str]] = None  # pieces of the open string
+        self._escape: Optional[str] = None        # characters after an open backslash
+        self._scalar = ""                          # partial number or literal
+        self.done = False
+
+    @property
+    def value(self) -> Any:
+        """The root value parsed so far (partial until done)."""
+        return self._root
+
+    def feed(self, chunk: str) -> List[JSONEvent]:
+        """
+        Consume the next piece of text.
+
+        Args:
+            chunk: Next part of the document
+
+        Returns:
+            Events for the containers opened or closed in this chunk
+
+        Raises:
+            ValueError: If the text is not valid JSON
+        """
+        events: List[JSONEvent] = []
+        i, n = 0, len(chunk)
+
+        while i < n and not self.done:
+            if self._string is not None:
+                i = self._read_string(chunk, i, events)
+                continue
+
+            c = chunk[i]
+            if self._scalar:
+                if c in _SCALAR_CHARS:
+                    self._scalar += c
+                    i += 1
+                    continue
+                self._finish_scalar()
+
+            if not self._stack:
+                # Skip everything before the root container
+                if c in "{[":
+                    self._open({} if c == "{" else [], events)
+                i += 1
+                continue
+
+            if c in _WHITESPACE:
+                i += 1
+            elif c == '"':
+                self._string = []
+                i += 1
+            elif c in "{[":
+                self._open({} if c == "{" else [], events)
+                i += 1
+            elif c in "}]":
+                self._close(c, events)
+                i += 1
+            elif c in _SCALAR_CHARS:
+                self._scalar = c
+                i += 1
+            else:
+                raise ValueError(f"Unexpected character {c!r} in JSON")
+
+        return events
+
+    def finish(self) -> Any:
+        """
+        The complete root value.
+
+        Raises:
+            ValueError: If the document is incomplete
+        """
+        if not self.done:
+            raise ValueError("Incomplete JSON document")
+        return self._root
+
+    def _read_string(self, chunk: str, i: int, events: List[JSONEvent]) -> int:
+        """Consume string content from chunk[i:]; returns the next position."""
+        n = len(chunk)
+        while i < n:
+            if self._escape is not None:
+                self._escape += chunk[i]
+                i += 1
+                if self._escape[0] == "u":
+                    if len(self._escape) < 5:
+                        continue
+                    self._string.append(chr(int(self._escape[1:], 16)))
+                else:
+                    self._string.append(_ESCAPES.get(self._escape, self._escape))
+                self._escape = None
+                continue
+
+            match = _STRING_SPECIAL.search(chunk, i)
+            if match is None:
+                self._string.append(chunk[i:])
+                return n
+
+            self._string.append(chunk[i:match.start()])
+            i = match.end()
+            if match.group() == "\\":
+                self._escape = ""
+                continue
+
+            value = "".join(self._string)
+            self._string = None
+            if any("\ud800" <= ch <= "\udfff" for ch in value):
+                # Join \\uXXXX surrogate pairs
+                value = value.encode("utf-16", "surrogatepass").decode("utf-16")
+            self._add_value(value, is_string=True)
+            return i
+        return i
+
+    def _finish_scalar(self):
+        """Convert the buffered number or literal and add it to its container."""
+        text, self._scalar = self._scalar, ""
+        if text in _LITERALS:
+            value = _LITERALS[text]
+        else:
+            try:
+                value = json.loads(text)
+            except json.JSONDecodeError:
+                raise ValueError(f"Invalid JSON value {text!r}")
+        self._add_value(value)
+
+    def _add_value(self, value: Any, is_string: bool = False):
+        """Store a scalar (or an object key) in the innermost container."""
+        frame = self._stack[-1]
+        if isinstance(frame.container, list):
+            frame.container.append(value)
+        elif frame.key is None:
+            if not is_string:
+                raise ValueError(f"Object key must be a string, got {value!r}")
+            frame.key = value
+        else:
+            frame.container[frame.key] = value
+            frame.key = None
+
+    def _open(self, container, events: List[JSONEvent]):
+        """Attach a new container to its parent and push it."""
+        parent = self._stack[-1] if self._stack else None
+        if parent is None:
+            self._root = container
+            path: Tuple[PathKey, ...] = ()
+        elif isinstance(parent.container, list):
+            path = parent.path + (len(parent.container),)
+            parent.container.append(container)
+        else:
+            if parent.key is None:
+                raise ValueError("Object key must be a string")
+            path = parent.path + (parent.key,)
+            parent.container[parent.key] = container
+            parent.key = None
+
+        self._stack.append(_Frame(container, path))
+        events.append(JSONEvent("start", path, container, parent.container if parent else None))
+
+    def _close(self, c: str, events: List[JSONEvent]):
+        """Pop the innermost container."""
+        frame = self._stack.pop()
+        if isinstance(frame.container, dict) != (c == "}"):
+            raise ValueError(f"Mismatched {c!r} in JSON")
+        parent = self._stack[-1].container if self._stack else None
+        events.append(JSONEvent("end", frame.path, frame.container, parent))
+        if not self._stack:
+            self.done = True
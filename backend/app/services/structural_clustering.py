@@ -0,0 +1,239 @@
+"""
+Structural Clustering for Pattern Discovery
+
+Cheap structural similarity between source files, used to split file groups
+into clusters of files that really share a shape, pick medoid samples for
+the AI, and merge near-identical clusters so they cost one discovery call.
+
+How it works:
+- Code is reduced to a structural token stream: keywords and punctuation
+  are kept, identifiers/strings/numbers become ID/STR/NUM, comments dropped
+- Token 5-shingles are hashed (crc32) and summarised by a 64-permutation
+  MinHash signature; equal signature slots estimate Jaccard similarity
+- Files are clustered greedily (leader algorithm) against cluster medoids
+- Each cluster is ordered by centrality, so the first files are the most
+  representative samples
+
+Everything is deterministic (fixed permutations, crc32), so the same tree
+always yields the same clusters and samples.
+
+Usage:
+    from app.services.structural_clustering import StructuralClusterer
+
+    clusterer = StructuralClusterer()
+    signatures = {path: clusterer.signature(content) for path, content in files}
+    for members in clusterer.cluster(signatures):
+        medoid = members[0]
+"""
+
+import re
+import zlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# Keywords kept verbatim in the structural token stream (PHP, JS/TS, Python, ...)
+KEYWORDS = frozenset({
+    "abstract", "as", "async", "await", "break", "case", "catch", "class", "const",
+    "constructor", "continue", "def", "default", "elif", "else", "enum", "export",
+    "extends", "false", "final", "finally", "for", "foreach", "from", "function",
+    "if", "implements", "import", "in", "interface", "lambda", "let", "namespace",
+    "new", "null", "None", "private", "protected", "public", "readonly", "return",
+    "self", "static", "super", "switch", "this", "throw", "trait", "True", "False",
+    "true", "try", "type", "use", "var", "while", "with", "yield",
+})
+
+_TOKEN = re.compile(
+    r"/\*.*?\*/"                              # block comment
+    r"|(?://|#)[^\n]*"                        # line comment
+    r"|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|`(?:\\.|[^`\\])*`"  # strings
+    r"|[A-Za-z_$][\w$]*"                      # identifier / keyword
+    r"|\d[\w.]*"                              # number
+    r"|\S",                                   # punctuation
+    re.DOTALL
+)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+
+
+@dataclass
+class FileCluster:
+    """
+    Files of one structural cluster.
+
+    paths is ordered by centrality (medoid first); signature is the medoid's.
+    """
+
+    key: str
+    extension: str
+    category: str
+    paths: List[str]
+    signature: np.ndarray
+
+    @property
+    def size(self) -> int:
+        return len(self.paths)
+
+
+class StructuralClusterer:
+    """
+    MinHash-based structural clustering of source files.
+    """
+
+    NUM_PERM = 64               # MinHash signature length
+    SHINGLE_SIZE = 5            # tokens per shingle
+    MAX_CHARS = 8000            # prefix of each file that is fingerprinted
+    CLUSTER_THRESHOLD = 0.5     # min similarity to join a cluster
+    MERGE_THRESHOLD = 0.8       # min medoid similarity to merge two clusters
+    MAX_CENTRALITY_SAMPLE = 200 # members compared when ordering large clusters
+
+    def __init__(self, seed: int = 1):
+        """
+        Args:
+            seed: Seed of the MinHash permutations (fixed for stable results)
+        """
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, 1 << 31, size=self.NUM_PERM).astype(np.uint64)
+        self._b = rng.randint(0, 1 << 31, size=self.NUM_PERM).astype(np.uint64)
+
+    def tokens(self, content: str) -> List[str]:
+        """
+        Structural token stream of a source file.
+
+        Args:
+            content: File content
+
+        Returns:
+            Tokens (keywords, punctuation, ID, STR, NUM)
+        """
+        tokens = []
+        for match in _TOKEN.finditer(content[:self.MAX_CHARS]):
+            token = match.group(0)
+            first = token[0]
+            if token.startswith(("/*", "//", "#")):
+                continue
+            if first in "\"'`":
+                tokens.append("STR")
+            elif first.isdigit():
+                tokens.append("NUM")
+            elif first.isalpha() or first in "_$":
+                tokens.append(token if token in KEYWORDS else "ID")
+            else:
+                tokens.append(token)
+        return tokens
+
+    def signature(self, content: str) -> np.ndarray:
+        """
+        MinHash signature of a file's structural shingles.
+
+        Args:
+            content: File content
+
+        Returns:
+            uint64 array of NUM_PERM slots
+        """
+        tokens = self.tokens(content)
+        size = self.SHINGLE_SIZE
+        shingles = {
+            " ".join(tokens[i:i + size])
+            for i in range(max(1, len(tokens) - size + 1))
+        }
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        # (a * x + b) mod p for every permutation, min over shingles
+        permuted = (np.outer(hashes, self._a) + self._b) % np.uint64(_MERSENNE_PRIME)
+        return permuted.min(axis=0)
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.mean(a == b))
+
+    def cluster(self, signatures: Dict[str, np.ndarray]) -> List[List[str]]:
+        """
+        Cluster files by signature (leader algorithm, input order).
+
+        Each file joins the most similar existing cluster if that similarity
+        reaches CLUSTER_THRESHOLD, otherwise it starts a new cluster.
+
+        Args:
+            signatures: path -> signature (iteration order decides leaders)
+
+        Returns:
+            Clusters, largest first, each ordered by centrality (medoid first)
+        """
+        if not signatures:
+            return []
+
+        leaders: List[np.ndarray] = []
+        members: List[List[str]] = []
+
+        for path, signature in signatures.items():
+            if leaders:
+                scores = np.mean(np.stack(leaders) == signature, axis=1)
+                best = int(np.argmax(scores))
+                if scores[best] >= self.CLUSTER_THRESHOLD:
+                    members[best].append(path)
+                    continue
+            leaders.append(signature)
+            members.append([path])
+
+        clusters = [self._order_by_centrality(paths, signatures) for paths in members]
+        clusters.sort(key=len, reverse=True)
+        return clusters
+
+    def merge(self, clusters: List[FileCluster]) -> List[FileCluster]:
+        """
+        Merge near-identical clusters of the same extension.
+
+        The larger cluster absorbs the smaller one (its key, category and
+        medoid are kept; absorbed paths are appended).
+
+        Args:
+            clusters: Clusters from any number of groups
+
+        Returns:
+            Merged clusters, largest first
+        """
+        merged: List[FileCluster] = []
+
+        for cluster in sorted(clusters, key=lambda c: c.size, reverse=True):
+            target = next(
+                (
+                    existing for existing in merged
+                    if existing.extension == cluster.extension
+                    and self.similarity(existing.signature, cluster.signature) >= self.MERGE_THRESHOLD
+                ),
+                None
+            )
+            if target is None:
+                merged.append(cluster)
+            else:
+                logger.debug(f"Merging cluster {cluster.key} into {target.key}")
+                target.paths.extend(cluster.paths)
+
+        return merged
+
+    def _order_by_centrality(self, paths: List[str], signatures: Dict[str, np.ndarray]) -> List[str]:
+        """Order paths by mean similarity to the other members (medoid first)."""
+        if len(paths) <= 2:
+            return list(paths)
+
+        # Large clusters: centrality measured against an evenly spaced subset
+        step = max(1, len(paths) // self.MAX_CENTRALITY_SAMPLE)
+        reference = np.stack([signatures[path] for path in paths[::step]])
+
+        matrix = np.stack([signatures[path] for path in paths])
+        centrality = np.array([np.mean(np.mean(reference == row, axis=1)) for row in matrix])
+
+        # Stable: ties keep input (path) order
+        order = np.argsort(-centrality, kind="stable")
+        return [paths[i] for i in order]
@@ -0,0 +1,495 @@
+"""
+Project Symbol Index
+
+Persistent per-project symbol table (project_symbols) shared by the
+consistency validators, ContextBuilder and the codebase indexer.
+
+Symbols are extracted once per source - a TaskResult's output_code when it
+is saved, a project file when it is (re)indexed - and stored with the
+content hash they came from. Consumers query the table instead of
+re-running regexes over every output, so a consistency check only parses
+the sources that changed.
+
+Kinds:
+- Definitions: class, function, method, field (owner = class), export
+- Usages: import, reference, call, access (kept for TaskResult sources only;
+  indexed files store definitions and imports)
+
+Usage:
+    from app.services.symbol_index import ProjectSymbolIndex
+
+    index = ProjectSymbolIndex(db)
+    index.update_task_result(project_id, task_result)
+
+    table = index.load_table(project_id, task_ids=[...])
+    for symbol in table.definitions("class"):
+        print(symbol.name, symbol.file_path)
+"""
+
+import re
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import and_, insert, or_
+from sqlalchemy.orm import Session
+
+from app.models.project_symbol import ProjectSymbol
+from app.services.fs_snapshot import EXTENSION_LANGUAGES
+
+logger = logging.getLogger(__name__)
+
+
+SOURCE_TASK = "task"
+SOURCE_FILE = "file"
+
+DEFINITION_KINDS = ("class", "function", "method", "field", "export")
+USAGE_KINDS = ("import", "reference", "call", "access")
+# Row recorded for a TaskResult without symbols: marks its content hash as extracted
+MARKER_KIND = "none"
+
+# Languages whose files carry symbols (None = unknown, e.g. generated code without path)
+CODE_LANGUAGES = {"php", "typescript", "javascript", "python", None}
+
+
+@dataclass(frozen=True)
+class Symbol:
+    """One extracted symbol (source-independent)."""
+
+    kind: str
+    name: str
+    owner: Optional[str] = None
+    qualified_name: Optional[str] = None
+    language: Optional[str] = None
+
+
+# Extraction patterns (same heuristics the validators used to run inline)
+_NAMESPACE = re.compile(r'namespace\s+([\w\\]+)')
+_CLASS = re.compile(r'class\s+(\w+)')
+_CALLABLE = re.compile(r'(?:function|public|private|protected|def)\s+(\w+)\s*\(')
+_PHP_FIELD = re.compile(
+    r'(?:private|public|protected|var)(?:\s+(?:static|readonly))*(?:\s+\??[\w\\]+)?\s+\$(\w+)'
+)
+_TS_MEMBER = re.compile(r'(?:private|public|protected)(?:\s+(?:static|readonly))*\s+(\w+)\s*[?!]?\s*[:=;]')
+_TYPED_FIELD = re.compile(r'(\w+)\??:\s*(?:string|number|boolean|Date)\b')
+_TS_EXPORT = re.compile(
+    r'export\s+(?:default\s+)?(?:abstract\s+)?(?:async\s+)?'
+    r'(?:class|function|const|let|interface|type|enum)\s+(\w+)'
+)
+_PHP_USE = re.compile(r'use\s+([\w\\]+);')
+_TS_NAMED_IMPORT = re.compile(r'import\s+(?:type\s+)?{([^}]+)}\s+from\s+[\'"]([^\'"]+)[\'"]')
+_TS_DEFAULT_IMPORT = re.compile(r'import\s+(\w+)\s+from\s+[\'"]([^\'"]+)[\'"]')
+_PY_FROM_IMPORT = re.compile(r'from\s+([\w.]+)\s+import\s+(?:\(([^)]*)\)|([\w, \t]+))')
+_IDENTIFIER = re.compile(r'\w+')
+_REFERENCE = re.compile(r'\b([A-Z]\w+)(?:\(|::)')
+_CALL = re.compile(r'(?:\$\w+|\w+)(?:->|\.)(\w+)\(')
+_ACCESS = re.compile(r'(?:\$\w+->|\b\w+\.)([A-Za-z_]\w*)\b(?!\s*\()')
+
+_KEYWORDS = {"function", "static", "readonly", "abstract", "const", "class"}
+
+
+def extract_symbols(
+    code: str,
+    language: Optional[str] = None,
+    usages: bool = True
+) -> List[Symbol]:
+    """
+    Extract definitions, exports, imports (and optionally usages) from code.
+
+    Language-agnostic on purpose: generated code often has no reliable
+    language, so PHP, TypeScript/JavaScript and Python syntax are matched
+    together. Methods and fields belong to the first class of the code.
+
+    Args:
+        code: Source code
+        language: Known language (recorded on definitions; None if unknown)
+        usages: Also extract references, calls and field accesses
+
+    Returns:
+        De-duplicated symbols in first-seen order
+    """
+    if language not in CODE_LANGUAGES or not code:
+        return []
+
+    symbols: Dict[Symbol, None] = {}
+
+    def add(kind: str, name: str, owner: str = None, qualified: str = None, lang: str = language):
+        name = name.strip()
+        if _IDENTIFIER.fullmatch(name) and name not in _KEYWORDS:
+            symbols[Symbol(kind, name[:255], owner, qualified, lang)] = None
+
+    namespace_match = _NAMESPACE.search(code)
+    namespace = namespace_match.group(1) if namespace_match else None
+
+    classes = _CLASS.findall(code)
+    owner = classes[0] if classes else None
+
+    for class_name in classes:
+        add("class", class_name, qualified=f"{namespace}\\{class_name}" if namespace else None)
+
+    for name in _CALLABLE.findall(code):
+        add("method" if owner else "function", name, owner=owner)
+
+    if owner:
+        for pattern in (_PHP_FIELD, _TS_MEMBER, _TYPED_FIELD):
+            for name in pattern.findall(code):
+                add("field", name, owner=owner)
+
+    # Exports: namespaced PHP class + TS/JS export declarations
+    if namespace and owner:
+        add("export", owner, qualified=f"{namespace}\\{owner}")
+    for name in _TS_EXPORT.findall(code):
+        add("export", name)
+
+    # Imports, tagged with the syntax they were found in
+    for full_name in _PHP_USE.findall(code):
+        add("import", full_name.split("\\")[-1], qualified=full_name, lang="php")
+    for items, module in _TS_NAMED_IMPORT.findall(code):
+        for item in items.split(","):
+            add("import", _import_name(item), qualified=module, lang="typescript")
+    for name, module in _TS_DEFAULT_IMPORT.findall(code):
+        add("import", name, qualified=module, lang="typescript")
+    for module, grouped, items in _PY_FROM_IMPORT.findall(code):
+        for item in (grouped or items).split(","):
+            add("import", _import_name(item), qualified=module, lang="python")
+
+    if usages:
+        for name in _REFERENCE.findall(code):
+            add("reference", name)
+        for name in _CALL.findall(code):
+            add("call", name)
+        for name in _ACCESS.findall(code):
+            add("access", name)
+
+    return list(symbols)
+
+
+def _import_name(item: str) -> str:
+    """Imported name of "Name", "Name as Alias" or "type Name"."""
+    name = item.split(" as ")[0].strip()
+    return name[5:] if name.startswith("type ") else name
+
+
+def language_for_path(file_path: Optional[str]) -> Optional[str]:
+    """Language of a target path by extension (None if unknown)."""
+    if not file_path:
+        return None
+    name = file_path.rsplit("/", 1)[-1].lower()
+    ext = name[name.rfind("."):] if "." in name else ""
+    return EXTENSION_LANGUAGES.get(ext)
+
+
+def content_hash(code: str) -> str:
+    return hashlib.sha256((code or "").encode("utf-8")).hexdigest()
+
+
+class SymbolTable:
+    """
+    In-memory view over symbol rows (ProjectSymbol instances).
+
+    Definitions are project-wide; usages are limited to the sources the
+    table was loaded for (the batch being validated).
+    """
+
+    def __init__(self, rows: Iterable[ProjectSymbol], usage_sources: Optional[Set[str]] = None):
+        self.rows = list(rows)
+        self.usage_sources = usage_sources
+
+    @classmethod
+    def from_task_results(cls, task_results: List) -> "SymbolTable":
+        """
+        Build a table straight from TaskResults (no database).
+
+        Args:
+            task_results: TaskResult-like objects (task_id, output_code, file_path)
+
+        Returns:
+            SymbolTable with definitions and usages of those results
+        """
+        rows = []
+        for result in task_results:
+            code = result.output_code or ""
+            digest = content_hash(code)
+            for symbol in extract_symbols(code, language_for_path(result.file_path)):
+                rows.append(_to_row(None, SOURCE_TASK, str(result.task_id), result.file_path, digest, symbol))
+        return cls(rows)
+
+    def definitions(self, kind: str) -> List[ProjectSymbol]:
+        return [row for row in self.rows if row.kind == kind]
+
+    def usages(self, kind: str) -> List[ProjectSymbol]:
+        return [
+            row for row in self.rows
+            if row.kind == kind and row.source == SOURCE_TASK
+            and (self.usage_sources is None or row.source_key in self.usage_sources)
+        ]
+
+
+def _to_row(
+    project_id: Optional[UUID],
+    source: str,
+    source_key: str,
+    file_path: Optional[str],
+    digest: str,
+    symbol: Symbol
+) -> ProjectSymbol:
+    return ProjectSymbol(
+        project_id=project_id,
+        source=source,
+        source_key=source_key,
+        file_path=file_path,
+        content_hash=digest,
+        kind=symbol.kind,
+        name=symbol.name,
+        owner=symbol.owner,
+        qualified_name=symbol.qualified_name,
+        language=symbol.language
+    )
+
+
+class ProjectSymbolIndex:
+    """
+    Maintains and queries the project_symbols table.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Args:
+            db: SQLAlchemy database session
+        """
+        self.db = db
+
+    # ------------------------------------------------------------------ writes
+
+    def update_task_result(self, project_id: UUID, task_result, commit: bool = True):
+        """
+        Replace the symbols of one TaskResult (call after saving or editing it).
+
+        Args:
+            project_id: Project the task belongs to
+            task_result: TaskResult with task_id, output_code and file_path
+            commit: Commit the transaction
+        """
+        self.update_task_results(project_id, [task_result], commit=commit)
+
+    def update_task_results(self, project_id: UUID, task_results: List, commit: bool = True):
+        """
+        Replace the symbols of several TaskResults in one transaction.
+
+        Args:
+            project_id: Project the tasks belong to
+            task_results: TaskResults to (re)extract
+            commit: Commit the transaction
+        """
+        if not task_results:
+            return
+
+        keys = [str(result.task_id) for result in task_results]
+        self._delete_sources(project_id, SOURCE_TASK, keys)
+
+        rows = []
+        for result in task_results:
+            code = result.output_code or ""
+            symbols = extract_symbols(code, language_for_path(result.file_path)) or [Symbol(MARKER_KIND, "")]
+            rows.extend(self._mappings(
+                project_id, SOURCE_TASK, str(result.task_id), result.file_path, content_hash(code), symbols
+            ))
+        self._insert(rows)
+
+        if commit:
+            self.db.commit()
+
+    def sync_task_results(self, project_id: UUID, task_results: List) -> int:
+        """
+        Re-extract only TaskResults whose stored symbols are missing or stale.
+
+        Results without symbols have a MARKER_KIND row, so they are not
+        re-extracted either.
+
+        Args:
+            project_id: Project the tasks belong to
+            task_results: TaskResults about to be validated
+
+        Returns:
+            Number of TaskResults that were (re)extracted
+        """
+        keys = [str(result.task_id) for result in task_results]
+        if not keys:
+            return 0
+
+        stored = dict(
+            self.db.query(ProjectSymbol.source_key, ProjectSymbol.content_hash).filter(
+                ProjectSymbol.project_id == project_id,
+                ProjectSymbol.source == SOURCE_TASK,
+                ProjectSymbol.source_key.in_(keys)
+            ).distinct().all()
+        )
+
+        stale = [
+            result for result in task_results
+            if stored.get(str(result.task_id)) != content_hash(result.output_code)
+        ]
+        if stale:
+            self.update_task_results(project_id, stale)
+
+        return len(stale)
+
+    def replace_file_symbols(
+        self,
+        project_id: UUID,
+        files: Dict[str, Tuple[str, List[Symbol]]],
+        commit: bool = False
+    ):
+        """
+        Replace the symbols of indexed files (called by the codebase indexer).
+
+        Args:
+            project_id: Project UUID
+            files: {relative path: (content hash, symbols)}
+            commit: Commit the transaction (the indexer commits its batch)
+        """
+        if not files:
+            return
+
+        self._delete_sources(project_id, SOURCE_FILE, list(files))
+
+        rows = []
+        for rel_path, (digest, symbols) in files.items():
+            rows.extend(self._mappings(project_id, SOURCE_FILE, rel_path, rel_path, digest, symbols))
+        self._insert(rows)
+
+        if commit:
+            self.db.commit()
+
+    def remove_file_symbols(self, project_id: UUID, rel_paths: Optional[List[str]] = None):
+        """
+        Drop symbols of removed files (all files of the project if None).
+
+        Args:
+            project_id: Project UUID
+            rel_paths: Relative paths of removed files
+        """
+        query = self.db.query(ProjectSymbol).filter(
+            ProjectSymbol.project_id == project_id,
+            ProjectSymbol.source == SOURCE_FILE
+        )
+        if rel_paths is not None:
+            if not rel_paths:
+                return
+            query = query.filter(ProjectSymbol.source_key.in_(rel_paths))
+        query.delete(synchronize_session=False)
+
+    # ----------------------------------------------------------------- queries
+
+    def load_table(self, project_id: UUID, task_ids: Iterable) -> SymbolTable:
+        """
+        Load project-wide definitions plus the usages of the given tasks.
+
+        Args:
+            project_id: Project UUID
+            task_ids: Tasks whose usages should be checked
+
+        Returns:
+            SymbolTable for the validators
+        """
+        keys = {str(task_id) for task_id in task_ids}
+
+        rows = self.db.query(ProjectSymbol).filter(
+            ProjectSymbol.project_id == project_id,
+            or_(
+                ProjectSymbol.kind.in_(DEFINITION_KINDS),
+                and_(
+                    ProjectSymbol.source == SOURCE_TASK,
+                    ProjectSymbol.source_key.in_(keys),
+                    ProjectSymbol.kind != MARKER_KIND
+                )
+            )
+        ).all()
+
+        return SymbolTable(rows, usage_sources=keys)
+
+    def definitions_for_tasks(self, project_id: UUID, task_ids: Iterable) -> List[ProjectSymbol]:
+        """
+        Definitions produced by the given tasks (their public surface).
+
+        Args:
+            project_id: Project UUID
+            task_ids: Task ids
+
+        Returns:
+            ProjectSymbol rows
+        """
+        keys = [str(task_id) for task_id in task_ids]
+        if not keys:
+            return []
+
+        return self.db.query(ProjectSymbol).filter(
+            ProjectSymbol.project_id == project_id,
+            ProjectSymbol.source == SOURCE_TASK,
+            ProjectSymbol.source_key.in_(keys),
+            ProjectSymbol.kind.in_(DEFINITION_KINDS)
+        ).all()
+
+    def find_definitions(self, project_id: UUID, names: Iterable[str]) -> List[ProjectSymbol]:
+        """
+        Classes with the given names plus their methods and fields.
+
+        Args:
+            project_id: Project UUID
+            names: Class names (e.g. mentioned in a task description)
+
+        Returns:
+            ProjectSymbol rows
+        """
+        names = list(set(names))
+        if not names:
+            return []
+
+        return self.db.query(ProjectSymbol).filter(
+            ProjectSymbol.project_id == project_id,
+            or_(
+                and_(ProjectSymbol.kind == "class", ProjectSymbol.name.in_(names)),
+                and_(ProjectSymbol.kind.in_(("method", "field")), ProjectSymbol.owner.in_(names))
+            )
+        ).all()
+
+    # ---------------------------------------------------------------- helpers
+
+    def _delete_sources(self, project_id: UUID, source: str, keys: List[str]):
+        self.db.query(ProjectSymbol).filter(
+            ProjectSymbol.project_id == project_id,
+            ProjectSymbol.source == source,
+            ProjectSymbol.source_key.in_(keys)
+        ).delete(synchronize_session=False)
+
+    def _mappings(
+        self,
+        project_id: UUID,
+        source: str,
+        source_key: str,
+        file_path: Optional[str],
+        digest: str,
+        symbols: List[Symbol]
+    ) -> List[Dict]:
+        return [
+            {
+                "id": uuid4(),
+                "project_id": project_id,
+                "source": source,
+                "source_key": source_key,
+                "file_path": file_path,
+                "content_hash": digest,
+                "kind": symbol.kind,
+                "name": symbol.name,
+                "owner": symbol.owner,
+                "qualified_name": symbol.qualified_name,
+                "language": symbol.language
+            }
+            for symbol in symbols
+        ]
+
+    def _insert(self, rows: List[Dict]):
+        if rows:
+            self.db.execute(insert(ProjectSymbol), rows)
@@ -5,12 +5,15 @@ PROMPT #70 - Refactor task_executor.py
 This module handles:
 - Batch execution of multiple tasks
 - Dependency resolution via topological sort
+- Concurrent execution of tasks whose dependencies are done
 - Progress tracking and broadcasting
 - Consistency validation after batch
 """
 
-from typing import List
+import asyncio
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from sqlalchemy.orm import Session
+from app.config import settings
 from app.models.task import Task
 from app.models.task_result import TaskResult
 from app.api.websocket import broadcast_event
@@ -26,6 +29,8 @@ class BatchExecutor:
 
     Features:
     - Topological sort for dependency resolution
+    - Independent tasks run concurrently (TASK_BATCH_CONCURRENCY)
+    - A failed task only skips its dependents
     - Progress tracking and broadcasting
     - Consistency validation after batch
     - Resilient to individual task failures
@@ -38,29 +43,47 @@ class BatchExecutor:
         self,
         task_ids: List[str],
         project_id: str,
-        execute_task_func
+        execute_task_func,
+        max_concurrency: Optional[int] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
     ) -> List[TaskResult]:
         """
         Execute multiple tasks respecting dependencies.
 
+        Ready-queue over the dependency DAG: every task whose dependencies
+        in the batch have completed starts at once, up to max_concurrency
+        running together, so wall-clock time follows the critical path
+        instead of the number of tasks. A failed task skips its (transitive)
+        dependents only; dependencies outside the batch count as done.
+
         Args:
             task_ids: List of task IDs (UUIDs)
             project_id: Project ID (UUID)
-            execute_task_func: Function to execute single task (async)
+            execute_task_func: Function to execute single task (async);
+                called concurrently, so it must not share a Session
+            max_concurrency: Tasks running at once (default: TASK_BATCH_CONCURRENCY)
+            on_progress: Called with (finished, total) after each task
+            is_cancelled: Checked before starting tasks; running ones finish
 
         Returns:
-            List of TaskResults
+            List of TaskResults (completion order)
         """
-        logger.info(f"🚀 Executing batch of {len(task_ids)} tasks")
+        max_concurrency = max(1, max_concurrency or settings.task_batch_concurrency)
+        logger.info(f"🚀 Executing batch of {len(task_ids)} tasks (up to {max_concurrency} at once)")
 
         results = []
         total_tasks = len(task_ids)
-        completed = 0
+        completed = failed = 0
         total_cost = 0.0
+        skipped: List[str] = []
 
-        # Order tasks by dependencies (tasks without deps first)
+        # Order tasks by dependencies (tasks without deps first); ready tasks start in this order
         tasks = self.db.query(Task).filter(Task.id.in_(task_ids)).all()
         ordered_tasks = self._topological_sort(tasks)
+        waiting_on, dependents = self._dependency_graph(ordered_tasks)
+        pending = {str(task.id): task for task in ordered_tasks}
+        running: Dict[asyncio.Task, str] = {}
 
         # Broadcast: Batch started
         await broadcast_event(
@@ -72,12 +95,54 @@ class BatchExecutor:
             }
         )
 
-        for task in ordered_tasks:
-            try:
-                result = await execute_task_func(str(task.id), project_id)
-                results.append(result)
-                completed += 1
-                total_cost += result.cost
+        while pending or running:
+            cancelled = is_cancelled is not None and is_cancelled()
+            if cancelled and not running:
+                logger.info(f"🛑 Batch cancelled with {len(pending)} tasks not started")
+                break
+
+            if not cancelled:
+                for task_id in [tid for tid in pending if not waiting_on[tid]]:
+                    if len(running) >= max_concurrency:
+                        break
+                    del pending[task_id]
+                    running[asyncio.create_task(execute_task_func(task_id, project_id))] = task_id
+
+                if not running:
+                    # Only tasks in a dependency cycle are left: release them one at a time
+                    task_id = next(iter(pending))
+                    logger.warning(f"Possible circular dependency, running task {task_id} anyway")
+                    waiting_on[task_id].clear()
+                    continue
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+
+            # Counters and broadcasts are only touched here, one finished task at a time
+            for finished in done:
+                task_id = running.pop(finished)
+                try:
+                    result = finished.result()
+                except Exception as e:
+                    failed += 1
+                    logger.error(f"  ❌ Task {task_id} failed: {str(e)}")
+                    for blocked in self._dependents_of(task_id, dependents):
+                        if pending.pop(blocked, None) is not None:
+                            skipped.append(blocked)
+                            await broadcast_event(
+                                project_id=project_id,
+                                event_type="task_skipped",
+                                data={"task_id": blocked, "blocked_by": task_id}
+                            )
+                            logger.warning(f"  ⏭️  Task {blocked} skipped: depends on failed task {task_id}")
+                else:
+                    results.append(result)
+                    completed += 1
+                    total_cost += result.cost
+                    for dependent in dependents[task_id]:
+                        waiting_on[dependent].discard(task_id)
+                    logger.info(f"  ✅ Task {task_id} completed ({completed}/{total_tasks})")
+
+                finished_count = completed + failed + len(skipped)
 
                 # Broadcast: Batch progress
                 await broadcast_event(
@@ -85,16 +150,15 @@ class BatchExecutor:
                     event_type="batch_progress",
                     data={
                         "completed": completed,
+                        "failed": failed,
+                        "skipped": len(skipped),
                         "total": total_tasks,
-                        "percentage": round((completed / total_tasks) * 100, 1),
+                        "percentage": round((finished_count / total_tasks) * 100, 1),
                         "total_cost": round(total_cost, 4)
                     }
                 )
-
-                logger.info(f"  ✅ Task {task.id} completed ({completed}/{total_tasks})")
-            except Exception as e:
-                logger.error(f"  ❌ Task {task.id} failed: {str(e)}")
-                # Continue with next tasks
+                if on_progress is not None:
+                    on_progress(finished_count, total_tasks)
 
         # Broadcast: Batch completed
         await broadcast_event(
@@ -103,7 +167,8 @@ class BatchExecutor:
             data={
                 "total_tasks": total_tasks,
                 "completed": len(results),
-                "failed": total_tasks - len(results),
+                "failed": total_tasks - len(results) - len(skipped),
+                "skipped": len(skipped),
                 "total_cost": round(total_cost, 4)
             }
         )
@@ -158,6 +223,38 @@ class BatchExecutor:
         elif validation_result['total_issues'] == 0:
             logger.info("✅ No consistency issues found!")
 
+    def _dependency_graph(self, tasks: List[Task]) -> Tuple[Dict[str, Set[str]], Dict[str, Set[str]]]:
+        """
+        Dependencies of each task within the batch, and the reverse edges.
+
+        Args:
+            tasks: List of Task objects
+
+        Returns:
+            (task ID -> IDs it waits on, task ID -> IDs waiting on it)
+        """
+        batch = {str(task.id) for task in tasks}
+        waiting_on = {
+            str(task.id): {str(dep_id) for dep_id in (task.depends_on or []) if str(dep_id) in batch}
+            for task in tasks
+        }
+        dependents: Dict[str, Set[str]] = {task_id: set() for task_id in batch}
+        for task_id, deps in waiting_on.items():
+            for dep_id in deps:
+                dependents[dep_id].add(task_id)
+        return waiting_on, dependents
+
+    def _dependents_of(self, task_id: str, dependents: Dict[str, Set[str]]) -> List[str]:
+        """All tasks depending on a task, directly or transitively."""
+        found: List[str] = []
+        stack = list(dependents.get(task_id, ()))
+        while stack:
+            current = stack.pop()
+            if current not in found:
+                found.append(current)
+                stack.extend(dependents.get(current, ()))
+        return found
+
     def _topological_sort(self, tasks: List[Task]) -> List[Task]:
         """
         Order tasks by dependencies (topological sort).
@@ -7,15 +7,21 @@ This module handles:
 - JIRA hierarchy context integration
 - Interview insights traceability
 - Acceptance criteria formatting
+- Known project symbols (from the project symbol table)
+- Interface summaries of dependency outputs (full code on demand)
 """
 
-from typing import Dict, Any
+import re
+from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
+from app.config import settings
 from app.models.task import Task
 from app.models.project import Project
 from app.models.task_result import TaskResult
 from app.services.task_hierarchy import TaskHierarchyService
 from app.services.codebase_indexer import CodebaseIndexer
+from app.services.symbol_index import ProjectSymbolIndex
+from app.services.task_execution.interface_summary import extract_interface
 import logging
 
 logger = logging.getLogger(__name__)
@@ -30,17 +36,25 @@ class ContextBuilder:
     - JIRA hierarchy integration (Epic → Story → Task)
     - Interview insights traceability
     - Acceptance criteria formatting
+    - Known symbols of dependencies and mentioned classes
+    - Dependency outputs as interface summaries (signatures, types, routes, schema)
     """
 
+    # Symbol context limits (keep it a compact reference, not a code dump)
+    MAX_SYMBOL_CLASSES = 15
+    MAX_MEMBERS_PER_CLASS = 12
+
     def __init__(self, db: Session):
         self.db = db
+        self.symbol_index = ProjectSymbolIndex(db)
 
     async def build_context(
         self,
         task: Task,
         project: Project,
         orchestrator,
-        specs_context: str = ""
+        specs_context: str = "",
+        full_dependency_code: Optional[bool] = None
     ) -> str:
         """
         Build surgical context using orchestrator.
@@ -50,7 +64,7 @@ class ContextBuilder:
         Includes:
         - Framework specs (Phase 4!)
         - Project spec
-        - Outputs of dependent tasks
+        - Outputs of dependent tasks (interface summaries by default)
         - Patterns from stack
         - Conventions
 
@@ -59,6 +73,8 @@ class ContextBuilder:
             project: Project object
             orchestrator: Stack orchestrator
             specs_context: Pre-formatted specs context (optional)
+            full_dependency_code: Paste dependency outputs in full
+                (default: not TASK_CONTEXT_DEPENDENCY_SUMMARIES)
 
         Returns:
             Complete context string for AI
@@ -66,17 +82,22 @@ class ContextBuilder:
         # Fetch project spec
         spec = getattr(project, 'spec', {})
 
-        # Fetch outputs of dependent tasks
+        # Fetch outputs of dependent tasks (one query)
+        if full_dependency_code is None:
+            full_dependency_code = not settings.task_context_dependency_summaries
         previous_outputs = {}
 
         if task.depends_on:
-            for dep_id in task.depends_on:
-                dep_result = self.db.query(TaskResult).filter(
-                    TaskResult.task_id == dep_id
-                ).first()
+            dep_results = self.db.query(TaskResult).filter(
+                TaskResult.task_id.in_(task.depends_on)
+            ).all()
+
+            by_task = {str(dep_result.task_id): dep_result for dep_result in dep_results}
 
+            for dep_id in task.depends_on:
+                dep_result = by_task.get(str(dep_id))
                 if dep_result:
-                    previous_outputs[str(dep_id)] = dep_result.output_code
+                    previous_outputs[str(dep_id)] = self._dependency_output(dep_result, full_dependency_code)
 
         # Use orchestrator to build task context
         orchestrator_context = orchestrator.build_task_context(
@@ -101,8 +122,109 @@ class ContextBuilder:
             context = code_context + "\n" + context
             logger.info("✨ PROMPT #89: Code context integrated from RAG")
 
+        # Exact names the new code must line up with (symbol table, no parsing)
+        symbol_context = self._build_symbol_context(task, project)
+        if symbol_context:
+            context = symbol_context + "\n" + context
+            logger.info("Known project symbols integrated into context")
+
         return context
 
+    def _dependency_output(self, result: TaskResult, full_code: bool) -> str:
+        """
+        What a dependent task sees of a dependency's output.
+
+        The interface summary stored with the result (extracted now for
+        results saved before summaries existed); the full code when asked
+        for, or when no summary is shorter than the code itself.
+
+        Args:
+            result: TaskResult of the dependency
+            full_code: Return the full output_code
+
+        Returns:
+            Code or interface summary
+        """
+        code = result.output_code or ""
+        if full_code:
+            return code
+
+        summary = result.interface_summary
+        if summary is None:
+            summary = extract_interface(code)
+        if not summary or len(summary) >= len(code):
+            return code
+
+        file_label = result.file_path or "generated file"
+        return f"(Interface of {file_label} - implementation omitted)\n{summary}"
+
+    def _build_symbol_context(self, task: Task, project: Project) -> str:
+        """
+        List the classes, methods and fields the task is likely to use.
+
+        Looks up, in the project symbol table, the definitions produced by the
+        tasks this one depends on plus any class named in its title or
+        description, so generated code uses the exact existing names.
+
+        Args:
+            task: Task being executed
+            project: Project object
+
+        Returns:
+            Formatted symbol context string or empty string
+        """
+        try:
+            symbols = list(self.symbol_index.definitions_for_tasks(project.id, task.depends_on or []))
+
+            text = " ".join(filter(None, [task.title, task.description]))
+            mentioned = set(re.findall(r"\b[A-Z][A-Za-z0-9]+\b", text))
+            if mentioned:
+                symbols.extend(self.symbol_index.find_definitions(project.id, mentioned))
+        except Exception as e:
+            logger.error(f"Error loading project symbols: {e}")
+            return ""
+
+        classes: Dict[str, Dict[str, Any]] = {}
+        functions: List[str] = []
+        for symbol in symbols:
+            if symbol.kind == "class":
+                entry = classes.setdefault(symbol.name, {"path": None, "methods": [], "fields": []})
+                entry["path"] = entry["path"] or symbol.file_path
+            elif symbol.kind in ("method", "field") and symbol.owner:
+                entry = classes.setdefault(symbol.owner, {"path": None, "methods": [], "fields": []})
+                members = entry["methods" if symbol.kind == "method" else "fields"]
+                if symbol.name not in members:
+                    members.append(symbol.name)
+            elif symbol.kind == "function" and symbol.name not in functions:
+                functions.append(symbol.name)
+
+        if not classes and not functions:
+            return ""
+
+        context_parts = [
+            "=" * 80,
+            "KNOWN PROJECT SYMBOLS",
+            "=" * 80,
+            "",
+            "Use these exact names when referring to existing code:",
+            ""
+        ]
+
+        for name, entry in list(classes.items())[:self.MAX_SYMBOL_CLASSES]:
+            context_parts.append(f"- {name}" + (f" ({entry['path']})" if entry["path"] else ""))
+            if entry["methods"]:
+                methods = entry["methods"][:self.MAX_MEMBERS_PER_CLASS]
+                context_parts.append(f"    methods: {', '.join(m + '()' for m in methods)}")
+            if entry["fields"]:
+                context_parts.append(f"    fields: {', '.join(entry['fields'][:self.MAX_MEMBERS_PER_CLASS])}")
+
+        if functions:
+            context_parts.append(f"- functions: {', '.join(f + '()' for f in functions[:self.MAX_MEMBERS_PER_CLASS])}")
+
+        context_parts.append("")
+
+        return "\n".join(context_parts)
+
     async def _retrieve_code_context(
         self,
         task: Task,
@@ -140,12 +262,12 @@ class ContextBuilder:
             # Detect language from task type or labels
             language = self._detect_task_language(task, project)
 
-            # Search for similar code
+            # Search for similar code regions (structure-aware chunks)
             results = await indexer.search_code(
                 project_id=project.id,
                 query=query,
                 language=language,
-                top_k=3  # Limit to 3 most relevant files
+                top_k=5  # Limit to 5 most relevant regions
             )
 
             if not results:
@@ -158,8 +280,8 @@ class ContextBuilder:
                 "RELEVANT CODE FROM PROJECT (RAG)",
                 "=" * 80,
                 "",
-                "The following code files from your project are relevant to this task.",
-                "Use them as reference for conventions, patterns, and structure.",
+                "The following code from your project is relevant to this task.",
+                "Use it as reference for conventions, patterns, and structure.",
                 ""
             ]
 
@@ -167,7 +289,28 @@ class ContextBuilder:
                 metadata = result.get("metadata", {})
                 file_path = metadata.get("file_path", "unknown")
                 similarity = result.get("similarity", 0.0)
+                content = result.get("content", "")
+
+                if metadata.get("type") == "code_chunk":
+                    # Exact region: symbol + line range + code
+                    context_parts.append(f"--- Relevant Code {i} (Similarity: {similarity:.2f}) ---")
+                    context_parts.append(
+                        f"Path: {file_path} "
+                        f"(lines {metadata.get('start_line')}-{metadata.get('end_line')})"
+                    )
+                    if metadata.get("symbol"):
+                        context_parts.append(f"Symbol: {metadata['symbol']}")
+
+                    code_lines = content.split("\n")
+                    code_start = next((j for j, line in enumerate(code_lines) if line == "Code:"), None)
+                    if code_start is not None:
+                        context_parts.append("\nCode:")
+                        context_parts.append("\n".join(code_lines[code_start+1:]))
 
+                    context_parts.append("")
+                    continue
+
+                # Legacy file-level document (indexed before chunking)
                 context_parts.append(f"--- Similar File {i} (Similarity: {similarity:.2f}) ---")
                 context_parts.append(f"Path: {file_path}")
 
@@ -182,11 +325,10 @@ class ContextBuilder:
                     context_parts.append(f"Components: {', '.join(metadata['components'][:5])}")
 
                 # Include content preview
-                content = result.get("content", "")
                 if content:
                     # Extract just the content preview part (after "Content Preview:")
                     preview_lines = content.split("\n")
-                    preview_start = next((i for i, line in enumerate(preview_lines) if "Content Preview:" in line), None)
+                    preview_start = next((j for j, line in enumerate(preview_lines) if "Content Preview:" in line), None)
                     if preview_start is not None:
                         preview = "\n".join(preview_lines[preview_start+1:preview_start+21])  # 20 lines preview
                         context_parts.append("\nCode Preview:")
@@ -201,7 +343,7 @@ class ContextBuilder:
             context_parts.append("- Code style and formatting")
             context_parts.append("")
 
-            logger.info(f"Retrieved {len(results)} relevant code files from RAG")
+            logger.info(f"Retrieved {len(results)} relevant code regions from RAG")
 
             return "\n".join(context_parts)
 
@@ -10,13 +10,15 @@ This module contains the core task execution logic:
 
 Features:
 - Intelligent model selection (Haiku vs Sonnet)
-- Automatic validation and regeneration (up to 3 attempts)
-- Real-time cost calculation
+- Automatic validation and repair (up to 3 attempts)
+- Real-time cost calculation (prompt caching included)
 - WebSocket event broadcasting
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import SessionLocal
 from app.models.task import Task
 from app.models.task_result import TaskResult
 from app.models.project import Project
@@ -28,9 +30,13 @@ from app.services.task_execution.project_spec_fetcher import ProjectSpecFetcher
 from app.services.task_execution.context_builder import ContextBuilder
 from app.services.task_execution.budget_manager import BudgetManager
 from app.services.task_execution.batch_executor import BatchExecutor
+from app.services.task_execution.interface_summary import extract_interface
+from app.services.task_execution.repair import apply_repair, generation_messages, repair_messages
+from app.services.symbol_index import ProjectSymbolIndex
 # PROMPT #103 - External prompts support
 from app.prompts import get_prompt_service
 import anthropic
+import asyncio
 import time
 import os
 import logging
@@ -46,7 +52,7 @@ class TaskExecutor:
     Features:
     - Intelligent model selection (Haiku for simple, Sonnet for complex)
     - Surgical context (3-5k tokens vs 200k)
-    - Automatic validation with regeneration (up to 3 attempts)
+    - Automatic validation with repair of the previous output (up to 3 attempts)
     - Real-time cost calculation based on tokens
     - Batch execution respecting dependencies
     """
@@ -62,9 +68,18 @@ class TaskExecutor:
             "output": 15.00  # $15.00 per MTok
         }
     }
+    # Prompt caching, relative to the input price
+    CACHE_WRITE_MULTIPLIER = 1.25
+    CACHE_READ_MULTIPLIER = 0.10
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, session_factory: Callable[[], Session] = SessionLocal):
+        """
+        Args:
+            db: Database session
+            session_factory: Creates the sessions of concurrently executed batch tasks
+        """
         self.db = db
+        self.session_factory = session_factory
         self.ai_orchestrator = AIOrchestrator(db)
 
         # Initialize helper modules
@@ -72,6 +87,7 @@ class TaskExecutor:
         self.context_builder = ContextBuilder(db)
         self.budget_manager = BudgetManager(db)
         self.batch_executor = BatchExecutor(db)
+        self.symbol_index = ProjectSymbolIndex(db)
 
         # Get Anthropic API key from environment or config
         api_key = os.getenv("ANTHROPIC_API_KEY")
@@ -84,7 +100,12 @@ class TaskExecutor:
         max_attempts: int = 3
     ) -> TaskResult:
         """
-        Execute a task with validation and automatic regeneration.
+        Execute a task with validation and automatic repair.
+
+        The context is built once. When validation fails, the next attempt
+        sends the previous output and its issues for a targeted fix (see
+        repair.py) instead of regenerating the file; TASK_REPAIR_MODE=false
+        regenerates it. The context is a cached prompt prefix in both cases.
 
         Args:
             task_id: Task ID (UUID)
@@ -133,23 +154,37 @@ class TaskExecutor:
             }
         )
 
-        # Try executing (with retry if validation fails)
+        # Build surgical context once: validation retries reuse it
+        context_start = time.time()
+        context = await self._build_context(
+            task=task,
+            project=project,
+            orchestrator=orchestrator
+        )
+        context_build_time = time.time() - context_start
+
+        logger.info(f"  Context size: {len(context.split())} words (~{len(context.split()) * 1.3:.0f} tokens)")
+
+        attempts_log: List[Dict] = []
+        output_code = None
+        validation_issues: List[str] = []
+        patch_error = None
+
+        # Try executing (with repair if validation fails)
         for attempt in range(1, max_attempts + 1):
             logger.info(f"  Attempt {attempt}/{max_attempts}")
 
             try:
                 # 1. Select model based on complexity
                 model = self._select_model(task.complexity)
-                logger.info(f"  Using {model}")
-
-                # 2. Build surgical context
-                context = await self._build_context(
-                    task=task,
-                    project=project,
-                    orchestrator=orchestrator
-                )
+                repair = output_code is not None and settings.task_repair_mode
+                logger.info(f"  Using {model} ({'repair' if repair else 'full generation'})")
 
-                logger.info(f"  Context size: {len(context.split())} words (~{len(context.split()) * 1.3:.0f} tokens)")
+                # 2. Full generation, or a targeted fix of the previous output
+                if repair:
+                    messages = repair_messages(context, output_code, validation_issues, patch_error)
+                else:
+                    messages = generation_messages(context)
 
                 # 3. Execute with Claude
                 start_time = time.time()
@@ -157,32 +192,52 @@ class TaskExecutor:
                 if not self.client:
                     raise ValueError("Anthropic API key not configured")
 
-                response = self.client.messages.create(
+                # In a thread: batch tasks run concurrently on the event loop
+                response = await asyncio.to_thread(
+                    self.client.messages.create,
                     model=model,
                     max_tokens=4000,
-                    messages=[{
-                        "role": "user",
-                        "content": context
-                    }]
+                    messages=messages
                 )
 
                 execution_time = time.time() - start_time
 
                 # Parse output
-                output_code = response.content[0].text
+                reply = response.content[0].text
+                if repair:
+                    candidate, patch_error, patched = apply_repair(output_code, reply)
+                else:
+                    candidate, patch_error, patched = reply, None, False
 
                 # 4. Calculate cost
-                input_tokens = response.usage.input_tokens
-                output_tokens = response.usage.output_tokens
-                cost = self._calculate_cost(model, input_tokens, output_tokens)
+                usage = self._attempt_usage(model, response.usage)
 
-                logger.info(f"  Generated {output_tokens} tokens in {execution_time:.2f}s (${cost:.4f})")
+                logger.info(
+                    f"  Generated {usage['output_tokens']} tokens in {execution_time:.2f}s (${usage['cost']:.4f}, "
+                    f"{usage['cache_read_input_tokens']} input tokens from cache)"
+                )
 
                 # 5. Validate output
-                validation_issues = orchestrator.validate_output(
-                    code=output_code,
-                    task=task.to_dict()
-                )
+                if patch_error:
+                    # Nothing was applied: the previous output and its issues stand
+                    logger.warning(f"  ⚠️  Repair could not be applied: {patch_error}")
+                else:
+                    output_code = candidate
+                    validation_issues = orchestrator.validate_output(
+                        code=output_code,
+                        task=task.to_dict()
+                    )
+
+                attempts_log.append({
+                    "attempt": attempt,
+                    "mode": "repair" if repair else "full",
+                    "model": model,
+                    **usage,
+                    "execution_time": round(execution_time, 3),
+                    "patch_applied": patched,
+                    "patch_error": patch_error,
+                    "issues": len(validation_issues)
+                })
 
                 validation_passed = len(validation_issues) == 0
 
@@ -195,12 +250,9 @@ class TaskExecutor:
                         project_id=project_id,
                         output_code=output_code,
                         model=model,
-                        input_tokens=input_tokens,
-                        output_tokens=output_tokens,
-                        cost=cost,
-                        execution_time=execution_time,
                         attempt=attempt,
-                        context=context
+                        context=context,
+                        execution_metrics=self._execution_metrics(attempts_log, context_build_time)
                     )
                     return result
 
@@ -232,13 +284,10 @@ class TaskExecutor:
                             project_id=project_id,
                             output_code=output_code,
                             model=model,
-                            input_tokens=input_tokens,
-                            output_tokens=output_tokens,
-                            cost=cost,
-                            execution_time=execution_time,
                             attempt=attempt,
                             validation_issues=validation_issues,
-                            context=context
+                            context=context,
+                            execution_metrics=self._execution_metrics(attempts_log, context_build_time)
                         )
                         return result
 
@@ -294,14 +343,21 @@ class TaskExecutor:
     async def execute_batch(
         self,
         task_ids: List[str],
-        project_id: str
+        project_id: str,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None
     ) -> List[TaskResult]:
         """
         Execute multiple tasks respecting dependencies.
 
+        Tasks whose dependencies are done run concurrently, each with its
+        own session (see BatchExecutor).
+
         Args:
             task_ids: List of task IDs (UUIDs)
             project_id: Project ID (UUID)
+            on_progress: Called with (finished, total) after each task
+            is_cancelled: Stops starting new tasks when it returns True
 
         Returns:
             List of TaskResults
@@ -309,9 +365,22 @@ class TaskExecutor:
         return await self.batch_executor.execute_batch(
             task_ids=task_ids,
             project_id=project_id,
-            execute_task_func=self.execute_task
+            execute_task_func=self._execute_task_in_own_session,
+            on_progress=on_progress,
+            is_cancelled=is_cancelled
         )
 
+    async def _execute_task_in_own_session(self, task_id: str, project_id: str) -> TaskResult:
+        """Execute one batch task with its own session; the result is returned detached."""
+        db = self.session_factory()
+        try:
+            result = await TaskExecutor(db, self.session_factory).execute_task(task_id, project_id)
+            db.refresh(result)
+            db.expunge(result)
+            return result
+        finally:
+            db.close()
+
     def _select_model(self, complexity: int) -> str:
         """
         Select model based on task complexity.
@@ -362,10 +431,15 @@ class TaskExecutor:
         self,
         model: str,
         input_tokens: int,
-        output_tokens: int
+        output_tokens: int,
+        cache_creation_input_tokens: int = 0,
+        cache_read_input_tokens: int = 0
     ) -> float:
         """
         Calculate real cost based on tokens.
+
+        Prompt tokens written to the cache cost 1.25x the input price, tokens
+        read from it 0.1x.
         """
         if model not in self.PRICING:
             return 0.0
@@ -373,10 +447,68 @@ class TaskExecutor:
         pricing = self.PRICING[model]
 
         cost = (input_tokens / 1_000_000 * pricing["input"]) + \
+               (cache_creation_input_tokens / 1_000_000 * pricing["input"] * self.CACHE_WRITE_MULTIPLIER) + \
+               (cache_read_input_tokens / 1_000_000 * pricing["input"] * self.CACHE_READ_MULTIPLIER) + \
                (output_tokens / 1_000_000 * pricing["output"])
 
         return round(cost, 6)
 
+    def _attempt_usage(self, model: str, usage) -> Dict:
+        """
+        Token counts and cost of one API call.
+
+        input_tokens excludes the prompt tokens written to or read from the cache.
+        """
+        counts = {
+            "input_tokens": usage.input_tokens,
+            "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+            "output_tokens": usage.output_tokens
+        }
+        counts["cost"] = self._calculate_cost(model, **counts)
+        return counts
+
+    def _execution_metrics(self, attempts_log: List[Dict], context_build_time: float) -> Dict:
+        """
+        Totals of all attempts and the estimated savings of repair attempts.
+
+        A repair attempt is compared to the full generation it replaced: the
+        cost and time of the first (full) attempt, plus rebuilding the context.
+        """
+        full = next((a for a in attempts_log if a["mode"] == "full"), None)
+        repairs = [a for a in attempts_log if a["mode"] == "repair"]
+
+        savings = 0.0
+        time_saved = 0.0
+        if full:
+            for repair in repairs:
+                savings += max(full["cost"] - repair["cost"], 0.0)
+                time_saved += max(full["execution_time"] + context_build_time - repair["execution_time"], 0.0)
+
+        return {
+            "input_tokens": sum(
+                a["input_tokens"] + a["cache_creation_input_tokens"] + a["cache_read_input_tokens"]
+                for a in attempts_log
+            ),
+            "cache_read_input_tokens": sum(a["cache_read_input_tokens"] for a in attempts_log),
+            "output_tokens": sum(a["output_tokens"] for a in attempts_log),
+            "cost": round(sum(a["cost"] for a in attempts_log), 6),
+            "execution_time": round(sum(a["execution_time"] for a in attempts_log), 3),
+            "context_build_time": round(context_build_time, 3),
+            "repair_attempts": len(repairs),
+            "estimated_savings_usd": round(savings, 6),
+            "estimated_time_saved": round(time_saved, 3),
+            "attempts": attempts_log
+        }
+
+    def _update_symbols(self, project: Project, result: TaskResult):
+        """Record the symbols of a saved result in the project symbol table."""
+        try:
+            self.symbol_index.update_task_result(project.id, result)
+        except Exception as e:
+            logger.error(f"  ⚠️  Failed to update symbol table: {e}")
+            self.db.rollback()
+
     async def _save_successful_result(
         self,
         task: Task,
@@ -385,20 +517,22 @@ class TaskExecutor:
         project_id: str,
         output_code: str,
         model: str,
-        input_tokens: int,
-        output_tokens: int,
-        cost: float,
-        execution_time: float,
         attempt: int,
-        context: str
+        context: str,
+        execution_metrics: Dict
     ) -> TaskResult:
-        """Save successful execution result."""
+        """Save successful execution result (token, cost and time totals of all attempts)."""
         logger.info(f"  ✅ Validation passed!")
+        input_tokens = execution_metrics["input_tokens"]
+        output_tokens = execution_metrics["output_tokens"]
+        cost = execution_metrics["cost"]
+        execution_time = execution_metrics["execution_time"]
 
         # Save result
         result = TaskResult(
             task_id=task_id,
             output_code=output_code,
+            interface_summary=extract_interface(output_code),
             file_path=task.file_path,
             model_used=model,
             input_tokens=input_tokens,
@@ -407,13 +541,16 @@ class TaskExecutor:
             execution_time=execution_time,
             validation_passed=True,
             validation_issues=[],
-            attempts=attempt
+            attempts=attempt,
+            execution_metrics=execution_metrics
         )
 
         self.db.add(result)
         self.db.commit()
         self.db.refresh(result)
 
+        self._update_symbols(project, result)
+
         # PROMPT #58 - Log successful execution to Prompt table
         try:
             prompt_log = Prompt(
@@ -435,7 +572,9 @@ class TaskExecutor:
                     "task_type": task.type,
                     "complexity": task.complexity,
                     "validation_passed": True,
-                    "attempts": attempt
+                    "attempts": attempt,
+                    "repair_attempts": execution_metrics["repair_attempts"],
+                    "estimated_savings_usd": execution_metrics["estimated_savings_usd"]
                 },
                 status="success",
                 created_at=datetime.utcnow(),
@@ -466,6 +605,7 @@ class TaskExecutor:
                 "cost": cost,
                 "execution_time": execution_time,
                 "attempts": attempt,
+                "repair_attempts": execution_metrics["repair_attempts"],
                 "validation_passed": True
             }
         )
@@ -480,20 +620,22 @@ class TaskExecutor:
         project_id: str,
         output_code: str,
         model: str,
-        input_tokens: int,
-        output_tokens: int,
-        cost: float,
-        execution_time: float,
         attempt: int,
         validation_issues: List[str],
-        context: str
+        context: str,
+        execution_metrics: Dict
     ) -> TaskResult:
-        """Save failed execution result."""
+        """Save failed execution result (token, cost and time totals of all attempts)."""
         logger.error(f"  ❌ Max attempts reached, saving with issues")
+        input_tokens = execution_metrics["input_tokens"]
+        output_tokens = execution_metrics["output_tokens"]
+        cost = execution_metrics["cost"]
+        execution_time = execution_metrics["execution_time"]
 
         result = TaskResult(
             task_id=task_id,
             output_code=output_code,
+            interface_summary=extract_interface(output_code),
             file_path=task.file_path,
             model_used=model,
             input_tokens=input_tokens,
@@ -502,13 +644,16 @@ class TaskExecutor:
             execution_time=execution_time,
             validation_passed=False,
             validation_issues=validation_issues,
-            attempts=attempt
+            attempts=attempt,
+            execution_metrics=execution_metrics
         )
 
         self.db.add(result)
         self.db.commit()
         self.db.refresh(result)
 
+        self._update_symbols(project, result)
+
         # PROMPT #58 - Log failed validation to Prompt table
         try:
             prompt_log = Prompt(
@@ -531,7 +676,9 @@ class TaskExecutor:
                     "complexity": task.complexity,
                     "validation_passed": False,
                     "validation_issues": validation_issues,
-                    "attempts": attempt
+                    "attempts": attempt,
+                    "repair_attempts": execution_metrics["repair_attempts"],
+                    "estimated_savings_usd": execution_metrics["estimated_savings_usd"]
                 },
                 status="error",
                 error_message=f"Validation failed after {attempt} attempts: {validation_issues}",
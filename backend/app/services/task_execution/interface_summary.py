@@ -0,0 +1,194 @@
+"""
+Interface Summary Module
+
+Compact interface of generated code, used in place of the full output of
+dependency tasks in the execution context.
+
+A dependent task needs what it can call or rely on, not the implementation:
+- namespace, class / interface / trait / enum declarations
+- public function and method signatures (with their decorators)
+- PHP and TypeScript properties (Eloquent $fillable / $casts arrays included)
+  and Python class-level fields (SQLAlchemy columns, Pydantic fields)
+- TypeScript interface / type declarations and Prisma models, in full
+- routes (Laravel Route::, Express router/app, FastAPI/NestJS decorators)
+- schema (Laravel Schema::create / $table-> columns, SQL CREATE TABLE)
+
+Bodies, private members and imports are dropped. Extraction is line-based
+and language-agnostic like the symbol extraction (app/services/symbol_index.py):
+generated code often has no reliable language.
+
+The summary is computed once, when a TaskResult is saved
+(TaskResult.interface_summary).
+
+Usage:
+    summary = extract_interface(result.output_code)
+"""
+
+import re
+from typing import List
+
+# Summary size cap (characters); longer summaries are cut at a line boundary
+MAX_SUMMARY_CHARS = 4000
+MAX_LINE_CHARS = 240
+# Lines kept of a block copied in full (TS interface/type, Prisma model, SQL table, PHP array property)
+MAX_BLOCK_LINES = 40
+# Continuation lines joined into one signature
+MAX_SIGNATURE_LINES = 8
+
+_NAMESPACE = re.compile(r'^\s*(?:namespace|package)\s+[\w\\.]+\s*;?\s*$')
+_TYPE_DECLARATION = re.compile(
+    r'^\s*(?:export\s+)?(?:default\s+)?(?:declare\s+)?(?:abstract\s+|final\s+|readonly\s+)*'
+    r'(?:class|interface|trait|enum)\s+\w+'
+)
+_FUNCTION = re.compile(
+    r'^\s*(?:export\s+)?(?:default\s+)?'
+    r'(?:(?:public|protected|static|abstract|final|async|override)\s+)*'
+    r'(?:function\s*\*?\s*\w*|def\s+\w+)\s*\('
+)
+_TS_METHOD = re.compile(
+    r'^\s+(?:(?:public|protected|static|async|readonly|override|get|set)\s+)*'
+    r'(?!(?:if|for|while|switch|catch|return|function|constructor\b)\b)\w+\s*(?:<[^>]*>)?\s*\([^;]*\)\s*(?::\s*[^{;]+)?\{\s*$'
+)
+_TS_CONSTRUCTOR = re.compile(r'^\s+(?:public\s+)?constructor\s*\(')
+_EXPORT_BINDING = re.compile(r'^\s*export\s+(?:default\s+)?(?:const|let|var)\s+\w+')
+_TS_TYPE_BLOCK = re.compile(r'^\s*(?:export\s+)?(?:declare\s+)?(?:interface\s+\w+|type\s+\w+[^=]*=)')
+_PRISMA_MODEL = re.compile(r'^\s*(?:model|enum)\s+\w+\s*\{\s*$')
+_PHP_PROPERTY = re.compile(r'^\s*(?:public|protected|var)(?:\s+(?:static|readonly))*(?:\s+\??[\w\\]+)?\s+\$\w+')
+_TS_PROPERTY = re.compile(r'^\s+(?:(?:public|protected|readonly|static|declare)\s+)*\w+[?!]?\s*:\s*[^=(,]+;\s*$')
+_PY_FIELD = re.compile(r'^\s+\w+\s*(?::\s*[\w\[\], .|"\']+)?\s*=\s*(?:Column|mapped_column|Field|relationship|models\.\w+)\(')
+_PY_ANNOTATED_FIELD = re.compile(r'^\s+\w+\s*:\s*[\w\[\], .|"\']+(?:\s*=\s*[^()]*)?$')
+_PRIVATE = re.compile(r'^\s*(?:\w+\s+)*private\b|^\s*(?:async\s+)?def\s+_(?!_)|^\s+#\w+')
+_DECORATOR = re.compile(r'^\s*@[\w.]+')
+_ROUTE = re.compile(
+    r'^\s*(?:Route::\w+\(|(?:router|app|api)\.(?:get|post|put|patch|delete|all|use|route)\s*\()'
+)
+_SCHEMA = re.compile(r'^\s*(?:Schema::(?:create|table)\(|\$table->\w+\()')
+_SQL_TABLE = re.compile(r'^\s*CREATE\s+TABLE\b', re.IGNORECASE)
+
+
+def extract_interface(code: str, max_chars: int = MAX_SUMMARY_CHARS) -> str:
+    """
+    Compact interface of a piece of generated code.
+
+    Args:
+        code: Source code (any of PHP, TypeScript/JavaScript, Python, SQL, Prisma)
+        max_chars: Size cap of the summary
+
+    Returns:
+        Summary lines (original indentation) or empty string if nothing was found
+    """
+    if not code:
+        return ""
+
+    lines = code.splitlines()
+    kept: List[str] = []
+    decorators: List[str] = []
+    i = 0
+
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+
+        if not stripped:
+            i += 1
+            continue
+
+        if _DECORATOR.match(line) and not _ROUTE.match(line):
+            decorators.append(_clip(line))
+            i += 1
+            continue
+
+        # Blocks copied in full: types, models, tables
+        if _TS_TYPE_BLOCK.match(line) or _PRISMA_MODEL.match(line) or _SQL_TABLE.match(line):
+            block, i = _block(lines, i)
+            kept.extend(decorators + block)
+            decorators = []
+            continue
+
+        if _PRIVATE.match(line):
+            decorators = []
+            i += 1
+            continue
+
+        if _TYPE_DECLARATION.match(line) or _FUNCTION.match(line) or _TS_METHOD.match(line) \
+                or _TS_CONSTRUCTOR.match(line) or _EXPORT_BINDING.match(line):
+            signature, i = _signature(lines, i)
+            kept.extend(decorators + [signature])
+            decorators = []
+            continue
+
+        if _PHP_PROPERTY.match(line):
+            if "[" in line and "]" not in line:
+                block, i = _block(lines, i, opener="[", closer="]")
+                kept.extend(block)
+            else:
+                kept.append(_clip(line))
+                i += 1
+            decorators = []
+            continue
+
+        if _NAMESPACE.match(line) or _ROUTE.match(line) or _SCHEMA.match(line) \
+                or _PY_FIELD.match(line) or _TS_PROPERTY.match(line) or _PY_ANNOTATED_FIELD.match(line):
+            kept.extend(decorators + [_clip(line)])
+
+        decorators = []
+        i += 1
+
+    if not kept:
+        return ""
+
+    summary: List[str] = []
+    size = 0
+    for line in kept:
+        if size + len(line) + 1 > max_chars:
+            summary.append("... (interface truncated)")
+            break
+        summary.append(line)
+        size += len(line) + 1
+    return "\n".join(summary)
+
+
+def _clip(line: str) -> str:
+    line = line.rstrip()
+    return line if len(line) <= MAX_LINE_CHARS else line[:MAX_LINE_CHARS] + " ..."
+
+
+def _signature(lines: List[str], start: int) -> tuple:
+    """Declaration line(s) up to the body: joins wrapped parameter lists, drops the opening brace."""
+    parts = [lines[start].rstrip()]
+    end = start + 1
+    while _open_parens(parts) > 0 and end < len(lines) and end - start < MAX_SIGNATURE_LINES:
+        parts.append(lines[end].strip())
+        end += 1
+
+    signature = parts[0] + " ".join(parts[1:])
+    signature = re.sub(r'\s*\{\s*\}?\s*$', "", signature)
+    signature = re.sub(r'\s*=>\s*\{?\s*$', " => ...", signature)
+    return _clip(signature), end
+
+
+def _open_parens(parts: List[str]) -> int:
+    return sum(part.count("(") - part.count(")") for part in parts)
+
+
+def _block(lines: List[str], start: int, opener: str = "{", closer: str = "}") -> tuple:
+    """A declaration and its body up to the matching closer (or the statement end)."""
+    block = [_clip(lines[start])]
+    depth = lines[start].count(opener) - lines[start].count(closer)
+    if "(" in lines[start] and opener == "{":
+        depth += lines[start].count("(") - lines[start].count(")")  # CREATE TABLE x (
+    end = start + 1
+    if depth <= 0:
+        # One-line declaration (type alias, inline interface)
+        return block, end
+    while end < len(lines) and depth > 0:
+        line = lines[end]
+        depth += line.count(opener) - line.count(closer)
+        if opener == "{":
+            depth += line.count("(") - line.count(")")
+        if len(block) < MAX_BLOCK_LINES:
+            block.append(_clip(line))
+        elif len(block) == MAX_BLOCK_LINES:
+            block.append("    ...")
+        end += 1
+    return block, end
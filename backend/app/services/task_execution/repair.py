@@ -0,0 +1,111 @@
+"""
+Repair Module
+
+Validation retries as targeted fixes instead of full regenerations.
+
+When the orchestrator's validation finds issues, the next attempt reuses the
+execution context already built for the task (no new RAG retrieval, spec or
+dependency queries) and sends it again as a cached prefix, followed by the
+previous output and the list of issues (prompt execution/task_repair). The
+model answers with SEARCH/REPLACE edit blocks, applied here to the previous
+output, or with the complete corrected file.
+
+Edits are all-or-nothing: if a SEARCH section does not match the previous
+output in exactly one place, nothing is applied and the error is sent back
+with the next repair request.
+
+Usage:
+    messages = repair_messages(context, previous_output, issues)
+    output_code, patch_error, patched = apply_repair(previous_output, reply)
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from app.prompts.loader import PromptLoader
+
+_EDIT_BLOCK = re.compile(
+    r'<{7} SEARCH[ \t]*\n(.*?)\n?={7}[ \t]*\n(.*?)\n?>{7} REPLACE',
+    re.DOTALL
+)
+_CODE_FENCE = re.compile(r'^\s*```[\w+-]*\n(.*?)\n```\s*$', re.DOTALL)
+
+
+def generation_messages(context: str) -> List[Dict]:
+    """
+    Messages of a full generation: the execution context, marked as a cache breakpoint.
+
+    Args:
+        context: Execution context built for the task
+
+    Returns:
+        Anthropic messages list
+    """
+    return [{
+        "role": "user",
+        "content": [{"type": "text", "text": context, "cache_control": {"type": "ephemeral"}}]
+    }]
+
+
+def repair_messages(
+    context: str,
+    previous_output: str,
+    issues: List[str],
+    patch_error: Optional[str] = None
+) -> List[Dict]:
+    """
+    Messages of a repair attempt: same cached prefix as the generation,
+    the previous output as the assistant turn and the fix request.
+
+    Args:
+        context: Execution context built for the task (unchanged since attempt 1)
+        previous_output: Code that failed validation
+        issues: Validation issues of previous_output
+        patch_error: Why the previous repair could not be applied, if it could not
+
+    Returns:
+        Anthropic messages list
+    """
+    _, repair_prompt = PromptLoader().render(
+        "execution/task_repair",
+        {"issues": issues, "patch_error": patch_error}
+    )
+    return generation_messages(context) + [
+        {"role": "assistant", "content": previous_output},
+        {"role": "user", "content": repair_prompt},
+    ]
+
+
+def apply_repair(previous_output: str, reply: str) -> Tuple[str, Optional[str], bool]:
+    """
+    Apply a repair reply to the previous output.
+
+    Args:
+        previous_output: Code that failed validation
+        reply: Model response (SEARCH/REPLACE blocks or a complete file)
+
+    Returns:
+        Tuple (output_code, patch_error, patched):
+        - edit blocks applied: (patched code, None, True)
+        - edit blocks that do not apply: (previous_output, error, False)
+        - no edit blocks: (reply as the complete file, None, False)
+    """
+    blocks = _EDIT_BLOCK.findall(reply)
+    if not blocks:
+        fenced = _CODE_FENCE.match(reply)
+        return (fenced.group(1) if fenced else reply), None, False
+
+    code = previous_output
+    for number, (search, replace) in enumerate(blocks, start=1):
+        if not search.strip():
+            return previous_output, f"SEARCH block {number} is empty", False
+
+        matches = code.count(search)
+        if matches == 0:
+            return previous_output, f"SEARCH block {number} does not match the code", False
+        if matches > 1:
+            return previous_output, f"SEARCH block {number} matches {matches} places, include more lines", False
+
+        code = code.replace(search, replace, 1)
+
+    return code, None, True
@@ -1,19 +1,26 @@
 """
 TaskHierarchyService
 Manages task hierarchies (parent-child relationships) and prevents cycles
+
+Ancestor, descendant, depth and cycle queries read the materialized
+Task.hierarchy_path through HierarchyLoader (cached by id for the lifetime of
+the service); paths are maintained on flush, including subtree rebasing when
+move_task changes a parent.
 """
 
-from typing import List, Set, Optional
+from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session
 from app.models.task import Task, ItemType
+from app.services.hierarchy_loader import HierarchyLoader
 
 
 class TaskHierarchyService:
     """Service for managing task hierarchies and validating hierarchy rules"""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, loader: Optional[HierarchyLoader] = None):
         self.db = db
+        self.loader = loader or HierarchyLoader(db)
 
     def get_all_descendants(self, task_id: UUID) -> List[Task]:
         """
@@ -25,32 +32,7 @@ class TaskHierarchyService:
         Returns:
             List of all descendant tasks
         """
-        descendants = []
-        visited = set()
-        self._collect_descendants(task_id, descendants, visited)
-        return descendants
-
-    def _collect_descendants(self, task_id: UUID, result: List[Task], visited: Set[UUID]):
-        """
-        Recursive helper to collect descendants
-
-        Args:
-            task_id: Current task ID
-            result: List to accumulate descendants
-            visited: Set of visited task IDs (prevents infinite loops)
-        """
-        if task_id in visited:
-            return  # Prevent infinite loops
-
-        visited.add(task_id)
-
-        # Get all children of current task
-        children = self.db.query(Task).filter(Task.parent_id == task_id).all()
-
-        for child in children:
-            result.append(child)
-            # Recursively collect descendants of this child
-            self._collect_descendants(child.id, result, visited)
+        return self.loader.descendants(task_id)
 
     def get_all_ancestors(self, task_id: UUID) -> List[Task]:
         """
@@ -62,27 +44,7 @@ class TaskHierarchyService:
         Returns:
             List of all ancestor tasks (ordered from immediate parent to root)
         """
-        ancestors = []
-        current_id = task_id
-        visited = set()  # Prevent infinite loops
-
-        while current_id and current_id not in visited:
-            visited.add(current_id)
-
-            # Get current task
-            task = self.db.query(Task).filter(Task.id == current_id).first()
-            if not task or not task.parent_id:
-                break
-
-            # Get parent
-            parent = self.db.query(Task).filter(Task.id == task.parent_id).first()
-            if parent:
-                ancestors.append(parent)
-                current_id = parent.id
-            else:
-                break
-
-        return ancestors
+        return self.loader.ancestors(task_id)
 
     def get_root_tasks(self, project_id: UUID, item_type: Optional[ItemType] = None) -> List[Task]:
         """
@@ -109,8 +71,9 @@ class TaskHierarchyService:
         """
         Check if creating a parent-child relationship would create a cycle
 
-        A cycle would occur if the target is already an ancestor of the source.
-        For example: A → B → C, trying to make C parent of A would create a cycle.
+        A cycle would occur if the target is the source itself or one of its
+        descendants. For example: A → B → C (A is the root), trying to make C
+        parent of A would create a cycle.
 
         Args:
             source_id: Task that would become the child
@@ -119,9 +82,10 @@ class TaskHierarchyService:
         Returns:
             True if this would create a cycle, False otherwise
         """
-        # Check if target is already an ancestor of source
-        ancestors = self.get_all_ancestors(source_id)
-        return any(a.id == target_id for a in ancestors)
+        if source_id == target_id:
+            return True
+        # Target inside the source's subtree (prefix check on the materialized paths)
+        return self.loader.is_descendant(target_id, source_id)
 
     def validate_hierarchy_rules(self, child_type: ItemType, parent_type: ItemType) -> bool:
         """
@@ -164,8 +128,7 @@ class TaskHierarchyService:
         Returns:
             Depth level (0-based)
         """
-        ancestors = self.get_all_ancestors(task_id)
-        return len(ancestors)
+        return self.loader.depth(task_id)
 
     def get_hierarchy_path(self, task_id: UUID) -> List[Task]:
         """
@@ -179,15 +142,7 @@ class TaskHierarchyService:
         Returns:
             List of tasks from root to current (inclusive)
         """
-        ancestors = self.get_all_ancestors(task_id)
-        ancestors.reverse()  # Root first
-
-        # Add current task
-        current_task = self.db.query(Task).filter(Task.id == task_id).first()
-        if current_task:
-            ancestors.append(current_task)
-
-        return ancestors
+        return self.loader.path(task_id)
 
     def move_task(
         self,
@@ -209,7 +164,7 @@ class TaskHierarchyService:
         Raises:
             ValueError: If operation would create a cycle
         """
-        task = self.db.query(Task).filter(Task.id == task_id).first()
+        task = self.loader.get(task_id)
         if not task:
             raise ValueError(f"Task {task_id} not found")
 
@@ -221,7 +176,7 @@ class TaskHierarchyService:
 
             # Validate hierarchy rules if requested
             if validate_rules:
-                parent = self.db.query(Task).filter(Task.id == new_parent_id).first()
+                parent = self.loader.get(new_parent_id)
                 if not parent:
                     raise ValueError(f"Parent task {new_parent_id} not found")
 
@@ -230,7 +185,7 @@ class TaskHierarchyService:
                         f"Invalid hierarchy: {parent.item_type.value} cannot contain {task.item_type.value}"
                     )
 
-        # Update parent
+        # Update parent (hierarchy_path of the task and its subtree is rebased on flush)
         task.parent_id = new_parent_id
         self.db.commit()
 
@@ -248,7 +203,7 @@ class TaskHierarchyService:
             Number of children
         """
         if recursive:
-            return len(self.get_all_descendants(task_id))
+            return self.loader.count_descendants(task_id)
         else:
             return self.db.query(Task).filter(Task.parent_id == task_id).count()
 
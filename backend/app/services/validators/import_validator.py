@@ -1,7 +1,8 @@
-from typing import List, Dict
-import re
+from typing import List, Dict, Optional
 import logging
 
+from app.services.symbol_index import SOURCE_TASK, SymbolTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,20 +15,33 @@ class ImportValidator:
     - Imports com paths incorretos
     - Circular dependencies
     - Missing imports
+
+    Lê imports/exports da tabela de símbolos do projeto em vez de
+    re-parsear o código de cada task.
     """
 
-    def validate(self, task_results: List) -> List[Dict]:
+    # Sintaxes de import verificadas contra exports (imports Python são quase sempre stdlib/pacotes)
+    CHECKED_LANGUAGES = ("php", "typescript")
+
+    def validate(self, task_results: List, symbols: Optional[SymbolTable] = None) -> List[Dict]:
         """
         Valida imports/exports
+
+        Args:
+            task_results: TaskResults do batch
+            symbols: Tabela de símbolos do projeto (construída dos task_results se None)
         """
 
+        if symbols is None:
+            symbols = SymbolTable.from_task_results(task_results)
+
         issues = []
 
         # Mapear exports
-        exports = self._extract_exports(task_results)
+        exports = self._extract_exports(symbols)
 
         # Mapear imports
-        imports = self._extract_imports(task_results)
+        imports = self._extract_imports(symbols)
 
         # Validar que imports têm exports correspondentes
         missing_exports = self._validate_imports_have_exports(imports, exports)
@@ -39,92 +53,43 @@ class ImportValidator:
 
         return issues
 
-    def _extract_exports(self, task_results: List) -> Dict:
+    def _extract_exports(self, symbols: SymbolTable) -> Dict:
         """
-        Extrai exports de cada task
+        Exports do projeto (nome curto e nome qualificado)
         """
 
         exports = {}
 
-        for result in task_results:
-            code = result.output_code
-            file_path = result.file_path or ''
-
-            # PHP: namespace + class name
-            namespace_match = re.search(r'namespace\s+([\w\\]+)', code)
-            class_match = re.search(r'class\s+(\w+)', code)
-
-            if namespace_match and class_match:
-                namespace = namespace_match.group(1)
-                class_name = class_match.group(1)
-                full_name = f"{namespace}\\{class_name}"
-
-                exports[full_name] = {
-                    'task_id': str(result.task_id),
-                    'file_path': file_path,
-                    'class_name': class_name
-                }
-
-                # Also add just the class name for easier matching
-                exports[class_name] = {
-                    'task_id': str(result.task_id),
-                    'file_path': file_path,
-                    'class_name': class_name
-                }
-
-            # TypeScript: export class/function
-            ts_exports = re.findall(r'export\s+(?:class|function|const)\s+(\w+)', code)
-
-            for exported in ts_exports:
-                exports[exported] = {
-                    'task_id': str(result.task_id),
-                    'file_path': file_path,
-                    'class_name': exported
-                }
+        for symbol in symbols.definitions('export'):
+            export = {
+                'task_id': symbol.source_key if symbol.source == SOURCE_TASK else None,
+                'file_path': symbol.file_path or '',
+                'class_name': symbol.name
+            }
+
+            exports[symbol.name] = export
+            if symbol.qualified_name:
+                exports[symbol.qualified_name] = export
 
         return exports
 
-    def _extract_imports(self, task_results: List) -> Dict:
+    def _extract_imports(self, symbols: SymbolTable) -> Dict:
         """
-        Extrai imports de cada task
+        Imports de cada task do batch
+
+        Returns:
+            {task_id: [(nome curto, nome exibido)]}
         """
 
         imports = {}
 
-        for result in task_results:
-            code = result.output_code
-            task_imports = []
-
-            # PHP: use statements
-            php_imports = re.findall(r'use\s+([\w\\]+);', code)
-
-            # Extract just the class name from full namespace
-            for php_import in php_imports:
-                # Ex: "App\Models\Book" -> "Book"
-                class_name = php_import.split('\\')[-1]
-                task_imports.append(class_name)
-                task_imports.append(php_import)  # Also keep full name
-
-            # TypeScript: import statements
-            ts_imports = re.findall(
-                r'import\s+{([^}]+)}\s+from\s+[\'"]([^\'"]+)[\'"]',
-                code
-            )
-
-            for imported_items, path in ts_imports:
-                items = [item.strip() for item in imported_items.split(',')]
-                task_imports.extend(items)
-
-            # TypeScript: default imports
-            default_imports = re.findall(
-                r'import\s+(\w+)\s+from\s+[\'"]([^\'"]+)[\'"]',
-                code
-            )
-
-            for imported, path in default_imports:
-                task_imports.append(imported)
+        for symbol in symbols.usages('import'):
+            if symbol.language not in self.CHECKED_LANGUAGES:
+                continue
 
-            imports[str(result.task_id)] = task_imports
+            # PHP: "App\Models\Book" -> ("Book", "App\Models\Book")
+            shown = symbol.qualified_name if symbol.language == 'php' else symbol.name
+            imports.setdefault(symbol.source_key, []).append((symbol.name, shown))
 
         return imports
 
@@ -140,20 +105,22 @@ class ImportValidator:
         issues = []
 
         for task_id, imported_items in imports.items():
-            for imported in imported_items:
-                if imported not in exports:
-                    # Check if it's a system/library import (e.g., React, Laravel)
-                    if self._is_system_import(imported):
-                        continue
-
-                    issues.append({
-                        'category': 'import',
-                        'severity': 'CRITICAL',
-                        'message': f'Task {task_id} imports "{imported}" but it is not exported by any task',
-                        'task_ids': [task_id],
-                        'auto_fixable': False,
-                        'fix_suggestion': f'Ensure "{imported}" is exported by the appropriate task'
-                    })
+            for name, imported in imported_items:
+                if name in exports or imported in exports:
+                    continue
+
+                # Check if it's a system/library import (e.g., React, Laravel)
+                if self._is_system_import(name):
+                    continue
+
+                issues.append({
+                    'category': 'import',
+                    'severity': 'CRITICAL',
+                    'message': f'Task {task_id} imports "{imported}" but it is not exported by any task',
+                    'task_ids': [task_id],
+                    'auto_fixable': False,
+                    'fix_suggestion': f'Ensure "{imported}" is exported by the appropriate task'
+                })
 
         return issues
 
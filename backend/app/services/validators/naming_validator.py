@@ -1,7 +1,9 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 import re
 import logging
 
+from app.services.symbol_index import SOURCE_TASK, SymbolTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +16,9 @@ class NamingValidator:
     - Method names diferentes (findById vs getById)
     - Field names diferentes (created_at vs createdAt)
     - Variable names diferentes
+
+    Definições vêm da tabela de símbolos do projeto; só os usos das tasks
+    do batch são verificados.
     """
 
     def __init__(self, stack_conventions: Dict):
@@ -23,77 +28,38 @@ class NamingValidator:
         """
         self.conventions = stack_conventions
 
-    def validate(self, task_results: List) -> List[Dict]:
+    def validate(self, task_results: List, symbols: Optional[SymbolTable] = None) -> List[Dict]:
         """
         Valida naming entre tasks
 
+        Args:
+            task_results: TaskResults do batch
+            symbols: Tabela de símbolos do projeto (construída dos task_results se None)
+
         Returns:
             Lista de issues encontrados
         """
 
-        issues = []
+        if symbols is None:
+            symbols = SymbolTable.from_task_results(task_results)
 
-        # Extrair entities de todas tasks
-        entities = self._extract_entities(task_results)
+        issues = []
 
         # Validar class names
-        class_issues = self._validate_class_names(entities, task_results)
+        class_issues = self._validate_class_names(symbols)
         issues.extend(class_issues)
 
         # Validar method names
-        method_issues = self._validate_method_names(task_results)
+        method_issues = self._validate_method_names(symbols)
         issues.extend(method_issues)
 
         # Validar field names
-        field_issues = self._validate_field_names(task_results)
+        field_issues = self._validate_field_names(symbols)
         issues.extend(field_issues)
 
         return issues
 
-    def _extract_entities(self, task_results: List) -> Dict:
-        """
-        Extrai entities (classes) de cada task
-
-        Returns:
-            {task_id: {entity_name, defined_as, referenced_as}}
-        """
-
-        entities = {}
-
-        for result in task_results:
-            code = result.output_code
-            task_id = str(result.task_id)
-
-            # Detectar definições de classe
-            # Ex: "class Book", "class BookRepository"
-            class_defs = re.findall(r'class\s+(\w+)', code)
-
-            # Detectar importações
-            # Ex: "import Book", "from models import Books"
-            imports = re.findall(r'(?:import|from)\s+[\w.]+\s+import\s+(\w+)', code)
-            imports += re.findall(r'import\s+{([^}]+)}', code)  # TypeScript: import { Book }
-
-            # Flatten imports from TypeScript
-            flat_imports = []
-            for imp in imports:
-                if ',' in imp:
-                    flat_imports.extend([i.strip() for i in imp.split(',')])
-                else:
-                    flat_imports.append(imp)
-
-            # Detectar referências
-            # Ex: "new Book()", "Book::find()"
-            refs = re.findall(r'\b([A-Z]\w+)(?:\(|\:\:)', code)
-
-            entities[task_id] = {
-                'defined': class_defs,
-                'imported': flat_imports,
-                'referenced': refs
-            }
-
-        return entities
-
-    def _validate_class_names(self, entities: Dict, task_results: List) -> List[Dict]:
+    def _validate_class_names(self, symbols: SymbolTable) -> List[Dict]:
         """
         Valida que class names são consistentes
 
@@ -105,48 +71,49 @@ class NamingValidator:
         issues = []
 
         # Mapear definições
-        defined_classes = {}  # {class_name: task_id}
-
-        for task_id, entity in entities.items():
-            for class_name in entity['defined']:
-                defined_classes[class_name] = task_id
-
-        # Verificar importações/referências
-        for task_id, entity in entities.items():
-            # Checar imports
-            for imported in entity['imported']:
-                if imported not in defined_classes:
-                    # Buscar similar (pode ser typo)
-                    similar = self._find_similar(imported, defined_classes.keys())
-
-                    if similar:
-                        issues.append({
-                            'category': 'naming',
-                            'severity': 'CRITICAL',
-                            'message': f'Task {task_id} imports "{imported}" but class is defined as "{similar}"',
-                            'task_ids': [task_id, defined_classes[similar]],
-                            'auto_fixable': True,
-                            'fix_suggestion': f'Change import from "{imported}" to "{similar}"'
-                        })
-
-            # Checar referências
-            for ref in entity['referenced']:
-                if ref not in defined_classes:
-                    similar = self._find_similar(ref, defined_classes.keys())
-
-                    if similar:
-                        issues.append({
-                            'category': 'naming',
-                            'severity': 'WARNING',
-                            'message': f'Task {task_id} references "{ref}" but class is defined as "{similar}"',
-                            'task_ids': [task_id, defined_classes[similar]],
-                            'auto_fixable': True,
-                            'fix_suggestion': f'Change reference from "{ref}" to "{similar}"'
-                        })
+        defined_classes = {
+            symbol.name: symbol
+            for symbol in symbols.definitions('class')
+        }  # {class_name: definição}
+
+        # Checar imports (PHP "use" fica com o ImportValidator: quase sempre vendor)
+        for symbol in symbols.usages('import'):
+            if symbol.language == 'php' or symbol.name in defined_classes:
+                continue
+
+            # Buscar similar (pode ser typo)
+            similar = self._find_similar(symbol.name, defined_classes.keys())
+
+            if similar:
+                issues.append({
+                    'category': 'naming',
+                    'severity': 'CRITICAL',
+                    'message': f'Task {symbol.source_key} imports "{symbol.name}" but class is defined as "{similar}"',
+                    'task_ids': self._task_ids(symbol, defined_classes[similar]),
+                    'auto_fixable': True,
+                    'fix_suggestion': f'Change import from "{symbol.name}" to "{similar}"'
+                })
+
+        # Checar referências
+        for symbol in symbols.usages('reference'):
+            if symbol.name in defined_classes:
+                continue
+
+            similar = self._find_similar(symbol.name, defined_classes.keys())
+
+            if similar:
+                issues.append({
+                    'category': 'naming',
+                    'severity': 'WARNING',
+                    'message': f'Task {symbol.source_key} references "{symbol.name}" but class is defined as "{similar}"',
+                    'task_ids': self._task_ids(symbol, defined_classes[similar]),
+                    'auto_fixable': True,
+                    'fix_suggestion': f'Change reference from "{symbol.name}" to "{similar}"'
+                })
 
         return issues
 
-    def _validate_method_names(self, task_results: List) -> List[Dict]:
+    def _validate_method_names(self, symbols: SymbolTable) -> List[Dict]:
         """
         Valida que métodos são chamados com nomes corretos
 
@@ -157,71 +124,31 @@ class NamingValidator:
 
         issues = []
 
-        # Mapear métodos definidos
-        defined_methods = {}  # {class_name: {method_name: task_id}}
-
-        for result in task_results:
-            code = result.output_code
-
-            # Detectar definições de método
-            # PHP: "public function findById"
-            # TypeScript: "findById()"
-
-            methods = re.findall(
-                r'(?:function|public|private|protected)\s+(\w+)\s*\(',
-                code
-            )
-
-            # Detectar qual classe
-            class_match = re.search(r'class\s+(\w+)', code)
-            if class_match:
-                class_name = class_match.group(1)
-
-                if class_name not in defined_methods:
-                    defined_methods[class_name] = {}
-
-                for method in methods:
-                    defined_methods[class_name][method] = str(result.task_id)
+        # Métodos definidos em qualquer classe do projeto
+        defined_methods = {symbol.name for symbol in symbols.definitions('method')}
 
         # Verificar chamadas de método
-        for result in task_results:
-            code = result.output_code
-
-            # Detectar chamadas de método
-            # Ex: "$repo->findById(", "repository.getById("
-            calls = re.findall(r'(?:\$\w+|\w+)->(\w+)\(', code)
-            calls += re.findall(r'(?:\$\w+|\w+)\.(\w+)\(', code)
-
-            for called_method in calls:
-                # Verificar se método existe em alguma classe
-                method_exists = any(
-                    called_method in methods
-                    for methods in defined_methods.values()
-                )
-
-                if not method_exists:
-                    # Buscar similar
-                    all_methods = [
-                        method
-                        for methods in defined_methods.values()
-                        for method in methods.keys()
-                    ]
-
-                    similar = self._find_similar(called_method, all_methods)
-
-                    if similar:
-                        issues.append({
-                            'category': 'naming',
-                            'severity': 'CRITICAL',
-                            'message': f'Task {result.task_id} calls method "{called_method}()" but method is defined as "{similar}()"',
-                            'task_ids': [str(result.task_id)],
-                            'auto_fixable': True,
-                            'fix_suggestion': f'Change method call from "{called_method}" to "{similar}"'
-                        })
+        # Ex: "$repo->findById(", "repository.getById("
+        for symbol in symbols.usages('call'):
+            if symbol.name in defined_methods:
+                continue
+
+            # Buscar similar
+            similar = self._find_similar(symbol.name, list(defined_methods))
+
+            if similar:
+                issues.append({
+                    'category': 'naming',
+                    'severity': 'CRITICAL',
+                    'message': f'Task {symbol.source_key} calls method "{symbol.name}()" but method is defined as "{similar}()"',
+                    'task_ids': [symbol.source_key],
+                    'auto_fixable': True,
+                    'fix_suggestion': f'Change method call from "{symbol.name}" to "{similar}"'
+                })
 
         return issues
 
-    def _validate_field_names(self, task_results: List) -> List[Dict]:
+    def _validate_field_names(self, symbols: SymbolTable) -> List[Dict]:
         """
         Valida que field names são consistentes
 
@@ -232,76 +159,44 @@ class NamingValidator:
 
         issues = []
 
-        # Mapear campos definidos
-        defined_fields = {}  # {class_name: {field_name: task_id}}
-
-        for result in task_results:
-            code = result.output_code
-
-            # Detectar definições de campo
-            # PHP: "private $created_at"
-            # TypeScript: "created_at: string"
-
-            fields = re.findall(r'(?:private|public|protected)\s+\$?(\w+)', code)
-            fields += re.findall(r'(\w+):\s*(?:string|number|boolean|Date)', code)
-
-            class_match = re.search(r'class\s+(\w+)', code)
-            if class_match:
-                class_name = class_match.group(1)
-
-                if class_name not in defined_fields:
-                    defined_fields[class_name] = {}
-
-                for field in fields:
-                    defined_fields[class_name][field] = str(result.task_id)
-
-        # Verificar referências a campos
-        for result in task_results:
-            code = result.output_code
-
-            # Detectar acessos a campos
-            # Ex: "$book->created_at", "book.createdAt"
-            accesses = re.findall(r'\$\w+->(\w+)', code)
-            accesses += re.findall(r'\w+\.(\w+)', code)
-
-            for accessed_field in accesses:
-                # Verificar consistência de naming
-                # Ex: created_at vs createdAt
-
-                # Converter para diferentes styles
-                snake_case = self._to_snake_case(accessed_field)
-                camel_case = self._to_camel_case(accessed_field)
-
-                # Verificar se campo existe em algum style
-                field_exists = any(
-                    accessed_field in fields or
-                    snake_case in fields or
-                    camel_case in fields
-                    for fields in defined_fields.values()
-                )
-
-                if not field_exists:
-                    # Buscar similar
-                    all_fields = [
-                        field
-                        for fields in defined_fields.values()
-                        for field in fields.keys()
-                    ]
-
-                    similar = self._find_similar(accessed_field, all_fields)
-
-                    if similar and similar != accessed_field:
-                        issues.append({
-                            'category': 'naming',
-                            'severity': 'WARNING',
-                            'message': f'Task {result.task_id} accesses field "{accessed_field}" but field is defined as "{similar}"',
-                            'task_ids': [str(result.task_id)],
-                            'auto_fixable': True,
-                            'fix_suggestion': f'Change field access from "{accessed_field}" to "{similar}"'
-                        })
+        # Campos definidos em qualquer classe do projeto
+        defined_fields = {symbol.name for symbol in symbols.definitions('field')}
+
+        # Verificar acessos a campos
+        # Ex: "$book->created_at", "book.createdAt"
+        for symbol in symbols.usages('access'):
+            accessed_field = symbol.name
+
+            # Verificar se campo existe em algum style (created_at vs createdAt)
+            if (
+                accessed_field in defined_fields or
+                self._to_snake_case(accessed_field) in defined_fields or
+                self._to_camel_case(accessed_field) in defined_fields
+            ):
+                continue
+
+            # Buscar similar
+            similar = self._find_similar(accessed_field, list(defined_fields))
+
+            if similar and similar != accessed_field:
+                issues.append({
+                    'category': 'naming',
+                    'severity': 'WARNING',
+                    'message': f'Task {symbol.source_key} accesses field "{accessed_field}" but field is defined as "{similar}"',
+                    'task_ids': [symbol.source_key],
+                    'auto_fixable': True,
+                    'fix_suggestion': f'Change field access from "{accessed_field}" to "{similar}"'
+                })
 
         return issues
 
+    def _task_ids(self, usage, definition) -> List[str]:
+        """Task do uso + task da definição (se a definição vier de uma task)"""
+        task_ids = [usage.source_key]
+        if definition.source == SOURCE_TASK and definition.source_key != usage.source_key:
+            task_ids.append(definition.source_key)
+        return task_ids
+
     def _find_similar(self, name: str, candidates: List[str]) -> str:
         """
         Encontra nome similar em lista de candidatos
@@ -0,0 +1,153 @@
+"""
+Unit tests for BatchExecutor
+Ready-queue over the dependency DAG, concurrency cap, failure propagation, progress
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.task_execution.batch_executor import BatchExecutor
+
+
+def task(task_id, *depends_on):
+    return SimpleNamespace(id=task_id, depends_on=list(depends_on))
+
+
+class FakeExecution:
+    """execute_task_func that takes `delay` seconds per task and records what runs when"""
+
+    def __init__(self, delay: float = 0.02, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.running = 0
+        self.max_running = 0
+        self.started = []
+        self.finished = []
+
+    async def __call__(self, task_id, project_id):
+        self.started.append(task_id)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(self.delay)
+        self.running -= 1
+        self.finished.append(task_id)
+        if task_id in self.fail:
+            raise RuntimeError("AI unavailable")
+        return SimpleNamespace(id=task_id, cost=0.5)
+
+
+@pytest.fixture(autouse=True)
+def websocket():
+    with patch("app.services.task_execution.batch_executor.broadcast_event", new_callable=AsyncMock) as broadcast:
+        yield broadcast
+
+
+def executor(tasks):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = tasks
+    batch = BatchExecutor(db)
+    batch._validate_consistency = AsyncMock()
+    return batch
+
+
+def events(broadcast, event_type):
+    return [call.kwargs["data"] for call in broadcast.call_args_list if call.kwargs["event_type"] == event_type]
+
+
+class TestScheduling:
+    """Tasks start as soon as their dependencies are done"""
+
+    @pytest.mark.asyncio
+    async def test_independent_tasks_run_concurrently_within_the_cap(self):
+        tasks = [task(f"t{i}") for i in range(8)]
+        execution = FakeExecution(delay=0.05)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        results = await executor(tasks).execute_batch([t.id for t in tasks], "p", execution, max_concurrency=4)
+        elapsed = loop.time() - started
+
+        assert len(results) == 8
+        assert execution.max_running == 4
+        assert elapsed < 0.05 * 8 / 2  # two waves, not eight tasks in a row
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_for_their_dependencies(self):
+        # a -> c, b -> c, c -> d; e independent
+        tasks = [task("d", "c"), task("c", "a", "b"), task("a"), task("b"), task("e")]
+        execution = FakeExecution()
+
+        await executor(tasks).execute_batch([t.id for t in tasks], "p", execution, max_concurrency=10)
+
+        assert set(execution.started[:3]) == {"a", "b", "e"}
+        assert execution.started.index("c") > max(execution.finished.index("a"), execution.finished.index("b"))
+        assert execution.started[-1] == "d"
+
+    @pytest.mark.asyncio
+    async def test_dependencies_outside_the_batch_count_as_done(self):
+        tasks = [task("a", "already-executed")]
+        execution = FakeExecution()
+
+        results = await executor(tasks).execute_batch(["a"], "p", execution)
+
+        assert [r.id for r in results] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_dependency_cycle_does_not_stall(self):
+        tasks = [task("a", "b"), task("b", "a"), task("c")]
+        execution = FakeExecution()
+
+        results = await executor(tasks).execute_batch(["a", "b", "c"], "p", execution, max_concurrency=2)
+
+        assert {r.id for r in results} == {"a", "b", "c"}
+
+
+class TestFailures:
+    """A failed task only skips what depends on it"""
+
+    @pytest.mark.asyncio
+    async def test_failure_skips_transitive_dependents_only(self, websocket):
+        tasks = [task("a"), task("b", "a"), task("c", "b"), task("d")]
+        execution = FakeExecution(fail={"a"})
+
+        results = await executor(tasks).execute_batch(["a", "b", "c", "d"], "p", execution)
+
+        assert [r.id for r in results] == ["d"]
+        assert "b" not in execution.started and "c" not in execution.started
+        assert {e["task_id"] for e in events(websocket, "task_skipped")} == {"b", "c"}
+        (summary,) = events(websocket, "batch_completed")
+        assert (summary["completed"], summary["failed"], summary["skipped"]) == (1, 1, 2)
+
+
+class TestProgress:
+    """Progress and cost are reported once per finished task, in order"""
+
+    @pytest.mark.asyncio
+    async def test_progress_is_monotonic_and_complete(self, websocket):
+        tasks = [task(f"t{i}") for i in range(5)]
+        reported = []
+
+        await executor(tasks).execute_batch(
+            [t.id for t in tasks], "p", FakeExecution(), max_concurrency=3,
+            on_progress=lambda finished, total: reported.append((finished, total))
+        )
+
+        progress = events(websocket, "batch_progress")
+        assert [e["completed"] for e in progress] == [1, 2, 3, 4, 5]
+        assert progress[-1]["percentage"] == 100.0 and progress[-1]["total_cost"] == 2.5
+        assert reported == [(i, 5) for i in range(1, 6)]
+
+    @pytest.mark.asyncio
+    async def test_cancellation_stops_starting_tasks(self):
+        tasks = [task(f"t{i}") for i in range(6)]
+        execution = FakeExecution()
+
+        results = await executor(tasks).execute_batch(
+            [t.id for t in tasks], "p", execution, max_concurrency=2,
+            is_cancelled=lambda: len(execution.finished) >= 2
+        )
+
+        assert len(results) == 2
+        assert len(execution.started) == 2
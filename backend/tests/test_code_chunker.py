@@ -0,0 +1,176 @@
+"""
+Unit tests for CodeChunker
+Structure-aware chunking for Code RAG
+"""
+
+from app.services.code_chunker import CodeChunker
+
+
+PHP_CONTROLLER = """<?php
+
+namespace App\\Http\\Controllers;
+
+use App\\Models\\User;
+use Illuminate\\Http\\Request;
+
+class UserController extends Controller
+{
+    public function index()
+    {
+        $users = User::all();
+        return view('users.index', compact('users'));
+    }
+
+    /**
+     * Store a new user.
+     */
+    public function store(Request $request)
+    {
+        $validated = $request->validate([
+            'name' => 'required|string|max:255',
+            'email' => 'required|email|unique:users',
+        ]);
+
+        $user = User::create($validated);
+
+        return redirect()->route('users.show', $user);
+    }
+}
+"""
+
+PYTHON_MODULE = '''"""Module docstring."""
+
+import os
+from typing import List
+
+
+class Repository:
+    """Stores things."""
+
+    def __init__(self, root: str):
+        self.root = root
+        self.items: List[str] = []
+        self.loaded = False
+        self.dirty = False
+
+    @property
+    def count(self) -> int:
+        total = len(self.items)
+        if total < 0:
+            raise ValueError("negative")
+        return total
+
+
+def load(path: str) -> Repository:
+    repo = Repository(path)
+    for name in os.listdir(path):
+        repo.items.append(name)
+    repo.loaded = True
+    return repo
+'''
+
+TS_MODULE = """import { api } from "./api";
+
+export interface User {
+  id: number;
+  name: string;
+}
+
+export const fetchUsers = async (page: number): Promise<User[]> => {
+  const res = await api.get(`/users?page=${page}`);
+  if (res.ok) {
+    return res.data;
+  }
+  return [];
+};
+
+export class UserStore {
+  private users: User[] = [];
+
+  async load(page: number) {
+    if (page > 0) {
+      this.users = await fetchUsers(page);
+    }
+    return this.users;
+  }
+}
+"""
+
+
+class TestCodeChunker:
+    """Test CodeChunker boundary detection and sizing"""
+
+    def setup_method(self):
+        self.chunker = CodeChunker()
+
+    def test_empty_content_has_no_chunks(self):
+        assert self.chunker.chunk("", "php") == []
+        assert self.chunker.chunk("\n\n   \n", "python") == []
+
+    def test_php_methods_become_chunks(self):
+        chunks = self.chunker.chunk(PHP_CONTROLLER, "php")
+        symbols = [c.symbol for c in chunks]
+
+        assert "UserController.store" in symbols
+        store = next(c for c in chunks if c.symbol == "UserController.store")
+        # Doc comment is attached to the method
+        assert store.content.lstrip().startswith("/**")
+        assert "User::create" in store.content
+        assert store.kind == "method"
+
+    def test_class_header_merges_forward_into_first_member(self):
+        chunks = self.chunker.chunk(PHP_CONTROLLER, "php")
+        header = next(c for c in chunks if c.symbol == "UserController")
+
+        assert "class UserController" in header.content
+        assert "function index" in header.content
+
+    def test_python_chunks_follow_classes_and_functions(self):
+        chunks = self.chunker.chunk(PYTHON_MODULE, "python")
+        symbols = [c.symbol for c in chunks]
+
+        assert "Repository.count" in symbols
+        assert "load" in symbols
+        count = next(c for c in chunks if c.symbol == "Repository.count")
+        assert count.content.lstrip().startswith("@property")
+
+    def test_typescript_functions_and_methods(self):
+        chunks = self.chunker.chunk(TS_MODULE, "typescript")
+        symbols = [c.symbol for c in chunks]
+
+        assert "fetchUsers" in symbols
+        assert any(s.startswith("UserStore") for s in symbols)
+
+    def test_chunks_cover_file_in_order_without_gaps(self):
+        for content, language in (
+            (PHP_CONTROLLER, "php"),
+            (PYTHON_MODULE, "python"),
+            (TS_MODULE, "typescript"),
+        ):
+            chunks = self.chunker.chunk(content, language)
+            assert chunks[0].start_line == 1
+            for previous, current in zip(chunks, chunks[1:]):
+                assert current.start_line == previous.end_line + 1
+            assert chunks[-1].end_line == len(content.splitlines())
+            assert [c.index for c in chunks] == list(range(len(chunks)))
+
+    def test_oversized_declaration_is_split_with_overlap(self):
+        body = "\n".join(f"    x{i} = {i}" for i in range(300))
+        content = f"def huge():\n{body}\n"
+
+        chunks = self.chunker.chunk(content, "python")
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.line_count <= CodeChunker.MAX_CHUNK_LINES
+        first, second = chunks[0], chunks[1]
+        assert second.start_line == first.end_line - CodeChunker.OVERLAP_LINES + 1
+        assert first.symbol == "huge (part 1)"
+
+    def test_unstructured_language_uses_windows(self):
+        content = "\n".join(f"key{i}: value" for i in range(250))
+
+        chunks = self.chunker.chunk(content, "yaml")
+
+        assert len(chunks) == 3
+        assert all(c.kind == "window" for c in chunks)
@@ -0,0 +1,142 @@
+"""
+Unit tests for CodeWatcher
+Event filtering, debounce batching and polling snapshots
+"""
+
+import asyncio
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from app.services.code_watcher import CodeWatcher
+
+
+@pytest.fixture
+def watcher(tmp_path: Path) -> CodeWatcher:
+    """Polling watcher over one project folder"""
+    watcher = CodeWatcher(
+        session_factory=MagicMock(),
+        debounce_seconds=0.05,
+        poll_interval_seconds=0.05,
+        force_polling=True,
+        queue_size=4
+    )
+    watcher.project_id = uuid4()
+    watcher.refresh_projects({watcher.project_id: tmp_path})
+    return watcher
+
+
+class TestEventIntake:
+    """Which changes are recorded"""
+
+    def test_ignored_dirs_and_unsupported_files_are_dropped(self, watcher, tmp_path):
+        watcher.record(watcher.project_id, str(tmp_path / "node_modules" / "lib" / "x.js"))
+        watcher.record(watcher.project_id, str(tmp_path / "app" / "logo.png"))
+        watcher.record(watcher.project_id, str(tmp_path / "app" / "user.py"))
+        watcher.record(uuid4(), str(tmp_path / "app" / "other.py"))
+
+        project = watcher.projects[watcher.project_id]
+        assert project.pending == {"app/user.py"}
+        assert project.rescan is False
+
+    def test_directory_delete_requests_rescan(self, watcher, tmp_path):
+        watcher.record(watcher.project_id, str(tmp_path / "app"), is_directory=True, event_type="modified")
+        assert watcher.projects[watcher.project_id].rescan is False
+
+        watcher.record(watcher.project_id, str(tmp_path / "app"), is_directory=True, event_type="deleted")
+        assert watcher.projects[watcher.project_id].rescan is True
+
+    def test_removed_project_is_no_longer_watched(self, watcher, tmp_path):
+        watcher.refresh_projects({})
+        watcher.record(watcher.project_id, str(tmp_path / "app" / "user.py"))
+
+        assert watcher.projects == {}
+
+
+class TestDebounce:
+    """Bursts become a single indexing batch"""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_flushed_once_after_quiet_period(self, watcher, tmp_path):
+        watcher.queue = asyncio.Queue(maxsize=4)
+        for name in ("a.py", "b.py", "a.py"):
+            watcher.record(watcher.project_id, str(tmp_path / name))
+
+        task = asyncio.create_task(watcher._debounce_loop())
+        try:
+            batch = await asyncio.wait_for(watcher.queue.get(), timeout=2)
+            await asyncio.sleep(0.15)
+        finally:
+            task.cancel()
+
+        assert batch == (watcher.project_id, tmp_path, {"a.py", "b.py"})
+        assert watcher.queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_rescan_is_queued_without_paths(self, watcher, tmp_path):
+        watcher.queue = asyncio.Queue(maxsize=4)
+        watcher.record(watcher.project_id, str(tmp_path / "a.py"))
+        watcher.record(watcher.project_id, str(tmp_path / "old"), is_directory=True, event_type="moved")
+
+        task = asyncio.create_task(watcher._debounce_loop())
+        try:
+            _, _, paths = await asyncio.wait_for(watcher.queue.get(), timeout=2)
+        finally:
+            task.cancel()
+
+        assert paths is None
+
+
+class TestPolling:
+    """Snapshot based change detection"""
+
+    def test_snapshot_skips_ignored_dirs(self, watcher, tmp_path):
+        (tmp_path / "app").mkdir()
+        (tmp_path / "app" / "user.py").write_text("x = 1\n")
+        (tmp_path / "app" / "notes.txt").write_text("n\n")
+        (tmp_path / "vendor").mkdir()
+        (tmp_path / "vendor" / "lib.php").write_text("<?php\n")
+
+        assert set(watcher._snapshot(tmp_path)) == {"app/user.py"}
+
+    def test_diff_snapshots(self):
+        previous = {"a.py": (1, 1.0), "b.py": (1, 1.0), "c.py": (1, 1.0)}
+        current = {"a.py": (1, 1.0), "b.py": (2, 2.0), "d.py": (1, 1.0)}
+
+        assert CodeWatcher._diff_snapshots(previous, current) == {"b.py", "c.py", "d.py"}
+
+
+class TestIndexing:
+    """Batches are applied through the incremental indexer"""
+
+    @pytest.mark.asyncio
+    async def test_paths_go_to_index_paths_when_project_is_indexed(self, watcher, tmp_path):
+        db = watcher.session_factory.return_value
+        db.query.return_value.filter.return_value.first.return_value = ("entry-id",)
+
+        with patch("app.services.code_watcher.CodebaseIndexer") as indexer_cls:
+            indexer = indexer_cls.return_value
+            indexer.index_paths = AsyncMock(return_value={"files_indexed": 1, "files_removed": 0})
+            indexer.index_directory = AsyncMock()
+
+            await watcher.index_changes(watcher.project_id, tmp_path, {"a.py"})
+
+        indexer.index_paths.assert_awaited_once_with(watcher.project_id, tmp_path, {"a.py"})
+        indexer.index_directory.assert_not_called()
+        db.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unindexed_project_gets_full_index(self, watcher, tmp_path):
+        db = watcher.session_factory.return_value
+        db.query.return_value.filter.return_value.first.return_value = None
+
+        with patch("app.services.code_watcher.CodebaseIndexer") as indexer_cls:
+            indexer = indexer_cls.return_value
+            indexer.index_paths = AsyncMock()
+            indexer.index_directory = AsyncMock(return_value={"files_indexed": 3, "files_removed": 0})
+
+            await watcher.index_changes(watcher.project_id, tmp_path, {"a.py"})
+
+        indexer.index_directory.assert_awaited_once_with(watcher.project_id, tmp_path)
+        indexer.index_paths.assert_not_called()
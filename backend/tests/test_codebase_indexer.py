@@ -0,0 +1,376 @@
+"""
+Unit tests for CodebaseIndexer incremental indexing
+"""
+
+import os
+import shutil
+import subprocess
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, MagicMock, patch
+from uuid import uuid4
+from sqlalchemy.orm import Session
+
+from app.models.code_index_entry import CodeIndexEntry
+from app.models.code_index_state import CodeIndexState
+from app.services.codebase_indexer import SYMBOLS_VERSION, CodebaseIndexer
+
+
+@pytest.fixture
+def indexer():
+    """CodebaseIndexer with mocked DB session and RAG service"""
+    with patch("app.services.codebase_indexer.RAGService") as rag_cls:
+        rag = MagicMock()
+        rag.embed_many.side_effect = lambda contents: [[0.0] * 3 for _ in contents]
+        rag.store_many.side_effect = lambda documents, embeddings=None, commit=True: [
+            doc["id"] for doc in documents
+        ]
+        rag_cls.return_value = rag
+        yield CodebaseIndexer(Mock(spec=Session))
+
+
+@pytest.fixture
+def project_dir(tmp_path: Path) -> Path:
+    """Small project tree"""
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "user.py").write_text("class User:\n    pass\n")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "lib.js").write_text("function x() {}\n")
+    return tmp_path
+
+
+def synced_state(project_id, root: Path, commit_sha=None) -> CodeIndexState:
+    """State of an index whose symbols are already backfilled"""
+    return CodeIndexState(
+        project_id=project_id, root_path=str(root), commit_sha=commit_sha,
+        pending_paths=[], symbols_version=SYMBOLS_VERSION
+    )
+
+
+class TestIncrementalIndexing:
+    """Manifest-driven skip / replace / delete behaviour"""
+
+    @pytest.mark.asyncio
+    async def test_new_file_is_indexed_and_recorded(self, indexer, project_dir):
+        file_path = project_dir / "app" / "user.py"
+
+        changed, entry = await indexer._index_if_changed(
+            uuid4(), file_path, "app/user.py", "python", None
+        )
+
+        assert changed is True
+        assert entry.file_path == "app/user.py"
+        assert entry.size == file_path.stat().st_size
+        assert len(entry.content_hash) == 64
+        assert entry.line_count == 2
+        stored = indexer.rag.store_many.call_args.args[0]
+        assert entry.doc_ids == [str(doc["id"]) for doc in stored]
+        assert stored[0]["metadata"]["type"] == "code_file"
+        assert all(doc["metadata"]["parent_id"] == str(stored[0]["id"]) for doc in stored[1:])
+        indexer.db.add.assert_called_once_with(entry)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_is_skipped_without_reading(self, indexer, project_dir):
+        file_path = project_dir / "app" / "user.py"
+        project_id = uuid4()
+        _, entry = await indexer._index_if_changed(project_id, file_path, "app/user.py", "python", None)
+        indexer.rag.store_many.reset_mock()
+
+        with patch("builtins.open") as open_mock:
+            changed, same_entry = await indexer._index_if_changed(
+                project_id, file_path, "app/user.py", "python", entry
+            )
+
+        assert changed is False
+        assert same_entry is entry
+        open_mock.assert_not_called()
+        indexer.rag.store_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_touched_file_with_same_content_is_skipped(self, indexer, project_dir):
+        file_path = project_dir / "app" / "user.py"
+        project_id = uuid4()
+        _, entry = await indexer._index_if_changed(project_id, file_path, "app/user.py", "python", None)
+        indexer.rag.store_many.reset_mock()
+
+        stat = file_path.stat()
+        os.utime(file_path, (stat.st_atime, stat.st_mtime + 10))
+
+        changed, _ = await indexer._index_if_changed(project_id, file_path, "app/user.py", "python", entry)
+
+        assert changed is False
+        assert entry.mtime == file_path.stat().st_mtime
+        indexer.rag.store_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changed_file_replaces_previous_documents(self, indexer, project_dir):
+        file_path = project_dir / "app" / "user.py"
+        project_id = uuid4()
+        _, entry = await indexer._index_if_changed(project_id, file_path, "app/user.py", "python", None)
+        old_doc_ids = list(entry.doc_ids)
+
+        file_path.write_text("class User:\n    name = 'x'\n\n\ndef helper():\n    return 1\n")
+
+        changed, _ = await indexer._index_if_changed(project_id, file_path, "app/user.py", "python", entry)
+
+        assert changed is True
+        indexer.rag.delete_many.assert_called_with(old_doc_ids, commit=False)
+        assert entry.doc_ids != old_doc_ids
+
+    @pytest.mark.asyncio
+    async def test_index_file_uses_the_pipeline_steps(self, indexer, project_dir):
+        indexer.db.query.return_value.filter.return_value.first.return_value = None
+        (project_dir / "LICENSE").write_text("MIT\n")
+
+        with patch.object(indexer, "_get_project_path", return_value=project_dir), \
+             patch.object(indexer, "_write_batch", wraps=indexer._write_batch) as write_batch:
+            assert await indexer.index_file(uuid4(), Path("app/user.py")) is True
+            assert await indexer.index_file(uuid4(), Path("LICENSE")) is False  # Unsupported
+
+        (prepared,), _, manifest = write_batch.call_args.args[1:]
+        assert prepared.rel_path == "app/user.py" and prepared.documents
+        assert manifest["app/user.py"].content_hash == prepared.content_hash
+
+    @pytest.mark.asyncio
+    async def test_pipeline_indexes_new_and_skips_unchanged(self, indexer, project_dir):
+        project_id = uuid4()
+        (project_dir / "app" / "order.php").write_text("<?php\nclass Order {}\n")
+        user_stat = (project_dir / "app" / "user.py").stat()
+        kept = CodeIndexEntry(
+            project_id=project_id, file_path="app/user.py", doc_ids=[],
+            size=user_stat.st_size, mtime=user_stat.st_mtime, content_hash="x" * 64, line_count=2
+        )
+
+        with patch.object(indexer, "_load_state", return_value=synced_state(project_id, project_dir)), \
+             patch.object(indexer, "_load_manifest", return_value={"app/user.py": kept}), \
+             patch.object(indexer, "_purge_code_index") as purge:
+            stats = await indexer.index_directory(project_id, project_dir)
+
+        purge.assert_not_called()
+        assert stats["files_scanned"] == 2  # node_modules is never walked
+        assert stats["files_indexed"] == 1
+        assert stats["files_unchanged"] == 1
+        assert stats["languages"] == {"php": 1, "python": 1}
+        stored_paths = {
+            doc["metadata"]["file_path"]
+            for call in indexer.rag.store_many.call_args_list
+            for doc in call.args[0]
+        }
+        assert stored_paths == {str(project_dir / "app" / "order.php")}
+
+    @pytest.mark.asyncio
+    async def test_deleted_files_are_removed(self, indexer, project_dir):
+        project_id = uuid4()
+        gone = CodeIndexEntry(project_id=project_id, file_path="app/gone.py", doc_ids=[str(uuid4())])
+        user_stat = (project_dir / "app" / "user.py").stat()
+        kept = CodeIndexEntry(
+            project_id=project_id, file_path="app/user.py", doc_ids=[],
+            size=user_stat.st_size, mtime=user_stat.st_mtime, content_hash="x" * 64, line_count=2
+        )
+
+        with patch.object(indexer, "_load_state", return_value=synced_state(project_id, project_dir)), \
+             patch.object(indexer, "_load_manifest", return_value={"app/gone.py": gone, "app/user.py": kept}), \
+             patch.object(indexer, "_remove_entries") as remove_entries, \
+             patch.object(indexer, "_purge_code_index") as purge:
+            stats = await indexer.index_directory(project_id, project_dir)
+
+        purge.assert_not_called()
+        remove_entries.assert_called_once_with([gone])
+        assert stats["files_removed"] == 1
+        assert stats["files_unchanged"] == 1
+        assert stats["files_indexed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_force_rebuilds_everything(self, indexer, project_dir):
+        project_id = uuid4()
+        user_stat = (project_dir / "app" / "user.py").stat()
+        existing = CodeIndexEntry(
+            project_id=project_id, file_path="app/user.py", doc_ids=[],
+            size=user_stat.st_size, mtime=user_stat.st_mtime, content_hash="x" * 64, line_count=2
+        )
+
+        with patch.object(indexer, "_load_manifest", return_value={"app/user.py": existing}), \
+             patch.object(indexer, "_purge_code_index") as purge:
+            stats = await indexer.index_directory(project_id, project_dir, force=True)
+
+        purge.assert_called_once_with(project_id)
+        assert stats["files_indexed"] == 1
+        assert stats["files_unchanged"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_stops_without_removing_files(self, indexer, project_dir):
+        project_id = uuid4()
+        gone = CodeIndexEntry(project_id=project_id, file_path="app/gone.py", doc_ids=[str(uuid4())])
+
+        with patch.object(indexer, "_load_manifest", return_value={"app/gone.py": gone}), \
+             patch.object(indexer, "_purge_code_index"), \
+             patch.object(indexer, "_remove_entries") as remove_entries, \
+             patch("app.services.codebase_indexer.JobManager") as job_manager_cls:
+            job_manager_cls.return_value.is_cancelled.return_value = True
+            stats = await indexer.index_directory(project_id, project_dir, job_id=uuid4())
+
+        assert stats["cancelled"] is True
+        remove_entries.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_index_paths_only_touches_given_files(self, indexer, project_dir):
+        project_id = uuid4()
+        gone = CodeIndexEntry(project_id=project_id, file_path="app/gone.py", doc_ids=[str(uuid4())])
+        (project_dir / "app" / "other.py").write_text("x = 1\n")
+
+        with patch.object(indexer, "_load_manifest", return_value={"app/gone.py": gone}) as load_manifest, \
+             patch.object(indexer, "_remove_entries") as remove_entries:
+            stats = await indexer.index_paths(project_id, project_dir, ["app/user.py", "app/gone.py"])
+
+        assert load_manifest.call_args.args[1] == {"app/user.py", "app/gone.py"}
+        assert stats["files_indexed"] == 1
+        remove_entries.assert_called_once_with([gone])
+
+
+def git(path: Path, *args: str) -> str:
+    """Run git in a test repository"""
+    result = subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=path, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def git_project(project_dir: Path) -> Path:
+    """project_dir as a git repository with one commit"""
+    if shutil.which("git") is None:
+        pytest.skip("git not available")
+    git(project_dir, "init", "-q")
+    (project_dir / ".gitignore").write_text("node_modules/\n")
+    (project_dir / "app" / "order.py").write_text("class Order:\n    pass\n")
+    git(project_dir, "add", "-A")
+    git(project_dir, "commit", "-q", "-m", "initial")
+    return project_dir
+
+
+def entry_for(project_id, root: Path, rel_path: str) -> CodeIndexEntry:
+    """Manifest entry matching the file currently on disk"""
+    stat = (root / rel_path).stat()
+    return CodeIndexEntry(
+        project_id=project_id, file_path=rel_path, doc_ids=[str(uuid4())],
+        size=stat.st_size, mtime=stat.st_mtime, content_hash="x" * 64, line_count=2
+    )
+
+
+class TestGitAwareIndexing:
+    """Re-indexing driven by commit diffs and working-tree changes"""
+
+    @pytest.mark.asyncio
+    async def test_only_files_changed_since_last_commit_are_visited(self, indexer, git_project):
+        project_id = uuid4()
+        last = git(git_project, "rev-parse", "HEAD")
+        state = synced_state(project_id, git_project, commit_sha=last)
+        gone = entry_for(project_id, git_project, "app/order.py")
+
+        (git_project / "app" / "user.py").write_text("class User:\n    name = 'x'\n")
+        git(git_project, "rm", "-q", "app/order.py")
+        git(git_project, "commit", "-q", "-am", "change")
+        (git_project / "app" / "draft.py").write_text("def draft():\n    pass\n")
+
+        with patch.object(indexer, "_load_state", return_value=state), \
+             patch.object(indexer, "_load_manifest", return_value={"app/order.py": gone}) as load_manifest, \
+             patch.object(indexer, "_remove_entries") as remove_entries, \
+             patch.object(indexer, "_purge_code_index") as purge, \
+             patch.object(indexer, "_save_state") as save_state:
+            stats = await indexer.index_directory(project_id, git_project)
+
+        purge.assert_not_called()
+        assert stats["mode"] == "git"
+        assert load_manifest.call_args.args[1] == {"app/user.py", "app/order.py", "app/draft.py"}
+        assert stats["files_scanned"] == 2
+        assert stats["files_indexed"] == 2
+        remove_entries.assert_called_once_with([gone])
+        head, dirty = save_state.call_args.args[2]
+        assert head == git(git_project, "rev-parse", "HEAD")
+        assert dirty == {"app/draft.py"}
+
+    @pytest.mark.asyncio
+    async def test_unknown_last_commit_falls_back_to_full_scan(self, indexer, git_project):
+        project_id = uuid4()
+        state = synced_state(project_id, git_project, commit_sha="0" * 40)
+        kept = {
+            path: entry_for(project_id, git_project, path)
+            for path in ("app/user.py", "app/order.py")
+        }
+
+        with patch.object(indexer, "_load_state", return_value=state), \
+             patch.object(indexer, "_load_manifest", return_value=kept), \
+             patch.object(indexer, "_save_state"):
+            stats = await indexer.index_directory(project_id, git_project)
+
+        assert stats["mode"] == "full"
+        assert stats["files_unchanged"] == 2
+
+    @pytest.mark.asyncio
+    async def test_state_records_head_and_pending_paths(self, indexer, git_project):
+        project_id = uuid4()
+        indexer.db.query.return_value.filter.return_value.first.return_value = None
+        head = git(git_project, "rev-parse", "HEAD")
+
+        indexer._save_state(
+            project_id, git_project, (head, {"app/draft.py"}),
+            seen_paths={"app/user.py", "app/broken.py"},
+            manifest={"app/user.py": entry_for(project_id, git_project, "app/user.py")}
+        )
+
+        state = indexer.db.add.call_args.args[0]
+        assert state.commit_sha == head
+        assert state.root_path == str(git_project)
+        assert state.pending_paths == ["app/broken.py", "app/draft.py"]
+        assert state.symbols_version == SYMBOLS_VERSION
+
+    @pytest.mark.asyncio
+    async def test_symbols_are_backfilled_once_even_without_symbols(self, indexer, git_project):
+        project_id = uuid4()
+        last = git(git_project, "rev-parse", "HEAD")
+        state = synced_state(project_id, git_project, commit_sha=last)
+        state.symbols_version = None  # Indexed before the symbol table existed
+        kept = {path: entry_for(project_id, git_project, path) for path in ("app/user.py", "app/order.py")}
+
+        with patch.object(indexer, "_load_state", return_value=state), \
+             patch.object(indexer, "_load_manifest", return_value=kept), \
+             patch.object(indexer, "_save_state") as save_state:
+            stats = await indexer.index_directory(project_id, git_project)
+
+        assert stats["mode"] == "full"  # Unchanged files parsed for their symbols
+        save_state.assert_called_once()
+
+        # Recorded after the pass: the next run diffs, whatever symbols were found
+        state.symbols_version = SYMBOLS_VERSION
+        with patch.object(indexer, "_load_state", return_value=state), \
+             patch.object(indexer, "_load_manifest", return_value={}), \
+             patch.object(indexer, "_save_state"):
+            stats = await indexer.index_directory(project_id, git_project)
+
+        assert stats["mode"] == "git"
+        assert stats["files_scanned"] == 0
+
+    @pytest.mark.asyncio
+    async def test_force_rebuilds_a_git_repository(self, indexer, git_project):
+        project_id = uuid4()
+
+        with patch.object(indexer, "_load_manifest", return_value={}), \
+             patch.object(indexer, "_purge_code_index") as purge, \
+             patch.object(indexer, "_save_state") as save_state:
+            stats = await indexer.index_directory(project_id, git_project, force=True)
+
+        purge.assert_called_once_with(project_id)
+        assert stats["mode"] == "full"
+        assert stats["files_indexed"] == 2
+        assert save_state.call_args.args[2][0] == git(git_project, "rev-parse", "HEAD")
+
+    def test_state_outside_git_records_the_backfill(self, indexer, project_dir):
+        indexer.db.query.return_value.filter.return_value.first.return_value = None
+
+        indexer._save_state(uuid4(), project_dir, None, seen_paths={"app/user.py"}, manifest={})
+
+        state = indexer.db.add.call_args.args[0]
+        assert state.commit_sha is None
+        assert state.pending_paths == ["app/user.py"]
+        assert state.symbols_version == SYMBOLS_VERSION
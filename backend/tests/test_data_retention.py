@@ -0,0 +1,232 @@
+"""
+Unit tests for DataRetentionService
+Monthly partitions, archive files, row expiry and prompt compaction (SQLite in memory)
+"""
+
+import gzip
+import json
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 - register all tables
+from app.database import Base
+from app.models.async_job import AsyncJob, JobStatus, JobType
+from app.models.prompt import Prompt
+from app.services.data_retention import (
+    ArchiveWriter,
+    DataRetentionService,
+    Partition,
+    add_months,
+    ensure_partitions,
+    expired_partitions,
+    parse_partition,
+    partition_for,
+    run_data_retention,
+)
+
+
+NOW = datetime(2026, 5, 15, 12, 0)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced here
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def read_archive(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def add_job(db, status, days_old):
+    job = AsyncJob(job_type=JobType.TASK_EXECUTION, status=status, input_data={},
+                   result={"ok": True}, created_at=NOW - timedelta(days=days_old))
+    db.add(job)
+    db.commit()
+    return job
+
+
+class TestPartitions:
+    """Monthly partition names and bounds"""
+
+    def test_partition_bounds(self):
+        partition = partition_for("async_jobs", datetime(2026, 12, 31, 23, 59))
+
+        assert partition == Partition("async_jobs_p2026_12", datetime(2026, 12, 1), datetime(2027, 1, 1))
+        assert add_months(datetime(2026, 1, 1), -1) == datetime(2025, 12, 1)
+
+    def test_parse_partition(self):
+        assert parse_partition("ai_executions", "ai_executions_p2026_02").start == datetime(2026, 2, 1)
+        assert parse_partition("async_jobs", "async_jobs_legacy") is None
+        assert parse_partition("async_jobs", "ai_executions_p2026_02") is None
+
+    def test_only_partitions_entirely_before_the_cutoff_expire(self):
+        partitions = [partition_for("async_jobs", datetime(2026, month, 1)) for month in (4, 2, 3)]
+
+        expired = expired_partitions(partitions, cutoff=datetime(2026, 4, 15))
+
+        assert [p.name for p in expired] == ["async_jobs_p2026_02", "async_jobs_p2026_03"]
+
+    def test_expired_partitions_are_dropped_whole(self, db, tmp_path):
+        service = DataRetentionService(db, archive_dir=str(tmp_path), now=NOW)
+        partitions = [partition_for("async_jobs", datetime(2026, month, 1)) for month in range(1, 6)]
+
+        with patch.object(service, "is_partitioned", return_value=True), \
+             patch.object(service, "ensure_partitions", return_value=["async_jobs_p2026_06"]), \
+             patch.object(service, "list_partitions", return_value=partitions), \
+             patch.object(service, "drop_partition", side_effect=[10, None]) as drop:
+            summary = service.expire("async_jobs", retention_days=60)
+
+        assert [call.args[1].name for call in drop.call_args_list] == ["async_jobs_p2026_01", "async_jobs_p2026_02"]
+        assert summary["partitions_dropped"] == ["async_jobs_p2026_01"]  # February still has running jobs
+        assert summary["rows_archived"] == 10
+        assert summary["partitions_created"] == ["async_jobs_p2026_06"]
+
+
+    def test_upcoming_partitions_and_months_held_by_default_are_created(self):
+        service = DataRetentionService(MagicMock(), now=NOW)
+
+        with patch.object(service, "_child_tables", return_value=["async_jobs_default", "async_jobs_p2026_05"]), \
+             patch.object(service, "_default_months", return_value=[datetime(2026, 2, 1)]), \
+             patch.object(service, "_move_from_default") as move:
+            created = service.ensure_partitions("async_jobs", months_ahead=2)
+
+        assert created == ["async_jobs_p2026_02", "async_jobs_p2026_06", "async_jobs_p2026_07"]
+        assert [call.args[1].name for call in move.call_args_list] == ["async_jobs_p2026_02"]
+        statements = [str(call.args[0]) for call in service.db.execute.call_args_list]
+        assert statements[0] == (
+            "CREATE TABLE IF NOT EXISTS async_jobs_p2026_06 PARTITION OF async_jobs "
+            "FOR VALUES FROM ('2026-06-01') TO ('2026-07-01')"
+        )
+
+    def test_ensure_partitions_skips_tables_that_are_not_partitioned(self, db):
+        assert ensure_partitions(lambda: db) == {}
+
+
+class TestArchiveWriter:
+    """Gzip JSONL export"""
+
+    def test_rows_are_written_as_jsonl(self, tmp_path):
+        row_id = uuid4()
+        path = tmp_path / "jobs" / "async_jobs_p2026_01.jsonl.gz"
+
+        with ArchiveWriter(path) as writer:
+            writer.write_all([{"id": row_id, "created_at": NOW, "status": JobStatus.COMPLETED, "result": {"a": 1}}])
+
+        assert writer.rows == 1
+        assert read_archive(path) == [
+            {"id": str(row_id), "created_at": NOW.isoformat(), "status": "completed", "result": {"a": 1}}
+        ]
+
+    def test_failed_export_leaves_no_archive(self, tmp_path):
+        path = tmp_path / "async_jobs_p2026_01.jsonl.gz"
+
+        with pytest.raises(RuntimeError):
+            with ArchiveWriter(path) as writer:
+                writer.write({"id": 1})
+                raise RuntimeError("disk full")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_nothing_is_created_without_rows(self, tmp_path):
+        with ArchiveWriter(tmp_path / "empty.jsonl.gz"):
+            pass
+
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestRowExpiry:
+    """Tables that are not partitioned: archive and delete in batches"""
+
+    def test_old_finished_jobs_are_archived_and_deleted(self, db, tmp_path):
+        old = add_job(db, JobStatus.COMPLETED, days_old=45)
+        stuck = add_job(db, JobStatus.PENDING, days_old=45)
+        recent = add_job(db, JobStatus.FAILED, days_old=5)
+        old_id = old.id
+
+        summary = DataRetentionService(db, archive_dir=str(tmp_path), now=NOW).expire("async_jobs", 30)
+
+        assert summary["rows_deleted"] == 1 and summary["rows_archived"] == 1
+        assert {job.id for job in db.query(AsyncJob)} == {stuck.id, recent.id}
+        (archive,) = (tmp_path / "async_jobs").iterdir()
+        assert [row["id"] for row in read_archive(archive)] == [str(old_id)]
+
+    def test_zero_days_keeps_everything(self, db, tmp_path):
+        add_job(db, JobStatus.COMPLETED, days_old=400)
+
+        summary = DataRetentionService(db, archive_dir=str(tmp_path), now=NOW).expire("async_jobs", 0)
+
+        assert summary["rows_deleted"] == 0
+        assert db.query(AsyncJob).count() == 1
+
+
+class TestPromptCompaction:
+    """Audit payload of old prompts is archived and cleared"""
+
+    def test_old_payload_is_cleared(self, db, tmp_path):
+        project_id = uuid4()
+        old = Prompt(project_id=project_id, content="Gerar épico", system_prompt="S" * 100,
+                     user_prompt="U", response="R", input_tokens=120, created_at=NOW - timedelta(days=120))
+        recent = Prompt(project_id=project_id, content="Gerar tarefa", system_prompt="S",
+                        response="R", created_at=NOW - timedelta(days=3))
+        db.add_all([old, recent])
+        db.commit()
+
+        service = DataRetentionService(db, archive_dir=str(tmp_path), now=NOW)
+        assert service.compact_prompts(older_than_days=90) == {"prompts_compacted": 1}
+        assert service.compact_prompts(older_than_days=90) == {"prompts_compacted": 0}
+
+        db.expire_all()
+        assert (old.system_prompt, old.user_prompt, old.response) == (None, None, None)
+        assert old.content == "Gerar épico" and old.input_tokens == 120
+        assert recent.system_prompt == "S"
+        (archive,) = (tmp_path / "prompts").iterdir()
+        assert read_archive(archive)[0]["system_prompt"] == "S" * 100
+
+
+class TestAdvisoryLock:
+    """One retention run at a time on Postgres; the lock is released after the run"""
+
+    def postgres(self, acquired):
+        db = MagicMock()
+        db.get_bind.return_value.dialect.name = "postgresql"
+        lock = db.get_bind.return_value.connect.return_value.execution_options.return_value
+        lock.execute.return_value.scalar.return_value = acquired
+        return db, lock
+
+    def statements(self, lock):
+        return [str(call.args[0]) for call in lock.execute.call_args_list]
+
+    def test_lock_is_released_before_the_connection_returns_to_the_pool(self):
+        db, lock = self.postgres(acquired=True)
+
+        with patch("app.services.data_retention.DataRetentionService") as service:
+            service.return_value.run.side_effect = RuntimeError("disk full")
+            with pytest.raises(RuntimeError):
+                run_data_retention(lambda: db)
+
+        assert self.statements(lock) == ["SELECT pg_try_advisory_lock(:id)", "SELECT pg_advisory_unlock(:id)"]
+        lock.close.assert_called_once()
+
+    def test_run_is_skipped_while_locked_elsewhere(self):
+        db, lock = self.postgres(acquired=False)
+
+        with patch("app.services.data_retention.DataRetentionService") as service:
+            assert run_data_retention(lambda: db) is None
+
+        service.assert_not_called()
+        assert self.statements(lock) == ["SELECT pg_try_advisory_lock(:id)"]
+        lock.close.assert_called_once()
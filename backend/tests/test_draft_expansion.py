@@ -0,0 +1,136 @@
+"""
+Unit tests for DraftHierarchyExpander
+Level-by-level fan-out, concurrency cap, batch writes, progress reporting
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from app.config import settings
+from app.models.task import ItemType
+from app.services.draft_expansion import DraftHierarchyExpander
+
+
+CHILD_TYPES = {ItemType.EPIC: ItemType.STORY, ItemType.STORY: ItemType.TASK, ItemType.TASK: ItemType.SUBTASK}
+
+
+class FakeContextService:
+    """Draft generators that create `fan_out` children after a short AI delay"""
+
+    def __init__(self, fan_out: int = 3, fail_for: str = None):
+        self.fan_out = fan_out
+        self.fail_for = fail_for
+        self.running = 0
+        self.max_running = 0
+        self.persist_flags = []
+
+    async def _generate(self, parent, project, persist=True):
+        self.persist_flags.append(persist)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.02)
+        self.running -= 1
+        if parent.title == self.fail_for:
+            raise RuntimeError("AI unavailable")
+        return [
+            SimpleNamespace(
+                id=uuid4(), parent_id=parent.id, item_type=CHILD_TYPES[parent.item_type],
+                title=f"{parent.title}.{i}"
+            )
+            for i in range(self.fan_out)
+        ]
+
+    _generate_draft_stories = _generate
+    _generate_draft_tasks = _generate
+    _generate_draft_subtasks = _generate
+
+
+@pytest.fixture
+def epic():
+    return SimpleNamespace(id=uuid4(), item_type=ItemType.EPIC, title="E")
+
+
+@pytest.fixture
+def project():
+    return SimpleNamespace(id=uuid4())
+
+
+@pytest.fixture(autouse=True)
+def websocket():
+    with patch("app.services.draft_expansion.broadcast_event", new_callable=AsyncMock) as broadcast:
+        yield broadcast
+
+
+class TestExpansion:
+    """Levels fan out concurrently and are written in batches"""
+
+    @pytest.mark.asyncio
+    async def test_full_expansion_writes_one_batch_per_level(self, epic, project, monkeypatch):
+        monkeypatch.setattr(settings, "draft_generation_concurrency", 4)
+        db = MagicMock()
+        service = FakeContextService()
+
+        levels = await DraftHierarchyExpander(db, service).expand(epic, project, depth=3)
+
+        assert [len(level) for level in levels] == [3, 9, 27]
+        assert {child.item_type for child in levels[2]} == {ItemType.SUBTASK}
+        story_ids = {story.id for story in levels[0]}
+        assert {task.parent_id for task in levels[1]} == story_ids
+        assert db.add_all.call_count == 3
+        assert db.commit.call_count == 3
+        assert service.max_running == 4
+        assert set(service.persist_flags) == {False}
+
+    @pytest.mark.asyncio
+    async def test_failed_parent_does_not_stop_its_siblings(self, epic, project):
+        service = FakeContextService(fan_out=2, fail_for="E.0")
+
+        levels = await DraftHierarchyExpander(MagicMock(), service).expand(epic, project, depth=2)
+
+        assert [child.title for child in levels[1]] == ["E.1.0", "E.1.1"]
+
+    @pytest.mark.asyncio
+    async def test_depth_is_capped_at_subtasks(self, epic, project):
+        levels = await DraftHierarchyExpander(MagicMock(), FakeContextService(fan_out=1)).expand(
+            epic, project, depth=10
+        )
+
+        assert len(levels) == 3
+
+
+class TestProgress:
+    """AsyncJob and WebSocket receive per-level progress"""
+
+    @pytest.mark.asyncio
+    async def test_progress_is_reported_to_job_and_websocket(self, epic, project, websocket):
+        job_id = uuid4()
+        job_manager = MagicMock()
+        job_manager.is_cancelled.return_value = False
+
+        with patch("app.services.draft_expansion.JobManager", return_value=job_manager):
+            await DraftHierarchyExpander(MagicMock(), FakeContextService(fan_out=2)).expand(
+                epic, project, depth=2, job_id=job_id, progress_range=(40.0, 90.0)
+            )
+
+        percents = [call.args[1] for call in job_manager.update_progress.call_args_list]
+        assert percents == sorted(percents)
+        assert percents[0] == 65.0 and percents[-1] == 90.0
+        assert websocket.await_count == 3
+        assert websocket.await_args.kwargs["event_type"] == "draft_expansion_progress"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_stops_before_next_level(self, epic, project):
+        job_manager = MagicMock()
+        job_manager.is_cancelled.side_effect = [False, True]
+        db = MagicMock()
+
+        with patch("app.services.draft_expansion.JobManager", return_value=job_manager):
+            levels = await DraftHierarchyExpander(db, FakeContextService()).expand(
+                epic, project, depth=3, job_id=uuid4()
+            )
+
+        assert len(levels) == 1
+        assert db.commit.call_count == 1
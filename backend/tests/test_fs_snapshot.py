@@ -0,0 +1,129 @@
+"""
+Unit tests for FileSnapshotService
+Shared os.scandir snapshot and its consumers
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+from app.config import settings
+from app.services.fs_snapshot import FileSnapshotService
+from app.services.file_processor import FileProcessor
+from app.services.stack_detector import StackDetector
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Small Laravel-like project with dependency folders"""
+    (tmp_path / "app" / "Http" / "Controllers").mkdir(parents=True)
+    (tmp_path / "app" / "Http" / "Controllers" / "UserController.php").write_text("<?php\nclass UserController {}\n")
+    (tmp_path / "app" / "Models").mkdir()
+    (tmp_path / "app" / "Models" / "User.php").write_text("<?php\nclass User {}\n")
+    (tmp_path / "artisan").write_text("#!/usr/bin/env php\n")
+    (tmp_path / "composer.json").write_text('{"require": {"laravel/framework": "^10.0"}}')
+    (tmp_path / "README.md").write_text("# Demo\n")
+    (tmp_path / "vendor" / "pkg").mkdir(parents=True)
+    (tmp_path / "vendor" / "pkg" / "Lib.php").write_text("<?php\n")
+    return tmp_path
+
+
+@pytest.fixture
+def service() -> FileSnapshotService:
+    return FileSnapshotService()
+
+
+@pytest.fixture
+def processor(tmp_path: Path, monkeypatch) -> FileProcessor:
+    """FileProcessor with storage dirs under tmp_path"""
+    monkeypatch.setattr(settings, "upload_dir", str(tmp_path / "storage" / "uploads"))
+    monkeypatch.setattr(settings, "extraction_dir", str(tmp_path / "storage" / "extractions"))
+    return FileProcessor()
+
+
+class TestSnapshot:
+    """Walk output"""
+
+    def test_files_are_sorted_with_metadata_and_ignored_dirs_pruned(self, service, project):
+        snapshot = service.scan(project)
+
+        assert [info.path for info in snapshot.files] == [
+            "README.md",
+            "app/Http/Controllers/UserController.php",
+            "app/Models/User.php",
+            "artisan",
+            "composer.json",
+        ]
+        user = snapshot.by_path["app/Models/User.php"]
+        assert user.ext == ".php"
+        assert user.language == "php"
+        assert user.size == (project / "app" / "Models" / "User.php").stat().st_size
+        assert snapshot.by_path["artisan"].language is None
+        assert snapshot.has_dir("app/Http/Controllers")
+        assert not snapshot.has_dir("vendor")
+
+    def test_glob_follows_path_glob_semantics(self, service, project):
+        snapshot = service.scan(project)
+
+        assert [i.path for i in snapshot.glob("app/Models/*.php")] == ["app/Models/User.php"]
+        assert len(snapshot.glob("app/**/*.php")) == 2
+        assert len(snapshot.glob("**/*.php")) == 2
+        assert snapshot.glob("*/User.php") == []
+
+    def test_scan_without_ignore_rules_counts_everything(self, service, project):
+        pruned = service.scan(project)
+        full = service.scan(project, ignore_dirs=())
+
+        assert full.total_size == pruned.total_size + len("<?php\n")
+
+
+class TestCache:
+    """Reuse and invalidation"""
+
+    def test_cached_snapshot_is_reused(self, service, project):
+        first = service.get(project)
+
+        assert service.get(project) is first
+
+    def test_added_file_invalidates_through_directory_mtime(self, service, project):
+        first = service.get(project)
+        models = project / "app" / "Models"
+        (models / "Order.php").write_text("<?php\n")
+        stat = models.stat()
+        os.utime(models, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second = service.get(project)
+
+        assert second is not first
+        assert second.has_file("app/Models/Order.php")
+
+    def test_explicit_invalidation_and_max_age(self, service, project):
+        first = service.get(project)
+        service.invalidate(project)
+        second = service.get(project)
+
+        assert second is not first
+        assert service.get(project, max_age=0) is not second
+
+
+class TestConsumers:
+    """Flows built on the snapshot"""
+
+    def test_file_tree_from_snapshot(self, service, processor, project):
+        tree = processor.build_file_tree(project, snapshot=service.scan(project))
+
+        names = [child["name"] for child in tree["children"]]
+        assert "vendor" not in names
+        app = next(child for child in tree["children"] if child["name"] == "app")
+        assert {child["path"] for child in app["children"]} == {"app/Http", "app/Models"}
+
+    def test_file_tree_respects_max_depth(self, service, processor, project):
+        tree = processor.build_file_tree(project, max_depth=1, snapshot=service.scan(project))
+
+        app = next(child for child in tree["children"] if child["name"] == "app")
+        assert app["children"] == []
+
+    def test_stack_detection_from_snapshot(self, service, project):
+        result = StackDetector().detect(project, snapshot=service.scan(project))
+
+        assert result["detected_stack"] == "laravel"
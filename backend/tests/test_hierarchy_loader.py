@@ -0,0 +1,163 @@
+"""
+Unit tests for HierarchyLoader and the materialized task path
+Path/CTE ancestor and subtree loading, identity cache, path maintenance (SQLite in memory)
+"""
+
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - register all tables referenced by Task
+from app.database import Base
+from app.models.task import Task, ItemType, path_segment
+from app.services.hierarchy_loader import HierarchyLoader
+from app.services.task_hierarchy import TaskHierarchyService
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced by tasks
+    return engine
+
+
+@pytest.fixture
+def tree(engine):
+    """Epic -> 2 Stories -> Task -> Subtask"""
+    project_id = uuid4()
+    ids = {name: uuid4() for name in ("epic", "s1", "s2", "task", "sub")}
+    rows = [
+        ("epic", None, ItemType.EPIC, 0), ("s1", "epic", ItemType.STORY, 1),
+        ("s2", "epic", ItemType.STORY, 0), ("task", "s1", ItemType.TASK, 0),
+        ("sub", "task", ItemType.SUBTASK, 0),
+    ]
+    with Session(engine) as db:
+        db.add_all([
+            Task(id=ids[name], project_id=project_id, title=name, item_type=item_type,
+                 parent_id=ids[parent] if parent else None, order=order)
+            for name, parent, item_type, order in rows
+        ])
+        db.commit()
+    return ids
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+    event.listen(engine, "before_cursor_execute", lambda *args: executed.append(args[2]))
+    return executed
+
+
+class TestAncestors:
+    """Chain from the materialized path, then from the cache"""
+
+    def test_chain_uses_path_and_cache(self, db, tree, statements):
+        loader = HierarchyLoader(db)
+
+        sub, task, story, epic = loader.chain(tree["sub"], 4)
+
+        assert [t.title for t in (sub, task, story, epic)] == ["sub", "task", "s1", "epic"]
+        assert len(statements) == 2  # the task, then its ancestors by primary key
+        assert not any("RECURSIVE" in statement for statement in statements)
+
+        assert [t.title for t in loader.path(tree["task"])] == ["epic", "s1", "task"]
+        assert loader.get(tree["s1"]) is story
+        assert loader.depth(tree["sub"]) == 3
+        assert len(statements) == 2
+
+    def test_rows_without_path_fall_back_to_recursive_cte(self, engine, db, tree, statements):
+        with engine.begin() as connection:
+            connection.execute(text("UPDATE tasks SET hierarchy_path = NULL"))
+        statements.clear()
+
+        chain = HierarchyLoader(db).chain(tree["sub"], 4)
+
+        assert [t.title for t in chain] == ["sub", "task", "s1", "epic"]
+        assert any("WITH RECURSIVE" in statement for statement in statements)
+
+    def test_chain_of_unsaved_task_starts_at_its_parent(self, db, tree):
+        draft = Task(title="draft", item_type=ItemType.SUBTASK, parent_id=tree["task"])
+
+        chain = HierarchyLoader(db).chain(draft, 5)
+
+        assert [t.title if t else None for t in chain] == ["draft", "task", "s1", "epic", None]
+
+    def test_root_and_missing_tasks(self, db, tree):
+        loader = HierarchyLoader(db)
+
+        assert loader.ancestors(tree["epic"]) == []
+        assert loader.path(uuid4()) == []
+        assert loader.get(None) is None
+
+
+class TestDescendants:
+    """Subtree with one prefix lookup, depth-first with siblings by order"""
+
+    def test_subtree_order(self, db, tree, statements):
+        loader = HierarchyLoader(db)
+
+        subtree = loader.descendants(tree["epic"])
+
+        assert [t.title for t in subtree] == ["s2", "s1", "task", "sub"]
+        assert len(statements) == 2  # root, then hierarchy_path LIKE '<root path>%'
+        assert "LIKE" in statements[1]
+        assert [t.title for t in loader.ancestors(tree["sub"])] == ["task", "s1", "epic"]
+        assert len(statements) == 2
+        assert loader.count_descendants(tree["s1"]) == 2
+
+
+class TestTaskHierarchyService:
+    """Service methods go through the loader"""
+
+    def test_path_cycle_check_and_counts(self, db, tree):
+        service = TaskHierarchyService(db)
+
+        assert [t.title for t in service.get_hierarchy_path(tree["sub"])] == ["epic", "s1", "task", "sub"]
+        assert service.get_hierarchy_depth(tree["sub"]) == 3
+        assert service.would_create_cycle(tree["epic"], tree["sub"]) is True
+        assert service.would_create_cycle(tree["sub"], tree["epic"]) is False
+        assert service.would_create_cycle(tree["s1"], tree["s1"]) is True
+        assert service.get_children_count(tree["epic"], recursive=True) == 4
+
+
+class TestMaterializedPath:
+    """hierarchy_path is kept up to date on flush"""
+
+    def test_paths_assigned_on_creation(self, db, tree):
+        sub = db.get(Task, tree["sub"])
+
+        assert sub.hierarchy_path == "".join(
+            path_segment(tree[name]) for name in ("epic", "s1", "task", "sub")
+        )
+
+    def test_move_rebases_subtree(self, engine, db, tree):
+        TaskHierarchyService(db).move_task(tree["task"], tree["s2"])
+
+        with Session(engine) as fresh:
+            sub = fresh.get(Task, tree["sub"])
+            assert sub.hierarchy_path == "".join(
+                path_segment(tree[name]) for name in ("epic", "s2", "task", "sub")
+            )
+            assert [t.title for t in HierarchyLoader(fresh).descendants(tree["s2"])] == ["task", "sub"]
+            assert HierarchyLoader(fresh).descendants(tree["s1"]) == []
+
+    def test_move_into_own_subtree_is_rejected(self, db, tree):
+        with pytest.raises(ValueError, match="cycle"):
+            TaskHierarchyService(db).move_task(tree["s1"], tree["sub"], validate_rules=False)
+
+    def test_cycle_is_rejected_on_flush(self, db, tree):
+        db.get(Task, tree["epic"]).parent_id = tree["sub"]
+
+        with pytest.raises(ValueError, match="cycle"):
+            db.flush()
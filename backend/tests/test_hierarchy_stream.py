@@ -0,0 +1,244 @@
+"""
+Unit tests for streamed hierarchy generation
+Incremental JSON parsing, early item release, batched writes (SQLite in memory)
+"""
+
+import json
+import random
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - register all tables referenced by Task
+from app.database import Base
+from app.models.task import Task, ItemType
+from app.services.backlog_generator import BacklogGeneratorService
+from app.services.hierarchy_stream import HierarchyBatchWriter, HierarchyStream, META_PROMPT_LEVELS
+from app.services.meta_prompt_processor import MetaPromptProcessor
+from app.services.streaming_json import IncrementalJSONParser
+
+
+HIERARCHY = {
+    "epic": {"title": "Shop", "description": "Online shop", "priority": "high"},
+    "stories": [
+        {
+            "title": "Checkout",
+            "tasks": [
+                {"title": "Card form", "subtasks": [{"title": "Validate CVV"}]},
+                {"title": "Receipt"},
+            ],
+            "story_points": 8,
+        },
+        {"title": "Catalog", "description": "Browse \"products\" é😀", "tasks": []},
+    ],
+    "metadata": {"total_items": 6},
+}
+
+
+def chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+async def stream_of(text, size=7):
+    for chunk in chunks(text, size):
+        yield chunk
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced here
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def broadcasts():
+    with patch("app.services.hierarchy_stream.broadcast_event", new_callable=AsyncMock) as broadcast:
+        yield broadcast
+
+
+class TestIncrementalJSONParser:
+    """Any chunking parses to what json.loads returns"""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_random_chunks_roundtrip(self, seed):
+        text = "```json\n" + json.dumps(HIERARCHY, ensure_ascii=seed % 2 == 0) + "\n```"
+        rng = random.Random(seed)
+        parser = IncrementalJSONParser()
+        position = 0
+        while position < len(text):
+            size = rng.randint(1, 12)
+            parser.feed(text[position:position + size])
+            position += size
+
+        assert parser.finish() == HIERARCHY
+
+    def test_events_report_closed_objects(self):
+        parser = IncrementalJSONParser()
+        events = []
+        for chunk in chunks('[{"a": [1, 2]}, {"b": null}]', 3):
+            events.extend(parser.feed(chunk))
+
+        closed = [(e.path, e.value) for e in events if e.kind == "end"]
+        assert closed == [((0, "a"), [1, 2]), ((0,), {"a": [1, 2]}), ((1,), {"b": None}),
+                          ((), [{"a": [1, 2]}, {"b": None}])]
+
+    def test_incomplete_and_invalid_documents(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": [1, ')
+        with pytest.raises(ValueError, match="Incomplete"):
+            parser.finish()
+        with pytest.raises(ValueError, match="Mismatched"):
+            IncrementalJSONParser().feed('{"a": 1]')
+
+
+class TestHierarchyStream:
+    """Parents are released before children, with ids children can reference"""
+
+    def test_release_order_and_parents(self):
+        stream = HierarchyStream(META_PROMPT_LEVELS)
+        items = []
+        for chunk in chunks(json.dumps(HIERARCHY), 5):
+            items.extend(stream.feed(chunk))
+        stream.finish()
+
+        created = [item for item in items if not item.update]
+        titles = [item.data["title"] for item in created]
+        assert titles == ["Shop", "Checkout", "Card form", "Validate CVV", "Receipt", "Catalog"]
+        by_title = {item.data["title"]: item for item in created}
+        assert by_title["Shop"].parent_id is None
+        assert by_title["Checkout"].parent_id == by_title["Shop"].id
+        assert by_title["Validate CVV"].parent_id == by_title["Card form"].id
+        assert by_title["Catalog"].order == 1
+        assert "tasks" not in by_title["Catalog"].data
+
+    def test_story_is_released_before_its_object_closes(self):
+        stream = HierarchyStream(META_PROMPT_LEVELS)
+        text = json.dumps(HIERARCHY)
+        cut = text.index('"Card form"')
+
+        items = stream.feed(text[:cut])
+
+        assert [item.data["title"] for item in items] == ["Shop", "Checkout"]
+
+    def test_fields_after_children_are_updates(self):
+        stream = HierarchyStream(META_PROMPT_LEVELS)
+        text = json.dumps(HIERARCHY)
+        cut = text.index('"story_points"')
+        items = stream.feed(text[:cut]) + stream.feed(text[cut:])
+
+        updates = [item for item in items if item.update]
+        assert [(item.data["title"], item.data["story_points"]) for item in updates] == [("Checkout", 8)]
+        assert updates[0].id == next(i.id for i in items if i.data["title"] == "Checkout" and not i.update)
+
+
+class TestHierarchyBatchWriter:
+    """One commit and one WebSocket event per batch"""
+
+    @pytest.mark.asyncio
+    async def test_batches(self, broadcasts):
+        db = MagicMock()
+        project_id, job_id = uuid4(), uuid4()
+        writer = HierarchyBatchWriter(db, project_id, batch_size=2, job_id=job_id)
+
+        for i in range(5):
+            await writer.add(Task(id=uuid4(), title=f"T{i}", item_type=ItemType.TASK, order=i))
+        tasks = await writer.finish()
+
+        assert len(tasks) == 5
+        assert db.commit.call_count == 3
+        assert [len(call.kwargs["data"]["items"]) for call in broadcasts.call_args_list] == [2, 2, 1]
+        last = broadcasts.call_args.kwargs
+        assert last["project_id"] == str(project_id)
+        assert last["event_type"] == "hierarchy_items_created"
+        assert last["data"]["job_id"] == str(job_id)
+        assert last["data"]["total_created"] == 5
+
+
+class TestMetaPromptStreaming:
+    """MetaPromptProcessor writes streamed items as they arrive"""
+
+    @pytest.fixture
+    def processor(self, db):
+        with patch("app.services.meta_prompt_processor.AIOrchestrator"), \
+             patch("app.services.meta_prompt_processor.PrompterFacade"), \
+             patch("app.services.meta_prompt_processor.get_prompt_service"):
+            processor = MetaPromptProcessor(db)
+        processor._build_hierarchy_prompts = lambda *args: ("system", "user")
+        processor.orchestrator.choose_model.return_value = {"db_model_name": "test-model"}
+        return processor
+
+    @pytest.mark.asyncio
+    async def test_streamed_hierarchy_is_persisted(self, db, processor, broadcasts, monkeypatch):
+        monkeypatch.setattr("app.services.hierarchy_stream.settings.hierarchy_stream_batch_size", 2)
+        processor.orchestrator.execute_stream = lambda **kwargs: stream_of(json.dumps(HIERARCHY))
+        project = SimpleNamespace(id=uuid4(), name="Shop")
+
+        created, metadata = await processor._stream_hierarchy_with_ai({}, [], project, uuid4())
+
+        assert metadata == {"total_items": 6, "ai_model": "test-model"}
+        assert broadcasts.call_count == 3
+        rows = {task.title: task for task in db.query(Task).all()}
+        assert len(rows) == 6
+        assert rows["Checkout"].parent_id == rows["Shop"].id
+        assert rows["Validate CVV"].parent_id == rows["Card form"].id
+        assert rows["Checkout"].story_points == 8  # arrived after its tasks
+        assert rows["Validate CVV"].item_type == ItemType.SUBTASK
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream_keeps_written_items(self, db, processor, broadcasts):
+        text = json.dumps(HIERARCHY)
+        processor.orchestrator.execute_stream = lambda **kwargs: stream_of(text[:text.index('"Receipt"')])
+
+        with pytest.raises(ValueError, match="valid JSON"):
+            await processor._stream_hierarchy_with_ai({}, [], SimpleNamespace(id=uuid4(), name="Shop"), uuid4())
+
+        assert db.query(Task).count() == 4
+
+
+class TestBacklogStreaming:
+    """Decomposition hands each suggestion over as soon as it is complete"""
+
+    @pytest.mark.asyncio
+    async def test_stream_suggestions(self):
+        with patch("app.services.backlog_generator.AIOrchestrator"), \
+             patch("app.services.backlog_generator.PrompterFacade"), \
+             patch("app.services.backlog_generator.get_prompt_service"):
+            generator = BacklogGeneratorService(MagicMock())
+        stories = [{"title": "A", "description_markdown": "# A"}, {"title": "B"}]
+        generator.orchestrator.execute_stream = lambda **kwargs: stream_of(json.dumps(stories), 4)
+        received = []
+
+        async def on_item(item):
+            received.append(item["title"])
+
+        epic_id = uuid4()
+        result = await generator._stream_suggestions(
+            "system", "user", uuid4(), {},
+            lambda story: generator._finalize_suggestion(story, epic_id, {"source": "test"}),
+            on_item
+        )
+
+        assert received == ["A", "B"]
+        assert result[0]["description"] == "# A"
+        assert result[1]["parent_id"] == str(epic_id)
+        assert result[1]["_metadata"] == {"source": "test", "uses_semantic_references": False}
+
+    @pytest.mark.asyncio
+    async def test_non_list_answer_is_rejected(self):
+        with patch("app.services.backlog_generator.AIOrchestrator"), \
+             patch("app.services.backlog_generator.PrompterFacade"), \
+             patch("app.services.backlog_generator.get_prompt_service"):
+            generator = BacklogGeneratorService(MagicMock())
+        generator.orchestrator.execute_stream = lambda **kwargs: stream_of('{"title": "A"}')
+
+        with pytest.raises(ValueError, match="not a list"):
+            await generator._stream_suggestions("s", "u", uuid4(), {}, lambda item: item, AsyncMock())
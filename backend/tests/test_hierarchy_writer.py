@@ -0,0 +1,143 @@
+"""
+Unit tests for HierarchyWriter
+Client-side ids, in-memory parent links, single-INSERT writes (SQLite in memory)
+"""
+
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - register all tables referenced by Task
+from app.database import Base
+from app.models.task import Task, ItemType, TaskStatus, path_segment
+from app.services.hierarchy_loader import HierarchyLoader
+from app.services.hierarchy_writer import HierarchyWriter
+from app.services.meta_prompt_processor import MetaPromptProcessor
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced by tasks
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def inserts(engine):
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT"):
+            executed.append(len(parameters) if executemany else 1)
+
+    event.listen(engine, "before_cursor_execute", record)
+    return executed
+
+
+@pytest.fixture
+def epic(db):
+    project_id = uuid4()
+    epic = Task(id=uuid4(), project_id=project_id, title="Checkout", item_type=ItemType.EPIC)
+    story = Task(id=uuid4(), project_id=project_id, parent_id=epic.id, title="Existing",
+                 item_type=ItemType.STORY, order=4)
+    db.add_all([epic, story])
+    db.commit()
+    return epic
+
+
+class TestWrite:
+    """A whole tree goes out in one INSERT"""
+
+    def test_tree_in_one_insert(self, db, inserts):
+        project_id = uuid4()
+        writer = HierarchyWriter(db)
+        epic_id = writer.add(Task(project_id=project_id, title="Epic", item_type=ItemType.EPIC))
+        story_ids = [
+            writer.add({"project_id": project_id, "parent_id": epic_id, "title": f"S{i}",
+                        "item_type": ItemType.STORY})
+            for i in range(3)
+        ]
+        task_id = writer.add(Task(project_id=project_id, parent_id=story_ids[1], title="T",
+                                  item_type=ItemType.TASK))
+
+        epic, s0, s1, s2, task = writer.write()
+
+        assert inserts == [5]
+        assert [s.order for s in (s0, s1, s2)] == [0, 1, 2]
+        assert task.hierarchy_path == path_segment(epic_id) + path_segment(story_ids[1]) + path_segment(task_id)
+        assert task.status == TaskStatus.BACKLOG  # column default
+        assert task.labels == []
+        assert [t.title for t in HierarchyLoader(db).descendants(epic_id)] == ["S0", "S1", "T", "S2"]
+
+    def test_children_of_existing_parent(self, db, epic, inserts):
+        writer = HierarchyWriter(db)
+        writer.add(Task(project_id=epic.project_id, parent_id=epic.id, title="New", item_type=ItemType.STORY))
+        writer.add(Task(project_id=epic.project_id, parent_id=epic.id, title="Newer", item_type=ItemType.STORY))
+
+        new, newer = writer.write()
+
+        assert (new.order, newer.order) == (5, 6)
+        assert new.hierarchy_path == epic.hierarchy_path + path_segment(new.id)
+
+    def test_failure_writes_nothing(self, db, epic):
+        writer = HierarchyWriter(db)
+        writer.add(Task(project_id=epic.project_id, title="Fine", item_type=ItemType.EPIC))
+        writer.add(Task(id=epic.id, project_id=epic.project_id, title="Duplicate", item_type=ItemType.EPIC))
+
+        with pytest.raises(IntegrityError):
+            writer.write()
+
+        assert db.query(Task).filter(Task.title == "Fine").count() == 0
+
+    def test_cycle_is_rejected(self, db):
+        a, b = uuid4(), uuid4()
+        writer = HierarchyWriter(db)
+        writer.add({"id": a, "parent_id": b, "title": "A"})
+        writer.add({"id": b, "parent_id": a, "title": "B"})
+
+        with pytest.raises(ValueError, match="cycle"):
+            writer.write()
+
+
+class TestMetaPromptHierarchy:
+    """MetaPromptProcessor creates a parsed hierarchy with one INSERT"""
+
+    @pytest.mark.asyncio
+    async def test_create_hierarchy(self, db, inserts):
+        with patch("app.services.meta_prompt_processor.AIOrchestrator"), \
+             patch("app.services.meta_prompt_processor.PrompterFacade"), \
+             patch("app.services.meta_prompt_processor.get_prompt_service"):
+            processor = MetaPromptProcessor(db)
+        hierarchy = {
+            "epic": {"title": "Shop", "description": "", "business_value": "Sales"},
+            "stories": [
+                {"title": "Cart", "description": "", "tasks": [
+                    {"title": "Add item", "description": "", "generated_prompt": "# Add",
+                     "subtasks": [{"title": "API", "description": ""}]},
+                ]},
+                {"title": "Pay", "description": ""},
+            ],
+        }
+
+        created = await processor._create_hierarchy(hierarchy, uuid4(), uuid4())
+
+        assert inserts == [5]
+        assert [(t.title, t.order) for t in created] == [
+            ("Shop", 0), ("Cart", 0), ("Add item", 0), ("API", 0), ("Pay", 1)
+        ]
+        assert created[0].interview_insights == {"business_value": "Sales"}
+        assert created[3].parent_id == created[2].id
+        assert created[2].generated_prompt == "# Add"
@@ -0,0 +1,194 @@
+"""
+Unit tests for interface summaries
+Signature extraction from generated code and its use in the execution context
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.services.task_execution.context_builder import ContextBuilder
+from app.services.task_execution.interface_summary import extract_interface
+
+
+PHP_MODEL = '''<?php
+
+namespace App\\Models;
+
+use Illuminate\\Database\\Eloquent\\Model;
+
+class Product extends Model
+{
+    protected $fillable = [
+        'name',
+        'price',
+    ];
+
+    private $cache = [];
+
+    public function category()
+    {
+        return $this->belongsTo(Category::class);
+    }
+
+    public function scopeActive($query,
+        bool $onlyVisible = true)
+    {
+        return $query->where('active', true);
+    }
+
+    private function normalize($value)
+    {
+        return trim($value);
+    }
+}
+'''
+
+TS_SERVICE = '''import { api } from './api';
+
+export interface Product {
+  id: string;
+  name: string;
+}
+
+export const fetchProducts = async (page: number): Promise<Product[]> => {
+  const response = await api.get('/products', { params: { page } });
+  return response.data;
+};
+
+export class ProductService {
+  private cache: Map<string, Product>;
+  public readonly baseUrl: string;
+
+  async getProduct(id: string): Promise<Product> {
+    if (this.cache.has(id)) {
+      return this.cache.get(id)!;
+    }
+    return { id, name: 'unknown' };
+  }
+}
+'''
+
+PY_ROUTES = '''from fastapi import APIRouter
+
+router = APIRouter()
+
+
+class Item(Base):
+    __tablename__ = "items"
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+
+
+@router.get("/items/{item_id}")
+async def read_item(item_id: int, db: Session = Depends(get_db)) -> ItemResponse:
+    item = db.query(Item).get(item_id)
+    return item
+
+
+def _serialize(item):
+    return item.__dict__
+'''
+
+MIGRATION = '''<?php
+
+return new class extends Migration
+{
+    public function up(): void
+    {
+        Schema::create('products', function (Blueprint $table) {
+            $table->id();
+            $table->string('name');
+            $table->decimal('price', 10, 2);
+        });
+    }
+};
+'''
+
+
+class TestExtraction:
+    """Public declarations are kept, bodies and private members dropped"""
+
+    def test_php_model(self):
+        summary = extract_interface(PHP_MODEL)
+
+        assert "namespace App\\Models;" in summary
+        assert "class Product extends Model" in summary
+        assert "'price'," in summary  # $fillable in full
+        assert "public function category()" in summary
+        assert "public function scopeActive($query,bool $onlyVisible = true)" in summary
+        assert "belongsTo" not in summary
+        assert "normalize" not in summary and "$cache" not in summary
+        assert "use Illuminate" not in summary
+
+    def test_typescript_types_and_signatures(self):
+        summary = extract_interface(TS_SERVICE)
+
+        assert "export interface Product {\n  id: string;\n  name: string;\n}" in summary
+        assert "export const fetchProducts = async (page: number): Promise<Product[]> => ..." in summary
+        assert "  async getProduct(id: string): Promise<Product>" in summary
+        assert "  public readonly baseUrl: string;" in summary
+        assert "api.get" not in summary and "cache" not in summary and "unknown" not in summary
+
+    def test_python_routes_and_columns(self):
+        summary = extract_interface(PY_ROUTES)
+
+        assert summary.splitlines() == [
+            "class Item(Base):",
+            "    id = Column(Integer, primary_key=True)",
+            "    name = Column(String(100), nullable=False)",
+            '@router.get("/items/{item_id}")',
+            "async def read_item(item_id: int, db: Session = Depends(get_db)) -> ItemResponse:",
+        ]
+
+    def test_migration_schema(self):
+        summary = extract_interface(MIGRATION)
+
+        assert "Schema::create('products', function (Blueprint $table) {" in summary
+        assert "$table->decimal('price', 10, 2);" in summary
+
+    def test_summary_is_capped(self):
+        code = "\n".join(f"function handler{i}(request) {{ return {i}; }}" for i in range(500))
+
+        summary = extract_interface(code, max_chars=300)
+
+        assert len(summary) < 330
+        assert summary.endswith("... (interface truncated)")
+
+    def test_code_without_declarations(self):
+        assert extract_interface("echo 'hello';") == ""
+        assert extract_interface("") == ""
+
+
+class TestDependencyContext:
+    """ContextBuilder uses summaries by default, full code on demand"""
+
+    def result(self, code, summary=None):
+        return SimpleNamespace(output_code=code, interface_summary=summary, file_path="app/Models/Product.php")
+
+    def test_summary_replaces_full_code(self):
+        builder = ContextBuilder(MagicMock())
+        result = self.result(PHP_MODEL, extract_interface(PHP_MODEL))
+
+        output = builder._dependency_output(result, full_code=False)
+
+        assert output.startswith("(Interface of app/Models/Product.php - implementation omitted)")
+        assert "public function category()" in output and "belongsTo" not in output
+        assert len(output) < len(PHP_MODEL)
+
+    def test_full_code_on_demand(self):
+        builder = ContextBuilder(MagicMock())
+
+        assert builder._dependency_output(self.result(PHP_MODEL, "class Product"), full_code=True) == PHP_MODEL
+
+    def test_results_saved_before_summaries_are_summarized(self):
+        builder = ContextBuilder(MagicMock())
+
+        output = builder._dependency_output(self.result(TS_SERVICE), full_code=False)
+
+        assert "getProduct(id: string)" in output and "api.get" not in output
+
+    def test_short_code_is_kept_whole(self):
+        builder = ContextBuilder(MagicMock())
+        code = "function add(a, b) { return a + b; }"
+
+        assert builder._dependency_output(self.result(code), full_code=False) == code
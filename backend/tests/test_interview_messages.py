@@ -0,0 +1,174 @@
+"""
+Unit tests for the append-only interview message store
+conversation_data view, one-row appends, cursor pagination (SQLite in memory)
+"""
+
+import pytest
+from uuid import uuid4
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - register all tables referenced by Interview
+from app.database import Base
+from app.models.interview import Interview
+from app.models.interview_message import InterviewMessage
+from app.services.interview_messages import InterviewMessageStore
+
+
+def message(i, role="assistant"):
+    return {"role": role, "content": f"Message {i}", "question_number": i}
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced here
+    return engine
+
+
+@pytest.fixture
+def db(engine):
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def statements(engine):
+    executed = []
+    event.listen(engine, "before_cursor_execute", lambda *args: executed.append(args[2]))
+    return executed
+
+
+@pytest.fixture
+def interview(engine):
+    with Session(engine) as session:
+        interview = Interview(
+            project_id=uuid4(),
+            ai_model_used="test",
+            conversation_data=[message(i) for i in range(3)]
+        )
+        session.add(interview)
+        session.commit()
+        return interview.id
+
+
+class TestConversationData:
+    """conversation_data is a list view over interview_messages"""
+
+    def test_messages_given_on_creation_are_stored(self, db, interview):
+        loaded = db.get(Interview, interview)
+
+        assert loaded.message_count == 3
+        assert loaded.conversation_data == [message(i) for i in range(3)]
+        assert [row.seq for row in db.query(InterviewMessage).order_by(InterviewMessage.seq)] == [0, 1, 2]
+
+    def test_append_writes_one_row(self, engine, db, interview, statements):
+        conversation = db.get(Interview, interview).conversation_data
+        statements.clear()
+
+        conversation.append(message(3, "user"))
+        db.commit()
+
+        writes = [s.split()[0] for s in statements if s.split()[0] in ("INSERT", "UPDATE", "DELETE")]
+        assert writes == ["UPDATE", "INSERT"]  # message_count, the new row - no rewrite
+        assert not any(s.startswith("SELECT") for s in statements)
+        with Session(engine) as fresh:
+            stored = fresh.get(Interview, interview).conversation_data
+            assert stored[-1] == message(3, "user")
+            assert len(stored) == 4
+
+    def test_add_message_does_not_read_the_conversation(self, engine, db, interview, statements):
+        loaded = db.get(Interview, interview)
+        statements.clear()
+
+        loaded.add_message(message(3, "user"))
+        db.commit()
+
+        assert not any("interview_messages" in s for s in statements if s.startswith("SELECT"))
+        assert [s.split()[0] for s in statements if s.split()[0] in ("INSERT", "UPDATE")] == ["UPDATE", "INSERT"]
+        assert InterviewMessageStore(db).recent(interview, 1)[0]["content"] == "Message 3"
+        assert db.get(Interview, interview).message_count == 4
+
+    def test_add_message_keeps_a_loaded_conversation_current(self, db, interview):
+        loaded = db.get(Interview, interview)
+        conversation = loaded.conversation_data
+
+        loaded.add_message(message(3, "user"))
+
+        assert conversation[-1] == message(3, "user")
+        assert loaded.conversation_data is conversation
+
+    def test_messages_added_before_the_session_are_kept(self, engine):
+        interview = Interview(project_id=uuid4(), ai_model_used="test")
+        interview.add_message(message(0))
+
+        assert interview.conversation_data == [message(0)]
+        with Session(engine) as session:
+            session.add(interview)
+            session.commit()
+            assert InterviewMessageStore(session).recent(interview.id, 5)[0]["seq"] == 0
+
+    def test_assignment_replaces_the_conversation(self, engine, db, interview):
+        loaded = db.get(Interview, interview)
+
+        loaded.conversation_data = [message(9)]
+        db.commit()
+
+        with Session(engine) as fresh:
+            assert fresh.get(Interview, interview).conversation_data == [message(9)]
+            assert fresh.get(Interview, interview).message_count == 1
+
+    def test_rollback_discards_appends(self, db, interview):
+        loaded = db.get(Interview, interview)
+        loaded.conversation_data.append(message(3))
+
+        db.rollback()
+
+        assert len(loaded.conversation_data) == 3
+        assert loaded.message_count == 3
+
+    def test_conversation_is_append_only(self, db, interview):
+        conversation = db.get(Interview, interview).conversation_data
+
+        with pytest.raises(TypeError, match="append-only"):
+            conversation.pop()
+        with pytest.raises(TypeError, match="append-only"):
+            conversation[0] = message(0)
+
+
+class TestMessageStore:
+    """Cursor pagination and tail reads"""
+
+    @pytest.fixture
+    def long_interview(self, db):
+        interview = Interview(project_id=uuid4(), ai_model_used="test")
+        db.add(interview)
+        interview.conversation_data.extend(message(i) for i in range(7))
+        db.commit()
+        return interview.id
+
+    def test_forward_pages(self, db, long_interview):
+        store = InterviewMessageStore(db)
+
+        first, cursor = store.page(long_interview, limit=3)
+        second, cursor = store.page(long_interview, after=cursor, limit=3)
+        third, cursor = store.page(long_interview, after=cursor, limit=3)
+
+        assert [m["seq"] for m in first + second + third] == list(range(7))
+        assert cursor is None
+        assert first[0]["content"] == "Message 0" and first[0]["question_number"] == 0
+
+    def test_backward_pages_and_tail(self, db, long_interview):
+        store = InterviewMessageStore(db)
+
+        newest, cursor = store.page(long_interview, before=7, limit=3)
+        older, cursor = store.page(long_interview, before=cursor, limit=3)
+
+        assert [m["seq"] for m in newest] == [4, 5, 6]
+        assert [m["seq"] for m in older] == [1, 2, 3]
+        assert cursor == 1
+        assert [m["seq"] for m in store.recent(long_interview, 2)] == [5, 6]
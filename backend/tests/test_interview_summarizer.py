@@ -0,0 +1,194 @@
+"""
+Unit tests for InterviewSummarizer
+Bounded prompts, rolling summary updates (SQLite in memory, mocked AI)
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - register all tables referenced by Interview
+from app.database import Base
+from app.models.interview import Interview
+from app.services import interview_summarizer
+from app.services.interview_summarizer import InterviewSummarizer
+
+
+def turns(count, start=1):
+    """Question/answer pairs as conversation messages."""
+    messages = []
+    for i in range(start, start + count):
+        messages.append({"role": "assistant", "content": f"Pergunta {i}?"})
+        messages.append({"role": "user", "content": f"Resposta {i}"})
+    return messages
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced here
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def interview(db):
+    interview = Interview(project_id=uuid4(), ai_model_used="test", conversation_data=turns(10))
+    db.add(interview)
+    db.commit()
+    return interview
+
+
+@pytest.fixture
+def limits():
+    with patch("app.services.interview_summarizer.settings") as settings:
+        settings.interview_summarization = True
+        settings.interview_recent_turns = 2
+        settings.interview_summary_every_turns = 3
+        settings.interview_summary_max_tokens = 400
+        settings.interview_recent_max_tokens = 1000
+        yield settings
+
+
+def orchestrator(summary="Sistema de vendas", facts=("Pagamento via Pix",)):
+    mock = Mock()
+    mock.execute = AsyncMock(return_value={
+        "content": "```json\n" + json.dumps({"summary": summary, "facts": list(facts)}) + "\n```"
+    })
+    return mock
+
+
+class TestBuildContext:
+    """Prompt = summary + facts + unsummarized messages"""
+
+    def test_without_summary_sends_all_messages(self, db, interview, limits):
+        messages, memory = InterviewSummarizer(db).build_context(interview)
+
+        assert len(messages) == 20
+        assert memory == ""
+
+    def test_summarized_messages_are_replaced_by_memory(self, db, interview, limits):
+        interview.conversation_summary = "Loja online"
+        interview.summary_facts = ["Pagamento via Pix"]
+        interview.summarized_until = 16
+        db.commit()
+
+        messages, memory = InterviewSummarizer(db).build_context(interview)
+
+        assert [m["content"] for m in messages] == ["Pergunta 9?", "Resposta 9", "Pergunta 10?", "Resposta 10"]
+        assert "Loja online" in memory and "- Pagamento via Pix" in memory
+
+    def test_token_target_bounds_a_lagging_tail(self, db, interview, limits):
+        limits.interview_recent_max_tokens = 8
+
+        messages, _ = InterviewSummarizer(db).build_context(interview)
+
+        assert [m["content"] for m in messages] == ["Pergunta 10?", "Resposta 10"]
+
+    def test_disabled_sends_full_conversation(self, db, interview, limits):
+        limits.interview_summarization = False
+        interview.conversation_summary = "Loja online"
+        interview.summarized_until = 16
+        db.commit()
+
+        messages, memory = InterviewSummarizer(db).build_context(interview)
+
+        assert len(messages) == 20 and memory == ""
+
+
+class TestSummarize:
+    """Older turns are folded into the stored summary"""
+
+    @pytest.mark.asyncio
+    async def test_summarizes_all_but_recent_turns(self, db, interview, limits):
+        ai = orchestrator()
+        summarizer = InterviewSummarizer(db, orchestrator=ai)
+
+        assert await summarizer.summarize(interview) is True
+
+        db.refresh(interview)
+        assert interview.summarized_until == 16  # 20 messages - 2 recent turns
+        assert interview.conversation_summary == "Sistema de vendas"
+        assert interview.summary_facts == ["Pagamento via Pix"]
+        request = ai.execute.call_args.kwargs
+        assert request["usage_type"] == "general"
+        assert "Resposta 8" in request["messages"][0]["content"]
+        assert "Resposta 9" not in request["messages"][0]["content"]
+
+    @pytest.mark.asyncio
+    async def test_waits_for_enough_new_turns(self, db, interview, limits):
+        interview.summarized_until = 12
+        db.commit()
+        ai = orchestrator()
+
+        assert await InterviewSummarizer(db, orchestrator=ai).summarize(interview) is False
+        ai.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_next_summary_builds_on_previous(self, db, interview, limits):
+        interview.conversation_summary = "Loja online"
+        interview.summary_facts = ["Pagamento via Pix"]
+        interview.summarized_until = 8
+        db.commit()
+        ai = orchestrator(summary="Loja online com entregas")
+
+        await InterviewSummarizer(db, orchestrator=ai).summarize(interview)
+
+        prompt = ai.execute.call_args.kwargs["messages"][0]["content"]
+        assert "Loja online" in prompt and "- Pagamento via Pix" in prompt
+        assert "Resposta 4" not in prompt and "Resposta 5" in prompt
+
+    @pytest.mark.asyncio
+    async def test_concurrent_update_wins(self, db, interview, limits):
+        ai = orchestrator()
+        summarizer = InterviewSummarizer(db, orchestrator=ai)
+
+        async def moved_meanwhile(**kwargs):
+            db.query(Interview).filter(Interview.id == interview.id).update({"summarized_until": 16})
+            return {"content": json.dumps({"summary": "Outro", "facts": []})}
+        ai.execute.side_effect = moved_meanwhile
+
+        assert await summarizer.summarize(interview) is False
+
+    @pytest.mark.asyncio
+    async def test_scheduled_run_is_referenced_until_done(self, db, interview, limits):
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def run(interview_id):
+            started.set()
+            await release.wait()
+
+        with patch("app.services.interview_summarizer.run_interview_summary", side_effect=run):
+            summarizer = InterviewSummarizer(db, orchestrator=orchestrator())
+            assert summarizer.schedule(interview) is True
+            assert summarizer.schedule(interview) is False  # one run per interview
+            await started.wait()
+
+            (task,) = interview_summarizer._tasks
+            assert interview.id in interview_summarizer._running
+
+            release.set()
+            await task
+            await asyncio.sleep(0)
+
+        assert not interview_summarizer._tasks
+        assert interview.id not in interview_summarizer._running
+
+    def test_replacing_the_conversation_resets_the_summary(self, db, interview):
+        interview.conversation_summary = "Loja online"
+        interview.summarized_until = 16
+
+        interview.conversation_data = turns(1)
+        db.commit()
+
+        assert interview.summarized_until == 0
+        assert interview.conversation_summary is None
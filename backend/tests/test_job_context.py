@@ -0,0 +1,160 @@
+"""
+Unit tests for JobContext
+Coalesced progress writes, in-memory cancellation (SQLite in memory)
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 - register all tables
+from app.database import Base
+from app.models.async_job import AsyncJob, JobStatus, JobType
+from app.services.job_context import JobContext, _cancel_on_event, get_job_context
+from app.services.job_manager import JobManager
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    with patch("app.services.job_events.get_redis", return_value=None):
+        yield
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced here
+    return engine
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def job(db):
+    job_manager = JobManager(db)
+    job = job_manager.create_job(JobType.BATCH_EXECUTION, {})
+    job_manager.start_job(job.id)
+    return job
+
+
+@pytest.fixture
+def statements(engine):
+    """async_jobs statements sent to the database."""
+    log = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "async_jobs" in statement:
+            log.append(statement.split()[0])
+    event.listen(engine, "before_cursor_execute", record)
+    yield log
+    event.remove(engine, "before_cursor_execute", record)
+
+
+def stored(db, job):
+    db.expire_all()
+    return db.get(AsyncJob, job.id)
+
+
+class TestProgress:
+    """Progress is buffered and written at checkpoints"""
+
+    def test_small_updates_are_coalesced(self, db, job, session_factory, statements):
+        job_manager = JobManager(db)
+
+        with JobContext(job.id, session_factory, flush_interval_ms=60000, min_delta=10) as context:
+            statements.clear()
+            for i in range(1, 9):
+                job_manager.update_progress(job.id, float(i), f"Task {i}/8")
+                assert not job_manager.is_cancelled(job.id)
+
+            assert context.writes == 1  # the first update
+            assert statements == ["UPDATE"]
+            assert stored(db, job).progress_percent == 1.0
+
+            job_manager.update_progress(job.id, 15.0)  # moved by the delta
+            assert context.writes == 2
+
+        assert stored(db, job).progress_percent == 15.0
+        assert stored(db, job).progress_message == "Task 8/8"
+        assert get_job_context(job.id) is None
+
+    @pytest.mark.asyncio
+    async def test_buffered_update_is_written_when_the_interval_ends(self, db, job, session_factory):
+        with JobContext(job.id, session_factory, flush_interval_ms=20, min_delta=50) as context:
+            context.report(1.0)
+            context.report(2.0, "Quase")
+            assert stored(db, job).progress_percent == 1.0
+
+            await asyncio.sleep(0.05)
+
+            assert stored(db, job).progress_percent == 2.0
+            assert context.writes == 2
+
+    def test_every_update_is_pushed(self, db, job, session_factory):
+        with patch("app.services.job_context.job_events") as events, \
+             JobContext(job.id, session_factory, flush_interval_ms=60000, min_delta=50) as context:
+            context.report(1.0, "Um")
+            context.report(2.0)
+
+        pushed = [call.args[0] for call in events.publish.call_args_list]
+        assert [e["progress_percent"] for e in pushed] == [1.0, 2.0]
+        assert pushed[1]["progress_message"] == "Um"
+
+    def test_completion_supersedes_buffered_progress(self, db, job, session_factory):
+        job_manager = JobManager(db)
+
+        with JobContext(job.id, session_factory, flush_interval_ms=60000, min_delta=50):
+            job_manager.update_progress(job.id, 1.0)
+            job_manager.update_progress(job.id, 2.0)
+            job_manager.complete_job(job.id, {"ok": True})
+
+        assert stored(db, job).status == JobStatus.COMPLETED
+        assert stored(db, job).progress_percent == 100.0
+
+
+class TestCancellation:
+    """is_cancelled reads the in-memory token"""
+
+    def test_cancel_in_this_process(self, db, job, session_factory, statements):
+        job_manager = JobManager(db)
+
+        with JobContext(job.id, session_factory):
+            JobManager(session_factory()).cancel_job(job.id)
+            statements.clear()
+
+            assert job_manager.is_cancelled(job.id)
+            assert statements == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_event_from_another_process(self, db, job, session_factory):
+        with JobContext(job.id, session_factory) as context:
+            await _cancel_on_event({"event": "cancelled", "id": str(job.id)})
+
+            assert context.cancelled
+
+    def test_checkpoint_detects_cancellation_without_events(self, db, job, session_factory):
+        with JobContext(job.id, session_factory, flush_interval_ms=0) as context:
+            db.query(AsyncJob).filter(AsyncJob.id == job.id).update({"status": JobStatus.CANCELLED})
+            db.commit()
+
+            context.report(50.0)
+
+            assert context.cancelled
+            assert stored(db, job).progress_percent is None
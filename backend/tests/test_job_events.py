@@ -0,0 +1,130 @@
+"""
+Unit tests for job events
+Broker fan-out, thread-safe publishing, JobManager lifecycle events (SQLite in memory)
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - register all tables
+from app.database import Base
+from app.models.async_job import JobType
+from app.services.job_events import JobEventBroker, MAX_QUEUED_EVENTS
+from app.services.job_manager import JobManager
+
+
+def event(job_id, project_id=None, name="progress", **fields):
+    return dict({"event": name, "id": str(job_id),
+                 "project_id": str(project_id) if project_id else None}, **fields)
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    with patch("app.services.job_events.get_redis", return_value=None):
+        yield
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced here
+    with Session(engine) as session:
+        yield session
+
+
+class TestBroker:
+    """Subscriptions, listeners, bounded queues"""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_only_receive_their_job(self):
+        broker = JobEventBroker()
+        job_id, other_id, project_id = uuid4(), uuid4(), uuid4()
+
+        with broker.subscribe(job_id=job_id) as by_job, broker.subscribe(project_id=project_id) as by_project:
+            broker.publish(event(other_id, project_id))
+            broker.publish(event(job_id))
+
+            assert (await by_job.get(timeout=1))["id"] == str(job_id)
+            assert (await by_project.get(timeout=1))["id"] == str(other_id)
+            assert await by_job.get(timeout=0.01) is None
+            assert await by_project.get(timeout=0.01) is None
+
+        assert not broker._subscriptions
+
+    @pytest.mark.asyncio
+    async def test_publish_from_another_thread(self):
+        broker = JobEventBroker()
+        job_id = uuid4()
+
+        with broker.subscribe(job_id=job_id) as subscription:
+            await asyncio.to_thread(broker.publish, event(job_id, name="completed"))
+
+            received = await subscription.get(timeout=1)
+
+        assert received["event"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_listeners_receive_every_event(self):
+        broker = JobEventBroker()
+        received = []
+
+        async def listener(e):
+            received.append(e["id"])
+        broker.add_listener(listener)
+        broker.subscribe().close()  # binds the event loop
+
+        broker.publish(event("a"))
+        broker.publish(event("b"))
+        await asyncio.sleep(0)
+
+        assert received == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_keeps_latest_events(self):
+        broker = JobEventBroker()
+        job_id = uuid4()
+
+        with broker.subscribe(job_id=job_id) as subscription:
+            for i in range(MAX_QUEUED_EVENTS + 5):
+                broker.publish(event(job_id, progress_percent=i))
+
+            assert subscription.queue.qsize() == MAX_QUEUED_EVENTS
+            assert (await subscription.get(timeout=1))["progress_percent"] == 5
+
+    def test_publish_without_event_loop_is_a_no_op(self):
+        JobEventBroker().publish(event(uuid4()))
+
+
+class TestJobManagerEvents:
+    """Every committed lifecycle change is published"""
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_events(self, db):
+        broker = JobEventBroker()
+        project_id = uuid4()
+
+        with patch("app.services.job_manager.job_events", broker), \
+             broker.subscribe(project_id=project_id) as subscription:
+            manager = JobManager(db)
+            job = manager.create_job(JobType.CODE_INDEXING, {"path": "/tmp"}, project_id=project_id)
+            manager.start_job(job.id)
+            manager.update_progress(job.id, 50.0, "Indexando")
+            manager.complete_job(job.id, {"files": 3})
+
+            received = [await subscription.get(timeout=1) for _ in range(4)]
+
+        assert [e["event"] for e in received] == ["created", "started", "progress", "completed"]
+        assert received[2]["progress_percent"] == 50.0
+        assert received[2]["progress_message"] == "Indexando"
+        assert "result" not in received[2]
+        assert received[3]["status"] == "completed"
+        assert received[3]["result"] == {"files": 3}
+        assert all(e["id"] == str(job.id) for e in received)
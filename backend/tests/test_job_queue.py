@@ -0,0 +1,265 @@
+"""
+Unit tests for the job queue and JobWorker
+Claiming, priorities, concurrency limits, stale job recovery (SQLite in memory)
+"""
+
+import asyncio
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import UUID, uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import app.models  # noqa: F401 - register all tables
+from app.database import Base
+from app.models.async_job import AsyncJob, JobStatus, JobType
+from app.models.task import ItemType
+from app.services.job_manager import JobManager
+from app.services.job_queue import (
+    claim_job,
+    concurrency_limits,
+    decode_kwargs,
+    job_handler,
+    release_jobs,
+    requeue_stale_jobs,
+)
+from app.services.job_worker import JobWorker
+
+
+calls = []
+
+
+@job_handler
+async def record_call(job_id: UUID, item_id: UUID, item_type: ItemType = ItemType.TASK):
+    calls.append((job_id, item_id, item_type))
+
+
+@job_handler
+async def complete_with_manager(job_id: UUID):
+    db = sessions["factory"]()
+    try:
+        JobManager(db).complete_job(job_id, {"done": True})
+    finally:
+        db.close()
+
+
+@job_handler
+async def explode(job_id: UUID):
+    raise RuntimeError("boom")
+
+
+@job_handler
+async def wait_forever(job_id: UUID):
+    await asyncio.Event().wait()
+
+
+async def not_registered(job_id: UUID):
+    pass
+
+
+sessions = {}  # Database of the running test, for handlers with their own session
+
+
+@pytest.fixture(autouse=True)
+def no_redis():
+    calls.clear()
+    with patch("app.services.job_events.get_redis", return_value=None):
+        yield
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced here
+    factory = sessionmaker(bind=engine)
+    sessions["factory"] = factory
+    yield factory
+    sessions.clear()
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+def queue(db, job_type=JobType.TASK_EXECUTION, handler=record_call, priority=None, **kwargs):
+    if handler is record_call:
+        kwargs.setdefault("item_id", uuid4())
+    return JobManager(db).create_job(
+        job_type=job_type, input_data={}, handler=handler, handler_kwargs=kwargs, priority=priority
+    )
+
+
+class TestQueue:
+    """create_job, claim_job, stale job recovery"""
+
+    def test_create_job_stores_handler(self, db):
+        item_id = uuid4()
+        job = queue(db, JobType.INTERVIEW_MESSAGE, item_id=item_id, item_type=ItemType.EPIC)
+
+        assert job.handler.endswith("test_job_queue:record_call")
+        assert job.handler_kwargs == {"item_id": str(item_id), "item_type": "epic"}
+        assert job.priority == 100  # interview answers first
+        assert decode_kwargs(record_call, job.handler_kwargs) == {"item_id": item_id, "item_type": ItemType.EPIC}
+
+    def test_unregistered_handler_is_rejected(self, db):
+        with pytest.raises(ValueError):
+            queue(db, handler=not_registered)
+
+    def test_claims_highest_priority_of_free_types(self, db):
+        low = queue(db, JobType.SPECULATIVE_GENERATION)
+        high = queue(db, JobType.COMMIT_GENERATION)
+        other = queue(db, JobType.TASK_EXECUTION, priority=500)
+        JobManager(db).create_job(job_type=JobType.COMMIT_GENERATION, input_data={}, priority=900)  # no handler
+
+        job_types = [JobType.SPECULATIVE_GENERATION, JobType.COMMIT_GENERATION]
+        first = claim_job(db, "worker-a", job_types)
+        second = claim_job(db, "worker-a", job_types)
+
+        assert [first.id, second.id] == [high.id, low.id]
+        assert first.status == JobStatus.RUNNING and first.worker_id == "worker-a" and first.attempts == 1
+        assert claim_job(db, "worker-a", job_types) is None
+        db.refresh(other)
+        assert other.status == JobStatus.PENDING
+
+    def test_stale_jobs_are_requeued_then_failed(self, db):
+        job = queue(db)
+        claim_job(db, "worker-a", [JobType.TASK_EXECUTION])
+        job.heartbeat_at = datetime.utcnow() - timedelta(minutes=5)
+        job.max_attempts = 2
+        db.commit()
+
+        assert requeue_stale_jobs(db, stale_after_seconds=60) == 1
+        db.refresh(job)
+        assert job.status == JobStatus.PENDING and job.worker_id is None
+
+        claim_job(db, "worker-b", [JobType.TASK_EXECUTION])
+        job.heartbeat_at = datetime.utcnow() - timedelta(minutes=5)
+        db.commit()
+
+        requeue_stale_jobs(db, stale_after_seconds=60)
+        db.refresh(job)
+        assert job.status == JobStatus.FAILED and "worker-b" in job.error
+
+    def test_fresh_heartbeat_is_left_alone(self, db):
+        job = queue(db)
+        claim_job(db, "worker-a", [JobType.TASK_EXECUTION])
+
+        assert requeue_stale_jobs(db, stale_after_seconds=60) == 0
+        db.refresh(job)
+        assert job.status == JobStatus.RUNNING
+
+    def test_released_jobs_do_not_count_an_attempt(self, db):
+        job = queue(db)
+        claim_job(db, "worker-a", [JobType.TASK_EXECUTION])
+
+        release_jobs(db, "worker-a", [job.id])
+
+        db.refresh(job)
+        assert job.status == JobStatus.PENDING and job.attempts == 0
+
+    def test_concurrency_overrides(self):
+        with patch("app.services.job_queue.settings") as settings:
+            settings.job_worker_concurrency = 3
+            settings.job_concurrency_limits = "task_execution=5, bogus=2"
+            limits = concurrency_limits()
+
+        assert limits[JobType.TASK_EXECUTION] == 5
+        assert limits[JobType.BATCH_EXECUTION] == 1
+        assert limits[JobType.BACKLOG_GENERATION] == 3
+
+
+class TestWorker:
+    """JobWorker runs claimed jobs within its limits"""
+
+    @pytest.mark.asyncio
+    async def test_per_type_limit(self, db, session_factory):
+        first, second = queue(db), queue(db)
+        worker = JobWorker("worker-a", limits={JobType.TASK_EXECUTION: 1}, concurrency=4,
+                           session_factory=session_factory)
+
+        assert worker.claim_available() == 1
+        assert worker.claim_available() == 0  # type full
+        await asyncio.gather(*[task for _, task in worker.running.values()])
+        assert worker.claim_available() == 1
+        await asyncio.gather(*[task for _, task in worker.running.values()])
+
+        assert [call[0] for call in calls] == [first.id, second.id]
+        assert isinstance(calls[0][1], UUID)
+        db.expire_all()
+        assert {job.status for job in db.query(AsyncJob)} == {JobStatus.COMPLETED}
+
+    @pytest.mark.asyncio
+    async def test_handler_outcomes(self, db, session_factory):
+        done = queue(db, handler=complete_with_manager)
+        failed = queue(db, handler=explode)
+        worker = JobWorker("worker-a", limits={JobType.TASK_EXECUTION: 2}, concurrency=2,
+                           session_factory=session_factory)
+
+        worker.claim_available()
+        await asyncio.gather(*[task for _, task in worker.running.values()])
+
+        db.expire_all()
+        assert db.get(AsyncJob, done.id).result == {"done": True}
+        assert db.get(AsyncJob, failed.id).status == JobStatus.FAILED
+        assert db.get(AsyncJob, failed.id).error == "boom"
+
+    @pytest.mark.asyncio
+    async def test_jobs_claimed_together_free_their_slots(self, db, session_factory):
+        jobs = [queue(db) for _ in range(3)]
+        worker = JobWorker("worker-a", limits={JobType.TASK_EXECUTION: 3}, concurrency=3,
+                           session_factory=session_factory)
+
+        assert worker.claim_available() == 3
+        await asyncio.gather(*[task for _, task in worker.running.values()])
+        await asyncio.sleep(0)
+
+        assert not worker.running
+        assert {call[0] for call in calls} == {job.id for job in jobs}
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_unfinished_jobs(self, db, session_factory):
+        job = queue(db, handler=wait_forever)
+        worker = JobWorker("worker-a", limits={JobType.TASK_EXECUTION: 1}, concurrency=1,
+                           session_factory=session_factory)
+        worker.claim_available()
+        await asyncio.sleep(0)
+
+        await worker.stop(grace_seconds=0.01)
+
+        db.expire_all()
+        released = db.get(AsyncJob, job.id)
+        assert released.status == JobStatus.PENDING and released.attempts == 0
+        assert not worker.running
+
+    @pytest.mark.asyncio
+    async def test_new_jobs_wake_the_worker(self, db, session_factory):
+        worker = JobWorker("worker-a", limits={JobType.TASK_EXECUTION: 1}, concurrency=1,
+                           session_factory=session_factory)
+        with patch("app.services.job_worker.settings") as settings:
+            settings.job_poll_interval_seconds = 60
+            settings.job_heartbeat_seconds = 60
+            settings.job_stale_after_seconds = 90
+            settings.data_retention_enabled = False
+            settings.data_retention_interval_hours = 24
+            run = asyncio.create_task(worker.run())
+            await asyncio.sleep(0.01)
+
+            job = queue(db)
+            for _ in range(100):
+                if calls:
+                    break
+                await asyncio.sleep(0.01)
+
+            await worker.stop()
+            run.cancel()
+
+        assert calls and calls[0][0] == job.id
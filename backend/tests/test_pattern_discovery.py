@@ -0,0 +1,134 @@
+"""
+Unit tests for PatternDiscoveryService
+Concurrent group analysis and per-group result caching
+"""
+
+import asyncio
+import pytest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+from app.config import settings
+from app.models.pattern_discovery_cache import PatternDiscoveryCache
+from app.schemas.pattern_discovery import DiscoveredPattern
+from app.services.pattern_discovery import PatternDiscoveryService
+
+
+@pytest.fixture
+def service():
+    """Service with AI, RAG indexing and spec persistence mocked out"""
+    with patch("app.services.pattern_discovery.AIOrchestrator"), \
+         patch("app.services.pattern_discovery.get_prompt_service"):
+        service = PatternDiscoveryService(MagicMock())
+    service._index_patterns_in_rag = AsyncMock()
+    service._save_patterns_to_database = AsyncMock(return_value=[])
+    return service
+
+
+SOURCES = {
+    "controllers": (".php", "<?php\nclass C{i} extends Controller {{\n"
+                            "    public function index() {{ return view('c{i}'); }}\n}}\n"),
+    "models": (".php", "<?php\nnamespace App\\Models;\nuse Eloquent;\n"
+                       "final class M{i} {{ protected $table = 'm{i}'; protected $casts = []; }}\n"),
+    "services": (".py", "def service_{i}(items):\n    for item in items:\n        yield item * {i}\n"),
+}
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    """Three groups of three structurally identical files each"""
+    for folder, (ext, source) in SOURCES.items():
+        (tmp_path / folder).mkdir()
+        for i in range(3):
+            (tmp_path / folder / f"f{i}{ext}").write_text(source.format(i=i))
+    return tmp_path
+
+
+def pattern_for(group_key: str) -> DiscoveredPattern:
+    return DiscoveredPattern(
+        category="custom", name=group_key, spec_type="x", title=f"{group_key} Pattern",
+        description="", template_content="", language="php", confidence_score=0.9,
+        reasoning="", is_framework_worthy=False
+    )
+
+
+class TestConcurrency:
+    """Groups run in parallel, bounded by the semaphore"""
+
+    @pytest.mark.asyncio
+    async def test_groups_run_concurrently_within_limit(self, service, project, monkeypatch):
+        monkeypatch.setattr(settings, "pattern_discovery_concurrency", 2)
+        running = {"now": 0, "max": 0}
+
+        async def fake_ai(group_key, sampled_files, file_group, project_id):
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.05)
+            running["now"] -= 1
+            return pattern_for(group_key), True
+
+        with patch.object(service, "_ai_discover_pattern", side_effect=fake_ai), \
+             patch.object(service, "_load_cache", return_value={}), \
+             patch.object(service, "_save_cache"):
+            patterns = await service.discover_patterns(project, uuid4())
+
+        assert running["max"] == 2
+        assert {p.name for p in patterns} == {".php:controller", ".php:model", ".py:service"}
+        assert all(p.occurrences == 3 for p in patterns)
+
+
+class TestCache:
+    """Unchanged groups skip the AI call"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_groups_reuse_cached_answers(self, service, project):
+        project_id = uuid4()
+        ai = AsyncMock(side_effect=lambda key, *args: (pattern_for(key) if "model" in key else None, True))
+
+        with patch.object(service, "_ai_discover_pattern", ai), \
+             patch.object(service, "_load_cache", return_value={}), \
+             patch.object(service, "_save_cache") as save_cache:
+            first = await service.discover_patterns(project, project_id)
+
+        answers = save_cache.call_args.args[2]
+        assert set(answers) == {".php:controller", ".php:model", ".py:service"}
+        cache = {
+            key: PatternDiscoveryCache(
+                project_id=project_id, group_key=key, fingerprint=fingerprint,
+                pattern=pattern.model_dump() if pattern else None
+            )
+            for key, (fingerprint, pattern) in answers.items()
+        }
+
+        (project / "services" / "f0.py").write_text(SOURCES["services"][1].format(i=7))
+        ai.reset_mock()
+
+        with patch.object(service, "_ai_discover_pattern", ai), \
+             patch.object(service, "_load_cache", return_value=cache), \
+             patch.object(service, "_save_cache") as save_cache:
+            second = await service.discover_patterns(project, project_id)
+
+        assert [call.args[0] for call in ai.call_args_list] == [".py:service"]
+        assert set(save_cache.call_args.args[2]) == {".py:service"}
+        assert [p.name for p in second] == [p.name for p in first] == [".php:model"]
+
+    @pytest.mark.asyncio
+    async def test_failed_calls_are_not_cached(self, service, project):
+        ai = AsyncMock(return_value=(None, False))
+
+        with patch.object(service, "_ai_discover_pattern", ai), \
+             patch.object(service, "_load_cache", return_value={}), \
+             patch.object(service, "_save_cache") as save_cache:
+            await service.discover_patterns(project, uuid4())
+
+        assert save_cache.call_args.args[2] == {}
+
+    @pytest.mark.asyncio
+    async def test_unparseable_ai_response_is_a_failure(self, service):
+        service.ai_orchestrator.execute = AsyncMock(return_value={"content": "not json"})
+        group = MagicMock(file_count=3, extension=".php", estimated_category="model")
+
+        result = await service._ai_discover_pattern(".php:model", [{"path": "a.php", "content": "x"}], group, uuid4())
+
+        assert result == (None, False)
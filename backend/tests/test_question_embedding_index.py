@@ -0,0 +1,163 @@
+"""
+Unit tests for QuestionEmbeddingIndex
+In-memory duplicate checks, Redis sharing between workers, embedding reuse
+"""
+
+import json
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+from app.services import question_embedding_index
+from app.services.question_embedding_index import QuestionEmbeddingIndex, normalize
+from app.services.interview_question_deduplicator import InterviewQuestionDeduplicator
+
+
+class FakeRedis:
+    """Lists, strings and pipelines - the subset the index uses."""
+
+    def __init__(self):
+        self.data = {}
+
+    def rpush(self, key, *values):
+        self.data.setdefault(key, []).extend(values)
+        return len(self.data[key])
+
+    def llen(self, key):
+        return len(self.data.get(key, []))
+
+    def lrange(self, key, start, end):
+        return self.data.get(key, [])[start:end + 1]
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def incr(self, key):
+        self.data[key] = str(int(self.data.get(key) or 0) + 1)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def expire(self, key, seconds):
+        pass
+
+    def pipeline(self):
+        redis, calls = self, []
+
+        class Pipeline:
+            def __getattr__(self, name):
+                def queue(*args):
+                    calls.append((name, args))
+                    return self
+                return queue
+
+            def execute(self):
+                return [getattr(redis, name)(*args) for name, args in calls]
+
+        return Pipeline()
+
+
+def stored_row(content, embedding, question_number=1):
+    return SimpleNamespace(
+        id=uuid4(),
+        content=content,
+        metadata=json.dumps({"type": "interview_question", "question_number": question_number,
+                             "interview_mode": "requirements"}),
+        embedding=json.dumps(embedding)
+    )
+
+
+def database(*rows):
+    db = Mock()
+    db.execute.return_value.fetchall.return_value = list(rows)
+    return db
+
+
+@pytest.fixture(autouse=True)
+def empty_index():
+    question_embedding_index._matrices.clear()
+    question_embedding_index._embeddings.clear()
+    yield
+    question_embedding_index._matrices.clear()
+    question_embedding_index._embeddings.clear()
+
+
+class TestIndex:
+    """Matrix-vector duplicate checks"""
+
+    def test_seeds_once_from_postgres(self):
+        project_id = uuid4()
+        db = database(stored_row("Qual banco de dados?", [1.0, 0.0]), stored_row("Quem usa?", [0.0, 2.0]))
+        index = QuestionEmbeddingIndex(db, redis_client=None)
+
+        match, similarity = index.best_match(project_id, normalize([0.1, 1.0]))
+        index.best_match(project_id, normalize([1.0, 0.0]))
+
+        assert match["content"] == "Quem usa?"
+        assert similarity == pytest.approx(1.0 / np.sqrt(1.01))
+        assert db.execute.call_count == 1
+
+    def test_added_questions_are_matched(self):
+        project_id = uuid4()
+        index = QuestionEmbeddingIndex(database(), redis_client=None)
+        assert index.best_match(project_id, normalize([1.0, 0.0])) == (None, 0.0)
+
+        index.add(project_id, normalize([3.0, 4.0]), {"id": uuid4(), "content": "Prazo?", "metadata": {}})
+
+        match, similarity = index.best_match(project_id, normalize([3.0, 4.0]))
+        assert match["content"] == "Prazo?" and similarity == pytest.approx(1.0)
+
+    def test_workers_share_questions_through_redis(self):
+        project_id, redis = uuid4(), FakeRedis()
+        worker_a = QuestionEmbeddingIndex(database(stored_row("Stack?", [1.0, 0.0])), redis_client=redis)
+        worker_b_db = database()
+        worker_b = QuestionEmbeddingIndex(worker_b_db, redis_client=redis)
+
+        worker_a.add(project_id, normalize([0.0, 1.0]), {"id": uuid4(), "content": "Usuários?", "metadata": {}})
+        question_embedding_index._matrices.clear()  # worker B is another process
+
+        match, _ = worker_b.best_match(project_id, normalize([0.0, 1.0]))
+        assert match["content"] == "Usuários?"
+        assert worker_b.best_match(project_id, normalize([1.0, 0.0]))[0]["content"] == "Stack?"
+        worker_b_db.execute.assert_not_called()  # seeded by worker A
+
+    def test_invalidate_forgets_deleted_questions(self):
+        project_id, redis = uuid4(), FakeRedis()
+        index = QuestionEmbeddingIndex(database(), redis_client=redis)
+        index.add(project_id, normalize([1.0, 0.0]), {"id": uuid4(), "content": "Stack?", "metadata": {}})
+
+        index.invalidate(project_id)
+
+        assert index.best_match(project_id, normalize([1.0, 0.0])) == (None, 0.0)
+
+
+class TestDeduplicator:
+    """check_duplicate and store_question share one embedding"""
+
+    @pytest.fixture
+    def rag(self):
+        with patch("app.services.interview_question_deduplicator.RAGService") as rag_class, \
+             patch("app.services.question_embedding_index.get_redis", return_value=None):
+            rag = rag_class.return_value
+            rag.embed_many.side_effect = lambda texts: [[float(len(texts[0])), 1.0]]
+            yield rag
+
+    def test_check_then_store_embeds_once(self, rag):
+        project_id = uuid4()
+        deduplicator = InterviewQuestionDeduplicator(database())
+        question = "❓ Pergunta 2: Qual banco de dados?\n\nEscolha uma opção."
+
+        assert deduplicator.check_duplicate(project_id, question) == (False, None, 0.0)
+        deduplicator.store_question(project_id, uuid4(), "requirements", question, 2)
+
+        assert rag.embed_many.call_count == 1
+        rag.retrieve.assert_not_called()
+        document = rag.store_many.call_args.args[0][0]
+        assert document["content"] == "Qual banco de dados?"
+        assert document["metadata"]["question_number"] == 2
+
+        is_duplicate, similar, score = deduplicator.check_duplicate(project_id, "Pergunta 7: Qual banco de dados?")
+        assert is_duplicate and score == pytest.approx(1.0)
+        assert similar["metadata"]["question_number"] == 2
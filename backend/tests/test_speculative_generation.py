@@ -0,0 +1,215 @@
+"""
+Unit tests for SpeculativeGenerator
+Draft storage, fingerprint invalidation, spend caps, activation shortcut (SQLite in memory)
+"""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import app.models  # noqa: F401 - register all tables referenced by Task
+from app.config import settings
+from app.database import Base
+from app.models.project import Project
+from app.models.speculative_draft import SpeculativeDraft, SpeculativeDraftStatus
+from app.models.task import Task, ItemType
+from app.services.ai_orchestrator import _record_usage, track_usage
+from app.services.context_generator import ContextGeneratorService
+from app.services.speculative_generation import run_speculative_generation
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    for table in Base.metadata.sorted_tables:
+        try:
+            table.create(engine)
+        except Exception:
+            pass  # Postgres-only column types; not referenced here
+    with Session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def tree(db):
+    """Activated Epic -> suggested Story -> suggested Task -> suggested Subtask"""
+    project = SimpleNamespace(id=uuid4(), name="Shop", context_semantic="ctx", context_locked=True)
+    epic = Task(id=uuid4(), project_id=project.id, title="Checkout", item_type=ItemType.EPIC,
+                generated_prompt="# Checkout", workflow_state="open")
+    story = Task(id=uuid4(), project_id=project.id, parent_id=epic.id, title="Pay by card",
+                 item_type=ItemType.STORY, labels=["suggested"], workflow_state="draft")
+    task = Task(id=uuid4(), project_id=project.id, parent_id=story.id, title="Card form",
+                item_type=ItemType.TASK, labels=["suggested"], workflow_state="draft")
+    subtask = Task(id=uuid4(), project_id=project.id, parent_id=task.id, title="Validate CVV",
+                   item_type=ItemType.SUBTASK, labels=["suggested"], workflow_state="draft")
+    db.add_all([epic, story, task, subtask])
+    db.commit()
+    return {"project": project, "epic": epic, "story": story, "task": task, "subtask": subtask}
+
+
+@pytest.fixture
+def project_lookup(db, tree, monkeypatch):
+    """Serve the project without loading its relationships (specs is Postgres-only)"""
+    query = db.query
+    found = MagicMock()
+    found.filter.return_value.first.return_value = tree["project"]
+    monkeypatch.setattr(db, "query", lambda model, *args: found if model is Project else query(model, *args))
+
+
+@pytest.fixture
+def service(db):
+    with patch("app.services.context_generator.AIOrchestrator"), \
+         patch("app.services.context_generator.PrompterFacade"), \
+         patch("app.services.context_generator.get_prompt_service"):
+        service = ContextGeneratorService(db)
+    service.calls = []
+
+    async def generate(item, project):
+        service.calls.append(item.title)
+        _record_usage({"input_tokens": 300, "output_tokens": 200, "total_tokens": 500})
+        return {"description": f"Full {item.title}", "generated_prompt": f"# {item.title}",
+                "acceptance_criteria": ["AC1"]}
+
+    service._generate_full_item_content = generate
+    return service
+
+
+class TestDrafts:
+    """Drafts are stored, served once and invalidated by input changes"""
+
+    @pytest.mark.asyncio
+    async def test_generated_draft_is_taken_once(self, db, tree, service):
+        project = tree["project"]
+
+        stats = await service.speculation.generate(project, [tree["story"].id, tree["task"].id])
+
+        assert stats == {"generated": 2, "skipped": 0, "tokens_used": 1000, "stopped": None}
+        content = service.speculation.take(tree["task"], project)
+        assert content["generated_prompt"] == "# Card form"
+        assert service.speculation.take(tree["task"], project) is None
+        statuses = {d.task_id: d.status for d in db.query(SpeculativeDraft).all()}
+        assert statuses == {tree["story"].id: SpeculativeDraftStatus.READY,
+                            tree["task"].id: SpeculativeDraftStatus.CONSUMED}
+
+    @pytest.mark.asyncio
+    async def test_parent_change_makes_draft_stale(self, db, tree, service):
+        await service.speculation.generate(tree["project"], [tree["subtask"].id])
+
+        tree["story"].description = "Also accepts debit cards"
+
+        assert service.speculation.take(tree["subtask"], tree["project"]) is None
+        assert db.query(SpeculativeDraft).one().status == SpeculativeDraftStatus.STALE
+
+    @pytest.mark.asyncio
+    async def test_activated_items_and_existing_drafts_are_skipped(self, tree, service):
+        ids = [tree["epic"].id, tree["story"].id]
+
+        await service.speculation.generate(tree["project"], ids)
+        stats = await service.speculation.generate(tree["project"], ids)
+
+        assert service.calls == ["Pay by card"]
+        assert stats["skipped"] == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_content_only_counts_its_spend(self, db, tree, service):
+        async def fallback(item, project):
+            _record_usage({"total_tokens": 800})
+            return {"description": item.title, "generated_prompt": ""}
+
+        service._generate_full_item_content = fallback
+
+        stats = await service.speculation.generate(tree["project"], [tree["story"].id])
+
+        assert stats["generated"] == 0
+        assert db.query(SpeculativeDraft).one().status == SpeculativeDraftStatus.STALE
+        assert service.speculation.tokens_spent_today(tree["project"].id) == 800
+
+
+class TestSpendCaps:
+    """Item and token caps bound each run"""
+
+    @pytest.mark.asyncio
+    async def test_item_limit(self, tree, service, monkeypatch):
+        monkeypatch.setattr(settings, "speculative_max_items_per_run", 1)
+
+        stats = await service.speculation.generate(tree["project"], [tree["story"].id, tree["task"].id])
+
+        assert stats["generated"] == 1
+        assert stats["stopped"] == "item_limit"
+
+    @pytest.mark.asyncio
+    async def test_daily_token_budget(self, tree, service, monkeypatch):
+        monkeypatch.setattr(settings, "speculative_daily_token_budget", 900)
+
+        stats = await service.speculation.generate(
+            tree["project"], [tree["story"].id, tree["task"].id, tree["subtask"].id]
+        )
+
+        assert service.calls == ["Pay by card", "Card form"]
+        assert stats["stopped"] == "token_budget"
+        assert service.speculation.tokens_spent_today(tree["project"].id) == 1000
+
+
+class TestScheduling:
+    """Jobs are queued only when enabled"""
+
+    def test_disabled_by_default(self, tree, service):
+        assert service.speculation.schedule(tree["project"].id, [tree["story"]]) is None
+
+    def test_enabled_queues_a_job(self, tree, service, monkeypatch):
+        monkeypatch.setattr(settings, "speculative_generation_enabled", True)
+        job_manager = MagicMock()
+        job_manager.create_job.return_value.id = uuid4()
+
+        with patch("app.services.speculative_generation.JobManager", return_value=job_manager):
+            job_id = service.speculation.schedule(tree["project"].id, [tree["story"], tree["task"]])
+
+        assert job_id == job_manager.create_job.return_value.id
+        request = job_manager.create_job.call_args.kwargs
+        assert request["input_data"]["task_ids"] == [str(tree["story"].id), str(tree["task"].id)]
+        assert request["handler"] is run_speculative_generation
+        assert request["handler_kwargs"]["task_ids"] == [tree["story"].id, tree["task"].id]
+
+
+class TestActivation:
+    """Activation serves a matching draft without calling the AI"""
+
+    @pytest.mark.asyncio
+    async def test_subtask_activation_uses_draft(self, db, tree, service, project_lookup):
+        await service.speculation.generate(tree["project"], [tree["subtask"].id])
+        service.calls.clear()
+
+        result = await service.activate_suggested_subtask(tree["subtask"].id)
+
+        assert service.calls == []
+        assert result["generated_prompt"] == "# Validate CVV"
+        assert db.query(SpeculativeDraft).one().status == SpeculativeDraftStatus.CONSUMED
+
+    @pytest.mark.asyncio
+    async def test_story_activation_without_draft_generates_live(self, tree, service, project_lookup):
+        service._generate_draft_tasks = AsyncMock(return_value=[])
+
+        result = await service.activate_suggested_story(tree["story"].id)
+
+        assert service.calls == ["Pay by card"]
+        assert result["generated_prompt"] == "# Pay by card"
+
+
+class TestUsageMeter:
+    """track_usage only counts the current task's executions"""
+
+    @pytest.mark.asyncio
+    async def test_meters_are_per_task(self):
+        async def spend(tokens):
+            with track_usage() as usage:
+                for _ in range(3):
+                    _record_usage({"total_tokens": tokens})
+                    await asyncio.sleep(0)
+            return usage["total_tokens"]
+
+        assert await asyncio.gather(spend(10), spend(100)) == [30, 300]
+        _record_usage({"total_tokens": 5})  # no active meter: ignored
@@ -0,0 +1,117 @@
+"""
+Unit tests for structural clustering
+MinHash signatures, leader clustering, medoid order, cluster merging
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from app.services.pattern_discovery import PatternDiscoveryService
+from app.services.structural_clustering import FileCluster, StructuralClusterer
+
+
+CONTROLLER = """<?php
+class {name}Controller extends Controller
+{{
+    public function index() {{ return view('{name}.index'); }}
+    public function show($id) {{ return view('{name}.show', ['item' => {name}::find($id)]); }}
+}}
+"""
+
+ENUM = """<?php
+enum {name}: string
+{{
+    case Active = 'active';
+    case Inactive = 'inactive';
+    case Pending = 'pending';
+    case Archived = 'archived';
+}}
+"""
+
+
+@pytest.fixture
+def clusterer():
+    return StructuralClusterer()
+
+
+class TestSignatures:
+    """Structural tokens and similarity"""
+
+    def test_identifiers_literals_and_comments_are_normalized(self, clusterer):
+        tokens = clusterer.tokens("// note\n$book = new Book('x', 42); /* done */")
+
+        assert tokens == ["ID", "=", "new", "ID", "(", "STR", ",", "NUM", ")", ";"]
+
+    def test_same_shape_is_similar_and_deterministic(self, clusterer):
+        books = clusterer.signature(CONTROLLER.format(name="Book"))
+        authors = clusterer.signature(CONTROLLER.format(name="Author"))
+        status = clusterer.signature(ENUM.format(name="Status"))
+
+        assert clusterer.similarity(books, authors) == 1.0
+        assert clusterer.similarity(books, status) < 0.2
+        assert (StructuralClusterer().signature(CONTROLLER.format(name="Book")) == books).all()
+
+
+class TestClustering:
+    """Leader clustering, medoid first"""
+
+    def test_files_are_split_by_shape(self, clusterer):
+        sources = {f"c{i}.php": CONTROLLER.format(name=f"N{i}") for i in range(3)}
+        sources.update({f"e{i}.php": ENUM.format(name=f"E{i}") for i in range(2)})
+
+        clusters = clusterer.cluster({path: clusterer.signature(code) for path, code in sources.items()})
+
+        assert clusters == [["c0.php", "c1.php", "c2.php"], ["e0.php", "e1.php"]]
+
+    def test_medoid_comes_first(self, clusterer):
+        extra = "    public function edit($id) { return view('x.edit'); }\n}\n"
+        signatures = {
+            "outlier.php": clusterer.signature(CONTROLLER.format(name="A").rstrip("}\n") + "\n" + extra * 3),
+            "typical1.php": clusterer.signature(CONTROLLER.format(name="B")),
+            "typical2.php": clusterer.signature(CONTROLLER.format(name="C")),
+        }
+
+        assert clusterer.cluster(signatures)[0][0] == "typical1.php"
+
+    def test_near_identical_clusters_merge_within_extension(self, clusterer):
+        controller = clusterer.signature(CONTROLLER.format(name="X"))
+        enum = clusterer.signature(ENUM.format(name="Y"))
+        clusters = [
+            FileCluster(".php:api", ".php", "api", ["a1", "a2"], controller),
+            FileCluster(".php:controller", ".php", "controller", ["c1", "c2", "c3"], controller),
+            FileCluster(".ts:general", ".ts", "general", ["t1"], controller),
+            FileCluster(".php:model", ".php", "model", ["m1"], enum),
+        ]
+
+        merged = clusterer.merge(clusters)
+
+        assert [(c.key, c.paths) for c in merged] == [
+            (".php:controller", ["c1", "c2", "c3", "a1", "a2"]),
+            (".ts:general", ["t1"]),
+            (".php:model", ["m1"]),
+        ]
+
+
+class TestPatternDiscoveryClusters:
+    """Groups become clusters before the AI is called"""
+
+    def test_groups_split_and_similar_groups_merge(self, tmp_path: Path):
+        for folder, template, count in (("controllers", CONTROLLER, 3), ("api", CONTROLLER, 2),
+                                        ("controllers/enums", ENUM, 3)):
+            (tmp_path / folder).mkdir(parents=True, exist_ok=True)
+            for i in range(count):
+                (tmp_path / folder / f"{folder.split('/')[-1]}{i}.php").write_text(template.format(name=f"N{i}"))
+
+        with patch("app.services.pattern_discovery.AIOrchestrator"), \
+             patch("app.services.pattern_discovery.get_prompt_service"):
+            service = PatternDiscoveryService(MagicMock())
+        groups = service._group_files(service._build_file_inventory(tmp_path))
+
+        clusters = service._cluster_groups(tmp_path, groups, min_occurrences=3)
+
+        assert set(clusters) == {".php:controller", ".php:controller#2"}
+        controllers = clusters[".php:controller"]
+        assert controllers.file_count == 5
+        assert {Path(p).parent.name for p in controllers.file_paths} == {"controllers", "api"}
+        assert all("enums" in p for p in clusters[".php:controller#2"].file_paths)
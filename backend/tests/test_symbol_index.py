@@ -0,0 +1,260 @@
+"""
+Unit tests for the project symbol table
+Extraction, validators on SymbolTable, incremental sync, indexer/context wiring
+"""
+
+import hashlib
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+from uuid import uuid4
+from sqlalchemy.orm import Session
+
+from app.services.codebase_indexer import CodebaseIndexer
+from app.services.fs_snapshot import FileInfo
+from app.services.symbol_index import (
+    MARKER_KIND, ProjectSymbolIndex, Symbol, SymbolTable, _to_row, content_hash, extract_symbols
+)
+from app.services.task_execution.context_builder import ContextBuilder
+from app.services.validators import ImportValidator, NamingValidator
+
+
+BOOK_MODEL = """<?php
+namespace App\\Models;
+
+class Book extends Model
+{
+    protected $fillable = ['title'];
+
+    public function findById($id) {}
+}
+"""
+
+BOOK_CONTROLLER = """<?php
+namespace App\\Http\\Controllers;
+
+use App\\Models\\Book;
+use App\\Services\\Pricing;
+
+class BookController extends Controller
+{
+    public function show($id)
+    {
+        $book = $this->repo->findByID($id);
+        return Books::find($id);
+    }
+}
+"""
+
+
+def result(code: str, file_path: str = None):
+    return SimpleNamespace(task_id=uuid4(), output_code=code, file_path=file_path)
+
+
+class TestExtraction:
+    """Symbols found in a source"""
+
+    def test_php_definitions_exports_imports_and_usages(self):
+        symbols = extract_symbols(BOOK_MODEL + BOOK_CONTROLLER)
+
+        assert Symbol("class", "Book", qualified_name="App\\Models\\Book") in symbols
+        assert Symbol("method", "findById", owner="Book") in symbols
+        assert Symbol("field", "fillable", owner="Book") in symbols
+        assert Symbol("export", "Book", qualified_name="App\\Models\\Book") in symbols
+        assert Symbol("import", "Pricing", qualified_name="App\\Services\\Pricing", language="php") in symbols
+        assert Symbol("call", "findByID") in symbols
+        assert Symbol("reference", "Books") in symbols
+        assert not any(s.kind == "field" and s.name == "function" for s in symbols)
+
+    def test_typescript_and_python_imports(self):
+        symbols = extract_symbols(
+            "import { Book, type Author as A } from './models';\n"
+            "from app.models import (User,\n    Order as O)\n"
+            "export function listBooks() {}\n",
+            "typescript"
+        )
+
+        imports = {(s.name, s.qualified_name, s.language) for s in symbols if s.kind == "import"}
+        assert imports == {
+            ("Book", "./models", "typescript"),
+            ("Author", "./models", "typescript"),
+            ("User", "app.models", "python"),
+            ("Order", "app.models", "python"),
+        }
+        assert Symbol("export", "listBooks", language="typescript") in symbols
+
+    def test_file_symbols_skip_usages_and_non_code(self):
+        symbols = extract_symbols(BOOK_CONTROLLER, "php", usages=False)
+
+        assert {s.kind for s in symbols} == {"class", "method", "export", "import"}
+        assert extract_symbols('{"class Foo": 1}', "json") == []
+
+
+class TestValidatorsOnSymbolTable:
+    """Validators read the table instead of the code"""
+
+    def test_naming_issues_for_batch_usages(self):
+        model, controller = result(BOOK_MODEL), result(BOOK_CONTROLLER)
+
+        issues = NamingValidator({}).validate([model, controller])
+
+        messages = [issue["message"] for issue in issues]
+        assert any('references "Books" but class is defined as "Book"' in m for m in messages)
+        assert any('calls method "findByID()" but method is defined as "findById()"' in m for m in messages)
+        reference = next(i for i in issues if '"Books"' in i["message"])
+        assert reference["task_ids"] == [str(controller.task_id), str(model.task_id)]
+
+    def test_only_usages_of_loaded_sources_are_checked(self):
+        model, controller = result(BOOK_MODEL), result(BOOK_CONTROLLER)
+        table = SymbolTable.from_task_results([model, controller])
+        table.usage_sources = {str(model.task_id)}
+
+        assert NamingValidator({}).validate([model], table) == []
+
+    def test_import_satisfied_by_indexed_file_export(self):
+        controller = result(BOOK_CONTROLLER)
+        table = SymbolTable.from_task_results([controller])
+        table.rows.append(_to_row(
+            None, "file", "app/Models/Book.php", "app/Models/Book.php", "h",
+            Symbol("export", "Book", qualified_name="App\\Models\\Book", language="php")
+        ))
+
+        issues = ImportValidator().validate([controller], table)
+
+        assert [issue["message"] for issue in issues] == [
+            f'Task {controller.task_id} imports "App\\Services\\Pricing" but it is not exported by any task'
+        ]
+
+    def test_system_and_python_imports_are_not_reported(self):
+        code = "use Illuminate\\Http\\Request;\nfrom typing import List\n"
+
+        assert ImportValidator().validate([result(code)]) == []
+
+
+class TestProjectSymbolIndex:
+    """Incremental maintenance of the table"""
+
+    def test_sync_only_reextracts_changed_results(self):
+        db = MagicMock(spec=Session)
+        index = ProjectSymbolIndex(db)
+        fresh, stale = result("class A {}"), result("class B {}")
+        db.query.return_value.filter.return_value.distinct.return_value.all.return_value = [
+            (str(fresh.task_id), content_hash(fresh.output_code)),
+            (str(stale.task_id), "old-hash"),
+        ]
+
+        with patch.object(index, "update_task_results") as update:
+            refreshed = index.sync_task_results(uuid4(), [fresh, stale])
+
+        assert refreshed == 1
+        update.assert_called_once()
+        assert update.call_args.args[1] == [stale]
+
+    def test_update_replaces_rows_of_the_source(self):
+        db = MagicMock(spec=Session)
+        index = ProjectSymbolIndex(db)
+        project_id = uuid4()
+        saved = result(BOOK_MODEL, "app/Models/Book.php")
+
+        index.update_task_result(project_id, saved)
+
+        db.query.return_value.filter.return_value.delete.assert_called_once_with(synchronize_session=False)
+        rows = db.execute.call_args.args[1]
+        assert {row["source_key"] for row in rows} == {str(saved.task_id)}
+        assert all(row["language"] in ("php", None) for row in rows)
+        assert {"Book", "findById", "fillable"} <= {row["name"] for row in rows}
+        db.commit.assert_called_once()
+
+
+    def test_result_without_symbols_is_marked_as_extracted(self):
+        db = MagicMock(spec=Session)
+        index = ProjectSymbolIndex(db)
+        empty = result("<p>Static page</p>", "resources/views/about.html")
+
+        index.update_task_result(uuid4(), empty)
+
+        (row,) = db.execute.call_args.args[1]
+        assert (row["kind"], row["name"], row["content_hash"]) == (MARKER_KIND, "", content_hash(empty.output_code))
+
+        db.query.return_value.filter.return_value.distinct.return_value.all.return_value = [
+            (row["source_key"], row["content_hash"])
+        ]
+        with patch.object(index, "update_task_results") as update:
+            assert index.sync_task_results(uuid4(), [empty]) == 0
+        update.assert_not_called()
+
+
+class TestIndexerIntegration:
+    """Indexed files feed the table"""
+
+    @pytest.fixture
+    def indexer(self):
+        with patch("app.services.codebase_indexer.RAGService"):
+            yield CodebaseIndexer(Mock(spec=Session))
+
+    def test_changed_file_is_parsed_for_symbols(self, indexer, tmp_path: Path):
+        file_path = tmp_path / "book.php"
+        file_path.write_text(BOOK_MODEL)
+        stat = file_path.stat()
+        info = FileInfo("book.php", stat.st_size, stat.st_mtime, ".php", "php")
+
+        prepared = indexer._prepare_file(uuid4(), file_path, info, None)
+
+        assert Symbol("class", "Book", qualified_name="App\\Models\\Book", language="php") in prepared.symbols
+        assert not any(symbol.kind == "call" for symbol in prepared.symbols)
+
+    def test_unchanged_file_is_parsed_only_for_backfill(self, indexer, tmp_path: Path):
+        file_path = tmp_path / "book.php"
+        file_path.write_text(BOOK_MODEL)
+        stat = file_path.stat()
+        info = FileInfo("book.php", stat.st_size, stat.st_mtime, ".php", "php")
+        known = (stat.st_size, stat.st_mtime, hashlib.sha256(BOOK_MODEL.encode()).hexdigest(), 9)
+
+        assert indexer._prepare_file(uuid4(), file_path, info, known).symbols is None
+
+        backfilled = indexer._prepare_file(uuid4(), file_path, info, known, refresh_symbols=True)
+        assert backfilled.documents is None
+        assert any(symbol.name == "Book" for symbol in backfilled.symbols)
+
+    def test_write_batch_replaces_file_symbols(self, indexer, tmp_path: Path):
+        file_path = tmp_path / "book.php"
+        file_path.write_text(BOOK_MODEL)
+        stat = file_path.stat()
+        info = FileInfo("book.php", stat.st_size, stat.st_mtime, ".php", "php")
+        project_id = uuid4()
+        prepared = indexer._prepare_file(project_id, file_path, info, None)
+
+        with patch.object(indexer.symbols, "replace_file_symbols") as replace:
+            indexer._write_batch(project_id, [prepared], [[0.0]] * len(prepared.documents), {})
+
+        replace.assert_called_once_with(
+            project_id, {"book.php": (prepared.content_hash, prepared.symbols)}
+        )
+
+
+class TestContextBuilder:
+    """Symbol section of the execution context"""
+
+    def test_dependency_and_mentioned_symbols_are_listed(self):
+        builder = ContextBuilder(Mock(spec=Session))
+        project = SimpleNamespace(id=uuid4())
+        task = SimpleNamespace(
+            depends_on=[uuid4()], title="Create BookController", description="Use the Author model"
+        )
+        book = [_to_row(project.id, "task", "t1", "app/Models/Book.php", "h", s) for s in (
+            Symbol("class", "Book"), Symbol("method", "findById", owner="Book"),
+            Symbol("field", "title", owner="Book"),
+        )]
+        author = [_to_row(project.id, "file", "app/Models/Author.php", "app/Models/Author.php", "h",
+                          Symbol("class", "Author"))]
+
+        with patch.object(builder.symbol_index, "definitions_for_tasks", return_value=book), \
+             patch.object(builder.symbol_index, "find_definitions", return_value=author) as find:
+            context = builder._build_symbol_context(task, project)
+
+        assert set(find.call_args.args[1]) == {"Create", "BookController", "Use", "Author"}
+        assert "- Book (app/Models/Book.php)" in context
+        assert "methods: findById()" in context
+        assert "fields: title" in context
+        assert "- Author (app/Models/Author.php)" in context
@@ -0,0 +1,202 @@
+"""
+Unit tests for repair attempts
+Edit blocks, repair messages, cached-prefix cost and retry metrics of TaskExecutor
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.task_execution.executor import TaskExecutor
+from app.services.task_execution.repair import apply_repair, generation_messages, repair_messages
+
+
+CODE = '''<?php
+
+class ProductController extends Controller
+{
+    public function index()
+    {
+        return Product::all();
+    }
+}
+'''
+
+FIX = '''<<<<<<< SEARCH
+    public function index()
+=======
+    public function index(): JsonResponse
+>>>>>>> REPLACE'''
+
+SONNET = "claude-sonnet-4-20250514"
+
+
+class TestApplyRepair:
+    """SEARCH/REPLACE blocks are applied all-or-nothing"""
+
+    def test_edit_blocks_are_applied(self):
+        reply = FIX + "\n\n<<<<<<< SEARCH\n        return Product::all();\n=======\n        return response()->json(Product::all());\n>>>>>>> REPLACE\n"
+
+        code, error, patched = apply_repair(CODE, reply)
+
+        assert (error, patched) == (None, True)
+        assert "public function index(): JsonResponse" in code
+        assert "return response()->json(Product::all());" in code
+        assert code.startswith("<?php\n\nclass ProductController")
+
+    def test_unmatched_block_applies_nothing(self):
+        reply = FIX + "\n<<<<<<< SEARCH\n    public function store()\n=======\n    public function store(Request $r)\n>>>>>>> REPLACE"
+
+        code, error, patched = apply_repair(CODE, reply)
+
+        assert code == CODE and not patched
+        assert error == "SEARCH block 2 does not match the code"
+
+    def test_ambiguous_block_applies_nothing(self):
+        code, error, _ = apply_repair("a = 1\na = 1\n", "<<<<<<< SEARCH\na = 1\n=======\na = 2\n>>>>>>> REPLACE")
+
+        assert code == "a = 1\na = 1\n"
+        assert error.startswith("SEARCH block 1 matches 2 places")
+
+    def test_reply_without_blocks_is_the_complete_file(self):
+        assert apply_repair(CODE, "```php\n<?php\necho 1;\n```") == ("<?php\necho 1;", None, False)
+        assert apply_repair(CODE, "<?php\necho 1;") == ("<?php\necho 1;", None, False)
+
+
+class TestMessages:
+    """Repair requests share the cached context prefix of the generation"""
+
+    def test_repair_extends_the_generation_prefix(self):
+        messages = repair_messages("CONTEXT", CODE, ["Missing return type on index()"])
+
+        assert messages[0] == generation_messages("CONTEXT")[0]
+        assert messages[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert messages[1] == {"role": "assistant", "content": CODE}
+        assert "- Missing return type on index()" in messages[2]["content"]
+        assert "could not be applied" not in messages[2]["content"]
+
+    def test_patch_error_is_reported(self):
+        messages = repair_messages("CONTEXT", CODE, ["x"], patch_error="SEARCH block 1 does not match the code")
+
+        assert "Your previous edit could not be applied: SEARCH block 1 does not match the code" in messages[2]["content"]
+
+
+def response(text, input_tokens, output_tokens, cache_write=0, cache_read=0):
+    usage = SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens,
+                            cache_creation_input_tokens=cache_write, cache_read_input_tokens=cache_read)
+    return SimpleNamespace(content=[SimpleNamespace(text=text)], usage=usage)
+
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = MagicMock()
+    with patch("app.services.task_execution.executor.OrchestratorRegistry.get_orchestrator", return_value=orchestrator), \
+         patch("app.services.task_execution.executor.broadcast_event", new_callable=AsyncMock):
+        yield orchestrator
+
+
+def executor(*responses):
+    task = SimpleNamespace(id="t1", title="Product list", type="feature", complexity=3, to_dict=lambda: {})
+    project = SimpleNamespace(id="p1", stack="php_mysql")
+
+    executor = TaskExecutor.__new__(TaskExecutor)
+    executor.db = MagicMock()
+    executor.db.query.return_value.filter.return_value.first.side_effect = [task, project, None]
+    executor.client = MagicMock()
+    executor.client.messages.create.side_effect = list(responses)
+    executor._build_context = AsyncMock(return_value="CONTEXT")
+    executor._save_successful_result = AsyncMock(return_value="saved")
+    executor._save_failed_result = AsyncMock(return_value="saved with issues")
+    return executor
+
+
+def sent_messages(executor):
+    return [call.kwargs["messages"] for call in executor.client.messages.create.call_args_list]
+
+
+class TestRepairAttempts:
+    """Validation retries repair the previous output with the context built once"""
+
+    @pytest.mark.asyncio
+    async def test_retry_repairs_previous_output(self, orchestrator):
+        orchestrator.validate_output.side_effect = [["Missing return type on index()"], []]
+        task_executor = executor(
+            response(CODE, input_tokens=20, output_tokens=1000, cache_write=4000),
+            response(FIX, input_tokens=150, output_tokens=60, cache_read=4000),
+        )
+
+        assert await task_executor.execute_task("t1", "p1") == "saved"
+
+        task_executor._build_context.assert_awaited_once()
+        first, second = sent_messages(task_executor)
+        assert first == generation_messages("CONTEXT")
+        assert second[:2] == [first[0], {"role": "assistant", "content": CODE}]
+
+        saved = task_executor._save_successful_result.call_args.kwargs
+        assert "index(): JsonResponse" in saved["output_code"] and saved["attempt"] == 2
+        metrics = saved["execution_metrics"]
+        assert [(a["mode"], a["patch_applied"]) for a in metrics["attempts"]] == [("full", False), ("repair", True)]
+        assert metrics["repair_attempts"] == 1
+        assert metrics["input_tokens"] == 20 + 4000 + 150 + 4000
+        assert metrics["cache_read_input_tokens"] == 4000
+        assert metrics["cost"] == round(sum(a["cost"] for a in metrics["attempts"]), 6)
+        full, repair = metrics["attempts"]
+        assert repair["cost"] < full["cost"]
+        assert metrics["estimated_savings_usd"] == pytest.approx(full["cost"] - repair["cost"])
+
+    @pytest.mark.asyncio
+    async def test_unapplied_repair_is_retried_with_the_error(self, orchestrator):
+        orchestrator.validate_output.side_effect = [["Missing return type on index()"], []]
+        bad_fix = "<<<<<<< SEARCH\n    public function show()\n=======\n    public function show(): JsonResponse\n>>>>>>> REPLACE"
+        task_executor = executor(
+            response(CODE, 20, 1000),
+            response(bad_fix, 150, 60),
+            response(FIX, 200, 60),
+        )
+
+        await task_executor.execute_task("t1", "p1")
+
+        assert orchestrator.validate_output.call_count == 2  # the unapplied edit is not validated
+        third = sent_messages(task_executor)[2]
+        assert third[1]["content"] == CODE
+        assert "- Missing return type on index()" in third[2]["content"]
+        assert "SEARCH block 1 does not match the code" in third[2]["content"]
+        metrics = task_executor._save_successful_result.call_args.kwargs["execution_metrics"]
+        assert metrics["attempts"][1]["patch_error"] == "SEARCH block 1 does not match the code"
+        assert metrics["repair_attempts"] == 2
+
+    @pytest.mark.asyncio
+    async def test_last_attempt_saves_issues_and_totals(self, orchestrator):
+        orchestrator.validate_output.return_value = ["Missing return type on index()"]
+        task_executor = executor(response(CODE, 20, 1000), response(FIX, 150, 60))
+
+        assert await task_executor.execute_task("t1", "p1", max_attempts=2) == "saved with issues"
+
+        saved = task_executor._save_failed_result.call_args.kwargs
+        assert saved["validation_issues"] == ["Missing return type on index()"]
+        assert saved["execution_metrics"]["output_tokens"] == 1060
+
+    @pytest.mark.asyncio
+    async def test_repair_mode_off_regenerates(self, orchestrator):
+        orchestrator.validate_output.side_effect = [["Missing return type on index()"], []]
+        task_executor = executor(response(CODE, 20, 1000), response(CODE, 20, 1000))
+
+        with patch("app.services.task_execution.executor.settings.task_repair_mode", False):
+            await task_executor.execute_task("t1", "p1")
+
+        assert sent_messages(task_executor) == [generation_messages("CONTEXT")] * 2
+        task_executor._build_context.assert_awaited_once()
+        metrics = task_executor._save_successful_result.call_args.kwargs["execution_metrics"]
+        assert metrics["repair_attempts"] == 0 and metrics["estimated_savings_usd"] == 0
+
+
+class TestCachedCost:
+    """Cache writes and reads are priced relative to the input price"""
+
+    def test_cache_pricing(self):
+        executor = TaskExecutor.__new__(TaskExecutor)
+
+        assert executor._calculate_cost(SONNET, 1_000_000, 0) == 3.0
+        assert executor._calculate_cost(SONNET, 0, 0, cache_creation_input_tokens=1_000_000) == 3.75
+        assert executor._calculate_cost(SONNET, 0, 0, cache_read_input_tokens=1_000_000) == 0.3
+        assert executor._calculate_cost("unknown-model", 1000, 1000, cache_read_input_tokens=1000) == 0.0
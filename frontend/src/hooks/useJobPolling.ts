@@ -2,9 +2,13 @@
  * useJobPolling Hook
  * PROMPT #65 - Async Job System
  *
- * Polls async job status until completion or failure.
+ * Follows async job status until completion or failure.
  * Provides real-time progress updates for long-running background tasks.
  *
+ * Status is pushed by the backend (Server-Sent Events, jobsApi.subscribe);
+ * polling GET /jobs/{id} every `interval` ms is only the fallback when the
+ * event stream is unavailable.
+ *
  * Usage:
  *   const { job, isPolling } = useJobPolling(jobId);
  *
@@ -18,7 +22,7 @@
  */
 
 import { useState, useEffect, useCallback } from 'react';
-import { jobsApi } from '@/lib/api';
+import { jobsApi, JobEvent } from '@/lib/api';
 
 export interface AsyncJob {
   id: string;
@@ -35,7 +39,7 @@ export interface AsyncJob {
 
 interface UseJobPollingOptions {
   /**
-   * Polling interval in milliseconds
+   * Polling interval in milliseconds (fallback when events are unavailable)
    * @default 1500
    */
   interval?: number;
@@ -78,59 +82,76 @@ export function useJobPolling(
   const [isPolling, setIsPolling] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
+  // Stop following once the job reaches a final state
+  const handleStatus = useCallback((data: AsyncJob) => {
+    if (data.status === 'completed') {
+      setIsPolling(false);
+      onComplete?.(data.result);
+      return true;
+    } else if (data.status === 'failed') {
+      setIsPolling(false);
+      setError(data.error);
+      onError?.(data.error ?? 'Job failed');
+      return true;
+    } else if (data.status === 'cancelled') {
+      setIsPolling(false);
+      onCancelled?.();
+      return true;
+    }
+    return false;
+  }, [onComplete, onError, onCancelled]);
+
   const fetchJobStatus = useCallback(async () => {
-    if (!jobId) return;
+    if (!jobId) return false;
 
     try {
       const response = await jobsApi.get(jobId);
       const data = response.data || response;
       setJob(data);
-
-      // If job is completed, failed, or cancelled, stop polling
-      if (data.status === 'completed') {
-        setIsPolling(false);
-        onComplete?.(data.result);
-      } else if (data.status === 'failed') {
-        setIsPolling(false);
-        setError(data.error);
-        onError?.(data.error);
-      } else if (data.status === 'cancelled') {
-        setIsPolling(false);
-        onCancelled?.();
-      }
+      return handleStatus(data);
     } catch (err: any) {
       console.error('Failed to fetch job status:', err);
       setError(err.message || 'Failed to fetch job status');
       setIsPolling(false);
+      return true;
     }
-  }, [jobId, onComplete, onError, onCancelled]);
+  }, [jobId, handleStatus]);
 
   useEffect(() => {
-    console.log('🔄 useJobPolling effect triggered:', { jobId, enabled });
-
     if (!jobId || !enabled) {
-      console.log('⏹️ Stopping polling (no jobId or disabled)');
       setIsPolling(false);
       return;
     }
 
-    console.log('▶️ Starting polling for job:', jobId);
     setIsPolling(true);
     setError(null);
 
-    // Fetch immediately
-    fetchJobStatus();
+    let pollInterval: ReturnType<typeof setInterval> | null = null;
+
+    const handleEvent = (event: JobEvent) => {
+      setJob(prev => ({ ...(prev ?? {}), ...event } as AsyncJob));
+      // Events carry status, error and (when completed) result
+      handleStatus(event as AsyncJob);
+    };
 
-    // Set up polling interval
-    const pollInterval = setInterval(() => {
+    // Fallback: poll when the event stream is unavailable
+    const startPolling = () => {
+      console.log('🔄 Job events unavailable, polling job:', jobId);
       fetchJobStatus();
-    }, interval);
+      pollInterval = setInterval(async () => {
+        if (await fetchJobStatus() && pollInterval) {
+          clearInterval(pollInterval);
+        }
+      }, interval);
+    };
+
+    const closeEvents = jobsApi.subscribe(jobId, handleEvent, startPolling);
 
     return () => {
-      console.log('🛑 Cleaning up polling for job:', jobId);
-      clearInterval(pollInterval);
+      closeEvents();
+      if (pollInterval) clearInterval(pollInterval);
     };
-  }, [jobId, enabled, interval, fetchJobStatus]);
+  }, [jobId, enabled, interval, fetchJobStatus, handleStatus]);
 
   return {
     job,
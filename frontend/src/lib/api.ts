@@ -858,6 +858,21 @@ export interface JobResponse {
   completed_at: string | null;
 }
 
+// Job lifecycle event pushed by GET /api/v1/jobs/{id}/events (Server-Sent Events)
+// Carries the job's status fields; result only on "snapshot" and "completed"
+export type JobEvent = Partial<JobResponse> & {
+  event: 'snapshot' | 'created' | 'started' | 'progress' | 'completed' | 'failed' | 'cancelled';
+  id: string;
+  status: JobStatus;
+};
+
+const JOB_EVENT_TYPES: JobEvent['event'][] = [
+  'snapshot', 'created', 'started', 'progress', 'completed', 'failed', 'cancelled',
+];
+
+const isFinished = (status: JobStatus) =>
+  status === 'completed' || status === 'failed' || status === 'cancelled';
+
 // Jobs API (PROMPT #65 - Async Job System)
 // PROMPT #108 - Added polling utility for background queue
 export const jobsApi = {
@@ -873,9 +888,50 @@ export const jobsApi = {
       method: 'PATCH',
     }),
 
-  // PROMPT #108 - Poll until job completes
+  eventsUrl: (jobId: string) => `${API_URL}/api/v1/jobs/${jobId}/events`,
+
+  // Push-based job status: onEvent receives every event until the job finishes.
+  // onUnavailable is called instead if the stream can't be used (no EventSource,
+  // connection lost) - callers fall back to polling. Returns a function that closes the stream.
+  subscribe: (
+    jobId: string,
+    onEvent: (event: JobEvent) => void,
+    onUnavailable: () => void
+  ): (() => void) => {
+    if (typeof EventSource === 'undefined') {
+      onUnavailable();
+      return () => {};
+    }
+
+    const source = new EventSource(jobsApi.eventsUrl(jobId));
+    let closed = false;
+
+    const handle = (message: MessageEvent) => {
+      const event: JobEvent = JSON.parse(message.data);
+      if (isFinished(event.status)) {
+        closed = true;
+        source.close();
+      }
+      onEvent(event);
+    };
+
+    JOB_EVENT_TYPES.forEach(type => source.addEventListener(type, handle as EventListener));
+    source.onerror = () => {
+      if (closed) return;
+      closed = true;
+      source.close();
+      onUnavailable();
+    };
+
+    return () => {
+      closed = true;
+      source.close();
+    };
+  },
+
+  // PROMPT #108 - Wait until job completes (pushed events, polling as fallback)
   // Returns the job result when completed, throws error when failed
-  poll: async (
+  poll: (
     jobId: string,
     onProgress?: (percent: number, message: string | null) => void,
     intervalMs: number = 1000,
@@ -883,6 +939,47 @@ export const jobsApi = {
   ): Promise<any> => {
     const startTime = Date.now();
 
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        close();
+        reject(new Error('Job polling timeout'));
+      }, timeoutMs);
+
+      const close = jobsApi.subscribe(
+        jobId,
+        (event) => {
+          if (onProgress && event.progress_percent != null) {
+            onProgress(event.progress_percent, event.progress_message ?? null);
+          }
+          if (!isFinished(event.status)) return;
+
+          clearTimeout(timer);
+          if (event.status === 'completed') {
+            resolve(event.result);
+          } else if (event.status === 'failed') {
+            reject(new Error(event.error || 'Job failed'));
+          } else {
+            reject(new Error('Job was cancelled'));
+          }
+        },
+        () => {
+          clearTimeout(timer);
+          const remainingMs = timeoutMs - (Date.now() - startTime);
+          jobsApi.pollStatus(jobId, onProgress, intervalMs, remainingMs).then(resolve, reject);
+        }
+      );
+    });
+  },
+
+  // Fallback: poll GET /jobs/{id} until the job completes
+  pollStatus: async (
+    jobId: string,
+    onProgress?: (percent: number, message: string | null) => void,
+    intervalMs: number = 1000,
+    timeoutMs: number = 300000
+  ): Promise<any> => {
+    const startTime = Date.now();
+
     while (true) {
       const job = await jobsApi.get(jobId);
 